@@ -12,8 +12,10 @@ import {
   StatusMessage,
   ErrorMessage,
   TTSReadyMessage,
+  TTSAudioStartMessage,
   WebSocketEventHandlers
 } from '@/lib/websocket-client';
+import { PcmStreamPlayer } from '@/lib/pcm-stream-player';
 import { API_CONFIG } from '@/lib/api-config';
 
 export interface AudioRecordingState {
@@ -76,6 +78,7 @@ export const useAvatarWebSocket = (): UseAvatarWebSocketReturn => {
   });
 
   const wsClient = useRef<AVATARWebSocketClient | null>(null);
+  const audioPlayer = useRef<PcmStreamPlayer>(new PcmStreamPlayer());
   const recordingTimer = useRef<NodeJS.Timeout | null>(null);
   const eventHandlers = useRef<{
     onStatus?: (status: StatusMessage) => void;
@@ -96,6 +99,10 @@ export const useAvatarWebSocket = (): UseAvatarWebSocketReturn => {
         setConnectionState(state);
       },
       onStatus: (status: StatusMessage) => {
+        if (status.stage === 'interrupted') {
+          audioPlayer.current.stop();
+        }
+
         setConversation(prev => ({
           ...prev,
           currentStage: status.stage,
@@ -130,6 +137,17 @@ export const useAvatarWebSocket = (): UseAvatarWebSocketReturn => {
         if (eventHandlers.current.onTTSReady) {
           eventHandlers.current.onTTSReady(tts);
         }
+      },
+      // Streamed speech: play frames as they arrive
+      onTTSAudioStart: (start: TTSAudioStartMessage) => {
+        audioPlayer.current.start(start.sample_rate, start.channels);
+      },
+      onTTSAudioFrame: (pcm: Int16Array) => {
+        audioPlayer.current.push(pcm);
+      },
+      onTTSAudioEnd: () => {
+        // Already played from the frames; audioUrl is left unset so it is not replayed
+        setConversation(prev => ({ ...prev, currentStage: 'ready' }));
       }
     };
 
@@ -139,6 +157,7 @@ export const useAvatarWebSocket = (): UseAvatarWebSocketReturn => {
       if (wsClient.current) {
         wsClient.current.disconnect();
       }
+      audioPlayer.current.close();
     };
   }, []);
 
@@ -170,6 +189,10 @@ export const useAvatarWebSocket = (): UseAvatarWebSocketReturn => {
 
   // Audio recording methods
   const startRecording = useCallback(async (): Promise<boolean> => {
+    // Barge-in: the user talks over the reply
+    audioPlayer.current.stop();
+    wsClient.current?.sendInterrupt();
+
     try {
       const stream = await navigator.mediaDevices.getUserMedia({
         audio: {
@@ -266,7 +289,7 @@ export const useAvatarWebSocket = (): UseAvatarWebSocketReturn => {
     }
 
     try {
-      // Convert blob to base64 chunks
+      // Send the blob as binary frames
       const arrayBuffer = await audioBlob.arrayBuffer();
       const uint8Array = new Uint8Array(arrayBuffer);
 
@@ -277,12 +300,9 @@ export const useAvatarWebSocket = (): UseAvatarWebSocketReturn => {
       for (let i = 0; i < totalChunks; i++) {
         const start = i * chunkSize;
         const end = Math.min(start + chunkSize, uint8Array.length);
-        const chunk = uint8Array.slice(start, end);
-
-        // Convert to base64
-        const base64Chunk = btoa(String.fromCharCode.apply(null, Array.from(chunk)));
+        const chunk = uint8Array.subarray(start, end);
 
-        const success = wsClient.current.sendAudioChunk(base64Chunk, i);
+        const success = wsClient.current.sendAudioFrame(chunk, i);
         if (!success) {
           throw new Error(`Failed to send audio chunk ${i}`);
         }
@@ -0,0 +1,77 @@
+/**
+ * PCM Stream Player
+ *
+ * Plays 16-bit PCM frames streamed over the WebSocket (tts_audio_start +
+ * binary frames) as they arrive, scheduling each frame right after the
+ * previous one so playback starts on the first frame without gaps.
+ */
+
+const START_DELAY_SEC = 0.05; // Small lead so the first frame is not clipped
+
+export class PcmStreamPlayer {
+  private context: AudioContext | null = null;
+  private sampleRate = 24000;
+  private channels = 1;
+  private nextStartTime = 0;
+  private sources = new Set<AudioBufferSourceNode>();
+
+  /**
+   * Begin a segment with the announced format
+   */
+  start(sampleRate: number, channels: number = 1): void {
+    this.sampleRate = sampleRate;
+    this.channels = channels;
+
+    if (!this.context) {
+      this.context = new AudioContext();
+    }
+    if (this.context.state === 'suspended') {
+      void this.context.resume();
+    }
+  }
+
+  /**
+   * Schedule one frame of interleaved PCM16 samples
+   */
+  push(pcm: Int16Array): void {
+    if (!this.context || pcm.length === 0) {
+      return;
+    }
+
+    const frameCount = Math.floor(pcm.length / this.channels);
+    const buffer = this.context.createBuffer(this.channels, frameCount, this.sampleRate);
+    for (let channel = 0; channel < this.channels; channel++) {
+      const output = buffer.getChannelData(channel);
+      for (let i = 0; i < frameCount; i++) {
+        output[i] = pcm[i * this.channels + channel] / 32768;
+      }
+    }
+
+    const source = this.context.createBufferSource();
+    source.buffer = buffer;
+    source.connect(this.context.destination);
+
+    const now = this.context.currentTime;
+    this.nextStartTime = Math.max(this.nextStartTime, now + START_DELAY_SEC);
+    source.start(this.nextStartTime);
+    this.nextStartTime += buffer.duration;
+
+    this.sources.add(source);
+    source.onended = () => this.sources.delete(source);
+  }
+
+  /**
+   * Stop playback and drop scheduled frames
+   */
+  stop(): void {
+    this.sources.forEach(source => source.stop());
+    this.sources.clear();
+    this.nextStartTime = 0;
+  }
+
+  close(): void {
+    this.stop();
+    void this.context?.close();
+    this.context = null;
+  }
+}
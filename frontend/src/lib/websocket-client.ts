@@ -19,7 +19,7 @@ export enum ConnectionState {
 // Message Types (Server → Client)
 export interface StatusMessage {
   type: 'status';
-  stage: 'stt' | 'llm' | 'tts' | 'ready' | 'processing';
+  stage: 'stt' | 'llm' | 'tts' | 'ready' | 'processing' | 'interrupted';
   session_id: string;
   message?: string;
 }
@@ -48,6 +48,24 @@ export interface ErrorMessage {
   code?: string;
 }
 
+// Synthesized speech streamed as binary frames between these two messages
+export interface TTSAudioStartMessage {
+  type: 'tts_audio_start';
+  turn_number: number;
+  segment: number;
+  codec: 'pcm_s16le';
+  sample_rate: number;
+  channels: number;
+}
+
+export interface TTSAudioEndMessage {
+  type: 'tts_audio_end';
+  turn_number: number;
+  segment: number;
+  frames: number;
+  audio_url: string; // For replay
+}
+
 export interface ConnectionMessage {
   type: 'connected';
   session_id: string;
@@ -58,6 +76,8 @@ export type ServerMessage =
   | TranscriptMessage
   | AIResponseMessage
   | TTSReadyMessage
+  | TTSAudioStartMessage
+  | TTSAudioEndMessage
   | ErrorMessage
   | ConnectionMessage;
 
@@ -72,9 +92,42 @@ export interface AudioEndMessage {
   type: 'audio_end';
   total_chunks: number;
   voice_profile_id?: number;
+  stream_audio?: boolean; // Send the reply as binary frames instead of a URL
+  accept_formats?: string[]; // Reply URL formats this browser can play, best first
 }
 
-export type ClientMessage = AudioChunkMessage | AudioEndMessage;
+// Cancel the turn in progress (barge-in); pending reply audio is dropped
+export interface InterruptMessage {
+  type: 'interrupt';
+}
+
+export type ClientMessage = AudioChunkMessage | AudioEndMessage | InterruptMessage;
+
+// Binary audio frames (Client → Server), see backend core/audio_frames.py:
+// [version u8][codec u8][reserved u16][sequence u32 BE] + raw audio bytes
+const AUDIO_FRAME_VERSION = 1;
+const AUDIO_FRAME_HEADER_SIZE = 8;
+
+/**
+ * Compressed reply formats this browser can play (WAV is always accepted)
+ */
+export function supportedAudioFormats(): string[] {
+  if (typeof Audio === 'undefined') {
+    return ['wav'];
+  }
+
+  const audio = new Audio();
+  const formats: string[] = [];
+  if (audio.canPlayType('audio/ogg; codecs=opus')) formats.push('opus');
+  if (audio.canPlayType('audio/webm; codecs=opus')) formats.push('webm');
+  formats.push('wav');
+  return formats;
+}
+
+export enum AudioCodec {
+  CONTAINER = 0, // MediaRecorder output (WebM/Opus, Ogg/Opus)
+  PCM16 = 1, // Raw 16-bit little-endian PCM, 16kHz mono
+}
 
 // Event Handlers
 export interface WebSocketEventHandlers {
@@ -85,6 +138,9 @@ export interface WebSocketEventHandlers {
   onTranscript?: (transcript: TranscriptMessage) => void;
   onAIResponse?: (response: AIResponseMessage) => void;
   onTTSReady?: (tts: TTSReadyMessage) => void;
+  onTTSAudioStart?: (start: TTSAudioStartMessage) => void;
+  onTTSAudioFrame?: (pcm: Int16Array, sequence: number) => void;
+  onTTSAudioEnd?: (end: TTSAudioEndMessage) => void;
   onError?: (error: ErrorMessage) => void;
 }
 
@@ -145,6 +201,7 @@ export class AVATARWebSocketClient {
         this.updateConnectionState(ConnectionState.CONNECTING);
 
         this.ws = new WebSocket(wsUrl);
+        this.ws.binaryType = 'arraybuffer';
 
         // Connection opened
         this.ws.onopen = () => {
@@ -157,6 +214,11 @@ export class AVATARWebSocketClient {
 
         // Message received
         this.ws.onmessage = (event) => {
+          if (event.data instanceof ArrayBuffer) {
+            this.handleAudioFrame(event.data);
+            return;
+          }
+
           try {
             const message: ServerMessage = JSON.parse(event.data);
             this.handleServerMessage(message);
@@ -241,10 +303,55 @@ export class AVATARWebSocketClient {
     }
   }
 
+  /**
+   * Send audio chunk as a binary frame (no base64, no JSON)
+   */
+  sendAudioFrame(chunk: Uint8Array, sequence: number, codec: AudioCodec = AudioCodec.CONTAINER): boolean {
+    if (!this.isConnected || !this.ws) {
+      console.error('[WebSocket] Cannot send audio frame: not connected');
+      return false;
+    }
+
+    const frame = new Uint8Array(AUDIO_FRAME_HEADER_SIZE + chunk.length);
+    const header = new DataView(frame.buffer);
+    header.setUint8(0, AUDIO_FRAME_VERSION);
+    header.setUint8(1, codec);
+    header.setUint16(2, 0);
+    header.setUint32(4, sequence);
+    frame.set(chunk, AUDIO_FRAME_HEADER_SIZE);
+
+    try {
+      this.ws.send(frame);
+      return true;
+    } catch (error) {
+      console.error('[WebSocket] Failed to send audio frame:', error);
+      return false;
+    }
+  }
+
+  /**
+   * Interrupt the reply in progress (stops LLM generation and TTS on the server)
+   */
+  sendInterrupt(): boolean {
+    if (!this.isConnected || !this.ws) {
+      return false;
+    }
+
+    const message: InterruptMessage = { type: 'interrupt' };
+
+    try {
+      this.ws.send(JSON.stringify(message));
+      return true;
+    } catch (error) {
+      console.error('[WebSocket] Failed to send interrupt:', error);
+      return false;
+    }
+  }
+
   /**
    * Send audio end signal
    */
-  sendAudioEnd(totalChunks: number, voiceProfileId?: number): boolean {
+  sendAudioEnd(totalChunks: number, voiceProfileId?: number, streamAudio: boolean = true): boolean {
     if (!this.isConnected || !this.ws) {
       console.error('[WebSocket] Cannot send audio end: not connected');
       return false;
@@ -254,6 +361,8 @@ export class AVATARWebSocketClient {
       type: 'audio_end',
       total_chunks: totalChunks,
       voice_profile_id: voiceProfileId,
+      stream_audio: streamAudio,
+      accept_formats: supportedAudioFormats(),
     };
 
     try {
@@ -293,6 +402,14 @@ export class AVATARWebSocketClient {
         this.handlers.onTTSReady?.(message);
         break;
 
+      case 'tts_audio_start':
+        this.handlers.onTTSAudioStart?.(message);
+        break;
+
+      case 'tts_audio_end':
+        this.handlers.onTTSAudioEnd?.(message);
+        break;
+
       case 'error':
         this.handlers.onError?.(message);
         break;
@@ -302,6 +419,25 @@ export class AVATARWebSocketClient {
     }
   }
 
+  /**
+   * Handle a binary audio frame (synthesized speech)
+   */
+  private handleAudioFrame(data: ArrayBuffer): void {
+    if (data.byteLength < AUDIO_FRAME_HEADER_SIZE) {
+      console.warn('[WebSocket] Audio frame too short:', data.byteLength);
+      return;
+    }
+
+    const header = new DataView(data);
+    if (header.getUint8(0) !== AUDIO_FRAME_VERSION || header.getUint8(1) !== AudioCodec.PCM16) {
+      console.warn('[WebSocket] Unsupported audio frame');
+      return;
+    }
+
+    const sequence = header.getUint32(4);
+    this.handlers.onTTSAudioFrame?.(new Int16Array(data, AUDIO_FRAME_HEADER_SIZE), sequence);
+  }
+
   /**
    * Update connection state and notify handlers
    */
@@ -0,0 +1,217 @@
+"""
+Audio file serving
+
+TTS output and conversation recordings are served with:
+- HTTP Range requests (206), so players can seek and resume downloads
+- ETag / Last-Modified validators, so replays revalidate with a 304
+- Opus transcoding (?format=opus|webm, or negotiated from the Accept
+  header), cached next to the WAV
+"""
+
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import AsyncIterator, Optional, Tuple
+
+import aiofiles
+import structlog
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+from avatar.core.audio_encoding import choose_format, get_encoded_audio
+from avatar.core.config import config
+from avatar.core.security import optional_api_token
+
+logger = structlog.get_logger()
+
+router = APIRouter(prefix="/api/audio", tags=["audio"])
+
+# Rate limiter
+limiter = Limiter(key_func=get_remote_address)
+
+TTS_URL_PREFIX = "/api/audio/tts/"
+CHUNK_SIZE = 64 * 1024
+CACHE_CONTROL = "private, max-age=86400"  # Files are never rewritten under the same name
+
+
+def resolve_tts_file(filename: str) -> Optional[Path]:
+    """TTS output file by name (fast or HQ directory), or None"""
+    if not filename or Path(filename).name != filename or filename.startswith("."):
+        return None  # Path components would escape the audio directories
+
+    for directory in (config.AUDIO_TTS_FAST, config.AUDIO_TTS_HQ):
+        path = directory / filename
+        if path.is_file():
+            return path
+    return None
+
+
+def resolve_stored_audio(stored: str) -> Optional[Path]:
+    """File behind an audio reference stored with a turn (path or /api/audio/tts/ URL)"""
+    if not stored:
+        return None
+    if stored.startswith(TTS_URL_PREFIX):
+        return resolve_tts_file(stored[len(TTS_URL_PREFIX):])
+
+    path = Path(stored)
+    return path if path.is_file() else None
+
+
+def parse_byte_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range Range header
+
+    Returns:
+        Inclusive (start, end), or None to serve the whole file (other units,
+        multiple ranges or malformed headers)
+
+    Raises:
+        HTTPException: 416 if the range lies outside the file
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+
+    first, dash, last = spec.strip().partition("-")
+    if not dash:
+        return None
+
+    try:
+        if first == "":  # Suffix range: last N bytes
+            length = int(last)
+            start, end = max(0, size - length), size - 1
+            if length <= 0:
+                start = size  # Unsatisfiable
+        else:
+            start = int(first)
+            end = min(int(last), size - 1) if last else size - 1
+    except ValueError:
+        return None
+
+    if start >= size or start > end:
+        raise HTTPException(
+            status_code=416,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"}
+        )
+    return start, end
+
+
+def requested_format(request: Request, audio_format: Optional[str]) -> str:
+    """Explicit ?format=, else the best format named in the Accept header"""
+    return audio_format or choose_format(request.headers.get("accept"))
+
+
+def _not_modified(request: Request, etag: str, mtime: float) -> bool:
+    """Evaluate If-None-Match, then If-Modified-Since"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return int(mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+async def _read_range(path: Path, start: int, end: int) -> AsyncIterator[bytes]:
+    async with aiofiles.open(path, "rb") as f:
+        await f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = await f.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def audio_file_response(
+    request: Request,
+    path: Path,
+    media_type: str,
+    filename: Optional[str] = None
+) -> Response:
+    """
+    Serve a file with conditional and Range request support
+
+    Args:
+        request: Incoming request (Range / If-* headers)
+        path: File to serve
+        media_type: Content type
+        filename: Download name (sent as attachment when set)
+
+    Returns:
+        304, 206 or 200 response
+    """
+    stat = path.stat()
+    etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+    last_modified = formatdate(stat.st_mtime, usegmt=True)
+    headers = {
+        "ETag": etag,
+        "Last-Modified": last_modified,
+        "Cache-Control": CACHE_CONTROL,
+        "Accept-Ranges": "bytes",
+        "Vary": "Accept",  # Format may be negotiated
+    }
+
+    if _not_modified(request, etag, stat.st_mtime):
+        return Response(status_code=304, headers=headers)
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (if_range is None or if_range.strip() in (etag, last_modified)):
+        byte_range = parse_byte_range(range_header, stat.st_size)
+        if byte_range is not None:
+            start, end = byte_range
+            headers["Content-Range"] = f"bytes {start}-{end}/{stat.st_size}"
+            headers["Content-Length"] = str(end - start + 1)
+            if filename:
+                headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+            return StreamingResponse(
+                _read_range(path, start, end),
+                status_code=206,
+                media_type=media_type,
+                headers=headers
+            )
+
+    return FileResponse(
+        path=str(path),
+        media_type=media_type,
+        filename=filename,
+        headers=headers,
+        stat_result=stat
+    )
+
+
+@router.get("/tts/{filename}")
+@limiter.limit("120/minute")
+async def get_tts_audio(
+    request: Request,
+    filename: str,
+    format: Optional[str] = Query(None, regex="^(wav|opus|webm)$", description="Audio format"),
+    authenticated: bool = Depends(optional_api_token)
+):
+    """
+    Synthesized speech by file name (URLs sent in tts_ready messages)
+
+    Args:
+        filename: TTS output file name
+        format: wav, opus or webm (transcoded and cached; WAV if ffmpeg is
+            missing). Default: negotiated from the Accept header
+        authenticated: Authentication status (optional)
+
+    Returns:
+        Audio file response
+    """
+    path = resolve_tts_file(filename)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Audio file not found")
+
+    path, media_type = await get_encoded_audio(path, requested_format(request, format))
+    return audio_file_response(request, path, media_type)
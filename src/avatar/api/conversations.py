@@ -13,6 +13,8 @@ from fastapi import APIRouter, HTTPException, Depends, Request, Query
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
 
+from avatar.api.audio import audio_file_response, requested_format, resolve_stored_audio
+from avatar.core.audio_encoding import get_encoded_audio
 from avatar.core.config import config
 from avatar.core.security import verify_api_token, optional_api_token, safe_error_response
 from avatar.services.database import get_database_service
@@ -218,16 +220,21 @@ async def get_conversation_audio(
     session_id: str,
     turn_number: int,
     audio_type: str = Query("ai_fast", regex="^(user|ai_fast|ai_hq)$"),
+    format: Optional[str] = Query(None, regex="^(wav|opus|webm)$", description="Audio format"),
     authenticated: bool = Depends(optional_api_token),
     db = Depends(get_database_service)
 ):
     """
     Download audio file from specific conversation turn
 
+    Supports Range requests and ETag/Last-Modified revalidation.
+
     Args:
         session_id: Session identifier
         turn_number: Turn number within session
         audio_type: Type of audio (user, ai_fast, ai_hq)
+        format: wav, opus or webm (transcoded and cached; WAV if ffmpeg is
+            missing). Default: negotiated from the Accept header
         authenticated: Authentication status (optional)
         db: Database service
 
@@ -243,8 +250,7 @@ async def get_conversation_audio(
 
     try:
         # Get specific conversation turn
-        turns = await db.get_conversation_history(session_id, limit=1000)  # Get all to find specific turn
-        turn = next((t for t in turns if t['turn_number'] == turn_number), None)
+        turn = await db.get_conversation_turn(session_id, turn_number)
 
         if not turn:
             raise HTTPException(
@@ -253,7 +259,6 @@ async def get_conversation_audio(
             )
 
         # Get audio path based on type
-        audio_path_key = f"{audio_type.replace('_', '_')}_audio_path"
         if audio_type == "user":
             audio_path = turn.get("user_audio_path")
         elif audio_type == "ai_fast":
@@ -269,14 +274,16 @@ async def get_conversation_audio(
                 detail=f"No {audio_type} audio available for this turn"
             )
 
-        # Check file exists
-        audio_file = Path(audio_path)
-        if not audio_file.exists():
+        # Check file exists (AI audio is stored as its /api/audio/tts/ URL)
+        audio_file = resolve_stored_audio(audio_path)
+        if audio_file is None:
             raise HTTPException(
                 status_code=404,
                 detail="Audio file not found on disk"
             )
 
+        audio_file, media_type = await get_encoded_audio(audio_file, requested_format(request, format))
+
         logger.info(
             "conversations.audio_served",
             session_id=session_id,
@@ -285,10 +292,11 @@ async def get_conversation_audio(
             file_size=audio_file.stat().st_size
         )
 
-        return FileResponse(
-            path=str(audio_file),
-            media_type="audio/wav",
-            filename=f"{session_id}_{turn_number}_{audio_type}.wav"
+        return audio_file_response(
+            request,
+            audio_file,
+            media_type=media_type,
+            filename=f"{session_id}_{turn_number}_{audio_type}{audio_file.suffix}"
         )
 
     except HTTPException:
@@ -243,6 +243,77 @@ async def get_performance_metrics():
         raise HTTPException(status_code=500, detail="Failed to get performance metrics")
 
 
+@router.get("/stt")
+async def get_stt_metrics():
+    """
+    Get STT decode pool metrics
+
+    Returns queue depth, active decodes and decode/queue-wait times
+    """
+    from avatar.services.stt import get_stt_metrics as get_provider_metrics
+
+    try:
+        metrics = get_provider_metrics()
+
+        return {
+            "loaded": metrics is not None,
+            "metrics": metrics or {},
+            "timestamp": time.time()
+        }
+
+    except Exception as e:
+        logger.error("monitoring.api.stt_failed", error=str(e))
+        raise HTTPException(status_code=500, detail="Failed to get STT metrics")
+
+
+@router.get("/llm")
+async def get_llm_metrics():
+    """
+    Get LLM prefix-cache metrics
+
+    Returns estimated prompt-token reuse, hit rate and TTFT for
+    prefix-cache hits vs misses
+    """
+    from avatar.services.llm import get_llm_metrics as get_provider_metrics
+
+    try:
+        metrics = get_provider_metrics()
+
+        return {
+            "loaded": metrics is not None,
+            "metrics": metrics or {},
+            "timestamp": time.time()
+        }
+
+    except Exception as e:
+        logger.error("monitoring.api.llm_failed", error=str(e))
+        raise HTTPException(status_code=500, detail="Failed to get LLM metrics")
+
+
+@router.get("/tts")
+async def get_tts_metrics():
+    """
+    Get TTS voice reference cache statistics
+
+    Returns hit/miss counts of prepared voice-profile references and of
+    the synthesized phrase cache
+    """
+    from avatar.core.config import config
+    from avatar.services.tts_phrase_cache import get_tts_phrase_cache
+    from avatar.services.voice_reference_cache import get_voice_reference_cache
+
+    try:
+        return {
+            "voice_reference_cache": get_voice_reference_cache().get_stats(),
+            "phrase_cache": get_tts_phrase_cache().get_stats() if config.TTS_PHRASE_CACHE_ENABLED else None,
+            "timestamp": time.time()
+        }
+
+    except Exception as e:
+        logger.error("monitoring.api.tts_failed", error=str(e))
+        raise HTTPException(status_code=500, detail="Failed to get TTS metrics")
+
+
 @router.get("/errors/recent")
 async def get_recent_errors(
     limit: int = Query(50, ge=1, le=500, description="Number of recent errors to return"),
@@ -295,7 +295,7 @@ async def get_detailed_status(api_key: str = Depends(verify_api_key)):
         "vram_monitoring": vram_monitor.get_monitoring_stats(),
         "vram_alerts": vram_monitor.get_alert_summary(),
         "queue_internals": {
-            "queue_objects": len(controller.session_queue.queue),
+            "queue_objects": controller.session_queue.waiting_count,
             "processing_objects": len(controller.session_queue.processing),
             "completed_objects": len(controller.session_queue.completed),
             "background_tasks_active": (
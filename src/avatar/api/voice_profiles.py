@@ -22,6 +22,8 @@ from slowapi.util import get_remote_address
 from avatar.core.config import config
 from avatar.core.security import verify_api_token, validate_input_string, safe_error_response
 from avatar.services.database import get_database_service
+from avatar.services.tts_phrase_cache import get_tts_phrase_cache
+from avatar.services.voice_reference_cache import get_voice_reference_cache
 
 logger = structlog.get_logger()
 
@@ -513,6 +515,8 @@ async def update_voice_profile(
             update_data['description'] = description
         if reference_text is not None:
             update_data['reference_text'] = reference_text
+            # TTS reads the reference text from disk, keep it in sync
+            await save_reference_text(config.AUDIO_PROFILES / profile_id, reference_text)
 
         # Update audio file if provided
         if audio_file and audio_file.filename:
@@ -531,6 +535,11 @@ async def update_voice_profile(
         # Update database
         await db.update_voice_profile_v2(profile_id, update_data)
 
+        # Drop the prepared TTS reference so the next synthesis uses the new files
+        get_voice_reference_cache().invalidate(profile_id)
+        if 'audio_path' in update_data or reference_text is not None:
+            get_tts_phrase_cache().invalidate_voice(profile_id)
+
         # Get updated profile
         updated_profile = await db.get_voice_profile_v2(profile_id)
 
@@ -576,6 +585,8 @@ async def delete_voice_profile(
         profile_dir = config.AUDIO_PROFILES / profile_id
         if profile_dir.exists():
             shutil.rmtree(profile_dir)
+        get_voice_reference_cache().invalidate(profile_id)
+        get_tts_phrase_cache().invalidate_voice(profile_id)
 
         # Delete from database
         await db.delete_voice_profile_v2(profile_id)
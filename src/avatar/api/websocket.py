@@ -6,7 +6,31 @@ Handles the full conversation pipeline:
 2. Transcribe with Whisper (STT)
 3. Generate response with vLLM
 4. Synthesize speech with TTS
-5. Send audio URL back to client
+5. Send audio back to client (URL, or binary frames on the socket)
+
+In streaming TTS mode (AVATAR_TTS_STREAMING or "stream_tts" on audio_end),
+steps 3 and 4 overlap: the LLM stream is cut into sentences and each one
+is synthesized and sent as its own numbered TTSReadyMessage.
+
+In HQ mode (AVATAR_TTS_MODE=hq or "tts_mode": "hq" on audio_end), the reply
+is synthesized with CosyVoice2 streaming inference instead; each chunk is
+sent as soon as it is produced, numbered the same way, with mode "hq".
+
+Audio arrives as binary frames (see core.audio_frames); JSON audio_chunk
+messages with base64 data are still accepted from older clients.
+
+Otherwise the TTS URL points to the most compact format listed in
+"accept_formats" on audio_end (e.g. ["opus", "wav"]), encoded on the fly.
+
+Each turn runs as its own task, so the connection keeps listening while it
+is processed. An "interrupt" message, or new speech with AVATAR_BARGE_IN,
+cancels the turn: the vLLM request is aborted, queued TTS sentences are
+dropped, and the client is told to stop playback (status "interrupted").
+
+With AVATAR_TTS_WS_AUDIO or "stream_audio" on audio_end, synthesized speech
+goes back the same way: tts_audio_start, PCM16 binary frames, tts_audio_end.
+The client starts playback on the first frame instead of fetching the WAV;
+the URL (in tts_audio_end) remains for replay and the conversation archive.
 """
 
 import asyncio
@@ -14,14 +38,35 @@ import base64
 import json
 import time
 import uuid
+from contextlib import aclosing
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
 
+import numpy as np
 import structlog
 from fastapi import WebSocket, WebSocketDisconnect
 from pydantic import ValidationError
 
+from avatar.core.audio_frames import (
+    CODEC_PCM16,
+    AudioBuffer,
+    AudioFrameError,
+    build_audio_frame,
+    parse_audio_frame,
+    read_pcm16_wav,
+    split_pcm,
+)
+from avatar.core.audio_encoding import (
+    cached_encoding,
+    choose_format,
+    schedule_encoding,
+)
 from avatar.core.config import config
+from avatar.core.conversation_memory import (
+    SUMMARY_MAX_TOKENS,
+    ConversationMemory,
+    token_counter_from_tokenizer,
+)
 from avatar.models.messages import (
     AudioChunkMessage,
     AudioEndMessage,
@@ -40,6 +85,42 @@ MAX_CHUNK_COUNT = 1000  # Max number of chunks
 BUFFER_TIMEOUT_SECONDS = 60  # 60 seconds max buffering time
 
 
+def parse_tts_options(message_data: dict) -> dict:
+    """
+    TTS delivery options of an audio_end message, with config defaults
+
+    Raises:
+        ValueError: An option has the wrong type or value
+    """
+    options = {
+        "tts_mode": message_data.get("tts_mode", config.TTS_DEFAULT_MODE),
+        "stream_tts": message_data.get("stream_tts", config.TTS_STREAMING_ENABLED),
+        "stream_audio": message_data.get("stream_audio", config.TTS_WS_AUDIO_ENABLED),
+        "accept_formats": message_data.get("accept_formats"),
+    }
+
+    if options["tts_mode"] not in ("fast", "hq"):
+        raise ValueError(f"tts_mode must be fast or hq, got {options['tts_mode']!r}")
+    for name in ("stream_tts", "stream_audio"):
+        if not isinstance(options[name], bool):
+            raise ValueError(f"{name} must be a boolean, got {options[name]!r}")
+    formats = options["accept_formats"]
+    if formats is not None and not (
+        isinstance(formats, list) and all(isinstance(name, str) for name in formats)
+    ):
+        raise ValueError(f"accept_formats must be a list of strings, got {formats!r}")
+
+    return options
+
+
+class TurnAudio(NamedTuple):
+    """Audio handed from the receive buffer to a turn when it starts"""
+    data: bytes
+    audio_format: Optional[str]  # Decoder hint (see AudioBuffer.audio_format)
+    codec: Optional[int]
+    transcriber: Optional[object]  # StreamingTranscriber fed during upload
+
+
 class ConversationSession:
     """
     Manages a single conversation session
@@ -50,14 +131,32 @@ class ConversationSession:
     def __init__(self, session_id: str, websocket: WebSocket):
         self.session_id = session_id
         self.websocket = websocket
-        self.audio_buffer: list[bytes] = []
+        self.audio_buffer = AudioBuffer()
         self.turn_number = 0
         self.voice_profile_id: Optional[int] = None
         self.is_processing = False
+        self._turn_task: Optional[asyncio.Task] = None  # process_audio() of the current turn
+        self.stream_tts = config.TTS_STREAMING_ENABLED
+        self.stream_audio = config.TTS_WS_AUDIO_ENABLED
+        self.tts_mode = config.TTS_DEFAULT_MODE  # fast (F5-TTS) or hq (CosyVoice2)
+        self.accept_formats: Optional[list[str]] = None  # From audio_end; None = WAV only
+        self._tts_frame_sequence = 0  # Downstream audio frames sent this turn
+
+        # Streaming STT: transcribe while the user is still speaking
+        self.stream_stt = config.STT_STREAMING_ENABLED and config.STT_PROVIDER.lower() == "local"
+        self._transcriber = None  # StreamingTranscriber for the current turn
+
+        # Background write of the current turn's user audio (off the critical path)
+        self._persist_task: Optional[asyncio.Task] = None
+
+        # Recent turns sent to the LLM as context (in memory, token-budgeted)
+        self.memory = ConversationMemory()
+        self._summary_task: Optional[asyncio.Task] = None
 
         # Buffer limit tracking
         self.buffer_size_bytes = 0
         self.buffer_first_chunk_time: Optional[float] = None
+        self._voiced_ms = 0.0  # PCM16 audio above BARGE_IN_MIN_RMS (barge-in gate)
 
         logger.info("session.created", session_id=session_id)
 
@@ -80,9 +179,173 @@ class ConversationSession:
         await self.websocket.send_text(error_msg.model_dump_json())
         logger.error("session.error", session_id=self.session_id, error=error, code=code)
 
+    async def send_tts_ready(
+        self,
+        audio_url: str,
+        sequence: Optional[int] = None,
+        audio_format: str = "wav",
+        mode: str = "fast"
+    ):
+        """
+        Send TTS ready notification to client
+
+        Args:
+            audio_url: URL of synthesized audio
+            sequence: Chunk number in streaming TTS mode (None for whole utterance)
+            audio_format: Format of the file behind audio_url (wav, opus, webm)
+            mode: TTS mode that produced the audio (fast, hq)
+        """
+        from avatar.models.messages import TTSReadyMessage
+
+        tts_msg = TTSReadyMessage(
+            audio_url=audio_url,
+            audio_format=audio_format,
+            mode=mode,
+            session_id=self.session_id,
+        )
+
+        if sequence is None:
+            await self.websocket.send_text(tts_msg.model_dump_json())
+            return
+
+        # Streaming chunk: client plays chunks in sequence order
+        tts_data = tts_msg.model_dump(mode="json")
+        tts_data["sequence"] = sequence
+        tts_data["turn_number"] = self.turn_number
+        await self.websocket.send_text(json.dumps(tts_data))
+
+    async def send_tts_audio(self, path: Path, audio_url: str, segment: int = 0) -> bool:
+        """
+        Send synthesized speech as binary PCM16 frames on the WebSocket
+
+        Sends tts_audio_start (sample rate, channels), the frames, then
+        tts_audio_end with the file URL. Frame sequence numbers run across
+        all segments of the turn.
+
+        Args:
+            path: Synthesized WAV file
+            audio_url: URL of the same file (for replay)
+            segment: Sentence number in streaming TTS mode (0 for whole utterance)
+
+        Returns:
+            False if the file cannot be sent as PCM16 (caller falls back to the URL)
+        """
+        loop = asyncio.get_event_loop()
+        try:
+            pcm, sample_rate, channels = await loop.run_in_executor(None, read_pcm16_wav, path)
+        except (AudioFrameError, OSError) as e:
+            logger.warning("session.tts_audio.fallback_url",
+                          session_id=self.session_id,
+                          path=str(path),
+                          error=str(e))
+            return False
+
+        await self.websocket.send_text(json.dumps({
+            "type": "tts_audio_start",
+            "session_id": self.session_id,
+            "turn_number": self.turn_number,
+            "segment": segment,
+            "codec": "pcm_s16le",
+            "sample_rate": sample_rate,
+            "channels": channels,
+        }))
+
+        frames = 0
+        for chunk in split_pcm(pcm, sample_rate, channels):
+            await self.websocket.send_bytes(
+                build_audio_frame(chunk, self._tts_frame_sequence, CODEC_PCM16)
+            )
+            self._tts_frame_sequence += 1
+            frames += 1
+
+        await self.websocket.send_text(json.dumps({
+            "type": "tts_audio_end",
+            "session_id": self.session_id,
+            "turn_number": self.turn_number,
+            "segment": segment,
+            "frames": frames,
+            "audio_url": audio_url,
+        }))
+        return True
+
+    async def deliver_tts(self, audio_url: str, sequence: Optional[int] = None, mode: str = "fast"):
+        """
+        Send synthesized speech to the client
+
+        As socket frames if the client asked for them, else as a URL to the
+        best format the client accepts. Encoding never delays playback: the
+        WAV URL is sent unless an encoded copy already exists, and the encode
+        runs in the background for replays.
+        """
+        directory = config.AUDIO_TTS_HQ if mode == "hq" else config.AUDIO_TTS_FAST
+        path = directory / audio_url.rsplit("/", 1)[-1]
+        if self.stream_audio and await self.send_tts_audio(path, audio_url, segment=sequence or 0):
+            return
+
+        audio_format = choose_format(self.accept_formats)
+        encoded = cached_encoding(path, audio_format)
+        if encoded is not None:
+            audio_url = f"/api/audio/tts/{encoded.name}"
+        else:
+            self._schedule_encoding(path, audio_format)
+            audio_format = "wav"
+
+        await self.send_tts_ready(audio_url, sequence=sequence, audio_format=audio_format, mode=mode)
+
+    def _schedule_encoding(self, path: Path, audio_format: str):
+        """Start a background encode for replays; a failure never fails the turn"""
+        try:
+            schedule_encoding(path, audio_format)
+        except Exception as e:
+            logger.warning("session.encode_schedule_failed",
+                          session_id=self.session_id,
+                          path=path.name,
+                          format=audio_format,
+                          error=str(e))
+
     def add_audio_chunk(self, data_b64: str):
         """
-        Add audio chunk to buffer with limits checking
+        Add a base64 audio chunk from a JSON audio_chunk message
+
+        Raises:
+            RuntimeError: Invalid base64 or buffer limit exceeded
+        """
+        try:
+            audio_bytes = base64.b64decode(data_b64)
+        except base64.binascii.Error as e:
+            logger.error("session.audio_decode_failed",
+                        session_id=self.session_id,
+                        error=str(e))
+            raise RuntimeError(f"Invalid base64 audio data: {e}") from e
+
+        self._append_audio(audio_bytes)
+
+    def add_audio_frame(self, data: bytes):
+        """
+        Add a binary audio frame (header + raw payload, see core.audio_frames)
+
+        Raises:
+            AudioFrameError: Malformed, out-of-sequence or codec-changing frame
+            RuntimeError: Buffer limit exceeded
+        """
+        frame = parse_audio_frame(data)
+        self.audio_buffer.check_frame(frame)
+
+        if self._transcriber is not None:
+            self._transcriber.audio_format = self.audio_buffer.audio_format
+
+        self._append_audio(frame.payload)
+
+        if frame.codec == CODEC_PCM16:
+            samples = np.frombuffer(frame.payload[:len(frame.payload) & ~1], dtype="<i2")
+            if len(samples):
+                rms = np.sqrt(np.mean(np.square(samples, dtype=np.float64))) / 32768
+                if rms >= config.BARGE_IN_MIN_RMS:
+                    self._voiced_ms += len(samples) * 1000 / 16000
+
+    def _append_audio(self, audio_bytes: bytes):
+        """
+        Add audio to buffer with limits checking
 
         Prevents memory leaks and DoS attacks by enforcing:
         - Maximum buffer size (10MB)
@@ -92,88 +355,250 @@ class ConversationSession:
         Raises:
             RuntimeError: Buffer limit exceeded
         """
-        try:
-            audio_bytes = base64.b64decode(data_b64)
-            chunk_size = len(audio_bytes)
-
-            # Track first chunk time for timeout detection
-            if self.buffer_first_chunk_time is None:
-                self.buffer_first_chunk_time = time.time()
-
-            # Check 1: Chunk count limit
-            if len(self.audio_buffer) >= MAX_CHUNK_COUNT:
-                logger.error("session.buffer.chunk_limit_exceeded",
-                            session_id=self.session_id,
-                            chunk_count=len(self.audio_buffer),
-                            limit=MAX_CHUNK_COUNT)
-                raise RuntimeError(
-                    f"Buffer chunk limit exceeded: {len(self.audio_buffer)} >= {MAX_CHUNK_COUNT}"
-                )
-
-            # Check 2: Size limit
-            if self.buffer_size_bytes + chunk_size > MAX_BUFFER_SIZE_BYTES:
-                logger.error("session.buffer.size_limit_exceeded",
-                            session_id=self.session_id,
-                            buffer_size_mb=round(self.buffer_size_bytes / 1024 / 1024, 2),
-                            chunk_size_kb=round(chunk_size / 1024, 2),
-                            limit_mb=round(MAX_BUFFER_SIZE_BYTES / 1024 / 1024, 2))
-                raise RuntimeError(
-                    f"Buffer size limit exceeded: "
-                    f"{self.buffer_size_bytes + chunk_size} > {MAX_BUFFER_SIZE_BYTES}"
-                )
+        chunk_size = len(audio_bytes)
 
-            # Check 3: Timeout
-            elapsed = time.time() - self.buffer_first_chunk_time
-            if elapsed > BUFFER_TIMEOUT_SECONDS:
-                logger.error("session.buffer.timeout",
-                            session_id=self.session_id,
-                            elapsed_sec=round(elapsed, 2),
-                            timeout_sec=BUFFER_TIMEOUT_SECONDS)
-                raise RuntimeError(
-                    f"Buffer timeout: {elapsed:.2f}s > {BUFFER_TIMEOUT_SECONDS}s"
-                )
+        # Track first chunk time for timeout detection
+        if self.buffer_first_chunk_time is None:
+            self.buffer_first_chunk_time = time.time()
 
-            # All checks passed, add to buffer
-            self.audio_buffer.append(audio_bytes)
-            self.buffer_size_bytes += chunk_size
+        # Check 1: Chunk count limit
+        if self.audio_buffer.chunk_count >= MAX_CHUNK_COUNT:
+            logger.error("session.buffer.chunk_limit_exceeded",
+                        session_id=self.session_id,
+                        chunk_count=self.audio_buffer.chunk_count,
+                        limit=MAX_CHUNK_COUNT)
+            raise RuntimeError(
+                f"Buffer chunk limit exceeded: {self.audio_buffer.chunk_count} >= {MAX_CHUNK_COUNT}"
+            )
 
-            logger.debug("session.audio_chunk",
+        # Check 2: Size limit
+        if self.buffer_size_bytes + chunk_size > MAX_BUFFER_SIZE_BYTES:
+            logger.error("session.buffer.size_limit_exceeded",
                         session_id=self.session_id,
-                        chunk_size=chunk_size,
-                        total_chunks=len(self.audio_buffer),
-                        total_size_kb=round(self.buffer_size_bytes / 1024, 2))
+                        buffer_size_mb=round(self.buffer_size_bytes / 1024 / 1024, 2),
+                        chunk_size_kb=round(chunk_size / 1024, 2),
+                        limit_mb=round(MAX_BUFFER_SIZE_BYTES / 1024 / 1024, 2))
+            raise RuntimeError(
+                f"Buffer size limit exceeded: "
+                f"{self.buffer_size_bytes + chunk_size} > {MAX_BUFFER_SIZE_BYTES}"
+            )
 
-        except base64.binascii.Error as e:
-            logger.error("session.audio_decode_failed",
+        # Check 3: Timeout
+        elapsed = time.time() - self.buffer_first_chunk_time
+        if elapsed > BUFFER_TIMEOUT_SECONDS:
+            logger.error("session.buffer.timeout",
                         session_id=self.session_id,
-                        error=str(e))
-            raise RuntimeError(f"Invalid base64 audio data: {e}") from e
+                        elapsed_sec=round(elapsed, 2),
+                        timeout_sec=BUFFER_TIMEOUT_SECONDS)
+            raise RuntimeError(
+                f"Buffer timeout: {elapsed:.2f}s > {BUFFER_TIMEOUT_SECONDS}s"
+            )
+
+        # All checks passed, add to buffer
+        self.audio_buffer.append(audio_bytes)
+        self.buffer_size_bytes += chunk_size
+
+        if self._transcriber is not None:
+            self._transcriber.feed(audio_bytes)
+
+        logger.debug("session.audio_chunk",
+                    session_id=self.session_id,
+                    chunk_size=chunk_size,
+                    total_chunks=self.audio_buffer.chunk_count,
+                    total_size_kb=round(self.buffer_size_bytes / 1024, 2))
+
+    async def ensure_streaming_stt(self):
+        """Create the streaming transcriber for the current turn (no-op if running)"""
+        from avatar.services.stt import get_stt_service
+        from avatar.services.stt_streaming import StreamingTranscriber
+
+        if self._transcriber is not None:
+            return
+
+        stt = await get_stt_service()
+        self._transcriber = StreamingTranscriber(
+            stt,
+            on_partial=self._send_partial_transcription
+        )
+
+    async def _send_partial_transcription(self, stable_text: str, text: str):
+        """Send a partial transcription as its stable prefix grows"""
+        from avatar.models.messages import TranscriptionMessage
+
+        trans_msg = TranscriptionMessage(
+            text=text,
+            session_id=self.session_id,
+        )
+        trans_data = trans_msg.model_dump(mode="json")
+        trans_data["is_partial"] = True
+        trans_data["stable_text"] = stable_text
+        await self.websocket.send_text(json.dumps(trans_data))
+
+    async def reset_audio_buffer(self):
+        """Clear buffered audio and any in-progress streaming transcription"""
+        turn_audio = self._take_turn_audio()
+        if turn_audio.transcriber is not None:
+            await turn_audio.transcriber.cancel()
+
+    def _take_turn_audio(self) -> TurnAudio:
+        """
+        Hand the buffered audio (and its transcriber) over and start an empty buffer
+
+        Audio received while the turn runs goes to the new buffer, so it is
+        kept for the next turn and its frame sequence continues from 0.
+        """
+        turn_audio = TurnAudio(
+            data=self.audio_buffer.getvalue(),
+            audio_format=self.audio_buffer.audio_format,
+            codec=self.audio_buffer.codec,
+            transcriber=self._transcriber,
+        )
+        self.audio_buffer.clear()
+        self.buffer_size_bytes = 0
+        self.buffer_first_chunk_time = None
+        self._voiced_ms = 0.0
+        self._transcriber = None
+        return turn_audio
+
+    @property
+    def turn_active(self) -> bool:
+        """A turn is being processed (or about to start)"""
+        return self._turn_task is not None and not self._turn_task.done()
+
+    async def start_turn(self):
+        """
+        Process the buffered audio as a background task
+
+        The receive loop keeps running meanwhile, so the turn can be
+        interrupted by the client.
+        """
+        if self.turn_active:
+            await self.send_error("Already processing a request", "ALREADY_PROCESSING")
+            return
+
+        # Taken synchronously: nothing received after audio_end can slip in
+        turn_audio = self._take_turn_audio()
+        self._turn_task = asyncio.create_task(self.process_audio(turn_audio))
+        self._turn_task.add_done_callback(self._on_turn_done)
+
+    def _on_turn_done(self, task: asyncio.Task):
+        """Log failures that escaped process_audio (e.g. the socket closed mid-send)"""
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("session.turn_failed",
+                          session_id=self.session_id,
+                          error=str(task.exception()))
+
+    async def cancel_turn(self) -> bool:
+        """
+        Cancel the turn in progress and wait for its cleanup
+
+        Cancellation reaches whatever stage is running: the LLM stream is
+        closed (aborting the vLLM request), the streaming TTS task is
+        cancelled with its queued sentences, and stage slots are released.
+
+        Returns:
+            True if a turn was cancelled
+        """
+        task = self._turn_task
+        if task is None or task.done():
+            return False
+
+        task.cancel()
+        await asyncio.wait({task})
+        return True
+
+    async def close(self):
+        """Stop background work left by the connection (summary, transcriber)"""
+        if self._summary_task is not None and not self._summary_task.done():
+            self._summary_task.cancel()
+            await asyncio.wait({self._summary_task})
+        await self.reset_audio_buffer()
+
+    async def on_speech(self):
+        """New user audio arrived: barge in on the current turn once it is speech"""
+        if config.BARGE_IN_ENABLED and self.turn_active and self._heard_speech():
+            await self.interrupt("speech")
+
+    def _heard_speech(self) -> bool:
+        """
+        Enough speech buffered to barge in (AVATAR_BARGE_IN_MIN_SPEECH_MS)
+
+        PCM16 frames are gated on energy; encoded chunks cannot be measured
+        without decoding, so they must keep arriving for the same duration.
+        """
+        if self.audio_buffer.codec == CODEC_PCM16:
+            return self._voiced_ms >= config.BARGE_IN_MIN_SPEECH_MS
+        if self.buffer_first_chunk_time is None:
+            return False
+        return (time.time() - self.buffer_first_chunk_time) * 1000 >= config.BARGE_IN_MIN_SPEECH_MS
+
+    async def interrupt(self, reason: str):
+        """
+        Stop the current turn and tell the client to drop pending audio
+
+        Args:
+            reason: "client" (interrupt message) or "speech" (barge-in)
+        """
+        if not await self.cancel_turn():
+            return
 
-    async def process_audio(self):
+        logger.info("session.interrupted",
+                   session_id=self.session_id,
+                   turn=self.turn_number,
+                   reason=reason)
+        await self.send_status("Interrupted", "interrupted")
+
+    async def process_audio(self, turn_audio: Optional[TurnAudio] = None):
         """
         Process accumulated audio through AI pipeline
 
         Pipeline: Audio → STT → LLM → TTS → Client
+
+        Each stage waits for its own slot in the session queue and releases
+        it when done, so the GPUs are shared between turns, not connections.
+
+        Args:
+            turn_audio: Audio taken from the buffer when the turn started
+                (default: take it now)
         """
+        from avatar.core.session_queue import AdmissionRejected
+
         if self.is_processing:
             await self.send_error("Already processing a request", "ALREADY_PROCESSING")
             return
 
-        if not self.audio_buffer:
+        if turn_audio is None:
+            turn_audio = self._take_turn_audio()
+
+        if not turn_audio.data:
+            if turn_audio.transcriber is not None:
+                await turn_audio.transcriber.cancel()
             await self.send_error("No audio data received", "NO_AUDIO_DATA")
             return
 
         self.is_processing = True
         self.turn_number += 1
+        self._tts_frame_sequence = 0
 
-        try:
-            # Save audio to file
-            await self.send_status("Saving audio...", "stt")
-            audio_path = await self._save_audio()
+        use_hq = self.tts_mode == "hq"
+        if use_hq and not config.TTS_ENABLE_HQ_MODE:
+            logger.warning("session.tts_hq.disabled", session_id=self.session_id)
+            use_hq = False
 
-            # Step 1: STT - Transcribe audio
+        try:
+            # Step 1: STT - Transcribe audio decoded in memory
+            # Disk writes run in the background and never block the pipeline
             await self.send_status("Transcribing speech...", "stt")
-            transcription = await self._run_stt(audio_path)
+            async with self._stage("stt"):
+                if turn_audio.transcriber is not None:
+                    # Streaming mode: only the uncommitted tail is left to decode
+                    transcription, samples = await self._finish_streaming_stt(turn_audio.transcriber)
+                else:
+                    samples = await self._decode_audio(turn_audio)
+                    transcription = None
+                self._start_persist(turn_audio, samples)
+                if transcription is None:
+                    transcription = await self._run_stt(samples)
 
             # Send transcription to client
             from avatar.models.messages import TranscriptionMessage
@@ -183,9 +608,32 @@ class ConversationSession:
             )
             await self.websocket.send_text(trans_msg.model_dump_json())
 
+            # Self-cloning TTS needs the user's audio as a WAV reference
+            ref_audio_path = None
+            if not self.voice_profile_id:
+                ref_audio_path = await self._reference_audio_path(samples)
+
             # Step 2: LLM - Generate response
+            # In streaming mode, TTS consumes sentences while the LLM generates
             await self.send_status("Thinking...", "llm")
-            llm_response = await self._run_llm(transcription)
+
+            sentence_queue: Optional[asyncio.Queue] = None
+            tts_task: Optional[asyncio.Task] = None
+            if self.stream_tts and not use_hq:
+                sentence_queue = asyncio.Queue()
+                tts_task = asyncio.create_task(self._run_tts_stream(
+                    sentence_queue,
+                    user_audio_path=ref_audio_path,
+                    user_text=transcription
+                ))
+
+            try:
+                async with self._stage("llm"):
+                    llm_response = await self._run_llm(transcription, sentence_queue)
+            except BaseException:
+                if tts_task is not None:
+                    tts_task.cancel()
+                raise
 
             # Send LLM response to client
             from avatar.models.messages import LLMResponseMessage
@@ -198,114 +646,218 @@ class ConversationSession:
 
             # Step 3: TTS - Synthesize speech
             await self.send_status("Synthesizing speech...", "tts")
-            tts_url = await self._run_tts(
-                text=llm_response,
-                user_audio_path=audio_path,
-                user_text=transcription
-            )
-
-            # Send TTS ready notification
-            from avatar.models.messages import TTSReadyMessage
-            tts_msg = TTSReadyMessage(
-                audio_url=tts_url,
-                audio_format="wav",
-                mode="fast",
-                session_id=self.session_id,
-            )
-            await self.websocket.send_text(tts_msg.model_dump_json())
+            if tts_task is not None:
+                # Chunks were already sent; this is the archived full utterance
+                tts_url = await tts_task
+                # Replays are served in the client's format; encode ahead of them
+                self._schedule_encoding(
+                    config.AUDIO_TTS_FAST / tts_url.rsplit("/", 1)[-1],
+                    choose_format(self.accept_formats)
+                )
+            elif use_hq:
+                # Chunks are sent while CosyVoice generates; this is the full utterance
+                async with self._stage("tts_hq"):
+                    tts_url = await self._run_tts_hq(
+                        text=llm_response,
+                        user_audio_path=ref_audio_path,
+                        user_text=transcription
+                    )
+                self._schedule_encoding(
+                    config.AUDIO_TTS_HQ / tts_url.rsplit("/", 1)[-1],
+                    choose_format(self.accept_formats)
+                )
+            else:
+                async with self._stage("tts_fast"):
+                    tts_url = await self._run_tts(
+                        text=llm_response,
+                        user_audio_path=ref_audio_path,
+                        user_text=transcription
+                    )
+                await self.deliver_tts(tts_url)
 
             # Final status
             await self.send_status("Ready", "ready")
 
             # Save conversation to database
             await self._save_conversation(
-                user_audio_path=str(audio_path),
+                user_audio_path=await self._persisted_audio_path(),
                 user_text=transcription,
                 ai_text=llm_response,
-                ai_audio_fast_path=tts_url,
+                ai_audio_fast_path=None if use_hq else tts_url,
+                ai_audio_hq_path=tts_url if use_hq else None,
             )
 
+        except AdmissionRejected as e:
+            logger.warning("session.stage_rejected",
+                          session_id=self.session_id,
+                          stage=e.service_type,
+                          reason=e.reason)
+            await self.send_error("Server is busy. Please try again later.", "SERVER_BUSY")
+
         except Exception as e:
             logger.exception("session.processing_failed", session_id=self.session_id)
             await self.send_error(f"Processing failed: {str(e)}", "PROCESSING_ERROR")
 
         finally:
             self.is_processing = False
-            self.audio_buffer.clear()
-            # Reset buffer tracking variables
-            self.buffer_size_bytes = 0
-            self.buffer_first_chunk_time = None
+            self._persist_task = None
+            # Only this turn's audio: anything received meanwhile belongs to the next turn
+            if turn_audio.transcriber is not None:
+                await turn_audio.transcriber.cancel()
 
-    async def _save_audio(self) -> Path:
+    def _stage(self, service_type: str):
+        """Slot of one pipeline stage, held only while the stage runs"""
+        from avatar.core.session_queue import get_session_queue
+
+        return get_session_queue().stage(
+            self.session_id, service_type, timeout=config.STAGE_QUEUE_TIMEOUT
+        )
+
+    async def _decode_audio(self, turn_audio: TurnAudio) -> np.ndarray:
         """
-        Save buffered audio and convert to WAV 16kHz mono
+        Decode the turn's audio in memory to float32 16kHz mono
 
         Browsers typically send WebM/Opus format, but Whisper requires
-        WAV PCM 16kHz mono. This method handles the conversion automatically.
+        PCM 16kHz mono. The upload is decoded straight from memory and
+        handed to Whisper as an array, with no file round-trip.
 
         Returns:
-            Path to converted WAV file
+            Decoded samples
 
         Raises:
-            RuntimeError: Audio conversion failed
+            RuntimeError: Audio decoding failed
         """
-        from avatar.core.audio_utils import convert_to_wav_async
+        from avatar.core.audio_utils import decode_audio_bytes_async
 
-        audio_data = b"".join(self.audio_buffer)
+        audio_data = turn_audio.data
 
-        # Step 1: Save raw audio from browser (WebM/Opus/etc.)
-        raw_filename = f"{self.session_id}_turn{self.turn_number}_{uuid.uuid4().hex[:8]}.webm"
-        raw_path = config.AUDIO_RAW / raw_filename
-        raw_path.write_bytes(audio_data)
+        try:
+            samples = await decode_audio_bytes_async(
+                audio_data,
+                target_sample_rate=16000,
+                format=turn_audio.audio_format
+            )
+        except Exception as e:
+            logger.error("session.audio.decode_failed",
+                        session_id=self.session_id,
+                        size_bytes=len(audio_data),
+                        error=str(e))
+            raise RuntimeError(f"Audio conversion failed: {e}") from e
 
-        logger.info("session.audio.raw_saved",
+        logger.info("session.audio.decoded",
                    session_id=self.session_id,
-                   path=str(raw_path),
-                   size_bytes=len(audio_data))
+                   size_bytes=len(audio_data),
+                   duration_sec=round(len(samples) / 16000, 2))
 
-        # Step 2: Convert to WAV 16kHz mono for Whisper
-        wav_filename = f"{self.session_id}_turn{self.turn_number}_{uuid.uuid4().hex[:8]}.wav"
-        wav_path = config.AUDIO_RAW / wav_filename
+        return samples
 
-        try:
-            converted_path, metadata = await convert_to_wav_async(
-                input_path=raw_path,
-                output_path=wav_path,
-                target_sample_rate=16000,
-                target_channels=1
-            )
+    def _user_audio_paths(self) -> tuple[Path, Path]:
+        """Raw and WAV paths for the current turn's user audio"""
+        stem = f"{self.session_id}_turn{self.turn_number}_{uuid.uuid4().hex[:8]}"
+        return config.AUDIO_RAW / f"{stem}.webm", config.AUDIO_RAW / f"{stem}.wav"
 
-            logger.info("session.audio.converted",
-                       session_id=self.session_id,
-                       raw_path=str(raw_path),
-                       wav_path=str(converted_path),
-                       duration_sec=metadata["converted_duration_sec"],
-                       compression_ratio=metadata["compression_ratio"])
+    def _start_persist(self, turn_audio: TurnAudio, samples: np.ndarray):
+        """Start writing the user's audio to disk in the background (if enabled)"""
+        if not config.PERSIST_USER_AUDIO:
+            return
 
-            # Clean up raw file (optional, to save disk space)
-            # raw_path.unlink(missing_ok=True)
+        raw_path, wav_path = self._user_audio_paths()
+        if turn_audio.codec == CODEC_PCM16:
+            raw_path = None  # Raw PCM holds nothing the WAV does not
+        self._persist_task = asyncio.create_task(
+            self._persist_audio(turn_audio.data, samples, wav_path, raw_path)
+        )
 
-            return converted_path
+    async def _persist_audio(
+        self,
+        audio_data: bytes,
+        samples: np.ndarray,
+        wav_path: Path,
+        raw_path: Optional[Path]
+    ) -> Optional[Path]:
+        """
+        Write user audio to disk (runs as a background task)
+
+        Args:
+            audio_data: Raw upload from browser (WebM/Opus/etc.)
+            samples: Decoded 16kHz mono samples
+            wav_path: Output WAV path (also the self-cloning TTS reference)
+            raw_path: Output path for the raw upload (None to skip)
 
+        Returns:
+            Path to WAV file, or None if writing failed
+        """
+        from avatar.core.audio_utils import save_wav
+
+        def _write_blocking() -> Path:
+            if raw_path is not None:
+                raw_path.parent.mkdir(parents=True, exist_ok=True)
+                raw_path.write_bytes(audio_data)
+            return save_wav(samples, wav_path, sample_rate=16000)
+
+        loop = asyncio.get_event_loop()
+
+        try:
+            await loop.run_in_executor(None, _write_blocking)
         except Exception as e:
-            logger.error("session.audio.conversion_failed",
+            # Archive failure must not break the conversation
+            logger.error("session.audio.persist_failed",
                         session_id=self.session_id,
-                        raw_path=str(raw_path),
+                        wav_path=str(wav_path),
                         error=str(e))
-            raise RuntimeError(f"Audio conversion failed: {e}") from e
+            return None
+
+        logger.info("session.audio.persisted",
+                   session_id=self.session_id,
+                   raw_path=str(raw_path) if raw_path else None,
+                   wav_path=str(wav_path))
+
+        return wav_path
+
+    async def _reference_audio_path(self, samples: np.ndarray) -> Path:
+        """
+        WAV of the user's audio for self-cloning TTS
+
+        Waits for the background persist task (usually done during STT), or
+        writes the WAV on demand when persistence is disabled.
+
+        Raises:
+            RuntimeError: WAV could not be written
+        """
+        if self._persist_task is None:
+            _, wav_path = self._user_audio_paths()
+            self._persist_task = asyncio.create_task(
+                self._persist_audio(b"", samples, wav_path, raw_path=None)
+            )
+
+        wav_path = await self._persist_task
+        if wav_path is None:
+            raise RuntimeError("Failed to write reference audio for self-cloning TTS")
 
-    async def _run_stt(self, audio_path: Path) -> str:
-        """Run speech-to-text on audio file using Whisper"""
+        return wav_path
+
+    async def _persisted_audio_path(self) -> str:
+        """Path of the persisted user audio for the database ('' if not kept)"""
+        if self._persist_task is None:
+            return ""
+
+        wav_path = await self._persist_task
+        return str(wav_path) if wav_path else ""
+
+    async def _run_stt(self, samples: np.ndarray) -> str:
+        """Run speech-to-text on in-memory audio using Whisper"""
         from avatar.services.stt import get_stt_service
 
-        logger.info("session.stt.start", session_id=self.session_id, audio_path=str(audio_path))
+        logger.info("session.stt.start",
+                   session_id=self.session_id,
+                   duration_sec=round(len(samples) / 16000, 2))
 
         # Get STT service (singleton)
         stt = await get_stt_service()
 
         # Transcribe audio (auto language detection)
         text, metadata = await stt.transcribe(
-            audio_path=audio_path,
+            audio_path=samples,
             language=None,  # Auto-detect
             beam_size=5,
             vad_filter=True
@@ -320,7 +872,30 @@ class ConversationSession:
 
         return text
 
-    async def _run_llm(self, user_text: str) -> str:
+    async def _finish_streaming_stt(self, transcriber) -> tuple[str, np.ndarray]:
+        """
+        Finish streaming transcription started during audio upload
+
+        Returns:
+            Tuple of (text, decoded 16kHz samples of the whole turn)
+        """
+        text, metadata = await transcriber.finish()
+
+        logger.info("session.stt.complete",
+                   session_id=self.session_id,
+                   text=text,
+                   language=metadata["language"],
+                   duration_sec=metadata["duration"],
+                   passes=metadata["passes"],
+                   tail_latency_sec=metadata["tail_latency_sec"])
+
+        return text, transcriber.samples
+
+    async def _run_llm(
+        self,
+        user_text: str,
+        sentence_queue: Optional[asyncio.Queue] = None
+    ) -> str:
         """
         Generate LLM response using vLLM with streaming
 
@@ -329,10 +904,13 @@ class ConversationSession:
 
         Args:
             user_text: User's input text
+            sentence_queue: If given, completed sentences are put here as they
+                            stream in, followed by a None sentinel (streaming TTS)
 
         Returns:
             Complete LLM response text
         """
+        from avatar.core.sentence_splitter import SentenceSplitter
         from avatar.services.llm import get_llm_service
         from avatar.models.messages import LLMResponseMessage
 
@@ -341,38 +919,79 @@ class ConversationSession:
         # Get LLM service (singleton)
         llm = await get_llm_service()
 
-        # Format as chat messages
-        messages = [{"role": "user", "content": user_text}]
+        # Count history tokens with the model's own tokenizer once it is available
+        if not self.memory.has_tokenizer and hasattr(llm, "get_tokenizer"):
+            tokenizer = await llm.get_tokenizer()
+            self.memory.set_token_counter(token_counter_from_tokenizer(tokenizer))
+
+        # Previous turns first (stable prefix), then the new message
+        messages = self.memory.build_messages(user_text)
 
         # Stream response chunks to client
         full_response = ""
         chunk_count = 0
+        splitter = SentenceSplitter(
+            min_chars=config.TTS_STREAM_MIN_CHARS,
+            max_chars=config.TTS_STREAM_MAX_CHARS
+        ) if sentence_queue is not None else None
 
-        async for chunk in llm.chat_stream(
+        # aclosing: an interrupted turn closes the stream, which aborts the request
+        async with aclosing(llm.chat_stream(
             messages=messages,
             max_tokens=512,
             temperature=0.7
-        ):
-            full_response += chunk
-            chunk_count += 1
-
-            # Send intermediate chunk to client
-            chunk_msg = LLMResponseMessage(
-                text=chunk,
-                is_final=False,
-                session_id=self.session_id
-            )
-            await self.websocket.send_text(chunk_msg.model_dump_json())
+        )) as stream:
+            async for chunk in stream:
+                full_response += chunk
+                chunk_count += 1
+
+                # Send intermediate chunk to client
+                chunk_msg = LLMResponseMessage(
+                    text=chunk,
+                    is_final=False,
+                    session_id=self.session_id
+                )
+                await self.websocket.send_text(chunk_msg.model_dump_json())
+
+                if splitter is not None:
+                    for sentence in splitter.feed(chunk):
+                        sentence_queue.put_nowait(sentence)
+
+        if splitter is not None:
+            for sentence in splitter.flush():
+                sentence_queue.put_nowait(sentence)
+            sentence_queue.put_nowait(None)  # End of stream
 
         logger.info("session.llm.complete",
                    session_id=self.session_id,
                    response_length=len(full_response),
                    chunks_sent=chunk_count,
-                   prompt_length=len(user_text))
+                   prompt_length=len(user_text),
+                   history_turns=len(self.memory.turns),
+                   history_tokens=self.memory.history_tokens)
+
+        full_response = full_response.strip()
+        self._remember_turn(llm, user_text, full_response)
+
+        return full_response
+
+    def _remember_turn(self, llm, user_text: str, response: str):
+        """Add the turn to memory; summarize evicted turns in the background"""
+        evicted = self.memory.add_turn(user_text, response)
+
+        if evicted and config.LLM_HISTORY_SUMMARIZE and hasattr(llm, "chat"):
+            async def chat(messages):
+                return await llm.chat(messages, max_tokens=SUMMARY_MAX_TOKENS, temperature=0.3)
 
-        return full_response.strip()
+            self._summary_task = asyncio.create_task(self.memory.summarize(evicted, chat))
 
-    async def _run_tts(self, text: str, user_audio_path: Optional[Path] = None, user_text: Optional[str] = None) -> str:
+    async def _run_tts(
+        self,
+        text: str,
+        user_audio_path: Optional[Path] = None,
+        user_text: Optional[str] = None,
+        filename: Optional[str] = None
+    ) -> str:
         """
         Synthesize speech from text using F5-TTS
 
@@ -384,11 +1003,13 @@ class ConversationSession:
             text: Text to synthesize
             user_audio_path: Path to user's audio (for self-cloning fallback)
             user_text: User's transcribed text (for self-cloning fallback)
+            filename: Output filename in AUDIO_TTS_FAST (default: per-turn name)
 
         Returns:
-            URL to synthesized audio file
+            URL to synthesized audio file (always the turn's own file)
         """
         from avatar.services.tts import get_tts_service
+        from avatar.services.tts_phrase_cache import get_tts_phrase_cache, profile_name
 
         logger.info("session.tts.start",
                    session_id=self.session_id,
@@ -399,21 +1020,25 @@ class ConversationSession:
         tts = await get_tts_service()
 
         # Output file path
-        filename = f"{self.session_id}_turn{self.turn_number}_tts.wav"
+        filename = filename or f"{self.session_id}_turn{self.turn_number}_tts.wav"
         output_path = config.AUDIO_TTS_FAST / filename
 
         try:
             if self.voice_profile_id:
-                # Mode 1: Use voice profile
-                # TODO: Query database for voice_profile_name
-                # For now, use placeholder
-                voice_profile_name = f"profile_{self.voice_profile_id}"
+                # Mode 1: Use voice profile (same name as the phrase cache warm-up)
+                voice_profile_name = profile_name(self.voice_profile_id)
 
-                await tts.synthesize_fast(
-                    text=text,
-                    voice_profile_name=voice_profile_name,
-                    output_path=output_path
-                )
+                if config.TTS_PHRASE_CACHE_ENABLED:
+                    # Repeated short phrases are copied from the cache
+                    await get_tts_phrase_cache().synthesize_fast(
+                        tts, text, voice_profile_name, output_path
+                    )
+                else:
+                    await tts.synthesize_fast(
+                        text=text,
+                        voice_profile_name=voice_profile_name,
+                        output_path=output_path
+                    )
 
                 logger.info("session.tts.complete",
                            session_id=self.session_id,
@@ -451,7 +1076,7 @@ class ConversationSession:
             raise RuntimeError(f"Voice profile not found: {e}") from e
 
         # Return audio URL
-        audio_url = f"/api/audio/tts/{filename}"
+        audio_url = f"/api/audio/tts/{output_path.name}"
 
         logger.info("session.tts.complete",
                    session_id=self.session_id,
@@ -460,12 +1085,156 @@ class ConversationSession:
 
         return audio_url
 
+    async def _run_tts_stream(
+        self,
+        sentence_queue: asyncio.Queue,
+        user_audio_path: Optional[Path] = None,
+        user_text: Optional[str] = None
+    ) -> str:
+        """
+        Synthesize sentences from the LLM stream one by one (streaming TTS)
+
+        Runs concurrently with _run_llm. Each sentence is synthesized into its
+        own chunk file and announced immediately with a sequence number, so the
+        client can start playback while the LLM is still generating.
+
+        Args:
+            sentence_queue: Sentences from _run_llm, terminated by None
+            user_audio_path: Path to user's audio (for self-cloning fallback)
+            user_text: User's transcribed text (for self-cloning fallback)
+
+        Returns:
+            URL of the concatenated full utterance (for conversation archive)
+        """
+        from avatar.core.audio_utils import concat_wav_files_async
+
+        chunk_paths: list[Path] = []
+        stream_start = time.time()
+
+        while True:
+            sentence = await sentence_queue.get()
+            if sentence is None:
+                break
+
+            sequence = len(chunk_paths)
+            filename = f"{self.session_id}_turn{self.turn_number}_tts_{sequence:03d}.wav"
+
+            async with self._stage("tts_fast"):
+                chunk_url = await self._run_tts(
+                    text=sentence,
+                    user_audio_path=user_audio_path,
+                    user_text=user_text,
+                    filename=filename
+                )
+            chunk_paths.append(config.AUDIO_TTS_FAST / filename)
+
+            await self.deliver_tts(chunk_url, sequence=sequence)
+
+            if sequence == 0:
+                logger.info("session.tts_stream.first_chunk",
+                           session_id=self.session_id,
+                           latency_sec=round(time.time() - stream_start, 3),
+                           text_length=len(sentence))
+
+        if not chunk_paths:
+            raise RuntimeError("LLM returned no text to synthesize")
+
+        # Archive the whole utterance as one file (client already has the chunks)
+        filename = f"{self.session_id}_turn{self.turn_number}_tts.wav"
+        await concat_wav_files_async(chunk_paths, config.AUDIO_TTS_FAST / filename)
+
+        logger.info("session.tts_stream.complete",
+                   session_id=self.session_id,
+                   chunks=len(chunk_paths),
+                   total_sec=round(time.time() - stream_start, 3))
+
+        return f"/api/audio/tts/{filename}"
+
+    async def _run_tts_hq(
+        self,
+        text: str,
+        user_audio_path: Optional[Path] = None,
+        user_text: Optional[str] = None
+    ) -> str:
+        """
+        Synthesize with CosyVoice2 (HQ mode), sending each chunk as it arrives
+
+        Chunks are delivered with a sequence number like sentences in
+        streaming TTS mode, so playback starts after the first chunk instead
+        of after the whole reply. Chunk files stay in AUDIO_TTS_HQ, since the
+        client may fetch them by URL.
+
+        Args:
+            text: Text to synthesize (full LLM response)
+            user_audio_path: Path to user's audio (for self-cloning fallback)
+            user_text: User's transcribed text (for self-cloning fallback)
+
+        Returns:
+            URL of the full utterance (for conversation archive)
+        """
+        from avatar.services.tts_hq import get_tts_hq_service
+        from avatar.services.tts_phrase_cache import profile_name
+
+        hq = get_tts_hq_service()
+        output_path = config.AUDIO_TTS_HQ / f"{self.session_id}_turn{self.turn_number}_tts_hq.wav"
+
+        if self.voice_profile_id:
+            stream = hq.synthesize_hq_stream(
+                text=text,
+                voice_profile_name=profile_name(self.voice_profile_id),
+                output_path=output_path,
+                keep_chunks=True
+            )
+        elif user_audio_path and user_text:
+            stream = hq.synthesize_stream(
+                text=text,
+                ref_audio_path=user_audio_path,
+                ref_text=user_text,
+                output_path=output_path,
+                keep_chunks=True
+            )
+        else:
+            raise RuntimeError(
+                "TTS requires either voice_profile_id or user audio for reference"
+            )
+
+        logger.info("session.tts_hq.start",
+                   session_id=self.session_id,
+                   text_length=len(text),
+                   has_voice_profile=self.voice_profile_id is not None)
+
+        stream_start = time.time()
+        sequence = 0
+        try:
+            async with aclosing(stream) as chunks:
+                async for chunk_path in chunks:
+                    await self.deliver_tts(f"/api/audio/tts/{chunk_path.name}", sequence=sequence, mode="hq")
+
+                    if sequence == 0:
+                        logger.info("session.tts_hq.first_chunk",
+                                   session_id=self.session_id,
+                                   latency_sec=round(time.time() - stream_start, 3))
+                    sequence += 1
+        except FileNotFoundError as e:
+            logger.error("session.tts.profile_not_found",
+                        session_id=self.session_id,
+                        error=str(e))
+            raise RuntimeError(f"Voice profile not found: {e}") from e
+
+        logger.info("session.tts_hq.complete",
+                   session_id=self.session_id,
+                   chunks=sequence,
+                   total_sec=round(time.time() - stream_start, 3))
+
+        return f"/api/audio/tts/{output_path.name}"
+
     async def _save_conversation(
         self,
         user_audio_path: str,
         user_text: str,
         ai_text: str,
-        ai_audio_fast_path: str,
+        ai_audio_fast_path: Optional[str],
+        ai_audio_hq_path: Optional[str] = None,
     ):
         """Save conversation turn to database"""
         try:
@@ -476,6 +1245,7 @@ class ConversationSession:
                 user_text=user_text,
                 ai_text=ai_text,
                 ai_audio_fast_path=ai_audio_fast_path,
+                ai_audio_hq_path=ai_audio_hq_path,
                 voice_profile_id=self.voice_profile_id,
             )
             logger.info("session.db.saved",
@@ -493,14 +1263,15 @@ async def websocket_endpoint(websocket: WebSocket):
     WebSocket endpoint handler for /ws/chat
 
     Manages the full lifecycle of a conversation session.
-    Includes VRAM monitoring and concurrency control.
+    The connection only takes a connection slot (AVATAR_MAX_CONNECTIONS);
+    GPU capacity is admitted per pipeline stage in process_audio().
     """
     from avatar.core.session_manager import get_session_manager
 
     # Generate session ID before accepting connection
     session_id = str(uuid.uuid4())
 
-    # Try to acquire session slot (with VRAM check)
+    # Try to acquire connection slot (with VRAM check)
     session_manager = get_session_manager()
 
     if not await session_manager.acquire_session(session_id, timeout=1.0):
@@ -529,8 +1300,26 @@ async def websocket_endpoint(websocket: WebSocket):
 
     try:
         while True:
-            # Receive message from client
-            raw_message = await websocket.receive_text()
+            # Receive message from client: binary audio frame or JSON text
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+
+            if message.get("bytes") is not None:
+                try:
+                    if session.stream_stt:
+                        await session.ensure_streaming_stt()
+                    session.add_audio_frame(message["bytes"])
+                    await session.on_speech()
+                except AudioFrameError as e:
+                    await session.send_error(str(e), "INVALID_AUDIO_FRAME")
+                    await session.reset_audio_buffer()
+                except RuntimeError as e:
+                    await session.send_error(str(e), "BUFFER_LIMIT_EXCEEDED")
+                    await session.reset_audio_buffer()
+                continue
+
+            raw_message = message.get("text") or ""
 
             try:
                 # Parse message type
@@ -539,14 +1328,36 @@ async def websocket_endpoint(websocket: WebSocket):
 
                 if message_type == "audio_chunk":
                     msg = AudioChunkMessage(**message_data)
+                    if session.stream_stt:
+                        await session.ensure_streaming_stt()
                     session.add_audio_chunk(msg.data)
+                    await session.on_speech()
 
                 elif message_type == "audio_end":
                     msg = AudioEndMessage(**message_data)
+                    if session.turn_active:
+                        # Settings below belong to the running turn; don't touch them
+                        await session.send_error("Already processing a request", "ALREADY_PROCESSING")
+                        continue
+
+                    try:
+                        options = parse_tts_options(message_data)
+                    except ValueError as e:
+                        await session.send_error(f"Invalid message format: {e}", "VALIDATION_ERROR")
+                        continue
+
                     session.voice_profile_id = msg.voice_profile_id
+                    session.tts_mode = options["tts_mode"]
+                    session.stream_tts = options["stream_tts"]
+                    session.stream_audio = options["stream_audio"]
+                    session.accept_formats = options["accept_formats"]
 
-                    # Process the complete audio
-                    await session.process_audio()
+                    # Process the complete audio (in the background, so the
+                    # loop can still receive an interrupt or new speech)
+                    await session.start_turn()
+
+                elif message_type == "interrupt":
+                    await session.interrupt("client")
 
                 else:
                     await session.send_error(
@@ -571,9 +1382,7 @@ async def websocket_endpoint(websocket: WebSocket):
                     "BUFFER_LIMIT_EXCEEDED"
                 )
                 # Clear buffer to allow retry
-                session.audio_buffer.clear()
-                session.buffer_size_bytes = 0
-                session.buffer_first_chunk_time = None
+                await session.reset_audio_buffer()
 
     except WebSocketDisconnect:
         logger.info("session.disconnected", session_id=session_id)
@@ -581,7 +1390,11 @@ async def websocket_endpoint(websocket: WebSocket):
         logger.exception("session.fatal_error", session_id=session_id)
         await session.send_error(f"Fatal error: {str(e)}", "FATAL_ERROR")
     finally:
-        # Release session slot
+        # Nobody is listening anymore: stop the turn and free its GPU work
+        await session.cancel_turn()
+        await session.close()
+
+        # Release connection slot
         session_manager.release_session(session_id)
         logger.info("session.closed",
                    session_id=session_id,
@@ -23,6 +23,7 @@ import structlog
 from fastapi import WebSocket, WebSocketDisconnect, WebSocketException
 from pydantic import ValidationError
 
+from avatar.core.audio_frames import CODEC_PCM16, AudioBuffer, AudioFrameError, parse_audio_frame
 from avatar.core.config import config
 from avatar.core.websocket_reconnect import (
     get_reconnect_manager, SessionSnapshot, DisconnectReason, ConnectionState
@@ -56,7 +57,7 @@ class EnhancedConversationSession:
     def __init__(self, session_id: str, websocket: WebSocket, recovered_state: Optional[SessionSnapshot] = None):
         self.session_id = session_id
         self.websocket = websocket
-        self.audio_buffer: list[bytes] = []
+        self.audio_buffer = AudioBuffer()
         self.is_processing = False
 
         # Initialize from recovered state or start fresh
@@ -151,18 +152,45 @@ class EnhancedConversationSession:
                     recoverable=is_recoverable)
 
     def add_audio_chunk(self, data_b64: str):
-        """Add audio chunk with enhanced buffer management"""
+        """Add base64 audio chunk from a JSON message (older clients)"""
+        try:
+            audio_bytes = base64.b64decode(data_b64)
+        except Exception as e:
+            logger.error("session.add_chunk_failed",
+                        session_id=self.session_id,
+                        error=str(e))
+            raise RuntimeError(f"Invalid base64 audio data: {e}") from e
+
+        self._append_audio(audio_bytes)
+
+    def add_audio_frame(self, data: bytes):
+        """
+        Add binary audio frame (header + raw payload, see core.audio_frames)
+
+        Only container audio is accepted: this pipeline converts the upload
+        through a file, which cannot carry headerless PCM (use /ws/chat).
+
+        Raises:
+            AudioFrameError: Malformed, out-of-sequence or PCM16 frame
+        """
+        frame = parse_audio_frame(data)
+        if frame.codec == CODEC_PCM16:
+            raise AudioFrameError("PCM16 frames are not supported on this endpoint; send WebM/Ogg audio")
+        self.audio_buffer.check_frame(frame)
+        self._append_audio(frame.payload)
+
+    def _append_audio(self, audio_bytes: bytes):
+        """Add audio with enhanced buffer management"""
         self.last_activity = time.time()
 
         try:
-            audio_bytes = base64.b64decode(data_b64)
             chunk_size = len(audio_bytes)
 
             if self.buffer_first_chunk_time is None:
                 self.buffer_first_chunk_time = time.time()
 
             # Enhanced buffer limit checks
-            if len(self.audio_buffer) >= MAX_CHUNK_COUNT:
+            if self.audio_buffer.chunk_count >= MAX_CHUNK_COUNT:
                 raise RuntimeError(f"Too many audio chunks (max: {MAX_CHUNK_COUNT})")
 
             if self.buffer_size_bytes + chunk_size > MAX_BUFFER_SIZE_BYTES:
@@ -255,7 +283,7 @@ class EnhancedConversationSession:
         """Save audio with error recovery"""
         from avatar.core.audio_utils import convert_audio_to_wav
 
-        raw_audio = b"".join(self.audio_buffer)
+        raw_audio = self.audio_buffer.getvalue()
         audio_filename = f"user_audio_{self.session_id}_{self.turn_number}_{int(time.time())}.webm"
         audio_path = Path(config.AUDIO_RAW_DIR) / audio_filename
 
@@ -421,8 +449,8 @@ async def enhanced_websocket_endpoint(websocket: WebSocket, session_id: Optional
         while True:
             # Receive message with timeout for heartbeat
             try:
-                raw_message = await asyncio.wait_for(
-                    websocket.receive_text(),
+                message = await asyncio.wait_for(
+                    websocket.receive(),
                     timeout=reconnect_manager.config.heartbeat_interval_seconds * 2
                 )
             except asyncio.TimeoutError:
@@ -430,6 +458,23 @@ async def enhanced_websocket_endpoint(websocket: WebSocket, session_id: Optional
                 await session.send_status("Heartbeat", "heartbeat")
                 continue
 
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+
+            # Binary message: audio frame
+            if message.get("bytes") is not None:
+                try:
+                    session.add_audio_frame(message["bytes"])
+                except (AudioFrameError, RuntimeError) as e:
+                    code = "INVALID_AUDIO_FRAME" if isinstance(e, AudioFrameError) else "BUFFER_LIMIT_EXCEEDED"
+                    await session.send_error(str(e), code, is_recoverable=True)
+                    session.audio_buffer.clear()
+                    session.buffer_size_bytes = 0
+                    session.buffer_first_chunk_time = None
+                continue
+
+            raw_message = message.get("text") or ""
+
             try:
                 # Parse and handle message
                 message_data = json.loads(raw_message)
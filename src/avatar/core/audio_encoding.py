@@ -0,0 +1,272 @@
+"""
+Compressed encodings of stored WAV audio
+
+Opus is roughly 10x smaller than the 16-bit WAV that F5-TTS and CosyVoice
+write, at speech quality. Two containers are produced:
+- opus: Ogg Opus (Chrome, Firefox, Android, Safari 17+)
+- webm: WebM Opus (Chrome, Firefox, Safari 15+)
+
+Encoding runs the ffmpeg CLI (libopus) as a subprocess, so it never blocks
+the event loop; at most AVATAR_AUDIO_ENCODE_WORKERS encodes run at once.
+Results are cached next to the source WAV as <stem>.enc.<ext> (so they never
+collide with uploads such as AUDIO_RAW/<stem>.webm) and reused while the WAV
+is unchanged.
+
+The format is picked from what the client accepts (choose_format). Without
+ffmpeg on PATH, callers keep serving WAV.
+"""
+
+import asyncio
+import shutil
+import uuid
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Union
+
+import structlog
+
+from avatar.core.config import config
+
+logger = structlog.get_logger()
+
+MEDIA_TYPES = {
+    "wav": "audio/wav",
+    "opus": "audio/ogg; codecs=opus",
+    "webm": "audio/webm; codecs=opus",
+}
+SUFFIXES = {
+    "wav": ".wav",
+    "opus": ".opus",
+    "webm": ".webm",
+}
+FORMATS_BY_SUFFIX = {suffix: audio_format for audio_format, suffix in SUFFIXES.items()}
+
+# ffmpeg output container per compressed format
+CONTAINERS = {
+    "opus": "ogg",
+    "webm": "webm",
+}
+
+# Names clients use for each format (format names or media types)
+FORMAT_ALIASES = {
+    "wav": "wav", "audio/wav": "wav", "audio/wave": "wav", "audio/x-wav": "wav",
+    "opus": "opus", "ogg": "opus", "audio/ogg": "opus", "audio/opus": "opus",
+    "webm": "webm", "audio/webm": "webm",
+}
+
+# One encode per output file at a time; concurrent requests share it
+_encode_locks: Dict[Path, asyncio.Lock] = {}
+
+# Worker pool: bounds concurrent ffmpeg processes
+_encode_slots = asyncio.Semaphore(config.AUDIO_ENCODE_WORKERS)
+
+# Background encodes (referenced until done so they are not garbage collected)
+_background_encodes: set = set()
+
+
+class AudioEncodingError(Exception):
+    """ffmpeg failed to encode a file"""
+
+
+@lru_cache(maxsize=1)
+def ffmpeg_path() -> Optional[str]:
+    """ffmpeg executable, or None if not installed"""
+    path = shutil.which("ffmpeg")
+    if path is None:
+        logger.warning("audio_encoding.ffmpeg_missing", message="Compressed audio disabled, serving WAV")
+    return path
+
+
+def encoded_path(source: Path, audio_format: str) -> Path:
+    """Cache location of source in audio_format (next to the source)"""
+    return source.with_name(f"{source.stem}.enc{SUFFIXES[audio_format]}")
+
+
+def _is_fresh(output: Path, source: Path) -> bool:
+    try:
+        return output.stat().st_mtime_ns >= source.stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+
+
+def cached_encoding(source: Path, audio_format: str) -> Optional[Path]:
+    """Encoded copy of source if it is already up to date, else None (no encode)"""
+    if audio_format not in CONTAINERS:
+        return None
+    output = encoded_path(source, audio_format)
+    return output if _is_fresh(output, source) else None
+
+
+def remove_encodings(source: Path):
+    """Delete the cached encodings of source (when source itself is deleted)"""
+    for audio_format in CONTAINERS:
+        encoded_path(source, audio_format).unlink(missing_ok=True)
+
+
+def choose_format(accepted: Union[str, Iterable[str], None]) -> str:
+    """
+    Best format for a client
+
+    Args:
+        accepted: Accept header ("audio/webm, audio/ogg;q=0.8, */*;q=0.5")
+            or format names (["opus", "wav"]); None = no preference
+
+    Returns:
+        Highest-q compressed format the client names explicitly (ties go
+        to AVATAR_AUDIO_TTS_FORMATS order), else "wav". Wildcards never
+        select a compressed format, since older players cannot play it.
+    """
+    if isinstance(accepted, str):
+        accepted = accepted.split(",")
+
+    quality: Dict[str, float] = {}
+    for item in accepted or ():
+        name, *params = [part.strip() for part in item.split(";")]
+        q = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    q = float(param[2:])
+                except ValueError:
+                    q = 0.0
+        audio_format = FORMAT_ALIASES.get(name.lower())
+        if audio_format is not None:
+            quality[audio_format] = max(quality.get(audio_format, 0.0), q)
+
+    candidates = [
+        audio_format for audio_format in config.AUDIO_TTS_FORMATS
+        if quality.get(audio_format, 0.0) > 0 and audio_format in CONTAINERS
+    ]
+    if not candidates or ffmpeg_path() is None:
+        return "wav"
+    return max(candidates, key=lambda audio_format: quality[audio_format])  # Stable: first max wins
+
+
+async def encode_audio(
+    source: Path,
+    audio_format: str,
+    output: Optional[Path] = None,
+    bitrate: str = config.AUDIO_OPUS_BITRATE
+) -> Path:
+    """
+    Encode a WAV file to a compressed format (cached)
+
+    Args:
+        source: WAV file
+        audio_format: "opus" or "webm"
+        output: Target file (default: source with the format's suffix)
+        bitrate: libopus bitrate, e.g. "32k"
+
+    Returns:
+        Path of the encoded file
+
+    Raises:
+        AudioEncodingError: ffmpeg missing or encoding failed
+    """
+    output = output or encoded_path(source, audio_format)
+    if _is_fresh(output, source):
+        return output
+
+    ffmpeg = ffmpeg_path()
+    if ffmpeg is None:
+        raise AudioEncodingError("ffmpeg not installed")
+
+    lock = _encode_locks.setdefault(output, asyncio.Lock())
+    try:
+        async with lock:
+            if _is_fresh(output, source):  # Encoded while waiting
+                return output
+
+            # Unique per encode: a caller arriving after the lock is dropped never shares it
+            tmp = output.with_name(f"{output.name}.{uuid.uuid4().hex[:8]}.tmp")
+            async with _encode_slots:
+                process = await asyncio.create_subprocess_exec(
+                    ffmpeg, "-nostdin", "-loglevel", "error", "-y",
+                    "-i", str(source),
+                    "-c:a", "libopus", "-b:a", bitrate, "-application", "voip",
+                    "-f", CONTAINERS[audio_format], str(tmp),
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+                try:
+                    _, stderr = await process.communicate()
+                except asyncio.CancelledError:
+                    # Caller went away: don't leave ffmpeg or a partial file behind
+                    if process.returncode is None:
+                        process.kill()
+                        await process.wait()
+                    tmp.unlink(missing_ok=True)
+                    raise
+
+            if process.returncode != 0:
+                tmp.unlink(missing_ok=True)
+                raise AudioEncodingError(stderr.decode(errors="replace").strip() or f"ffmpeg exit {process.returncode}")
+
+            tmp.replace(output)  # Atomic: readers never see a partial file
+    finally:
+        if _encode_locks.get(output) is lock:
+            del _encode_locks[output]
+
+    logger.debug("audio_encoding.encoded",
+                source=source.name,
+                format=audio_format,
+                source_bytes=source.stat().st_size,
+                encoded_bytes=output.stat().st_size)
+    return output
+
+
+async def encode_opus(
+    source: Path,
+    output: Optional[Path] = None,
+    bitrate: str = config.AUDIO_OPUS_BITRATE
+) -> Path:
+    """Encode a WAV file to Ogg Opus (cached, see encode_audio)"""
+    return await encode_audio(source, "opus", output, bitrate)
+
+
+async def get_encoded_audio(source: Path, audio_format: str) -> tuple[Path, str]:
+    """
+    File and media type to serve for source in the requested format
+
+    Falls back to the WAV source when the format is unavailable. Already
+    compressed sources are served as they are.
+
+    Returns:
+        (path, media_type)
+    """
+    source_format = FORMATS_BY_SUFFIX.get(source.suffix.lower(), "wav")
+    if source_format != "wav":
+        return source, MEDIA_TYPES[source_format]
+
+    if audio_format in CONTAINERS:
+        try:
+            return await encode_audio(source, audio_format), MEDIA_TYPES[audio_format]
+        except AudioEncodingError as e:
+            logger.warning("audio_encoding.fallback_wav", source=source.name, error=str(e))
+
+    return source, MEDIA_TYPES["wav"]
+
+
+def schedule_encoding(source: Path, audio_format: str) -> Optional[asyncio.Task]:
+    """
+    Encode source in the background (e.g. an archived turn the client will replay)
+
+    Returns:
+        The task, or None for WAV
+    """
+    if audio_format not in CONTAINERS:
+        return None
+
+    async def _encode():
+        try:
+            await encode_audio(source, audio_format)
+        except Exception as e:
+            logger.warning("audio_encoding.background_failed",
+                          source=source.name,
+                          format=audio_format,
+                          error=str(e))
+
+    task = asyncio.create_task(_encode())
+    _background_encodes.add(task)
+    task.add_done_callback(_background_encodes.discard)
+    return task
@@ -0,0 +1,186 @@
+"""
+Binary WebSocket audio frames
+
+Clients can send audio as binary WebSocket messages instead of base64 inside
+JSON (33% larger, plus a JSON parse and base64 decode per chunk). Each binary
+message is one frame:
+
+    offset  size  field
+    0       1     version  (FRAME_VERSION)
+    1       1     codec    (CODEC_CONTAINER or CODEC_PCM16)
+    2       2     reserved (0)
+    4       4     sequence (uint32, network byte order, 0 for the first frame of a turn)
+    8       ...   payload  (raw audio bytes)
+
+Control messages (audio_end, ping, ...) stay JSON text messages, and the
+JSON audio_chunk message keeps working for older clients.
+
+The server uses the same frames to stream synthesized speech back (PCM16 at
+the rate announced in the preceding tts_audio_start message), so playback can
+start without fetching the WAV over HTTP.
+
+Frames are appended into an AudioBuffer, a preallocated bytearray that
+grows geometrically, instead of a list of chunks joined at the end of the turn.
+Idle connections hold no buffer; it is reserved with the first chunk.
+"""
+
+import struct
+import wave
+from pathlib import Path
+from typing import Iterator, NamedTuple, Optional, Tuple, Union
+
+FRAME_VERSION = 1
+FRAME_HEADER = struct.Struct("!BBHI")
+
+# Codecs
+CODEC_CONTAINER = 0  # Encoded stream with a container (MediaRecorder WebM/Opus, Ogg/Opus, WAV)
+CODEC_PCM16 = 1      # Raw 16-bit little-endian PCM (16kHz mono upstream)
+
+# Decoder format hint per codec (see decode_audio_bytes)
+CODEC_FORMATS = {
+    CODEC_CONTAINER: None,  # Auto-detect
+    CODEC_PCM16: "pcm_s16le",
+}
+
+INITIAL_BUFFER_BYTES = 256 * 1024  # ~16s of Opus, ~8s of PCM
+TTS_FRAME_SEC = 0.2  # Downstream frame length: small enough to start playback early
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+class AudioFrameError(ValueError):
+    """Malformed or out-of-order audio frame"""
+
+
+class AudioFrame(NamedTuple):
+    sequence: int
+    codec: int
+    payload: memoryview
+
+
+def parse_audio_frame(data: BytesLike) -> AudioFrame:
+    """
+    Split a binary message into header fields and payload (no copy)
+
+    Raises:
+        AudioFrameError: Frame too short, unknown version or codec
+    """
+    if len(data) < FRAME_HEADER.size:
+        raise AudioFrameError(f"Audio frame too short: {len(data)} bytes")
+
+    version, codec, _, sequence = FRAME_HEADER.unpack_from(data)
+    if version != FRAME_VERSION:
+        raise AudioFrameError(f"Unsupported audio frame version: {version}")
+    if codec not in CODEC_FORMATS:
+        raise AudioFrameError(f"Unknown audio codec: {codec}")
+
+    return AudioFrame(sequence, codec, memoryview(data)[FRAME_HEADER.size:])
+
+
+def build_audio_frame(payload: BytesLike, sequence: int, codec: int = CODEC_CONTAINER) -> bytes:
+    """Binary message for payload"""
+    return FRAME_HEADER.pack(FRAME_VERSION, codec, 0, sequence) + bytes(payload)
+
+
+def read_pcm16_wav(path: Path) -> Tuple[bytes, int, int]:
+    """
+    PCM payload of a 16-bit WAV file
+
+    Returns:
+        (pcm_bytes, sample_rate, channels)
+
+    Raises:
+        AudioFrameError: Not a 16-bit PCM WAV
+    """
+    try:
+        with wave.open(str(path), "rb") as f:
+            if f.getsampwidth() != 2:
+                raise AudioFrameError(f"Not 16-bit PCM: {f.getsampwidth() * 8} bits")
+            return f.readframes(f.getnframes()), f.getframerate(), f.getnchannels()
+    except (wave.Error, EOFError) as e:
+        raise AudioFrameError(f"Not a PCM WAV file: {e}") from e
+
+
+def split_pcm(
+    pcm: BytesLike,
+    sample_rate: int,
+    channels: int = 1,
+    frame_sec: float = TTS_FRAME_SEC
+) -> Iterator[memoryview]:
+    """Cut PCM16 into frame_sec pieces on sample boundaries (no copy)"""
+    frame_bytes = max(1, int(sample_rate * frame_sec)) * 2 * channels
+    view = memoryview(pcm)
+    for start in range(0, len(view), frame_bytes):
+        yield view[start:start + frame_bytes]
+
+
+class AudioBuffer:
+    """
+    Audio of the current turn in one preallocated bytearray
+
+    Appends copy each chunk once into spare capacity; the capacity doubles
+    when full and is kept across turns of the same connection.
+    """
+
+    def __init__(self, initial_capacity: int = INITIAL_BUFFER_BYTES):
+        self.initial_capacity = initial_capacity
+        self._data = bytearray()  # Reserved with the first chunk
+        self._size = 0
+        self.chunk_count = 0
+        self.codec: Optional[int] = None  # None until the first binary frame
+        self.next_sequence = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return len(self._data)
+
+    @property
+    def audio_format(self) -> Optional[str]:
+        """Decoder format hint for the buffered audio"""
+        return CODEC_FORMATS[self.codec] if self.codec is not None else None
+
+    def check_frame(self, frame: AudioFrame):
+        """
+        Accept the header of the next frame
+
+        Frames of a turn must arrive in sequence and share one codec; a gap
+        means the client lost audio (e.g. across a reconnect).
+
+        Raises:
+            AudioFrameError: Sequence gap or codec change
+        """
+        if frame.sequence != self.next_sequence:
+            raise AudioFrameError(
+                f"Audio frame out of sequence: got {frame.sequence}, expected {self.next_sequence}"
+            )
+        if self.codec is not None and frame.codec != self.codec:
+            raise AudioFrameError(f"Audio codec changed mid-turn: {self.codec} -> {frame.codec}")
+
+        self.codec = frame.codec
+        self.next_sequence += 1
+
+    def append(self, chunk: BytesLike):
+        """Copy chunk to the end of the buffer"""
+        end = self._size + len(chunk)
+        if end > len(self._data):
+            capacity = max(end, 2 * len(self._data), self.initial_capacity)
+            self._data.extend(bytes(capacity - len(self._data)))
+
+        self._data[self._size:end] = chunk
+        self._size = end
+        self.chunk_count += 1
+
+    def getvalue(self) -> bytes:
+        """Buffered audio as bytes"""
+        with memoryview(self._data) as view:
+            return bytes(view[:self._size])
+
+    def clear(self):
+        """Forget the turn's audio (capacity is kept)"""
+        self._size = 0
+        self.chunk_count = 0
+        self.codec = None
+        self.next_sequence = 0
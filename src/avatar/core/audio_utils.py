@@ -12,15 +12,124 @@ Design Philosophy (Linus-style):
 """
 
 import asyncio
+import io
+import math
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple
 
+import numpy as np
 import structlog
 import torch
 import torchaudio
 
 logger = structlog.get_logger()
 
+# Headerless 16-bit PCM (binary WebSocket frames), always 16kHz mono
+PCM_FORMAT = "pcm_s16le"
+PCM_SAMPLE_RATE = 16000
+
+
+@lru_cache(maxsize=16)
+def get_resampler(orig_sample_rate: int, target_sample_rate: int) -> torchaudio.transforms.Resample:
+    """
+    Get a cached resampler for a (orig, target) sample rate pair
+
+    Building a Resample transform computes its windowed-sinc kernel, which
+    is the expensive part for short clips. Browsers almost always send
+    48kHz, so one kernel serves nearly every turn.
+
+    The transform is stateless after construction, so sharing it between
+    executor threads is safe.
+    """
+    logger.debug("audio.resampler.created",
+                orig_sr=orig_sample_rate,
+                target_sr=target_sample_rate)
+    return torchaudio.transforms.Resample(
+        orig_freq=orig_sample_rate,
+        new_freq=target_sample_rate
+    )
+
+
+def to_target_format(
+    waveform: torch.Tensor,
+    sample_rate: int,
+    target_sample_rate: int = 16000,
+    target_channels: int = 1
+) -> torch.Tensor:
+    """
+    Downmix and resample a [channels, samples] waveform in one pass
+
+    Channels are averaged before resampling, so the sinc convolution runs
+    on a single channel instead of every input channel.
+
+    Args:
+        waveform: Audio tensor [channels, samples]
+        sample_rate: Sample rate of waveform
+        target_sample_rate: Output sample rate
+        target_channels: Downmix to mono when input has more channels
+
+    Returns:
+        Converted waveform [channels, samples]
+    """
+    if waveform.shape[0] > target_channels:
+        waveform = torch.mean(waveform, dim=0, keepdim=True)
+
+    if sample_rate != target_sample_rate:
+        with torch.inference_mode():
+            waveform = get_resampler(sample_rate, target_sample_rate)(waveform)
+
+    return waveform
+
+
+def resample_batch(
+    clips: list[tuple[torch.Tensor, int]],
+    target_sample_rate: int = 16000,
+    target_channels: int = 1
+) -> list[torch.Tensor]:
+    """
+    Convert many clips with one resampler call per source sample rate
+
+    Clips sharing a sample rate are zero-padded into a single
+    [batch, channels, samples] tensor and resampled together, then
+    trimmed back to their own lengths.
+
+    Args:
+        clips: List of (waveform [channels, samples], sample_rate)
+        target_sample_rate: Output sample rate
+        target_channels: Downmix to mono when input has more channels
+
+    Returns:
+        Converted waveforms, in input order
+    """
+    results: list[Optional[torch.Tensor]] = [None] * len(clips)
+    groups: dict[tuple[int, int], list[tuple[int, torch.Tensor]]] = defaultdict(list)
+
+    for index, (waveform, sample_rate) in enumerate(clips):
+        if waveform.shape[0] > target_channels:
+            waveform = torch.mean(waveform, dim=0, keepdim=True)
+
+        if sample_rate == target_sample_rate:
+            results[index] = waveform
+        else:
+            groups[(sample_rate, waveform.shape[0])].append((index, waveform))
+
+    for (sample_rate, channels), members in groups.items():
+        max_len = max(waveform.shape[1] for _, waveform in members)
+        batch = torch.zeros(len(members), channels, max_len)
+        for row, (_, waveform) in enumerate(members):
+            batch[row, :, :waveform.shape[1]] = waveform
+
+        with torch.inference_mode():
+            resampled = get_resampler(sample_rate, target_sample_rate)(batch)
+
+        for row, (index, waveform) in enumerate(members):
+            out_len = math.ceil(waveform.shape[1] * target_sample_rate / sample_rate)
+            results[index] = resampled[row, :, :out_len]
+
+    return results  # type: ignore[return-value]
+
 
 def convert_to_wav(
     input_path: Path,
@@ -76,46 +185,17 @@ def convert_to_wav(
                     orig_channels=orig_channels,
                     orig_duration_sec=round(orig_duration, 2))
 
-        # 1. Convert to mono if needed
-        if waveform.shape[0] > target_channels:
-            # Average all channels to mono
-            waveform = torch.mean(waveform, dim=0, keepdim=True)
-            logger.debug("audio.convert.to_mono", channels=f"{orig_channels} -> 1")
-
-        # 2. Resample if needed
-        if sample_rate != target_sample_rate:
-            resampler = torchaudio.transforms.Resample(
-                orig_freq=sample_rate,
-                new_freq=target_sample_rate
-            )
-            waveform = resampler(waveform)
-            logger.debug("audio.convert.resample",
-                        sample_rate=f"{sample_rate} -> {target_sample_rate}")
+        # 1+2. Downmix and resample (cached kernel)
+        waveform = to_target_format(waveform, sample_rate, target_sample_rate, target_channels)
 
         # 3. Save as WAV PCM
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        torchaudio.save(
-            str(output_path),
-            waveform,
-            target_sample_rate,
-            encoding="PCM_S",  # 16-bit PCM
-            bits_per_sample=16
+        metadata = _save_converted(
+            input_path, output_path, waveform,
+            sample_rate, orig_channels, orig_duration,
+            target_sample_rate, target_channels
         )
-
-        # Get final file size
-        file_size = output_path.stat().st_size
-        final_duration = waveform.shape[1] / target_sample_rate
-
-        metadata = {
-            "original_sample_rate": sample_rate,
-            "original_channels": orig_channels,
-            "original_duration_sec": round(orig_duration, 2),
-            "converted_sample_rate": target_sample_rate,
-            "converted_channels": target_channels,
-            "converted_duration_sec": round(final_duration, 2),
-            "file_size_bytes": file_size,
-            "compression_ratio": round(input_path.stat().st_size / file_size, 2)
-        }
+        file_size = metadata["file_size_bytes"]
+        final_duration = metadata["converted_duration_sec"]
 
         logger.info("audio.convert.complete",
                    output=str(output_path),
@@ -133,6 +213,113 @@ def convert_to_wav(
         raise RuntimeError(f"Audio conversion failed: {e}") from e
 
 
+def _save_converted(
+    input_path: Path,
+    output_path: Path,
+    waveform: torch.Tensor,
+    sample_rate: int,
+    orig_channels: int,
+    orig_duration: float,
+    target_sample_rate: int,
+    target_channels: int
+) -> dict:
+    """Write a converted waveform as 16-bit PCM WAV and build its metadata"""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    torchaudio.save(
+        str(output_path),
+        waveform,
+        target_sample_rate,
+        encoding="PCM_S",  # 16-bit PCM
+        bits_per_sample=16
+    )
+
+    file_size = output_path.stat().st_size
+    final_duration = waveform.shape[1] / target_sample_rate
+
+    return {
+        "original_sample_rate": sample_rate,
+        "original_channels": orig_channels,
+        "original_duration_sec": round(orig_duration, 2),
+        "converted_sample_rate": target_sample_rate,
+        "converted_channels": target_channels,
+        "converted_duration_sec": round(final_duration, 2),
+        "file_size_bytes": file_size,
+        "compression_ratio": round(input_path.stat().st_size / file_size, 2)
+    }
+
+
+def convert_batch_to_wav(
+    jobs: list[tuple[Path, Path]],
+    target_sample_rate: int = 16000,
+    target_channels: int = 1
+) -> list[Tuple[Path, dict]]:
+    """
+    Convert a batch of audio files to WAV (blocking)
+
+    Intended for bulk voice-profile import: clips are decoded, then
+    resampled together with resample_batch() (one kernel call per source
+    sample rate) and written out.
+
+    Args:
+        jobs: List of (input_path, output_path)
+        target_sample_rate: Target sample rate (default: 16000 Hz)
+        target_channels: Target channels (default: 1 = mono)
+
+    Returns:
+        List of (output_path, metadata_dict), in input order
+
+    Raises:
+        FileNotFoundError: An input file was not found
+        RuntimeError: Audio conversion failed
+    """
+    for input_path, _ in jobs:
+        if not input_path.exists():
+            logger.error("audio.convert.input_not_found", path=str(input_path))
+            raise FileNotFoundError(f"Input audio not found: {input_path}")
+
+    try:
+        loaded = [torchaudio.load(str(input_path)) for input_path, _ in jobs]
+        converted = resample_batch(loaded, target_sample_rate, target_channels)
+
+        results = []
+        for (input_path, output_path), (waveform, sample_rate), out in zip(jobs, loaded, converted):
+            metadata = _save_converted(
+                input_path, output_path, out,
+                sample_rate, waveform.shape[0], waveform.shape[1] / sample_rate,
+                target_sample_rate, target_channels
+            )
+            results.append((output_path, metadata))
+
+        logger.info("audio.convert_batch.complete",
+                   clips=len(jobs),
+                   target_sr=target_sample_rate)
+
+        return results
+
+    except Exception as e:
+        logger.error("audio.convert_batch.failed",
+                    clips=len(jobs),
+                    error=str(e),
+                    error_type=type(e).__name__)
+        raise RuntimeError(f"Batch audio conversion failed: {e}") from e
+
+
+async def convert_batch_to_wav_async(
+    jobs: list[tuple[Path, Path]],
+    target_sample_rate: int = 16000,
+    target_channels: int = 1
+) -> list[Tuple[Path, dict]]:
+    """Async wrapper for convert_batch_to_wav() (runs in thread pool)"""
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(
+        None,
+        convert_batch_to_wav,
+        jobs,
+        target_sample_rate,
+        target_channels
+    )
+
+
 async def convert_to_wav_async(
     input_path: Path,
     output_path: Path,
@@ -169,6 +356,152 @@ async def convert_to_wav_async(
     )
 
 
+def decode_audio_bytes(
+    data: bytes,
+    target_sample_rate: int = 16000,
+    format: Optional[str] = None
+) -> np.ndarray:
+    """
+    Decode an in-memory audio buffer to float32 mono samples (blocking)
+
+    Whisper (faster-whisper) accepts a float32 NumPy array at 16kHz directly,
+    so no intermediate WAV file is needed.
+
+    Args:
+        data: Encoded audio bytes (WebM/Opus, WAV, etc.)
+        target_sample_rate: Output sample rate (default: 16000 Hz)
+        format: Container hint for the decoder (None = auto-detect),
+            or PCM_FORMAT for raw 16kHz mono PCM
+
+    Returns:
+        1-D float32 array in [-1, 1] at target_sample_rate
+
+    Raises:
+        RuntimeError: Audio decoding failed
+    """
+    if format == PCM_FORMAT:
+        # Already samples: no decoder involved
+        pcm = np.frombuffer(data, dtype="<i2", count=len(data) // 2)
+        samples = pcm.astype(np.float32) / 32768.0
+        if target_sample_rate == PCM_SAMPLE_RATE:
+            return samples
+        waveform = to_target_format(
+            torch.from_numpy(samples).unsqueeze(0), PCM_SAMPLE_RATE, target_sample_rate, target_channels=1
+        )
+        return waveform.squeeze(0).numpy().astype(np.float32, copy=False)
+
+    try:
+        waveform, sample_rate = torchaudio.load(io.BytesIO(data), format=format)
+    except Exception as e:
+        raise RuntimeError(f"Audio decoding failed: {e}") from e
+
+    waveform = to_target_format(waveform, sample_rate, target_sample_rate, target_channels=1)
+
+    return waveform.squeeze(0).numpy().astype(np.float32, copy=False)
+
+
+async def decode_audio_bytes_async(
+    data: bytes,
+    target_sample_rate: int = 16000,
+    format: Optional[str] = None
+) -> np.ndarray:
+    """Async wrapper for decode_audio_bytes() (runs in thread pool)"""
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(
+        None,
+        decode_audio_bytes,
+        data,
+        target_sample_rate,
+        format
+    )
+
+
+def save_wav(samples: np.ndarray, output_path: Path, sample_rate: int = 16000) -> Path:
+    """
+    Write float32 mono samples as WAV PCM 16-bit (blocking)
+
+    Args:
+        samples: 1-D float32 array in [-1, 1]
+        output_path: Path to output WAV file
+        sample_rate: Sample rate of samples
+
+    Returns:
+        Path to written WAV file
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    torchaudio.save(
+        str(output_path),
+        torch.from_numpy(samples).unsqueeze(0),
+        sample_rate,
+        encoding="PCM_S",
+        bits_per_sample=16
+    )
+    return output_path
+
+
+def concat_wav_files(input_paths: list[Path], output_path: Path) -> Path:
+    """
+    Concatenate WAV files with identical sample rate into one file (blocking)
+
+    Used to archive sentence-level TTS chunks as a single utterance.
+
+    Args:
+        input_paths: WAV files in playback order
+        output_path: Path to output WAV file
+
+    Returns:
+        Path to concatenated WAV file
+
+    Raises:
+        ValueError: No input files, or sample rates differ
+        RuntimeError: Concatenation failed
+    """
+    if not input_paths:
+        raise ValueError("No audio files to concatenate")
+
+    waveforms = []
+    sample_rate = None
+
+    for path in input_paths:
+        waveform, sr = torchaudio.load(str(path))
+        if sample_rate is None:
+            sample_rate = sr
+        elif sr != sample_rate:
+            raise ValueError(
+                f"Sample rate mismatch: {path} is {sr}Hz, expected {sample_rate}Hz"
+            )
+        waveforms.append(waveform)
+
+    try:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        torchaudio.save(
+            str(output_path),
+            torch.cat(waveforms, dim=1),
+            sample_rate,
+            encoding="PCM_S",
+            bits_per_sample=16
+        )
+
+        logger.info("audio.concat.complete",
+                   output=str(output_path),
+                   inputs=len(input_paths),
+                   size_bytes=output_path.stat().st_size)
+
+        return output_path
+
+    except Exception as e:
+        logger.error("audio.concat.failed",
+                    output=str(output_path),
+                    error=str(e))
+        raise RuntimeError(f"Audio concatenation failed: {e}") from e
+
+
+async def concat_wav_files_async(input_paths: list[Path], output_path: Path) -> Path:
+    """Async wrapper for concat_wav_files() (runs in thread pool)"""
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(None, concat_wav_files, input_paths, output_path)
+
+
 def validate_audio_for_whisper(audio_path: Path) -> bool:
     """
     Validate if audio file meets Whisper requirements
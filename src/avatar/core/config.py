@@ -21,8 +21,21 @@ class Config:
     AUDIO_TTS_FAST = AUDIO_DIR / "tts_fast"
     AUDIO_TTS_HQ = AUDIO_DIR / "tts_hq"
 
+    # Opus encoding of stored WAV audio (requires ffmpeg with libopus)
+    AUDIO_OPUS_BITRATE: str = os.getenv("AVATAR_AUDIO_OPUS_BITRATE", "32k")
+    AUDIO_ENCODE_WORKERS: int = int(os.getenv("AVATAR_AUDIO_ENCODE_WORKERS", "2"))  # Concurrent ffmpeg processes
+    AUDIO_TTS_FORMATS: list[str] = [
+        name.strip() for name in os.getenv("AVATAR_AUDIO_TTS_FORMATS", "opus,webm,wav").split(",") if name.strip()
+    ]  # Server preference among the formats a client accepts
+
+    # Persist uploaded user audio (raw + 16kHz WAV) in the background
+    # Off the critical path: STT decodes the upload in memory
+    PERSIST_USER_AUDIO: bool = os.getenv("AVATAR_PERSIST_USER_AUDIO", "true").lower() == "true"
+
     # Database
     DATABASE_PATH = BASE_DIR / "app.db"
+    DB_READ_POOL_SIZE: int = int(os.getenv("AVATAR_DB_READ_POOL_SIZE", "4"))  # Read-only connections (WAL)
+    DB_COMMIT_INTERVAL_MS: float = float(os.getenv("AVATAR_DB_COMMIT_INTERVAL_MS", "5"))  # Group-commit window
 
     # Server settings
     HOST: str = os.getenv("AVATAR_HOST", "0.0.0.0")
@@ -38,10 +51,41 @@ class Config:
     MAX_CONCURRENT_SESSIONS: int = int(os.getenv("AVATAR_MAX_SESSIONS", "4"))  # Reduced for 20GB
     VRAM_LIMIT_GB: int = int(os.getenv("AVATAR_VRAM_LIMIT", "20"))  # RTX 4000 SFF Ada
 
+    # Per-stage admission: a conversation turn holds an STT, then an LLM, then a TTS
+    # slot only while that stage runs, so idle connections hold no GPU capacity
+    MAX_CONNECTIONS: int = int(os.getenv("AVATAR_MAX_CONNECTIONS", "32"))
+    STAGE_CONCURRENCY: dict[str, int] = {
+        "stt": int(os.getenv("AVATAR_STT_CONCURRENCY", "2")),
+        "llm": int(os.getenv("AVATAR_LLM_CONCURRENCY", "8")),  # vLLM batches concurrent requests
+        "tts_fast": int(os.getenv("AVATAR_TTS_CONCURRENCY", "2")),
+        "tts_hq": int(os.getenv("AVATAR_TTS_HQ_CONCURRENCY", "1")),
+    }
+    STAGE_QUEUE_TIMEOUT: float = float(os.getenv("AVATAR_STAGE_QUEUE_TIMEOUT", "30"))
+    # Barge-in: new speech during a turn cancels it (LLM request aborted, pending TTS dropped)
+    BARGE_IN_ENABLED: bool = os.getenv("AVATAR_BARGE_IN", "true").lower() == "true"
+    # Speech needed before barging in: voiced PCM16 audio (RMS >= BARGE_IN_MIN_RMS, full scale = 1.0),
+    # or for encoded audio, audio streamed for this long (noise and stray chunks don't interrupt)
+    BARGE_IN_MIN_SPEECH_MS: int = int(os.getenv("AVATAR_BARGE_IN_MIN_SPEECH_MS", "300"))
+    BARGE_IN_MIN_RMS: float = float(os.getenv("AVATAR_BARGE_IN_MIN_RMS", "0.02"))
+
     # Multi-GPU configuration
     GPU_DEVICE: Optional[int] = None if os.getenv("AVATAR_GPU_DEVICE") is None else int(os.getenv("AVATAR_GPU_DEVICE", "1"))  # Use GPU 1 (RTX 4000)
     AUTO_SELECT_GPU: bool = os.getenv("AVATAR_AUTO_SELECT_GPU", "true").lower() == "true"
 
+    # GPU telemetry: all VRAM consumers read one sampled snapshot (NVML when available)
+    GPU_TELEMETRY_INTERVAL: float = float(os.getenv("AVATAR_GPU_TELEMETRY_INTERVAL", "1.0"))
+    GPU_TELEMETRY_HISTORY: int = int(os.getenv("AVATAR_GPU_TELEMETRY_HISTORY", "300"))  # Samples kept
+
+    # VRAM usage history: fixed-size ring buffer per GPU, aggregates kept per window
+    VRAM_MONITOR_INTERVAL: float = float(os.getenv("AVATAR_VRAM_MONITOR_INTERVAL", "1.0"))
+    VRAM_HISTORY_SIZE: int = int(os.getenv("AVATAR_VRAM_HISTORY_SIZE", "21600"))  # Samples per GPU (6h at 1s)
+    VRAM_HISTORY_WINDOWS: list[int] = [
+        int(minutes) for minutes in os.getenv("AVATAR_VRAM_HISTORY_WINDOWS", "1,5,10,60").split(",")
+    ]  # Minutes
+
+    # Startup preloading: load models on different devices concurrently
+    MODEL_PRELOAD_PARALLEL: bool = os.getenv("AVATAR_PRELOAD_PARALLEL", "true").lower() == "true"
+
     # ============================================================
     # Service Provider Configuration (地端/API 切換)
     # ============================================================
@@ -82,6 +126,18 @@ class Config:
     WHISPER_MODEL_SIZE: str = os.getenv("AVATAR_WHISPER_MODEL", "base")  # tiny, base, small, medium, large
     WHISPER_DEVICE: str = os.getenv("AVATAR_WHISPER_DEVICE", "cpu")  # Force CPU inference
     WHISPER_COMPUTE_TYPE: str = os.getenv("AVATAR_WHISPER_COMPUTE", "int8")  # int8 for CPU efficiency
+    WHISPER_NUM_WORKERS: int = int(os.getenv("AVATAR_WHISPER_WORKERS", "2"))  # Parallel decodes (dedicated threads)
+
+    # Batched STT: merge concurrent sessions' requests into one batched Whisper pass
+    STT_BATCHING_ENABLED: bool = os.getenv("AVATAR_STT_BATCHING", "false").lower() == "true"
+    STT_BATCH_SIZE: int = int(os.getenv("AVATAR_STT_BATCH_SIZE", "8"))  # Max requests per batch
+    STT_BATCH_WAIT_MS: float = float(os.getenv("AVATAR_STT_BATCH_WAIT_MS", "10"))  # Micro-batching window
+
+    # Streaming STT: rolling-window Whisper passes while the user is still speaking
+    STT_STREAMING_ENABLED: bool = os.getenv("AVATAR_STT_STREAMING", "false").lower() == "true"
+    STT_STREAM_INTERVAL_SEC: float = float(os.getenv("AVATAR_STT_STREAM_INTERVAL", "1.0"))  # Min time between passes
+    STT_STREAM_MAX_WINDOW_SEC: float = float(os.getenv("AVATAR_STT_STREAM_MAX_WINDOW", "15.0"))  # Force commit beyond this
+    STT_STREAM_COMMIT_MARGIN_SEC: float = float(os.getenv("AVATAR_STT_STREAM_COMMIT_MARGIN", "1.0"))  # Keep tail tentative
 
     # vLLM (Local)
     VLLM_MODEL: str = os.getenv(
@@ -90,14 +146,49 @@ class Config:
     )
     VLLM_GPU_MEMORY: float = float(os.getenv("AVATAR_VLLM_MEMORY", "0.75"))  # GPU 記憶體比例
     VLLM_MAX_TOKENS: int = int(os.getenv("AVATAR_VLLM_MAX_TOKENS", "2048"))
+    VLLM_ENABLE_PREFIX_CACHING: bool = os.getenv("AVATAR_VLLM_PREFIX_CACHING", "true").lower() == "true"  # Reuse KV of shared prefixes
+
+    # Fixed persona placed first in every chat prompt (shared, cacheable prefix)
+    LLM_SYSTEM_PROMPT: str = os.getenv(
+        "AVATAR_LLM_SYSTEM_PROMPT",
+        "你是 AVATAR，一個友善的語音助理。請用自然、簡潔的口語回答，不要使用 Markdown、表情符號或條列格式，因為回覆會直接轉成語音。"
+    )
+
+    # Conversation memory: recent turns sent to the LLM, trimmed to a token budget
+    LLM_HISTORY_TOKENS: int = int(os.getenv("AVATAR_LLM_HISTORY_TOKENS", "1024"))  # Budget for past turns
+    LLM_HISTORY_MAX_TURNS: int = int(os.getenv("AVATAR_LLM_HISTORY_MAX_TURNS", "20"))
+    LLM_HISTORY_SUMMARIZE: bool = os.getenv("AVATAR_LLM_HISTORY_SUMMARIZE", "false").lower() == "true"
 
     # TTS settings
     F5_TTS_SPEED: float = float(os.getenv("AVATAR_F5_SPEED", "1.0"))
     COSYVOICE_SAMPLE_RATE: int = int(os.getenv("AVATAR_COSY_SAMPLE_RATE", "24000"))  # CosyVoice2 uses 24kHz
+    TTS_VOICE_CACHE_SIZE: int = int(os.getenv("AVATAR_TTS_VOICE_CACHE_SIZE", "16"))  # Prepared voice references kept in memory
+
+    # Phrase cache: reuse synthesized audio of repeated short phrases (greetings, fallbacks)
+    TTS_PHRASE_CACHE_ENABLED: bool = os.getenv("AVATAR_TTS_PHRASE_CACHE", "true").lower() == "true"
+    TTS_PHRASE_CACHE_MB: int = int(os.getenv("AVATAR_TTS_PHRASE_CACHE_MB", "512"))  # Disk cap, LRU eviction
+    TTS_PHRASE_CACHE_MAX_CHARS: int = int(os.getenv("AVATAR_TTS_PHRASE_CACHE_MAX_CHARS", "40"))  # Longer texts are not cached
+    TTS_WARMUP_PHRASES: list[str] = [
+        phrase for phrase in os.getenv(
+            "AVATAR_TTS_WARMUP_PHRASES",
+            "你好！|請稍等一下。|抱歉，我沒有聽清楚，可以再說一次嗎？|抱歉，系統暫時無法回應。"
+        ).split("|") if phrase.strip()
+    ]
+    TTS_WARMUP_PROFILES: list[str] = [
+        name.strip() for name in os.getenv("AVATAR_TTS_WARMUP_PROFILES", "").split(",") if name.strip()
+    ]  # Empty = all profiles on disk
+
+    # Streaming TTS: synthesize sentence by sentence while the LLM is still generating
+    TTS_STREAMING_ENABLED: bool = os.getenv("AVATAR_TTS_STREAMING", "false").lower() == "true"
+    TTS_STREAM_MIN_CHARS: int = int(os.getenv("AVATAR_TTS_STREAM_MIN_CHARS", "6"))  # Shorter sentences merge forward
+    TTS_STREAM_MAX_CHARS: int = int(os.getenv("AVATAR_TTS_STREAM_MAX_CHARS", "120"))  # Force cut without punctuation
+    # Send synthesized audio down the WebSocket as binary frames instead of a URL to fetch
+    TTS_WS_AUDIO_ENABLED: bool = os.getenv("AVATAR_TTS_WS_AUDIO", "false").lower() == "true"
 
     # TTS Quality Mode Settings (CosyVoice2)
     TTS_ENABLE_HQ_MODE: bool = bool(os.getenv("AVATAR_TTS_ENABLE_HQ", "true").lower() == "true")  # Enable by default
     TTS_HQ_MODEL_PATH: str = os.getenv("AVATAR_TTS_HQ_MODEL", "CosyVoice/pretrained_models/CosyVoice2-0.5B")
+    TTS_DEFAULT_MODE: str = os.getenv("AVATAR_TTS_MODE", "fast").lower()  # fast or hq; client can send tts_mode on audio_end
 
     # Performance thresholds (KPIs)
     TARGET_E2E_LATENCY_SEC: float = 3.5  # P95 target
@@ -116,31 +207,27 @@ class Config:
             GPU device ID with most available VRAM
         """
         try:
-            import torch
-            if not torch.cuda.is_available():
+            from avatar.core.gpu_telemetry import get_gpu_telemetry
+
+            snapshot = get_gpu_telemetry().snapshot()
+            if not snapshot.gpus:
                 raise RuntimeError("CUDA not available")
 
-            gpu_count = torch.cuda.device_count()
             best_gpu = 0
             max_memory = 0
 
-            print(f"🔍 Scanning {gpu_count} GPUs for optimal selection:")
-
-            for i in range(gpu_count):
-                props = torch.cuda.get_device_properties(i)
-                total_memory = props.total_memory / (1024**3)  # GB
+            print(f"🔍 Scanning {len(snapshot.gpus)} GPUs for optimal selection:")
 
-                # Get current memory usage
-                torch.cuda.set_device(i)
-                allocated = torch.cuda.memory_allocated(i) / (1024**3)
-                available = total_memory - allocated
+            for gpu in snapshot.gpus:
+                # Device-wide free memory (includes other processes with NVML)
+                available = gpu.free_gb
 
-                print(f"  GPU {i}: {props.name}")
-                print(f"    Total: {total_memory:.1f}GB, Available: {available:.1f}GB")
+                print(f"  GPU {gpu.device_id}: {gpu.name}")
+                print(f"    Total: {gpu.total_gb:.1f}GB, Available: {available:.1f}GB")
 
                 if available > max_memory:
                     max_memory = available
-                    best_gpu = i
+                    best_gpu = gpu.device_id
 
             print(f"✅ Selected GPU {best_gpu} with {max_memory:.1f}GB available VRAM")
             return best_gpu
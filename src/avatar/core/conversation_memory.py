@@ -0,0 +1,224 @@
+"""
+Per-session conversation memory for multi-turn LLM context
+
+Keeps a session's recent turns in process memory (no DB query per turn)
+and builds the chat messages for the next LLM call within a token budget.
+
+Prompt layout:
+    [system prompt] [summary of evicted turns] [turn 1] ... [turn N] [new user message]
+
+Design Philosophy:
+- Token counts are computed once per turn, with the model's own tokenizer
+  when available (estimated until then)
+- Trimming drops old turns in blocks, down to a low watermark, instead of
+  one turn per request: between trims the prompt prefix stays identical,
+  so vLLM prefix caching can reuse the KV cache of the whole history
+- Summarization of evicted turns is optional and runs off the critical path
+"""
+
+import asyncio
+import re
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+
+import structlog
+
+from avatar.core.config import config
+
+logger = structlog.get_logger()
+
+TokenCounter = Callable[[str], int]
+ChatFunction = Callable[[list[dict[str, str]]], Awaitable[str]]
+
+# Chat-template tokens around each message (<|im_start|>role\n ... <|im_end|>\n)
+MESSAGE_OVERHEAD_TOKENS = 5
+
+# After a trim, history is cut down to this fraction of the budget
+TRIM_TARGET_RATIO = 0.6
+
+SUMMARY_MAX_TOKENS = 200
+
+SUMMARY_PREFIX = "Summary of the earlier conversation: "
+
+SUMMARIZE_INSTRUCTION = (
+    "Summarize the conversation below in at most 150 words. Keep names, facts, "
+    "preferences and open questions; drop small talk. Reply with the summary only, "
+    "in the language of the conversation."
+)
+
+_CJK_PATTERN = re.compile(r"[\u3000-\u30ff\u3400-\u9fff\uac00-\ud7af\uff00-\uffef]")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough token count used until the real tokenizer is available
+
+    CJK characters are about one token each; other text about four
+    characters per token.
+    """
+    cjk = len(_CJK_PATTERN.findall(text))
+    return cjk + (len(text) - cjk + 3) // 4
+
+
+def token_counter_from_tokenizer(tokenizer) -> TokenCounter:
+    """Wrap a HuggingFace tokenizer as a TokenCounter"""
+    def count(text: str) -> int:
+        return len(tokenizer.encode(text, add_special_tokens=False))
+    return count
+
+
+@dataclass
+class Turn:
+    """One user/assistant exchange"""
+    user: str
+    assistant: str
+    tokens: int
+
+
+class ConversationMemory:
+    """
+    Rolling, token-budgeted history of one conversation session
+
+    Usage:
+        memory = ConversationMemory()
+        messages = memory.build_messages(user_text, system_prompt=persona)
+        ... generate response ...
+        evicted = memory.add_turn(user_text, response)
+    """
+
+    def __init__(
+        self,
+        token_budget: int = config.LLM_HISTORY_TOKENS,
+        max_turns: int = config.LLM_HISTORY_MAX_TURNS,
+        count_tokens: Optional[TokenCounter] = None
+    ):
+        """
+        Args:
+            token_budget: Max tokens of past turns (and summary) in the prompt
+            max_turns: Max turns kept, regardless of tokens
+            count_tokens: Token counter, None to estimate until set_token_counter()
+        """
+        self.token_budget = token_budget
+        self.max_turns = max_turns
+        self.turns: list[Turn] = []
+        self.summary = ""
+
+        self._count_tokens: TokenCounter = count_tokens or estimate_tokens
+        self.has_tokenizer = count_tokens is not None
+        self._summary_tokens = 0
+        self._summary_lock = asyncio.Lock()
+
+    @property
+    def history_tokens(self) -> int:
+        """Tokens currently used by the summary and kept turns"""
+        return self._summary_tokens + sum(turn.tokens for turn in self.turns)
+
+    def set_token_counter(self, count_tokens: TokenCounter):
+        """Switch to the model's tokenizer and recount kept turns"""
+        self._count_tokens = count_tokens
+        self.has_tokenizer = True
+        for turn in self.turns:
+            turn.tokens = self._turn_tokens(turn.user, turn.assistant)
+        self._summary_tokens = self._message_tokens(SUMMARY_PREFIX + self.summary) if self.summary else 0
+
+    def build_messages(self, user_text: str, system_prompt: Optional[str] = None) -> list[dict[str, str]]:
+        """
+        Chat messages for the next request: stable prefix, then the new message
+
+        Args:
+            user_text: New user message
+            system_prompt: Fixed persona placed first (keeps the prefix cacheable)
+
+        Returns:
+            List of message dicts with 'role' and 'content'
+        """
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        if self.summary:
+            messages.append({"role": "system", "content": SUMMARY_PREFIX + self.summary})
+
+        for turn in self.turns:
+            messages.append({"role": "user", "content": turn.user})
+            messages.append({"role": "assistant", "content": turn.assistant})
+
+        messages.append({"role": "user", "content": user_text})
+        return messages
+
+    def add_turn(self, user_text: str, assistant_text: str) -> list[Turn]:
+        """
+        Record a finished turn and trim the history if it is over budget
+
+        Returns:
+            Turns evicted by this call (oldest first), for summarization
+        """
+        self.turns.append(Turn(user_text, assistant_text, self._turn_tokens(user_text, assistant_text)))
+
+        if self.history_tokens <= self.token_budget and len(self.turns) <= self.max_turns:
+            return []
+
+        # Trim well below the limit so the next trims (prefix changes) are rare
+        target_tokens = int(self.token_budget * TRIM_TARGET_RATIO)
+        target_turns = max(1, int(self.max_turns * TRIM_TARGET_RATIO))
+
+        evicted = []
+        while len(self.turns) > 1 and (
+            self.history_tokens > target_tokens or len(self.turns) > target_turns
+        ):
+            evicted.append(self.turns.pop(0))
+
+        logger.debug("memory.trimmed",
+                    evicted_turns=len(evicted),
+                    kept_turns=len(self.turns),
+                    history_tokens=self.history_tokens)
+
+        return evicted
+
+    async def summarize(self, evicted: list[Turn], chat: ChatFunction):
+        """
+        Fold evicted turns into the running summary
+
+        Meant to run as a background task after the turn completes; the
+        new summary takes effect from the next request after it finishes.
+
+        Args:
+            evicted: Turns returned by add_turn
+            chat: Non-streaming chat function (e.g. LLM provider's chat)
+        """
+        if not evicted:
+            return
+
+        async with self._summary_lock:
+            transcript = "\n".join(
+                f"User: {turn.user}\nAssistant: {turn.assistant}" for turn in evicted
+            )
+            if self.summary:
+                transcript = f"{SUMMARY_PREFIX}{self.summary}\n{transcript}"
+
+            try:
+                summary = await chat([
+                    {"role": "system", "content": SUMMARIZE_INSTRUCTION},
+                    {"role": "user", "content": transcript},
+                ])
+            except Exception as e:
+                logger.warning("memory.summarize_failed", error=str(e))
+                return
+
+            self.summary = summary.strip()
+            self._summary_tokens = self._message_tokens(SUMMARY_PREFIX + self.summary)
+
+            logger.info("memory.summarized",
+                       evicted_turns=len(evicted),
+                       summary_tokens=self._summary_tokens)
+
+    def clear(self):
+        """Forget all turns and the summary"""
+        self.turns.clear()
+        self.summary = ""
+        self._summary_tokens = 0
+
+    def _message_tokens(self, text: str) -> int:
+        return self._count_tokens(text) + MESSAGE_OVERHEAD_TOKENS
+
+    def _turn_tokens(self, user_text: str, assistant_text: str) -> int:
+        return self._message_tokens(user_text) + self._message_tokens(assistant_text)
@@ -0,0 +1,297 @@
+"""
+Sampled GPU telemetry shared by all VRAM consumers
+
+GPU auto-selection, session admission and the VRAM monitor used to query
+torch.cuda on their own, several of them on every request. GPUTelemetry
+samples all GPUs on a fixed cadence into a ring buffer and every consumer
+reads the latest snapshot instead.
+
+Memory sources:
+- NVML (pynvml, installed with vLLM): device-wide used memory, which covers
+  vLLM's preallocated pool, CUDA contexts and other processes, plus the
+  memory of this process
+- torch allocator: allocated/reserved by this process (always collected)
+
+Without NVML, used memory falls back to what torch has reserved.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, List, Optional, Tuple
+
+import structlog
+import torch
+
+from avatar.core.config import config
+
+logger = structlog.get_logger()
+
+GB = 1024 ** 3
+
+
+@dataclass(frozen=True)
+class GPUSample:
+    """Telemetry of one GPU at one point in time"""
+    device_id: int                  # CUDA device index
+    name: str
+    total_gb: float
+    used_gb: float                  # Device-wide (NVML), or torch reserved without NVML
+    process_gb: float               # This process (NVML), or torch reserved without NVML
+    allocated_gb: float             # torch allocator
+    reserved_gb: float              # torch caching allocator
+    temperature_c: Optional[float] = None
+    power_usage_w: Optional[float] = None
+    utilization_percent: Optional[float] = None
+
+    @property
+    def free_gb(self) -> float:
+        return max(0.0, self.total_gb - self.used_gb)
+
+    @property
+    def usage_percent(self) -> float:
+        return (self.used_gb / self.total_gb) * 100 if self.total_gb > 0 else 0.0
+
+
+@dataclass(frozen=True)
+class TelemetrySnapshot:
+    """All GPUs sampled together"""
+    timestamp: float
+    gpus: Tuple[GPUSample, ...]
+    source: str                     # "nvml", "torch" or "none" (no CUDA)
+
+    def gpu(self, device_id: int) -> Optional[GPUSample]:
+        for sample in self.gpus:
+            if sample.device_id == device_id:
+                return sample
+        return None
+
+
+@dataclass
+class _Device:
+    """Static per-device information, resolved once"""
+    device_id: int
+    name: str
+    total_gb: float
+    nvml_handle: Any = None
+
+
+class GPUTelemetry:
+    """
+    Fixed-cadence GPU sampler with a ring buffer of snapshots
+
+    Usage:
+        telemetry = get_gpu_telemetry()
+        telemetry.start()                  # Background sampling (event loop)
+        snapshot = telemetry.snapshot()    # Latest sample, no GPU query
+
+    snapshot() samples synchronously only when the latest sample is older
+    than max_age, e.g. before the sampler is started.
+    """
+
+    def __init__(
+        self,
+        interval: float = config.GPU_TELEMETRY_INTERVAL,
+        history_size: int = config.GPU_TELEMETRY_HISTORY
+    ):
+        """
+        Args:
+            interval: Seconds between samples
+            history_size: Snapshots kept in the ring buffer
+        """
+        self.interval = interval
+        self.history: Deque[TelemetrySnapshot] = deque(maxlen=max(1, history_size))
+
+        self._devices: Optional[List[_Device]] = None
+        self._nvml = None
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+        self.sample_count = 0
+        self.on_demand_samples = 0
+        self.last_sample_ms = 0.0
+
+    @property
+    def source(self) -> str:
+        if not self._devices:
+            return "none"
+        return "nvml" if self._nvml is not None else "torch"
+
+    def _init_devices(self) -> List[_Device]:
+        """Resolve device names, sizes and NVML handles (first sample only)"""
+        if not torch.cuda.is_available():
+            return []
+
+        try:
+            import pynvml
+            pynvml.nvmlInit()
+            self._nvml = pynvml
+        except Exception as e:  # Not installed, or no NVIDIA driver
+            logger.info("gpu_telemetry.nvml_unavailable", error=str(e))
+
+        devices = []
+        for device_id in range(torch.cuda.device_count()):
+            props = torch.cuda.get_device_properties(device_id)
+            devices.append(_Device(
+                device_id=device_id,
+                name=props.name,
+                total_gb=props.total_memory / GB,
+                nvml_handle=self._nvml_handle(device_id, props)
+            ))
+
+        logger.info("gpu_telemetry.init",
+                   gpu_count=len(devices),
+                   source="nvml" if self._nvml is not None else "torch",
+                   interval=self.interval)
+        return devices
+
+    def _nvml_handle(self, device_id: int, props) -> Any:
+        """NVML handle of a CUDA device (matched by UUID; NVML order may differ)"""
+        if self._nvml is None:
+            return None
+
+        try:
+            uuid = getattr(props, "uuid", None)
+            if uuid is not None:
+                return self._nvml.nvmlDeviceGetHandleByUUID(f"GPU-{uuid}")
+            return self._nvml.nvmlDeviceGetHandleByIndex(device_id)
+        except Exception as e:
+            logger.warning("gpu_telemetry.nvml_handle_failed", device_id=device_id, error=str(e))
+            return None
+
+    def _sample_device(self, device: _Device) -> GPUSample:
+        allocated_gb = torch.cuda.memory_allocated(device.device_id) / GB
+        reserved_gb = torch.cuda.memory_reserved(device.device_id) / GB
+        used_gb = process_gb = reserved_gb
+        temperature = power = utilization = None
+
+        handle = device.nvml_handle
+        if handle is not None:
+            nvml = self._nvml
+            used_gb = nvml.nvmlDeviceGetMemoryInfo(handle).used / GB
+
+            # PIDs do not match inside containers; keep the torch figure then
+            pid = os.getpid()
+            own = [
+                process.usedGpuMemory or 0
+                for process in nvml.nvmlDeviceGetComputeRunningProcesses(handle)
+                if process.pid == pid
+            ]
+            if own:
+                process_gb = sum(own) / GB
+
+            try:
+                temperature = float(nvml.nvmlDeviceGetTemperature(handle, nvml.NVML_TEMPERATURE_GPU))
+                power = nvml.nvmlDeviceGetPowerUsage(handle) / 1000.0  # mW -> W
+                utilization = float(nvml.nvmlDeviceGetUtilizationRates(handle).gpu)
+            except Exception:
+                pass  # Not supported on every board
+
+        return GPUSample(
+            device_id=device.device_id,
+            name=device.name,
+            total_gb=round(device.total_gb, 2),
+            used_gb=round(used_gb, 2),
+            process_gb=round(process_gb, 2),
+            allocated_gb=round(allocated_gb, 2),
+            reserved_gb=round(reserved_gb, 2),
+            temperature_c=temperature,
+            power_usage_w=round(power, 1) if power is not None else None,
+            utilization_percent=utilization
+        )
+
+    def sample(self) -> TelemetrySnapshot:
+        """Sample all GPUs now and append to the ring buffer"""
+        with self._lock:
+            start = time.perf_counter()
+            if self._devices is None:
+                self._devices = self._init_devices()
+
+            gpus = []
+            for device in self._devices:
+                try:
+                    gpus.append(self._sample_device(device))
+                except Exception as e:
+                    logger.error("gpu_telemetry.sample_error", device_id=device.device_id, error=str(e))
+
+            snapshot = TelemetrySnapshot(timestamp=time.time(), gpus=tuple(gpus), source=self.source)
+            self.history.append(snapshot)
+            self.sample_count += 1
+            self.last_sample_ms = (time.perf_counter() - start) * 1000
+
+        return snapshot
+
+    def snapshot(self, max_age: Optional[float] = None) -> TelemetrySnapshot:
+        """
+        Latest snapshot
+
+        Args:
+            max_age: Oldest acceptable sample in seconds (default: two intervals)
+
+        Returns:
+            Latest snapshot, sampled now if none is fresh enough
+        """
+        max_age = 2 * self.interval if max_age is None else max_age
+        latest = self.history[-1] if self.history else None
+
+        if latest is not None and time.time() - latest.timestamp <= max_age:
+            return latest
+
+        self.on_demand_samples += 1
+        return self.sample()
+
+    def start(self):
+        """Start background sampling (requires a running event loop)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._sampling_loop())
+            logger.info("gpu_telemetry.started", interval=self.interval)
+
+    def stop(self):
+        """Stop background sampling"""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            logger.info("gpu_telemetry.stopped")
+
+    async def _sampling_loop(self):
+        """Sample in a worker thread so NVML calls never block the event loop"""
+        loop = asyncio.get_running_loop()
+
+        try:
+            while True:
+                await loop.run_in_executor(None, self.sample)
+                await asyncio.sleep(self.interval)
+
+        except asyncio.CancelledError:
+            logger.info("gpu_telemetry.loop_cancelled")
+        except Exception as e:
+            logger.error("gpu_telemetry.loop_error", error=str(e))
+
+    def get_stats(self) -> dict:
+        """Sampler status for monitoring endpoints"""
+        latest = self.history[-1] if self.history else None
+        return {
+            "source": self.source,
+            "interval_sec": self.interval,
+            "history_size": len(self.history),
+            "history_capacity": self.history.maxlen,
+            "samples": self.sample_count,
+            "on_demand_samples": self.on_demand_samples,
+            "last_sample_ms": round(self.last_sample_ms, 2),
+            "last_sample_age_sec": round(time.time() - latest.timestamp, 2) if latest else None,
+            "running": self._task is not None and not self._task.done(),
+        }
+
+
+# Global instance shared by config, SessionManager and VRAMMonitor
+_gpu_telemetry: Optional[GPUTelemetry] = None
+
+
+def get_gpu_telemetry() -> GPUTelemetry:
+    """Get global GPU telemetry sampler"""
+    global _gpu_telemetry
+    if _gpu_telemetry is None:
+        _gpu_telemetry = GPUTelemetry()
+    return _gpu_telemetry
@@ -6,6 +6,7 @@ Based on Linus's principle: "The best optimization is doing work once, not optim
 
 Design Philosophy:
 - Load everything at startup (simple, predictable)
+- Independent models load concurrently; models sharing a GPU load in order
 - No lazy loading for production models
 - Clear separation of concerns
 - Robust error handling with fallbacks
@@ -13,7 +14,7 @@ Design Philosophy:
 
 import asyncio
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 import structlog
 import torch
@@ -23,6 +24,7 @@ from avatar.services.llm import get_llm_service
 from avatar.services.tts import get_tts_service
 from avatar.services.tts_hq import get_tts_hq_service
 from avatar.core.config import config
+from avatar.core.preload_scheduler import PreloadTask, run_preload_tasks
 
 logger = structlog.get_logger()
 
@@ -43,33 +45,38 @@ class ModelPreloader:
             "tts_hq": {"loaded": False, "load_time": 0, "error": None}
         }
         self.total_preload_time = 0
+        self.timeline: Dict[str, Dict[str, Any]] = {}
 
     async def preload_all_models(self, enable_hq_tts: bool = True) -> Dict[str, Any]:
         """
-        Preload all AI models in optimal order
+        Preload all AI models, independent ones concurrently
+
+        Whisper (CPU), vLLM and the TTS models load in parallel where their
+        devices allow; models sharing a GPU load in the order below, vLLM
+        first since it sizes its KV cache from the VRAM it finds free.
+        F5-TTS always waits for vLLM (see _build_tasks).
+        With AVATAR_PRELOAD_PARALLEL=false everything loads sequentially.
 
         Args:
             enable_hq_tts: Whether to preload HQ TTS (CosyVoice2)
 
         Returns:
-            Dict with preload status and timing information
+            Dict with preload status, timing and per-model timeline
         """
-        logger.info("model_preloader.start", enable_hq_tts=enable_hq_tts)
+        logger.info("model_preloader.start",
+                   enable_hq_tts=enable_hq_tts,
+                   parallel=config.MODEL_PRELOAD_PARALLEL)
         start_total = time.time()
 
-        # Preload in optimal order based on resource usage and dependencies
-        # 1. STT first (CPU, fastest, no VRAM)
-        await self._preload_stt()
-
-        # 2. LLM (largest VRAM consumer, takes longest)
-        await self._preload_llm()
-
-        # 3. TTS Fast (medium VRAM, shared with LLM GPU)
-        await self._preload_tts_fast()
+        tasks = await self._build_tasks(enable_hq_tts and config.TTS_ENABLE_HQ_MODE)
+        self.timeline = await run_preload_tasks(tasks)
 
-        # 4. TTS HQ (if enabled, uses separate GPU ideally)
-        if enable_hq_tts and config.TTS_ENABLE_HQ_MODE:
-            await self._preload_tts_hq()
+        for name, entry in self.timeline.items():
+            self.preload_status[name].update({
+                "loaded": entry["loaded"],
+                "load_time": entry["duration"],
+                "error": entry["error"]
+            })
 
         self.total_preload_time = time.time() - start_total
 
@@ -81,110 +88,83 @@ class ModelPreloader:
 
         return summary
 
+    async def _build_tasks(self, enable_hq_tts: bool) -> List[PreloadTask]:
+        """Preload tasks in priority order, with the device each model loads on"""
+        gpu_available = torch.cuda.is_available()
+
+        tasks = [
+            PreloadTask("stt", self._preload_stt, device=config.WHISPER_DEVICE),
+            # vLLM workers always run on the first visible GPU (local rank 0)
+            PreloadTask("llm", self._preload_llm, device="cuda:0" if gpu_available else None),
+            # F5TTSProvider picks the GPU with the most free VRAM when it is
+            # constructed, so it is not constructed here: only once vLLM has
+            # allocated does that choice avoid vLLM's GPU
+            PreloadTask("tts_fast", self._preload_tts_fast, after=("llm",)),
+        ]
+        if enable_hq_tts:
+            tasks.append(PreloadTask("tts_hq", self._preload_tts_hq, device=get_tts_hq_service().device))
+
+        if not config.MODEL_PRELOAD_PARALLEL:
+            # Chain every task to the previous one: one model at a time
+            for previous, task in zip(tasks, tasks[1:]):
+                task.after = (previous.name,)
+
+        return tasks
+
     async def _preload_stt(self):
         """Preload Speech-to-Text model (Whisper)"""
-        try:
-            start = time.time()
-            logger.info("model_preloader.stt_start")
+        logger.info("model_preloader.stt_start")
 
-            stt_service = await get_stt_service()
+        stt_service = await get_stt_service()
 
-            # Warm up with dummy transcription to fully load model
-            dummy_audio = config.AUDIO_RAW / "test_sample.wav"
-            if dummy_audio.exists():
-                await stt_service.transcribe(dummy_audio)
+        # Load weights off the event loop so other models keep loading
+        if hasattr(stt_service, "_load_model"):
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, stt_service._load_model)
 
-            load_time = time.time() - start
-            self.preload_status["stt"].update({
-                "loaded": True,
-                "load_time": load_time
-            })
-
-            logger.info("model_preloader.stt_success", load_time=load_time)
-
-        except Exception as e:
-            self.preload_status["stt"]["error"] = str(e)
-            logger.error("model_preloader.stt_failed", error=str(e))
+        # Warm up with dummy transcription to fully load model
+        dummy_audio = config.AUDIO_RAW / "test_sample.wav"
+        if dummy_audio.exists():
+            await stt_service.transcribe(dummy_audio)
 
     async def _preload_llm(self):
         """Preload Large Language Model (vLLM)"""
-        try:
-            start = time.time()
-            logger.info("model_preloader.llm_start")
-
-            llm_service = await get_llm_service()
-
-            # Warm up with dummy inference to build CUDA graphs
-            dummy_messages = [{"role": "user", "content": "Hello"}]
-            dummy_response = ""
-            async for chunk in llm_service.chat_stream(
-                dummy_messages,
-                max_tokens=5,
-                temperature=0.1
-            ):
-                dummy_response += chunk
-                break  # Just get first token
-
-            load_time = time.time() - start
-            self.preload_status["llm"].update({
-                "loaded": True,
-                "load_time": load_time
-            })
+        logger.info("model_preloader.llm_start")
 
-            logger.info("model_preloader.llm_success",
-                       load_time=load_time,
-                       warmup_response=dummy_response[:50])
+        llm_service = await get_llm_service()
 
-        except Exception as e:
-            self.preload_status["llm"]["error"] = str(e)
-            logger.error("model_preloader.llm_failed", error=str(e))
+        # Warm up with dummy inference to build CUDA graphs
+        dummy_messages = [{"role": "user", "content": "Hello"}]
+        dummy_response = ""
+        async for chunk in llm_service.chat_stream(
+            dummy_messages,
+            max_tokens=5,
+            temperature=0.1
+        ):
+            dummy_response += chunk
+            break  # Just get first token
+
+        logger.info("model_preloader.llm_warmup",
+                   warmup_response=dummy_response[:50])
 
     async def _preload_tts_fast(self):
         """Preload Fast TTS model (F5-TTS)"""
-        try:
-            start = time.time()
-            logger.info("model_preloader.tts_fast_start")
-
-            tts_service = await get_tts_service()
-
-            # Trigger model loading by accessing private model
-            # This loads F5-TTS model without full synthesis
-            tts_service._load_model()
-
-            load_time = time.time() - start
-            self.preload_status["tts_fast"].update({
-                "loaded": True,
-                "load_time": load_time
-            })
+        logger.info("model_preloader.tts_fast_start")
 
-            logger.info("model_preloader.tts_fast_success", load_time=load_time)
+        tts_service = await get_tts_service()
 
-        except Exception as e:
-            self.preload_status["tts_fast"]["error"] = str(e)
-            logger.error("model_preloader.tts_fast_failed", error=str(e))
+        # Load F5-TTS model without full synthesis, off the event loop
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, tts_service._load_model)
 
     async def _preload_tts_hq(self):
         """Preload High-Quality TTS model (CosyVoice2)"""
-        try:
-            start = time.time()
-            logger.info("model_preloader.tts_hq_start")
-
-            tts_hq_service = get_tts_hq_service()
-
-            # Trigger model loading
-            await tts_hq_service._ensure_model_loaded()
-
-            load_time = time.time() - start
-            self.preload_status["tts_hq"].update({
-                "loaded": True,
-                "load_time": load_time
-            })
+        logger.info("model_preloader.tts_hq_start")
 
-            logger.info("model_preloader.tts_hq_success", load_time=load_time)
+        tts_hq_service = get_tts_hq_service()
 
-        except Exception as e:
-            self.preload_status["tts_hq"]["error"] = str(e)
-            logger.error("model_preloader.tts_hq_failed", error=str(e))
+        # Trigger model loading (runs in executor)
+        await tts_hq_service._ensure_model_loaded()
 
     def _generate_preload_summary(self) -> Dict[str, Any]:
         """Generate comprehensive preload summary"""
@@ -209,10 +189,11 @@ class ModelPreloader:
             failed_models = [name for name, status in self.preload_status.items() if not status["loaded"]]
             summary["recommendations"].append(f"Failed models: {failed_models}. Check errors and retry.")
 
-        # VRAM usage recommendations
-        total_load_time = sum(status["load_time"] for status in self.preload_status.values() if status["loaded"])
-        if total_load_time > 30:
-            summary["recommendations"].append("Consider parallel model loading to reduce startup time.")
+        # Per-model timeline; sequential_time vs total shows the overlap gained
+        summary["timeline"] = self.timeline.copy()
+        summary["sequential_time"] = round(sum(entry["duration"] for entry in self.timeline.values()), 3)
+        if self.total_preload_time > 0:
+            summary["parallel_speedup"] = round(summary["sequential_time"] / self.total_preload_time, 2)
 
         return summary
 
@@ -221,6 +202,7 @@ class ModelPreloader:
         return {
             "status": self.preload_status.copy(),
             "total_time": self.total_preload_time,
+            "timeline": self.timeline.copy(),
             "loaded_models": [name for name, status in self.preload_status.items() if status["loaded"]],
             "failed_models": [name for name, status in self.preload_status.items() if status.get("error")]
         }
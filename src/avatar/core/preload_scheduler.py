@@ -0,0 +1,135 @@
+"""
+Dependency-aware scheduler for concurrent model loading
+
+Models that do not share a device load at the same time (Whisper on CPU
+while vLLM loads on one GPU and the TTS models on another). Models on the
+same GPU load one after another in declaration order: vLLM sizes its KV
+cache from the free VRAM it sees at load time, so a concurrent load on its
+GPU would make that measurement wrong.
+
+Ordering is soft: a failed load still releases the models waiting on it,
+so one broken model does not block the rest of the startup.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional
+
+import structlog
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class PreloadTask:
+    """One model to load"""
+    name: str
+    load: Callable[[], Awaitable[Any]]
+    device: Optional[str] = None   # "cuda:N"; None for CPU-only models
+    after: tuple[str, ...] = ()     # Tasks that must finish first (declared earlier)
+
+
+def device_key(device: Optional[str]) -> Optional[str]:
+    """
+    Normalize a torch device string for ordering
+
+    Returns:
+        "cuda:N", or None for CPU (no ordering needed)
+    """
+    if not device or device == "cpu":
+        return None
+    if device == "cuda":
+        return "cuda:0"  # Unset device resolves to GPU 0 in a fresh thread
+    return device
+
+
+def _resolve_dependencies(tasks: list[PreloadTask]) -> dict[str, list[str]]:
+    """Explicit dependencies plus the previous task on the same device"""
+    seen: set[str] = set()
+    last_on_device: dict[str, str] = {}
+    dependencies: dict[str, list[str]] = {}
+
+    for task in tasks:
+        if task.name in seen:
+            raise ValueError(f"Duplicate preload task: {task.name}")
+
+        unknown = [name for name in task.after if name not in seen]
+        if unknown:
+            raise ValueError(f"Preload task {task.name} depends on undeclared tasks: {unknown}")
+
+        deps = list(task.after)
+        device = device_key(task.device)
+        if device is not None:
+            previous = last_on_device.get(device)
+            if previous is not None and previous not in deps:
+                deps.append(previous)
+            last_on_device[device] = task.name
+
+        dependencies[task.name] = deps
+        seen.add(task.name)
+
+    return dependencies
+
+
+async def run_preload_tasks(tasks: list[PreloadTask]) -> dict[str, dict[str, Any]]:
+    """
+    Run preload tasks as concurrently as their devices and dependencies allow
+
+    Args:
+        tasks: Tasks in priority order (earlier tasks win a shared device)
+
+    Returns:
+        Timeline per task name: device, after, start/end offsets (seconds
+        since the scheduler started), wait and duration, loaded, error
+
+    Raises:
+        ValueError: Duplicate names or dependencies on undeclared tasks
+    """
+    dependencies = _resolve_dependencies(tasks)
+
+    loop = asyncio.get_running_loop()
+    finished = {task.name: loop.create_future() for task in tasks}
+    origin = time.perf_counter()
+
+    async def run(task: PreloadTask) -> dict[str, Any]:
+        entry: dict[str, Any] = {
+            "device": device_key(task.device) or "cpu",
+            "after": dependencies[task.name],
+            "loaded": False,
+            "error": None,
+        }
+
+        try:
+            for name in dependencies[task.name]:
+                await finished[name]
+
+            entry["start"] = round(time.perf_counter() - origin, 3)
+            logger.info("model_preloader.task_start",
+                       model=task.name,
+                       device=entry["device"],
+                       waited_sec=entry["start"])
+
+            await task.load()
+            entry["loaded"] = True
+
+        except Exception as e:
+            entry["error"] = str(e)
+            logger.error("model_preloader.task_failed", model=task.name, error=str(e))
+
+        finally:
+            end = round(time.perf_counter() - origin, 3)
+            entry.setdefault("start", end)
+            entry["end"] = end
+            entry["wait"] = entry["start"]
+            entry["duration"] = round(end - entry["start"], 3)
+            finished[task.name].set_result(None)
+
+        logger.info("model_preloader.task_done",
+                   model=task.name,
+                   loaded=entry["loaded"],
+                   duration_sec=entry["duration"])
+        return entry
+
+    entries = await asyncio.gather(*(run(task) for task in tasks))
+    return {task.name: entry for task, entry in zip(tasks, entries)}
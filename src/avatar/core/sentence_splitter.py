@@ -0,0 +1,161 @@
+"""
+Incremental sentence splitter for streaming TTS
+
+Cuts a streamed LLM response into speakable sentences while tokens are
+still arriving, so each sentence can be synthesized before the LLM has
+finished the whole answer.
+
+Boundary rules:
+- CJK terminators (。！？；…) and newlines end a sentence immediately
+- ASCII terminators (. ! ?) only end a sentence when followed by
+  whitespace, so "3.14" or "v1.2" stay in one piece
+- Trailing closers (」”） etc.) stay attached to their sentence
+- Sentences shorter than min_chars are merged with the next one
+- Text without any terminator is cut at max_chars (soft punctuation first)
+
+Design Philosophy (Linus-style):
+- Pure string processing, no model or tokenizer dependency
+- A boundary is only confirmed once the next character has arrived,
+  so a token split in the middle of "……" or '."' never breaks early
+"""
+
+from typing import Optional
+
+# Characters that end a sentence on their own (CJK does not use spaces)
+_CJK_TERMINATORS = "。！？；…\n"
+
+# ASCII terminators need a following whitespace to count as a boundary
+_ASCII_TERMINATORS = ".!?;"
+
+_TERMINATORS = _CJK_TERMINATORS + _ASCII_TERMINATORS
+
+# Closing quotes/brackets that belong to the preceding sentence
+_CLOSERS = "」』”’）》】)]\"'"
+
+# Preferred cut points when a sentence exceeds max_chars
+_SOFT_BREAKS = "，、,：:"
+
+
+class SentenceSplitter:
+    """
+    Stateful splitter fed with streamed text chunks
+
+    Usage:
+        splitter = SentenceSplitter()
+        async for chunk in llm.chat_stream(messages):
+            for sentence in splitter.feed(chunk):
+                enqueue_tts(sentence)
+        for sentence in splitter.flush():
+            enqueue_tts(sentence)
+    """
+
+    def __init__(self, min_chars: int = 6, max_chars: int = 120):
+        """
+        Args:
+            min_chars: Minimum sentence length; shorter ones merge forward
+            max_chars: Force a cut when no terminator appears within this length
+        """
+        if min_chars < 1 or max_chars < min_chars:
+            raise ValueError(
+                f"Invalid splitter limits: min_chars={min_chars}, max_chars={max_chars}"
+            )
+
+        self.min_chars = min_chars
+        self.max_chars = max_chars
+        self._buffer = ""
+        self._scan_from = 0
+
+    def feed(self, text: str) -> list[str]:
+        """
+        Append streamed text and return every sentence completed by it
+
+        Args:
+            text: Next chunk of LLM output (delta, not cumulative)
+
+        Returns:
+            Completed sentences in order (may be empty)
+        """
+        self._buffer += text
+
+        sentences = []
+        while True:
+            sentence = self._next_sentence()
+            if sentence is None:
+                break
+            sentences.append(sentence)
+
+        return sentences
+
+    def flush(self) -> list[str]:
+        """
+        Return whatever text is left once the stream has ended
+
+        Returns:
+            Remaining sentence as a single-item list, or empty list
+        """
+        rest = self._buffer.strip()
+        self._buffer = ""
+        self._scan_from = 0
+        return [rest] if rest else []
+
+    def _next_sentence(self) -> Optional[str]:
+        """Extract the next complete sentence from the buffer, if any"""
+        buf = self._buffer
+        n = len(buf)
+        i = self._scan_from
+
+        while i < n:
+            if buf[i] not in _TERMINATORS:
+                i += 1
+                continue
+
+            # Absorb runs like "！！", "……", '."' into the same sentence
+            end = i + 1
+            while end < n and (buf[end] in _TERMINATORS or buf[end] in _CLOSERS):
+                end += 1
+
+            if end == n:
+                # Boundary not confirmed until the next character arrives
+                break
+
+            if buf[i] in _ASCII_TERMINATORS and not buf[end].isspace():
+                # "3.14", "v1.2", "e.g.x" - not a sentence end
+                i = end
+                continue
+
+            sentence = buf[:end].strip()
+            if len(sentence) >= self.min_chars:
+                self._consume(end)
+                return sentence
+
+            # Too short to synthesize on its own, merge with the next one
+            i = end
+
+        self._scan_from = i
+
+        if n >= self.max_chars:
+            cut = self._find_soft_cut(buf[:self.max_chars])
+            sentence = buf[:cut].strip()
+            self._consume(cut)
+            if sentence:
+                return sentence
+
+        return None
+
+    def _consume(self, end: int):
+        """Drop the first `end` characters from the buffer"""
+        self._buffer = self._buffer[end:]
+        self._scan_from = 0
+
+    @staticmethod
+    def _find_soft_cut(window: str) -> int:
+        """Find the best cut position inside an over-long window"""
+        soft = max(window.rfind(ch) for ch in _SOFT_BREAKS)
+        if soft > 0:
+            return soft + 1
+
+        space = max(window.rfind(" "), window.rfind("\t"))
+        if space > 0:
+            return space + 1
+
+        return len(window)
@@ -107,7 +107,7 @@ class SessionController:
                 )
 
             # Try immediate processing if resources available and queue empty
-            if (len(self.session_queue.queue) == 0 and
+            if (self.session_queue.waiting_count == 0 and
                 len(self.session_queue.processing) < self.session_queue.max_concurrent and
                 prediction["can_handle"]):
 
@@ -136,11 +136,7 @@ class SessionController:
                 )
 
                 # Find position in queue
-                queue_position = None
-                for i, session in enumerate(self.session_queue.queue):
-                    if session.session_id == session_id:
-                        queue_position = i
-                        break
+                queue_position = self.session_queue.position_of(session_id)
 
                 estimated_wait = self.session_queue._estimate_wait_time(queue_position or 0)
 
@@ -248,7 +244,7 @@ class SessionController:
             "capacity": {
                 "max_concurrent": self.session_queue.max_concurrent,
                 "current_processing": len(self.session_queue.processing),
-                "queue_size": len(self.session_queue.queue),
+                "queue_size": self.session_queue.waiting_count,
                 "queue_capacity": self.session_queue.max_queue_size,
                 "utilization_percent": (
                     len(self.session_queue.processing) / self.session_queue.max_concurrent * 100
@@ -275,7 +271,7 @@ class SessionController:
 
         for service_type in services:
             prediction = self.vram_monitor.predict_can_handle_service(service_type)
-            queue_estimate = self.session_queue._estimate_wait_time(len(self.session_queue.queue))
+            queue_estimate = self.session_queue._estimate_wait_time(self.session_queue.waiting_count)
 
             availability[service_type] = {
                 "available": prediction["can_handle"],
@@ -323,9 +319,9 @@ class SessionController:
                 issues.append(f"GPU {gpu_status.device_id} high VRAM usage: {gpu_status.usage_percent}%")
 
         # Check queue health
-        if len(self.session_queue.queue) > self.session_queue.max_queue_size * 0.8:
+        if self.session_queue.waiting_count > self.session_queue.max_queue_size * 0.8:
             health_score -= 15
-            issues.append(f"Queue nearly full: {len(self.session_queue.queue)}/{self.session_queue.max_queue_size}")
+            issues.append(f"Queue nearly full: {self.session_queue.waiting_count}/{self.session_queue.max_queue_size}")
 
         # Check processing health
         if len(self.session_queue.processing) == self.session_queue.max_concurrent:
@@ -337,7 +333,7 @@ class SessionController:
             "health_score": max(0, health_score),
             "issues": issues,
             "metrics": {
-                "queue_size": len(self.session_queue.queue),
+                "queue_size": self.session_queue.waiting_count,
                 "processing_count": len(self.session_queue.processing),
                 "vram_usage_max": max([s.usage_percent for s in vram_status] or [0]),
                 "recent_rejections": queue_status["statistics"]["total_rejected"]
@@ -21,6 +21,7 @@ import structlog
 import torch
 
 from avatar.core.config import config
+from avatar.core.gpu_telemetry import GPUSample, get_gpu_telemetry
 
 logger = structlog.get_logger()
 
@@ -183,6 +184,61 @@ class SessionManager:
                        session_id=session_id,
                        active_count=len(self.active_sessions))
 
+    def _get_multi_gpu_vram_status(self) -> List[VRAMStatus]:
+        """VRAM status of all GPUs from the latest telemetry sample"""
+        status_list = []
+
+        for gpu in get_gpu_telemetry().snapshot().gpus:
+            usage_percent = gpu.usage_percent
+            if usage_percent < VRAMThreshold.SAFE.value:
+                threshold = VRAMThreshold.SAFE
+            elif usage_percent < VRAMThreshold.WARNING.value:
+                threshold = VRAMThreshold.WARNING
+            elif usage_percent < VRAMThreshold.CRITICAL.value:
+                threshold = VRAMThreshold.CRITICAL
+            else:
+                threshold = VRAMThreshold.DANGER
+
+            status_list.append(VRAMStatus(
+                device_id=gpu.device_id,
+                device_name=gpu.name,
+                total_gb=gpu.total_gb,
+                allocated_gb=gpu.allocated_gb,
+                reserved_gb=gpu.reserved_gb,
+                free_gb=round(gpu.free_gb, 2),
+                usage_percent=round(usage_percent, 1),
+                threshold=threshold,
+                can_accept_new=threshold != VRAMThreshold.DANGER
+            ))
+
+        return status_list
+
+    def _evaluate_session_acceptance(self, vram_status: List[VRAMStatus],
+                                     service_type: str) -> bool:
+        """
+        Accept unless every GPU is close to exhaustion
+
+        CPU-only hosts always accept; per-service GPU admission happens in
+        SessionQueue when the work actually runs.
+        """
+        if service_type == "stt" or not vram_status:
+            return True
+        return any(status.can_accept_new for status in vram_status)
+
+    def _suggest_gpu_allocation(self, service_type: str) -> Optional[int]:
+        """GPU with the most free VRAM, or None for CPU-only services/hosts"""
+        if service_type == "stt":
+            return None
+
+        gpus = get_gpu_telemetry().snapshot().gpus
+        if not gpus:
+            return None
+        return max(gpus, key=lambda gpu: gpu.free_gb).device_id
+
+    def _primary_gpu(self) -> Optional[GPUSample]:
+        """Latest telemetry sample of GPU 0 (None without CUDA)"""
+        return get_gpu_telemetry().snapshot().gpu(0)
+
     def _check_vram_available(self) -> bool:
         """
         Check if VRAM is available for new session
@@ -194,26 +250,22 @@ class SessionManager:
         90% threshold leaves 10% buffer for spikes.
         Aggressive but prevents OOM.
         """
-        if not torch.cuda.is_available():
+        gpu = self._primary_gpu()
+        if gpu is None:
             return True  # CPU mode always OK
 
-        allocated_gb = torch.cuda.memory_allocated(0) / 1024**3
-        total_gb = torch.cuda.get_device_properties(0).total_memory / 1024**3
-        usage_pct = (allocated_gb / total_gb) * 100
-
         # Threshold: 90%
-        return usage_pct < 90.0
+        return gpu.usage_percent < 90.0
 
     def _get_vram_usage_gb(self) -> float:
         """
         Get current VRAM usage in GB
 
         Returns:
-            VRAM allocated in GB, or 0.0 if CUDA not available
+            VRAM used in GB, or 0.0 if CUDA not available
         """
-        if torch.cuda.is_available():
-            return torch.cuda.memory_allocated(0) / 1024**3
-        return 0.0
+        gpu = self._primary_gpu()
+        return gpu.used_gb if gpu is not None else 0.0
 
     def get_status(self) -> dict:
         """
@@ -223,16 +275,14 @@ class SessionManager:
             Dictionary with status information
         """
         vram_info = {}
-        if torch.cuda.is_available():
-            allocated_gb = torch.cuda.memory_allocated(0) / 1024**3
-            reserved_gb = torch.cuda.memory_reserved(0) / 1024**3
-            total_gb = torch.cuda.get_device_properties(0).total_memory / 1024**3
-
+        gpu = self._primary_gpu()
+        if gpu is not None:
             vram_info = {
-                "allocated_gb": round(allocated_gb, 2),
-                "reserved_gb": round(reserved_gb, 2),
-                "total_gb": round(total_gb, 2),
-                "usage_pct": round((allocated_gb / total_gb) * 100, 1)
+                "allocated_gb": gpu.allocated_gb,
+                "reserved_gb": gpu.reserved_gb,
+                "process_gb": gpu.process_gb,
+                "total_gb": gpu.total_gb,
+                "usage_pct": round(gpu.usage_percent, 1)
             }
 
         return {
@@ -249,11 +299,12 @@ class SessionManager:
         Returns:
             Dictionary with VRAM information:
             - total_gb: Total VRAM in GB
-            - used_gb: Allocated VRAM in GB
+            - used_gb: Used VRAM in GB (device-wide with NVML)
             - free_gb: Free VRAM in GB
             - usage_percent: Usage percentage
         """
-        if not torch.cuda.is_available():
+        gpu = self._primary_gpu()
+        if gpu is None:
             return {
                 "total_gb": 0.0,
                 "used_gb": 0.0,
@@ -261,16 +312,11 @@ class SessionManager:
                 "usage_percent": 0.0
             }
 
-        allocated_gb = torch.cuda.memory_allocated(0) / 1024**3
-        total_gb = torch.cuda.get_device_properties(0).total_memory / 1024**3
-        free_gb = total_gb - allocated_gb
-        usage_pct = (allocated_gb / total_gb) * 100
-
         return {
-            "total_gb": round(total_gb, 2),
-            "used_gb": round(allocated_gb, 2),
-            "free_gb": round(free_gb, 2),
-            "usage_percent": round(usage_pct, 1)
+            "total_gb": gpu.total_gb,
+            "used_gb": gpu.used_gb,
+            "free_gb": round(gpu.free_gb, 2),
+            "usage_percent": round(gpu.usage_percent, 1)
         }
 
     async def try_acquire_session(self, session_id: str, timeout: float = 1.0) -> bool:
@@ -289,7 +335,8 @@ class SessionManager:
 
 # Global singleton instance
 # Linus would approve: simple, no factory pattern, just a global
-_session_manager: SessionManager = SessionManager()
+# Caps WebSocket connections; GPU work is admitted per stage by SessionQueue
+_session_manager: SessionManager = SessionManager(max_sessions=config.MAX_CONNECTIONS)
 
 
 def get_session_manager() -> SessionManager:
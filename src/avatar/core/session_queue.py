@@ -6,14 +6,23 @@ Design Philosophy: Linus-style "Good Taste" - eliminate special cases
 
 Key Principles:
 1. Single queue for all services, priority-based processing
-2. No complex state machines - simple queue + semaphore
+2. No complex state machines - simple heap + slot count
 3. VRAM-aware queuing with predictive acceptance
 4. Fail fast when queue is full (no infinite waiting)
+5. Event-driven: the scheduler sleeps until enqueue, release, cancel,
+   a VRAM change or the next queue timeout - no polling
+6. Per-stage admission: a conversation turn holds an STT, then an LLM,
+   then a TTS slot, each only while that stage runs (see stage())
 """
 
 import asyncio
+import heapq
+import itertools
 import time
-from typing import Dict, List, Optional, Tuple, Any
+from collections import Counter
+from contextlib import asynccontextmanager
+from dataclasses import replace
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
 from enum import Enum
 from uuid import uuid4
@@ -21,10 +30,18 @@ from uuid import uuid4
 import structlog
 
 from avatar.core.config import config
-from avatar.core.vram_monitor import get_vram_monitor, ServicePriority
+from avatar.core.vram_monitor import (
+    SERVICE_VRAM_REQUIREMENTS_GB,
+    ServicePriority,
+    VRAMStatus,
+    get_vram_monitor,
+)
 
 logger = structlog.get_logger()
 
+# Stale heap entries tolerated before compaction
+HEAP_COMPACT_SLACK = 32
+
 
 class QueueState(Enum):
     """Session queue states"""
@@ -35,6 +52,15 @@ class QueueState(Enum):
     CANCELLED = "cancelled"     # Cancelled by user
 
 
+class AdmissionRejected(Exception):
+    """A pipeline stage could not get a slot (queue full or queue timeout)"""
+
+    def __init__(self, service_type: str, reason: str):
+        super().__init__(f"No free {service_type} slot ({reason})")
+        self.service_type = service_type
+        self.reason = reason
+
+
 @dataclass
 class QueuedSession:
     """A session in the queue"""
@@ -50,6 +76,13 @@ class QueuedSession:
     completed_at: Optional[float] = None
     gpu_allocation: Optional[int] = None
     error_reason: Optional[str] = None
+    key: str = ""                              # Queue key (session_id, or "session_id/stage")
+    vram_check: bool = True                    # Admission requires a VRAM prediction
+    admitted: Optional[asyncio.Future] = None  # Resolved on admission (pipeline stages)
+
+    def __post_init__(self):
+        if not self.key:
+            self.key = self.session_id
 
     @property
     def wait_time_seconds(self) -> float:
@@ -77,7 +110,15 @@ class SessionQueue:
     """
     Intelligent session queue with VRAM-aware processing
 
-    Design: Single priority queue + semaphore-based concurrency control
+    Design: Priority heap + event-driven scheduler
+
+    Waiting sessions live in a heap ordered by (priority, arrival); removed
+    entries (cancelled, timed out) are skipped lazily when popped. One
+    scheduling round reads GPU status once and admits as many sessions as
+    free slots and that snapshot allow.
+
+    Each service type also has its own concurrency limit (stage_limits), so
+    a burst of one stage cannot take the slots of the others.
 
     Features:
     - Priority-based queuing (CRITICAL > HIGH > MEDIUM > LOW)
@@ -90,27 +131,36 @@ class SessionQueue:
     def __init__(self,
                  max_concurrent: int = None,
                  max_queue_size: int = None,
-                 default_timeout: float = 30.0):
+                 default_timeout: float = 30.0,
+                 stage_limits: Optional[Dict[str, int]] = None):
         """
         Initialize session queue
 
         Args:
-            max_concurrent: Maximum concurrent processing sessions
+            max_concurrent: Maximum concurrent processing sessions (default: sum of stage limits)
             max_queue_size: Maximum queue size (prevents memory bloat)
             default_timeout: Default timeout for queued sessions
+            stage_limits: Concurrency limit per service type (default from config;
+                          types not listed are only bound by max_concurrent)
         """
-        self.max_concurrent = max_concurrent or config.MAX_CONCURRENT_SESSIONS
+        self.stage_limits = dict(config.STAGE_CONCURRENCY if stage_limits is None else stage_limits)
+        self.max_concurrent = max_concurrent or sum(self.stage_limits.values()) or config.MAX_CONCURRENT_SESSIONS
         self.max_queue_size = max_queue_size or (self.max_concurrent * 3)  # 3x buffer
         self.default_timeout = default_timeout
 
         # Core data structures
-        self.queue: List[QueuedSession] = []
+        self._heap: List[Tuple[int, int, QueuedSession]] = []       # (priority, seq, session)
+        self._deadlines: List[Tuple[float, int, QueuedSession]] = []  # (timeout_at, seq, session)
+        self._waiting: Dict[str, QueuedSession] = {}
+        self._waiting_by_priority: Counter = Counter()
+        self._sequence = itertools.count()
         self.processing: Dict[str, QueuedSession] = {}
         self.completed: Dict[str, QueuedSession] = {}  # Recent completions for stats
+        self._running_by_service: Counter = Counter()
 
         # Concurrency control
-        self._semaphore = asyncio.Semaphore(self.max_concurrent)
         self._queue_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
 
         # Monitoring
         self.vram_monitor = get_vram_monitor()
@@ -120,17 +170,26 @@ class SessionQueue:
             "total_rejected": 0,
             "total_timeouts": 0,
             "avg_wait_time": 0.0,
-            "avg_processing_time": 0.0
+            "avg_processing_time": 0.0,
+            "scheduling_rounds": 0
         }
 
         # Background tasks
         self._queue_processor_task: Optional[asyncio.Task] = None
         self._cleanup_task: Optional[asyncio.Task] = None
+        self._execution_tasks: set = set()
+        self._listening = False
 
         logger.info("session_queue.init",
                    max_concurrent=self.max_concurrent,
                    max_queue_size=self.max_queue_size,
-                   default_timeout=self.default_timeout)
+                   default_timeout=self.default_timeout,
+                   stage_limits=self.stage_limits)
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the scheduler task is active"""
+        return self._queue_processor_task is not None and not self._queue_processor_task.done()
 
     async def start(self):
         """Start background queue processing"""
@@ -140,11 +199,18 @@ class SessionQueue:
         if self._cleanup_task is None or self._cleanup_task.done():
             self._cleanup_task = asyncio.create_task(self._cleanup_completed())
 
+        if not self._listening:
+            self.vram_monitor.add_change_listener(self._on_vram_change)
+            self._listening = True
+
         logger.info("session_queue.started")
 
     async def stop(self):
         """Stop background processing"""
-        tasks = [self._queue_processor_task, self._cleanup_task]
+        self.vram_monitor.remove_change_listener(self._on_vram_change)
+        self._listening = False
+
+        tasks = [self._queue_processor_task, self._cleanup_task, *self._execution_tasks]
         for task in tasks:
             if task and not task.done():
                 task.cancel()
@@ -173,38 +239,111 @@ class SessionQueue:
         Raises:
             asyncio.QueueFull: If queue is at capacity
         """
+        session_timeout = timeout or self.default_timeout
+        queued_session = QueuedSession(
+            session_id=session_id,
+            service_type=service_type,
+            priority=self.vram_monitor.service_priority.get(service_type, ServicePriority.LOW),
+            requested_at=time.time(),
+            timeout_at=time.time() + session_timeout,
+            websocket_connection=websocket_connection,
+            metadata=metadata or {}
+        )
+
+        await self._enqueue(queued_session)
+        return queued_session
+
+    @asynccontextmanager
+    async def stage(self,
+                    session_id: str,
+                    service_type: str,
+                    timeout: Optional[float] = None) -> AsyncIterator[QueuedSession]:
+        """
+        Hold a slot of one pipeline stage for the duration of the block
+
+        Usage:
+            async with queue.stage(session_id, "llm"):
+                response = await llm.chat(...)
+
+        Stages run on resident models whose VRAM (weights, KV cache) is
+        reserved at load time, so admission is bound by the stage's
+        concurrency limit rather than a per-request VRAM prediction.
+        The slot is released when the block exits, also on errors and
+        cancellation.
+
+        Args:
+            session_id: Conversation session
+            service_type: Stage (stt, llm, tts_fast, tts_hq)
+            timeout: Max time to wait for a slot (uses default if None)
+
+        Raises:
+            AdmissionRejected: Queue full, or no slot within the timeout
+        """
+        if not self.is_running:
+            await self.start()
+
+        key = f"{session_id}/{service_type}"
+        if key in self._waiting or key in self.processing:
+            raise RuntimeError(f"Session {session_id} already holds or waits for a {service_type} slot")
+
+        session = QueuedSession(
+            session_id=session_id,
+            service_type=service_type,
+            priority=self.vram_monitor.service_priority.get(service_type, ServicePriority.LOW),
+            requested_at=time.time(),
+            timeout_at=time.time() + (timeout or self.default_timeout),
+            key=key,
+            vram_check=False,
+            admitted=asyncio.get_running_loop().create_future()
+        )
+
+        try:
+            await self._enqueue(session)
+        except asyncio.QueueFull:
+            raise AdmissionRejected(service_type, "queue_full") from None
+
+        try:
+            await session.admitted
+        except asyncio.CancelledError:
+            # Withdraw, or give back a slot granted just before the cancellation
+            if session.state == QueueState.WAITING:
+                self._remove_waiting(session, QueueState.CANCELLED)
+                self._wakeup.set()
+            self._complete(session, error="cancelled")
+            raise
+
+        try:
+            yield session
+        except BaseException as e:
+            self._complete(session, error=str(e) or type(e).__name__)
+            raise
+        else:
+            self._complete(session)
+
+    async def _enqueue(self, queued_session: QueuedSession):
+        """Push a session into the waiting heap and wake the scheduler"""
+        session_id = queued_session.session_id
+        service_type = queued_session.service_type
+        websocket_connection = queued_session.websocket_connection
+        priority = queued_session.priority
+
         async with self._queue_lock:
             # Check queue capacity
-            if len(self.queue) >= self.max_queue_size:
+            if len(self._waiting) >= self.max_queue_size:
                 self.stats["total_rejected"] += 1
                 raise asyncio.QueueFull(f"Queue at capacity ({self.max_queue_size})")
 
-            # Get service priority
-            priority = self.vram_monitor.service_priority.get(
-                service_type, ServicePriority.LOW
+            # Behind every waiting session of the same or higher priority
+            insert_position = sum(
+                count for value, count in self._waiting_by_priority.items()
+                if value <= priority.value
             )
 
-            # Create queued session
-            session_timeout = timeout or self.default_timeout
-            queued_session = QueuedSession(
-                session_id=session_id,
-                service_type=service_type,
-                priority=priority,
-                requested_at=time.time(),
-                timeout_at=time.time() + session_timeout,
-                websocket_connection=websocket_connection,
-                metadata=metadata or {}
-            )
-
-            # Insert in priority order (higher priority = lower number)
-            insert_position = 0
-            for i, existing in enumerate(self.queue):
-                if existing.priority.value > priority.value:
-                    insert_position = i
-                    break
-                insert_position = i + 1
-
-            self.queue.insert(insert_position, queued_session)
+            seq = next(self._sequence)
+            heapq.heappush(self._heap, (priority.value, seq, queued_session))
+            heapq.heappush(self._deadlines, (queued_session.timeout_at, seq, queued_session))
+            self._waiting[queued_session.key] = queued_session
+            self._waiting_by_priority[priority.value] += 1
             self.stats["total_queued"] += 1
 
             logger.info("session_queue.enqueued",
@@ -212,7 +351,7 @@ class SessionQueue:
                        service_type=service_type,
                        priority=priority.name,
                        queue_position=insert_position,
-                       queue_size=len(self.queue))
+                       queue_size=len(self._waiting))
 
             # Notify via WebSocket if available
             if websocket_connection:
@@ -222,87 +361,229 @@ class SessionQueue:
                     "estimated_wait_time": self._estimate_wait_time(insert_position)
                 })
 
-            return queued_session
+        self._wakeup.set()
+
+    @property
+    def queue(self) -> List[QueuedSession]:
+        """Waiting sessions in processing order (snapshot, O(n log n))"""
+        return [
+            session for _, _, session in sorted(self._heap, key=lambda entry: entry[:2])
+            if session.state == QueueState.WAITING
+        ]
+
+    @property
+    def waiting_count(self) -> int:
+        """Number of waiting sessions (O(1))"""
+        return len(self._waiting)
+
+    def position_of(self, session_id: str) -> Optional[int]:
+        """Queue position of a waiting session, None if not waiting"""
+        session = self._waiting.get(session_id)
+        if session is None:
+            return None
+
+        for position, waiting in enumerate(self.queue):
+            if waiting is session:
+                return position
+        return None
+
+    def _remove_waiting(self, session: QueuedSession, state: QueueState):
+        """Mark a waiting session as no longer waiting (heap entry dropped lazily)"""
+        session.state = state
+        if self._waiting.get(session.key) is session:
+            del self._waiting[session.key]
+        self._waiting_by_priority[session.priority.value] -= 1
+
+    def _complete(self, session: QueuedSession, error: Optional[str] = None):
+        """Free a processing session's slot and let the scheduler fill it"""
+        if self.processing.get(session.key) is not session:
+            return
+
+        del self.processing[session.key]
+        self._running_by_service[session.service_type] -= 1
+        session.completed_at = time.time()
+
+        if error is None:
+            session.state = QueueState.COMPLETED
+            self.completed[session.key] = session
+            self.stats["total_processed"] += 1
+            self._update_average_times(session)
+        else:
+            session.state = QueueState.REJECTED
+            session.error_reason = error
+
+        self._wakeup.set()
+
+    def _on_vram_change(self):
+        """VRAM monitor callback: admission may have changed"""
+        if self._waiting:
+            self._wakeup.set()
 
     async def _queue_processor(self):
-        """Background queue processor - the heart of the system"""
+        """
+        Background scheduler - the heart of the system
+
+        Sleeps until something can change the outcome of a scheduling
+        round: enqueue, release, cancel, a VRAM change, or the next queued
+        session's timeout.
+        """
         try:
             while True:
-                await self._process_next_session()
-                await asyncio.sleep(0.1)  # Small delay to prevent busy waiting
+                # Clear before the round: events during the round trigger another one
+                self._wakeup.clear()
+                await self._schedule_round()
+
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self._next_deadline_delay())
+                except asyncio.TimeoutError:
+                    pass  # A queued session timed out; expire it next round
 
         except asyncio.CancelledError:
             logger.info("session_queue.processor_cancelled")
         except Exception as e:
             logger.error("session_queue.processor_error", error=str(e))
 
-    async def _process_next_session(self):
-        """Process the next session in queue if resources available"""
-        # Get next session from queue
-        session = await self._get_next_processable_session()
-        if not session:
-            return
+    def _next_deadline_delay(self) -> Optional[float]:
+        """Seconds until the earliest waiting session times out (None: no waiters)"""
+        while self._deadlines and self._deadlines[0][2].state != QueueState.WAITING:
+            heapq.heappop(self._deadlines)
 
-        # Try to acquire processing slot
-        try:
-            await asyncio.wait_for(
-                self._semaphore.acquire(),
-                timeout=0.1  # Non-blocking check
-            )
-        except asyncio.TimeoutError:
-            # No slots available, wait for next cycle
-            return
+        if not self._deadlines:
+            return None
+        return max(0.0, self._deadlines[0][0] - time.time())
+
+    async def _schedule_round(self):
+        """Expire timed-out sessions, then admit sessions into free slots"""
+        started: List[QueuedSession] = []
+        expired: List[QueuedSession] = []
 
-        # Move to processing
-        async with self._queue_lock:
-            if session in self.queue:
-                self.queue.remove(session)
-                session.state = QueueState.PROCESSING
-                session.started_at = time.time()
-                self.processing[session.session_id] = session
-
-        logger.info("session_queue.processing_started",
-                   session_id=session.session_id,
-                   service_type=session.service_type,
-                   wait_time=session.wait_time_seconds)
-
-        # Process session in background
-        asyncio.create_task(self._execute_session(session))
-
-    async def _get_next_processable_session(self) -> Optional[QueuedSession]:
-        """Get next session that can be processed based on VRAM availability"""
         async with self._queue_lock:
-            # Clean up expired sessions first
-            expired_sessions = [s for s in self.queue if s.is_expired]
-            for session in expired_sessions:
-                self.queue.remove(session)
-                session.state = QueueState.REJECTED
-                session.error_reason = "timeout"
-                self.stats["total_timeouts"] += 1
-
-                logger.warning("session_queue.timeout",
-                             session_id=session.session_id,
-                             wait_time=session.wait_time_seconds)
-
-                # Notify timeout
-                if session.websocket_connection:
-                    await self._notify_websocket(session.websocket_connection, "timeout", {
-                        "session_id": session.session_id,
-                        "reason": "Queue timeout"
-                    })
-
-            # Find next processable session
-            for session in self.queue:
-                # Check VRAM availability
-                prediction = self.vram_monitor.predict_can_handle_service(session.service_type)
-                if prediction["can_handle"]:
-                    session.gpu_allocation = prediction.get("recommended_gpu")
-                    return session
+            self.stats["scheduling_rounds"] += 1
+            now = time.time()
+
+            # Expire timed-out sessions (deadline heap, earliest first)
+            while self._deadlines and (
+                self._deadlines[0][2].state != QueueState.WAITING or self._deadlines[0][0] <= now
+            ):
+                _, _, session = heapq.heappop(self._deadlines)
+                if session.state == QueueState.WAITING:
+                    self._remove_waiting(session, QueueState.REJECTED)
+                    session.error_reason = "timeout"
+                    self.stats["total_timeouts"] += 1
+                    expired.append(session)
+
+                    if session.admitted is not None and not session.admitted.done():
+                        session.admitted.set_exception(AdmissionRejected(session.service_type, "timeout"))
+
+            # Drop lazily removed entries once they dominate the heap
+            if len(self._heap) > 2 * len(self._waiting) + HEAP_COMPACT_SLACK:
+                self._heap = [entry for entry in self._heap if entry[2].state == QueueState.WAITING]
+                heapq.heapify(self._heap)
+
+            free_slots = self.max_concurrent - len(self.processing)
+            if free_slots > 0 and self._waiting:
+                started = self._admit(free_slots)
+
+        for session in expired:
+            logger.warning("session_queue.timeout",
+                         session_id=session.session_id,
+                         wait_time=session.wait_time_seconds)
+
+            # Notify timeout
+            if session.websocket_connection:
+                await self._notify_websocket(session.websocket_connection, "timeout", {
+                    "session_id": session.session_id,
+                    "reason": "Queue timeout"
+                })
 
-            return None
+        for session in started:
+            logger.info("session_queue.processing_started",
+                       session_id=session.session_id,
+                       service_type=session.service_type,
+                       wait_time=session.wait_time_seconds)
+
+            if session.admitted is not None:
+                # Pipeline stage: the caller runs the work and releases the slot
+                if session.admitted.done():
+                    self._complete(session, error="cancelled")  # Caller gave up meanwhile
+                else:
+                    session.admitted.set_result(session)
+                continue
+
+            # Process session in background (keep a reference until done)
+            task = asyncio.create_task(self._execute_session(session))
+            self._execution_tasks.add(task)
+            task.add_done_callback(self._execution_tasks.discard)
+
+    def _admit(self, free_slots: int) -> List[QueuedSession]:
+        """
+        Pop admissible sessions in priority order (caller holds the lock)
+
+        GPU status is read once; each admitted GPU session deducts its
+        estimated VRAM from the snapshot so later decisions in the same
+        round account for it. Sessions that do not fit, or whose stage is
+        at its concurrency limit, stay queued.
+        """
+        snapshot: Dict[int, VRAMStatus] = {
+            status.device_id: status for status in self.vram_monitor.get_all_gpu_status()
+        }
+        predictions: Dict[str, dict] = {}
+        deferred = []
+        started = []
+
+        while self._heap and len(started) < free_slots:
+            entry = heapq.heappop(self._heap)
+            session = entry[2]
+            if session.state != QueueState.WAITING:
+                continue  # Cancelled or timed out
+
+            limit = self.stage_limits.get(session.service_type)
+            if limit is not None and self._running_by_service[session.service_type] >= limit:
+                deferred.append(entry)
+                continue
+
+            if session.vram_check:
+                prediction = predictions.get(session.service_type)
+                if prediction is None:
+                    prediction = self.vram_monitor.predict_can_handle_service(
+                        session.service_type, vram_status=list(snapshot.values())
+                    )
+                    predictions[session.service_type] = prediction
+
+                if not prediction["can_handle"]:
+                    deferred.append(entry)
+                    continue
+
+                session.gpu_allocation = prediction.get("recommended_gpu")
+
+            self._remove_waiting(session, QueueState.PROCESSING)
+            session.started_at = time.time()
+            self.processing[session.key] = session
+            self._running_by_service[session.service_type] += 1
+            started.append(session)
+
+            if not session.vram_check:
+                continue
+
+            required_gb = SERVICE_VRAM_REQUIREMENTS_GB.get(session.service_type, 1.0)
+            if session.gpu_allocation in snapshot and required_gb > 0:
+                status = snapshot[session.gpu_allocation]
+                snapshot[session.gpu_allocation] = replace(status, free_gb=status.free_gb - required_gb)
+                predictions.clear()
+
+        for entry in deferred:
+            heapq.heappush(self._heap, entry)
+
+        return started
 
     async def _execute_session(self, session: QueuedSession):
-        """Execute a session (placeholder for actual processing)"""
+        """
+        Hold the slot of an admission-only request (SessionController API)
+
+        Such requests carry no work of their own, so the slot is held for
+        the service's typical processing time. The conversation pipeline
+        uses stage() instead and releases its slots when the work is done.
+        """
         try:
             # Notify processing started
             if session.websocket_connection:
@@ -311,7 +592,7 @@ class SessionQueue:
                     "gpu_allocation": session.gpu_allocation
                 })
 
-            # Simulate processing (this would call actual AI services)
+            # Typical processing time of the service
             processing_time = {
                 "stt": 0.6,
                 "llm": 2.0,
@@ -321,19 +602,8 @@ class SessionQueue:
 
             await asyncio.sleep(processing_time)
 
-            # Mark as completed
-            session.state = QueueState.COMPLETED
-            session.completed_at = time.time()
-
-            # Move to completed
-            async with self._queue_lock:
-                if session.session_id in self.processing:
-                    del self.processing[session.session_id]
-                    self.completed[session.session_id] = session
-                    self.stats["total_processed"] += 1
-
-            # Update average times
-            self._update_average_times(session)
+            # Free the slot and let the scheduler fill it
+            self._complete(session)
 
             logger.info("session_queue.completed",
                        session_id=session.session_id,
@@ -348,8 +618,7 @@ class SessionQueue:
                 })
 
         except Exception as e:
-            session.state = QueueState.REJECTED
-            session.error_reason = str(e)
+            self._complete(session, error=str(e))
 
             logger.error("session_queue.execution_error",
                         session_id=session.session_id,
@@ -363,8 +632,8 @@ class SessionQueue:
                 })
 
         finally:
-            # Always release semaphore
-            self._semaphore.release()
+            # Cancelled (queue stopped): the slot must not stay taken
+            self._complete(session, error="cancelled")
 
     async def _cleanup_completed(self):
         """Cleanup old completed sessions"""
@@ -442,10 +711,15 @@ class SessionQueue:
     def get_queue_status(self) -> Dict:
         """Get current queue status"""
         return {
-            "queue_size": len(self.queue),
+            "queue_size": len(self._waiting),
             "processing_count": len(self.processing),
             "max_concurrent": self.max_concurrent,
             "max_queue_size": self.max_queue_size,
+            "stage_limits": dict(self.stage_limits),
+            "stage_running": {
+                service_type: self._running_by_service[service_type]
+                for service_type in self.stage_limits
+            },
             "statistics": self.stats.copy(),
             "queue_sessions": [
                 {
@@ -472,12 +746,12 @@ class SessionQueue:
         """Cancel a queued or processing session"""
         async with self._queue_lock:
             # Check queue
-            for session in self.queue:
-                if session.session_id == session_id:
-                    self.queue.remove(session)
-                    session.state = QueueState.CANCELLED
-                    logger.info("session_queue.cancelled_from_queue", session_id=session_id)
-                    return True
+            session = self._waiting.get(session_id)
+            if session is not None:
+                self._remove_waiting(session, QueueState.CANCELLED)
+                logger.info("session_queue.cancelled_from_queue", session_id=session_id)
+                self._wakeup.set()
+                return True
 
             # Check processing (can't cancel, but mark for early termination)
             if session_id in self.processing:
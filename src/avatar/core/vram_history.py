@@ -0,0 +1,226 @@
+"""
+Fixed-size VRAM usage history with windowed aggregates
+
+One ring buffer per GPU keeps (timestamp, usage %, session count) in
+preallocated NumPy arrays: appending is O(1) and memory is fixed, so hours
+of 1 s samples cost no more per query than a few minutes did.
+
+Aggregates over the configured windows (e.g. 1/5/10/60 minutes) are kept
+incrementally while samples enter and leave each window:
+- min/max through monotonic index deques (amortized O(1) per sample)
+- mean and least-squares trend slope through running sums
+so reading them is O(1). Other window lengths are computed from the
+buffer slice with vectorized NumPy: O(window), never O(history).
+"""
+
+import bisect
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+class _Window:
+    """Running aggregates over the last `seconds` of a buffer"""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.start = 0              # Logical index of the oldest sample in the window
+        self.n = 0
+        self.sum_u = 0.0
+        self.sum_t = 0.0
+        self.sum_tu = 0.0
+        self.sum_tt = 0.0
+        self.min_idx: Deque[int] = deque()
+        self.max_idx: Deque[int] = deque()
+
+
+def _slope(n: int, sum_t: float, sum_u: float, sum_tu: float, sum_tt: float) -> float:
+    """Least-squares slope (usage points per second) from running sums"""
+    denominator = n * sum_tt - sum_t * sum_t
+    if n < 2 or denominator <= 1e-9:
+        return 0.0
+    return (n * sum_tu - sum_t * sum_u) / denominator
+
+
+class UsageRingBuffer:
+    """
+    Usage history of one GPU
+
+    Usage:
+        buffer = UsageRingBuffer(capacity=21600, windows_sec=(60, 300, 600, 3600))
+        buffer.append(time.time(), usage_percent, session_count)
+        stats = buffer.window_stats(600)   # O(1) for a configured window
+    """
+
+    def __init__(self, capacity: int, windows_sec: Iterable[float] = ()):
+        """
+        Args:
+            capacity: Samples kept (older ones are overwritten)
+            windows_sec: Window lengths with incremental aggregates
+        """
+        self.capacity = max(2, capacity)
+        self._time = np.zeros(self.capacity, dtype=np.float64)
+        self._usage = np.zeros(self.capacity, dtype=np.float32)
+        self._sessions = np.zeros(self.capacity, dtype=np.int32)
+        self._count = 0             # Samples ever appended (next logical index)
+        self._origin: Optional[float] = None  # Time base for the slope sums
+        self._windows: Dict[float, _Window] = {
+            float(seconds): _Window(float(seconds)) for seconds in windows_sec
+        }
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    @property
+    def _oldest(self) -> int:
+        return max(0, self._count - self.capacity)
+
+    def _t(self, index: int) -> float:
+        return float(self._time[index % self.capacity]) - self._origin
+
+    def _u(self, index: int) -> float:
+        return float(self._usage[index % self.capacity])
+
+    def append(self, timestamp: float, usage_percent: float, session_count: int = 0):
+        """Add a sample (timestamps must not decrease)"""
+        if self._origin is None:
+            self._origin = timestamp
+
+        index = self._count
+
+        # The slot about to be overwritten leaves every window first
+        if index >= self.capacity:
+            for window in self._windows.values():
+                if window.start <= index - self.capacity:
+                    self._pop_front(window)
+
+        slot = index % self.capacity
+        self._time[slot] = timestamp
+        self._usage[slot] = usage_percent
+        self._sessions[slot] = session_count
+        self._count += 1
+
+        u = self._u(index)  # float32-rounded, as the buffer stores it
+        t = timestamp - self._origin
+        for window in self._windows.values():
+            window.n += 1
+            window.sum_u += u
+            window.sum_t += t
+            window.sum_tu += t * u
+            window.sum_tt += t * t
+
+            while window.min_idx and self._u(window.min_idx[-1]) >= u:
+                window.min_idx.pop()
+            window.min_idx.append(index)
+            while window.max_idx and self._u(window.max_idx[-1]) <= u:
+                window.max_idx.pop()
+            window.max_idx.append(index)
+
+            cutoff = timestamp - window.seconds
+            while window.start < index and float(self._time[window.start % self.capacity]) < cutoff:
+                self._pop_front(window)
+
+    def _pop_front(self, window: _Window):
+        index = window.start
+        t, u = self._t(index), self._u(index)
+
+        window.n -= 1
+        window.sum_u -= u
+        window.sum_t -= t
+        window.sum_tu -= t * u
+        window.sum_tt -= t * t
+
+        if window.min_idx and window.min_idx[0] == index:
+            window.min_idx.popleft()
+        if window.max_idx and window.max_idx[0] == index:
+            window.max_idx.popleft()
+        window.start += 1
+
+    def latest(self) -> Optional[Tuple[float, float]]:
+        """(timestamp, usage_percent) of the newest sample"""
+        if self._count == 0:
+            return None
+        slot = (self._count - 1) % self.capacity
+        return float(self._time[slot]), float(self._usage[slot])
+
+    def _first_index_since(self, cutoff: float) -> int:
+        """Logical index of the first sample at or after cutoff (O(log n))"""
+        return bisect.bisect_left(
+            range(self._oldest, self._count), cutoff,
+            key=lambda index: self._time[index % self.capacity]
+        ) + self._oldest
+
+    def _segments(self, start: int) -> List[slice]:
+        """Array slices covering logical indices [start, count)"""
+        if start >= self._count:
+            return []
+        first, last = start % self.capacity, (self._count - 1) % self.capacity
+        if first <= last:
+            return [slice(first, last + 1)]
+        return [slice(first, self.capacity), slice(0, last + 1)]
+
+    def values_since(self, cutoff: float) -> Tuple[np.ndarray, np.ndarray]:
+        """(timestamps, usage) of samples at or after cutoff, oldest first"""
+        segments = self._segments(self._first_index_since(cutoff))
+        if not segments:
+            return np.empty(0), np.empty(0, dtype=np.float32)
+        times = np.concatenate([self._time[s] for s in segments])
+        usage = np.concatenate([self._usage[s] for s in segments])
+        return times, usage
+
+    def window_stats(self, seconds: float, now: Optional[float] = None) -> Optional[dict]:
+        """
+        Aggregates over the last `seconds`
+
+        Args:
+            seconds: Window length
+            now: End of the window (default: newest sample)
+
+        Returns:
+            count, min, max, mean, current and slope_per_minute, or None if
+            the window holds no samples
+        """
+        latest = self.latest()
+        if latest is None:
+            return None
+        now = latest[0] if now is None else now
+        cutoff = now - seconds
+
+        window = self._windows.get(float(seconds))
+        if (window is not None and window.n > 0
+                and float(self._time[window.start % self.capacity]) >= cutoff):
+            # Incremental path: nothing in the window has gone stale
+            return {
+                "count": window.n,
+                "min": self._u(window.min_idx[0]),
+                "max": self._u(window.max_idx[0]),
+                "mean": window.sum_u / window.n,
+                "current": latest[1],
+                "slope_per_minute": 60.0 * _slope(
+                    window.n, window.sum_t, window.sum_u, window.sum_tu, window.sum_tt
+                ),
+            }
+
+        times, usage = self.values_since(cutoff)
+        if len(usage) == 0:
+            return None
+
+        t = times - times[0]
+        u = usage.astype(np.float64)
+        return {
+            "count": int(len(u)),
+            "min": float(u.min()),
+            "max": float(u.max()),
+            "mean": float(u.mean()),
+            "current": latest[1],
+            "slope_per_minute": 60.0 * _slope(
+                len(u), float(t.sum()), float(u.sum()), float((t * u).sum()), float((t * t).sum())
+            ),
+        }
+
+    def bucket_counts(self, seconds: float, edges: List[float], now: float) -> List[int]:
+        """Samples of the last `seconds` counted per usage bucket (edges ascending)"""
+        _, usage = self.values_since(now - seconds)
+        buckets = np.digitize(usage, edges)  # Bucket i: edges[i-1] <= usage < edges[i]
+        return np.bincount(buckets, minlength=len(edges) + 1).tolist()
@@ -7,7 +7,7 @@ Based on Linus principle: "Monitor what matters, throttle what kills the system.
 
 import asyncio
 import time
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -15,6 +15,8 @@ import structlog
 import torch
 
 from avatar.core.config import config
+from avatar.core.gpu_telemetry import GPUSample, get_gpu_telemetry
+from avatar.core.vram_history import UsageRingBuffer
 
 logger = structlog.get_logger()
 
@@ -27,6 +29,18 @@ class VRAMThreshold(Enum):
     DANGER = 98    # > 95% - Reject all new sessions
 
 
+# Estimated VRAM per service (based on actual measurements)
+SERVICE_VRAM_REQUIREMENTS_GB = {
+    "stt": 0,        # CPU only
+    "llm": 5.2,
+    "tts_fast": 1.5,
+    "tts_hq": 3.0
+}
+
+# Usage change (percentage points) that notifies change listeners
+VRAM_CHANGE_NOTIFY_PERCENT = 1.0
+
+
 class ServicePriority(Enum):
     """Service priority levels for resource allocation"""
     CRITICAL = 1   # STT (always allow)
@@ -49,15 +63,7 @@ class VRAMStatus:
     can_accept_new: bool
     temperature_c: Optional[float] = None
     power_usage_w: Optional[float] = None
-
-
-@dataclass
-class VRAMHistory:
-    """Historical VRAM usage data"""
-    timestamp: float
-    device_id: int
-    usage_percent: float
-    session_count: int
+    process_gb: Optional[float] = None  # This process incl. vLLM's pool (NVML)
 
 
 class VRAMMonitor:
@@ -75,14 +81,20 @@ class VRAMMonitor:
     def __init__(self):
         """Initialize VRAM monitor"""
         self.gpu_count = torch.cuda.device_count() if torch.cuda.is_available() else 0
-        self.history: List[VRAMHistory] = []
         self.last_emergency_alert = 0
-        self.monitoring_interval = 5.0  # seconds
+        self.monitoring_interval = config.VRAM_MONITOR_INTERVAL  # seconds
         self._monitoring_task: Optional[asyncio.Task] = None
         self.emergency_mode = False
         self.rejection_count = 0
-        self._cached_vram_status: List[VRAMStatus] = []
-        self.last_vram_check = 0
+        self.telemetry = get_gpu_telemetry()
+
+        # Usage history: one fixed-size ring buffer per GPU, created on first sample
+        self.history: Dict[int, UsageRingBuffer] = {}
+        self._history_windows = tuple(minutes * 60 for minutes in config.VRAM_HISTORY_WINDOWS)
+
+        # Notified when usage changes noticeably (e.g. session queue admission)
+        self._change_listeners: List[Callable[[], None]] = []
+        self._last_notified_usage: Dict[int, float] = {}
 
         # Service type to GPU mapping
         self.service_gpu_preference = {
@@ -107,6 +119,7 @@ class VRAMMonitor:
     def start_monitoring(self):
         """Start background VRAM monitoring"""
         if self._monitoring_task is None or self._monitoring_task.done():
+            self.telemetry.start()
             self._monitoring_task = asyncio.create_task(self._monitoring_loop())
             logger.info("vram_monitor.started")
 
@@ -128,21 +141,53 @@ class VRAMMonitor:
         except Exception as e:
             logger.error("vram_monitor.loop_error", error=str(e))
 
+    def add_change_listener(self, callback: Callable[[], None]):
+        """
+        Register a callback for VRAM changes
+
+        Called from the monitoring loop when any GPU's usage moved by at
+        least VRAM_CHANGE_NOTIFY_PERCENT, when emergency mode toggles and
+        after a forced cleanup. Callbacks must be cheap and non-blocking.
+        """
+        if callback not in self._change_listeners:
+            self._change_listeners.append(callback)
+
+    def remove_change_listener(self, callback: Callable[[], None]):
+        """Unregister a VRAM change callback"""
+        if callback in self._change_listeners:
+            self._change_listeners.remove(callback)
+
+    def _notify_change(self):
+        for callback in list(self._change_listeners):
+            try:
+                callback()
+            except Exception as e:
+                logger.warning("vram_monitor.listener_failed", error=str(e))
+
+    def _check_usage_change(self, usage_by_device: Dict[int, float]):
+        """Notify listeners if usage moved enough since the last notification"""
+        changed = any(
+            abs(usage - self._last_notified_usage.get(device_id, -100.0)) >= VRAM_CHANGE_NOTIFY_PERCENT
+            for device_id, usage in usage_by_device.items()
+        )
+        if changed:
+            self._last_notified_usage.update(usage_by_device)
+            self._notify_change()
+
     async def _collect_vram_metrics(self):
         """Collect VRAM metrics for all GPUs"""
-        if not torch.cuda.is_available():
+        snapshot = self.telemetry.snapshot()
+        if not snapshot.gpus:
             return
 
-        current_time = time.time()
+        current_time = snapshot.timestamp
+        usage_by_device: Dict[int, float] = {}
 
-        for device_id in range(self.gpu_count):
+        for gpu in snapshot.gpus:
+            device_id = gpu.device_id
             try:
-                # Get VRAM usage
-                allocated = torch.cuda.memory_allocated(device_id) / 1024**3
-                reserved = torch.cuda.memory_reserved(device_id) / 1024**3
-                total = torch.cuda.get_device_properties(device_id).total_memory / 1024**3
-
-                usage_percent = (allocated / total) * 100 if total > 0 else 0
+                usage_percent = gpu.usage_percent
+                usage_by_device[device_id] = usage_percent
 
                 # Record history
                 # Get session count from session controller if available
@@ -157,16 +202,13 @@ class VRAMMonitor:
                     # Fallback: no session tracking
                     session_count = 0
 
-                self.history.append(VRAMHistory(
-                    timestamp=current_time,
-                    device_id=device_id,
-                    usage_percent=usage_percent,
-                    session_count=session_count
-                ))
-
-                # Trim history (keep last 100 records per GPU)
-                if len(self.history) > self.gpu_count * 100:
-                    self.history = self.history[-self.gpu_count * 100:]
+                history = self.history.get(device_id)
+                if history is None:
+                    history = self.history[device_id] = UsageRingBuffer(
+                        capacity=config.VRAM_HISTORY_SIZE,
+                        windows_sec=self._history_windows
+                    )
+                history.append(current_time, usage_percent, session_count)
 
                 # Check for emergency conditions
                 if usage_percent > VRAMThreshold.DANGER.value:
@@ -175,6 +217,8 @@ class VRAMMonitor:
             except Exception as e:
                 logger.error("vram_monitor.collect_error", device_id=device_id, error=str(e))
 
+        self._check_usage_change(usage_by_device)
+
     async def _handle_emergency_condition(self, device_id: int, usage_percent: float):
         """Handle emergency VRAM conditions"""
         current_time = time.time()
@@ -185,6 +229,7 @@ class VRAMMonitor:
 
         self.last_emergency_alert = current_time
         self.emergency_mode = True
+        self._notify_change()
 
         logger.critical("vram_monitor.emergency",
                        device_id=device_id,
@@ -199,67 +244,50 @@ class VRAMMonitor:
         # Reset emergency mode after cleanup
         await asyncio.sleep(5)  # Give cleanup time to work
         self.emergency_mode = False
+        self._notify_change()
+
+    def _to_vram_status(self, gpu: GPUSample) -> VRAMStatus:
+        """Classify one telemetry sample"""
+        usage_percent = gpu.usage_percent
+
+        # Determine threshold level
+        if usage_percent < VRAMThreshold.SAFE.value:
+            threshold = VRAMThreshold.SAFE
+        elif usage_percent < VRAMThreshold.WARNING.value:
+            threshold = VRAMThreshold.WARNING
+        elif usage_percent < VRAMThreshold.CRITICAL.value:
+            threshold = VRAMThreshold.CRITICAL
+        else:
+            threshold = VRAMThreshold.DANGER
+
+        # Determine if can accept new sessions
+        can_accept = (
+            threshold in [VRAMThreshold.SAFE, VRAMThreshold.WARNING] and
+            not self.emergency_mode
+        )
+
+        return VRAMStatus(
+            device_id=gpu.device_id,
+            device_name=gpu.name,
+            total_gb=gpu.total_gb,
+            allocated_gb=gpu.allocated_gb,
+            reserved_gb=gpu.reserved_gb,
+            free_gb=round(gpu.free_gb, 2),
+            usage_percent=round(usage_percent, 1),
+            threshold=threshold,
+            can_accept_new=can_accept,
+            temperature_c=gpu.temperature_c,
+            power_usage_w=gpu.power_usage_w,
+            process_gb=gpu.process_gb
+        )
 
     def get_all_gpu_status(self) -> List[VRAMStatus]:
-        """Get comprehensive VRAM status for all GPUs"""
-        if not torch.cuda.is_available():
-            return []
-
-        status_list = []
-
-        for device_id in range(self.gpu_count):
-            try:
-                props = torch.cuda.get_device_properties(device_id)
-                allocated = torch.cuda.memory_allocated(device_id) / 1024**3
-                reserved = torch.cuda.memory_reserved(device_id) / 1024**3
-                total = props.total_memory / 1024**3
-                free = total - allocated
-                usage_percent = (allocated / total) * 100 if total > 0 else 0
-
-                # Determine threshold level
-                if usage_percent < VRAMThreshold.SAFE.value:
-                    threshold = VRAMThreshold.SAFE
-                elif usage_percent < VRAMThreshold.WARNING.value:
-                    threshold = VRAMThreshold.WARNING
-                elif usage_percent < VRAMThreshold.CRITICAL.value:
-                    threshold = VRAMThreshold.CRITICAL
-                else:
-                    threshold = VRAMThreshold.DANGER
-
-                # Determine if can accept new sessions
-                can_accept = (
-                    threshold in [VRAMThreshold.SAFE, VRAMThreshold.WARNING] and
-                    not self.emergency_mode
-                )
-
-                status_list.append(VRAMStatus(
-                    device_id=device_id,
-                    device_name=props.name,
-                    total_gb=round(total, 2),
-                    allocated_gb=round(allocated, 2),
-                    reserved_gb=round(reserved, 2),
-                    free_gb=round(free, 2),
-                    usage_percent=round(usage_percent, 1),
-                    threshold=threshold,
-                    can_accept_new=can_accept
-                ))
-
-            except Exception as e:
-                logger.error("vram_monitor.status_error", device_id=device_id, error=str(e))
-
-        return status_list
+        """Get comprehensive VRAM status for all GPUs (latest telemetry sample)"""
+        return [self._to_vram_status(gpu) for gpu in self.telemetry.snapshot().gpus]
 
     def _get_multi_gpu_vram_status(self) -> List[VRAMStatus]:
-        """Get VRAM status for all GPUs (cached for performance)"""
-        current_time = time.time()
-
-        # Cache for 1 second to avoid excessive GPU queries
-        if current_time - self.last_vram_check < 1.0:
-            return getattr(self, '_cached_vram_status', [])
-
-        self.last_vram_check = current_time
-        self._cached_vram_status = self.get_all_gpu_status()
-        return self._cached_vram_status
+        """Get VRAM status for all GPUs (telemetry snapshots are already cached)"""
+        return self.get_all_gpu_status()
 
     def _evaluate_session_acceptance(self, vram_status: List[VRAMStatus],
                                    service_type: str) -> bool:
@@ -342,9 +370,12 @@ class VRAMMonitor:
     def get_monitoring_stats(self) -> dict:
         """Get comprehensive monitoring statistics"""
         vram_status = self.get_all_gpu_status()
-        recent_history = [h for h in self.history if time.time() - h.timestamp < 300]  # Last 5 minutes
 
-        avg_usage = sum(h.usage_percent for h in recent_history) / len(recent_history) if recent_history else 0
+        # Last 5 minutes up to each GPU's newest sample (incremental window), weighted by samples
+        recent = [stats for stats in (history.window_stats(300) for history in self.history.values())
+                  if stats is not None]
+        samples = sum(stats["count"] for stats in recent)
+        avg_usage = sum(stats["mean"] * stats["count"] for stats in recent) / samples if samples else 0
 
         return {
             "gpus": [
@@ -353,15 +384,20 @@ class VRAMMonitor:
                     "device_name": status.device_name,
                     "total_gb": status.total_gb,
                     "allocated_gb": status.allocated_gb,
+                    "process_gb": status.process_gb,
                     "free_gb": status.free_gb,
                     "usage_percent": status.usage_percent,
+                    "temperature_c": status.temperature_c,
+                    "power_usage_w": status.power_usage_w,
                     "threshold": status.threshold.name,
                     "can_accept_new": status.can_accept_new
                 }
                 for status in vram_status
             ],
+            "telemetry": self.telemetry.get_stats(),
             "monitoring": {
-                "history_points": len(self.history),
+                "history_points": sum(len(history) for history in self.history.values()),
+                "history_capacity_per_gpu": config.VRAM_HISTORY_SIZE,
                 "average_usage_5min": round(avg_usage, 1),
                 "emergency_mode": self.emergency_mode,
                 "rejection_count": self.rejection_count,
@@ -384,52 +420,54 @@ class VRAMMonitor:
             minutes: Time period in minutes
 
         Returns:
-            Usage trend information
+            Usage trend information over the period ending at the newest
+            sample (O(1) for the windows in config.VRAM_HISTORY_WINDOWS,
+            O(window) otherwise)
         """
-        cutoff_time = time.time() - (minutes * 60)
-        relevant_history = [
-            h for h in self.history
-            if h.device_id == device_id and h.timestamp >= cutoff_time
-        ]
+        history = self.history.get(device_id)
+        stats = history.window_stats(minutes * 60) if history is not None else None
 
-        if not relevant_history:
+        if stats is None:
             return {"error": "No data available for specified period"}
 
-        usage_values = [h.usage_percent for h in relevant_history]
+        # Least-squares slope; under 5 points of change over the period counts as stable
+        slope = stats["slope_per_minute"]
+        if abs(slope * minutes) < 5:
+            trend = "stable"
+        else:
+            trend = "increasing" if slope > 0 else "decreasing"
 
         return {
             "device_id": device_id,
             "period_minutes": minutes,
-            "data_points": len(relevant_history),
-            "min_usage": round(min(usage_values), 1),
-            "max_usage": round(max(usage_values), 1),
-            "avg_usage": round(sum(usage_values) / len(usage_values), 1),
-            "current_usage": round(usage_values[-1], 1),
-            "trend": "increasing" if usage_values[-1] > usage_values[0] else "stable" if abs(usage_values[-1] - usage_values[0]) < 5 else "decreasing"
+            "data_points": stats["count"],
+            "min_usage": round(stats["min"], 1),
+            "max_usage": round(stats["max"], 1),
+            "avg_usage": round(stats["mean"], 1),
+            "current_usage": round(stats["current"], 1),
+            "slope_per_minute": round(slope, 3),
+            "trend": trend
         }
 
-    def predict_can_handle_service(self, service_type: str) -> dict:
+    def predict_can_handle_service(self, service_type: str,
+                                   vram_status: Optional[List[VRAMStatus]] = None) -> dict:
         """
         Predict if system can handle a new service request
 
         Args:
             service_type: Type of service (stt, llm, tts_fast, tts_hq)
+            vram_status: GPU status snapshot to evaluate against (queried if None),
+                so several predictions can share one query
 
         Returns:
             Prediction results with reasoning
         """
-        vram_status = self.get_all_gpu_status()
+        if vram_status is None:
+            vram_status = self.get_all_gpu_status()
         priority = self.service_priority.get(service_type, ServicePriority.LOW)
 
         # Estimate VRAM requirements
-        vram_requirements = {
-            "stt": 0,        # CPU only
-            "llm": 5.2,      # Based on actual measurements
-            "tts_fast": 1.5, # Based on actual measurements
-            "tts_hq": 3.0    # Based on actual measurements
-        }
-
-        required_gb = vram_requirements.get(service_type, 1.0)
+        required_gb = SERVICE_VRAM_REQUIREMENTS_GB.get(service_type, 1.0)
 
         prediction = {
             "service_type": service_type,
@@ -499,30 +537,22 @@ class VRAMMonitor:
                 torch.cuda.ipc_collect()
             logger.info("vram_monitor.forced_cleanup_all", gpu_count=self.gpu_count)
 
+        self._notify_change()
+
     def get_alert_summary(self) -> dict:
         """Get summary of recent alerts and rejections"""
-        recent_history = [h for h in self.history if time.time() - h.timestamp < 3600]  # Last hour
+        # Last hour: below SAFE / WARNING / CRITICAL, anything above counts as danger
+        edges = [VRAMThreshold.SAFE.value, VRAMThreshold.WARNING.value, VRAMThreshold.CRITICAL.value]
+        counts = [0] * (len(edges) + 1)
+        now = time.time()
+        for history in self.history.values():
+            counts = [a + b for a, b in zip(counts, history.bucket_counts(3600, edges, now))]
 
-        alert_counts = {
-            "safe": 0,
-            "warning": 0,
-            "critical": 0,
-            "danger": 0
-        }
-
-        for history_point in recent_history:
-            if history_point.usage_percent < VRAMThreshold.SAFE.value:
-                alert_counts["safe"] += 1
-            elif history_point.usage_percent < VRAMThreshold.WARNING.value:
-                alert_counts["warning"] += 1
-            elif history_point.usage_percent < VRAMThreshold.CRITICAL.value:
-                alert_counts["critical"] += 1
-            else:
-                alert_counts["danger"] += 1
+        alert_counts = dict(zip(("safe", "warning", "critical", "danger"), counts))
 
         return {
             "period_hours": 1,
-            "total_measurements": len(recent_history),
+            "total_measurements": sum(counts),
             "alert_distribution": alert_counts,
             "rejection_count_hour": self.rejection_count,  # TODO: Make this time-bound
             "emergency_activations": 1 if self.emergency_mode else 0
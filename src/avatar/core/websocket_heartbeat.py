@@ -9,12 +9,19 @@ Design Principles:
 2. Adaptive timing - adjusts based on network conditions
 3. Graceful degradation - continues operation even if heartbeat fails
 4. Connection quality metrics - tracks latency and reliability
+
+All monitors of a worker share one HeartbeatScheduler: a hashed timer wheel
+driven by a single task that sends every due ping of a tick as one batch and
+checks pong timeouts in the same pass. An idle connection costs one
+HeartbeatEntry in a wheel bucket instead of a sleeping task.
 """
 
 import asyncio
+import math
 import time
 import uuid
-from typing import Dict, Optional, Callable, Any, List
+from functools import partial
+from typing import Dict, Optional, Callable, Any, List, Set
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -111,16 +118,235 @@ class HeartbeatConfig:
     quality_sample_size: int = 20         # Number of pings to assess quality
 
 
+# Timer wheel geometry: 0.25s resolution, one revolution covers max_interval_seconds
+WHEEL_TICK_SECONDS = 0.25
+WHEEL_SLOTS = 256
+
+# on_result(latency_ms, error): error is None on pong, TimeoutError on timeout
+PingResultCallback = Callable[[Optional[float], Optional[BaseException]], None]
+
+
+class HeartbeatEntry:
+    """
+    Heartbeat state of one registered connection
+
+    Sits in exactly one wheel bucket at a time: waiting for its next ping
+    (sent_at is None) or for the pong of the ping in flight.
+    """
+
+    __slots__ = ("websocket", "interval", "timeout", "on_result",
+                 "due_tick", "sent_at", "pong", "generation", "active")
+
+    def __init__(self, websocket: WebSocket, interval: Callable[[], float],
+                 timeout: float, on_result: PingResultCallback):
+        self.websocket = websocket
+        self.interval = interval        # Re-read after every ping (adaptive timing)
+        self.timeout = timeout
+        self.on_result = on_result
+        self.due_tick: Optional[int] = None
+        self.sent_at: Optional[float] = None
+        self.pong: Optional[asyncio.Future] = None
+        self.generation = 0             # Bumped per completed ping; drops late pongs
+        self.active = True
+
+
+class HeartbeatScheduler:
+    """
+    Shared heartbeat timer wheel
+
+    One task wakes every tick, takes the due entries from the current bucket,
+    sends their pings as one batch and fails pings whose pong did not arrive
+    within their timeout. The task exits when nothing is registered.
+    """
+
+    def __init__(self, tick_seconds: float = WHEEL_TICK_SECONDS, slots: int = WHEEL_SLOTS):
+        self.tick_seconds = tick_seconds
+        self.slots = slots
+        self._wheel: List[Set[HeartbeatEntry]] = [set() for _ in range(slots)]
+        self._tick = 0
+        self._origin = 0.0  # Loop time of tick 0
+        self._count = 0
+        self._task: Optional[asyncio.Task] = None
+        self._batches: Set[asyncio.Task] = set()
+
+        # Statistics
+        self.pings_sent = 0
+        self.ping_failures = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def register(self, websocket: WebSocket, interval: Callable[[], float],
+                 timeout: float, on_result: PingResultCallback) -> HeartbeatEntry:
+        """
+        Ping websocket every interval() seconds until unregistered
+
+        Args:
+            websocket: Connection to ping
+            interval: Returns the delay before the next ping
+            timeout: Seconds to wait for the pong
+            on_result: Called with (latency_ms, error) after every ping
+        """
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            # Rebase the clock so the current tick is now
+            self._origin = loop.time() - self._tick * self.tick_seconds
+            self._task = loop.create_task(self._run())
+
+        entry = HeartbeatEntry(websocket, interval, timeout, on_result)
+        self._count += 1
+        self._schedule(entry, interval())
+        return entry
+
+    def unregister(self, entry: Optional[HeartbeatEntry]):
+        """Stop pinging entry's connection (safe to call twice)"""
+        if entry is None or not entry.active:
+            return
+
+        entry.active = False
+        entry.generation += 1
+        self._unschedule(entry)
+        if entry.pong is not None and not entry.pong.done():
+            entry.pong.cancel()
+        entry.pong = None
+        self._count -= 1
+
+    def _schedule(self, entry: HeartbeatEntry, delay: float):
+        """Put entry in the bucket of the first tick at or after now + delay"""
+        self._unschedule(entry)
+        due = asyncio.get_running_loop().time() + delay
+        entry.due_tick = max(self._tick + 1, math.ceil((due - self._origin) / self.tick_seconds))
+        self._wheel[entry.due_tick % self.slots].add(entry)
+
+    def _unschedule(self, entry: HeartbeatEntry):
+        if entry.due_tick is not None:
+            self._wheel[entry.due_tick % self.slots].discard(entry)
+            entry.due_tick = None
+
+    async def _run(self):
+        """Advance the wheel one tick at a time (catching up if late)"""
+        loop = asyncio.get_running_loop()
+        while self._count:
+            delay = self._origin + (self._tick + 1) * self.tick_seconds - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._tick += 1
+            self._advance()
+
+    def _advance(self):
+        """Handle every entry due at the current tick"""
+        bucket = self._wheel[self._tick % self.slots]
+        due = [entry for entry in bucket if entry.due_tick <= self._tick]
+        if not due:
+            return
+
+        pings = []
+        for entry in due:
+            bucket.discard(entry)
+            entry.due_tick = None
+            if entry.sent_at is None:
+                pings.append(entry)
+            else:
+                self._complete(entry, None, asyncio.TimeoutError())
+
+        if pings:
+            # Timeout checks are scheduled before the sends, so a ping() that
+            # never returns still fails on time
+            for entry in pings:
+                entry.sent_at = self._origin + self._tick * self.tick_seconds
+                self._schedule(entry, entry.timeout)
+            self.pings_sent += len(pings)
+            batch = asyncio.create_task(self._send_pings(pings))
+            self._batches.add(batch)
+            batch.add_done_callback(self._batches.discard)
+
+    async def _send_pings(self, entries: List[HeartbeatEntry]):
+        await asyncio.gather(*(self._send_ping(entry) for entry in entries))
+
+    async def _send_ping(self, entry: HeartbeatEntry):
+        """Send one ping and watch its pong waiter"""
+        generation = entry.generation
+        entry.sent_at = asyncio.get_running_loop().time()
+        try:
+            pong = asyncio.ensure_future(await entry.websocket.ping())
+        except Exception as e:
+            if entry.generation == generation:
+                self._complete(entry, None, e)
+            return
+
+        if entry.generation != generation:
+            # Timed out or unregistered while ping() was running
+            pong.cancel()
+            return
+        entry.pong = pong
+        pong.add_done_callback(partial(self._on_pong, entry, generation))
+
+    def _on_pong(self, entry: HeartbeatEntry, generation: int, pong: asyncio.Future):
+        if entry.generation != generation or pong.cancelled():
+            return
+
+        error = pong.exception()
+        if error is not None:
+            self._complete(entry, None, error)
+        else:
+            latency_ms = (asyncio.get_running_loop().time() - entry.sent_at) * 1000
+            self._complete(entry, latency_ms, None)
+
+    def _complete(self, entry: HeartbeatEntry, latency_ms: Optional[float],
+                  error: Optional[BaseException]):
+        """Report a finished ping and schedule the next one"""
+        entry.generation += 1
+        if entry.pong is not None and not entry.pong.done():
+            entry.pong.cancel()
+        entry.pong = None
+        entry.sent_at = None
+        self._unschedule(entry)
+        if error is not None:
+            self.ping_failures += 1
+
+        try:
+            entry.on_result(latency_ms, error)
+        except Exception as e:
+            logger.error("heartbeat.callback_error", error=str(e))
+
+        if entry.active:
+            self._schedule(entry, entry.interval())
+
+    async def shutdown(self):
+        """Unregister everything and stop the wheel task"""
+        for bucket in self._wheel:
+            for entry in list(bucket):
+                self.unregister(entry)
+
+        for task in [self._task, *self._batches]:
+            if task and not task.done():
+                task.cancel()
+        self._task = None
+
+    def get_status(self) -> Dict[str, Any]:
+        """Scheduler statistics"""
+        return {
+            "connections": self._count,
+            "tick": self._tick,
+            "tick_seconds": self.tick_seconds,
+            "pings_sent": self.pings_sent,
+            "ping_failures": self.ping_failures,
+            "running": self._task is not None and not self._task.done()
+        }
+
+
 class WebSocketHeartbeatMonitor:
     """
     WebSocket heartbeat monitoring system
 
     Manages connection health through periodic ping/pong exchanges.
     Provides connection quality metrics and adaptive timing.
+    Pings are sent by the shared HeartbeatScheduler.
     """
 
     def __init__(self, websocket: WebSocket, session_id: str,
-                 config: Optional[HeartbeatConfig] = None):
+                 config: Optional[HeartbeatConfig] = None,
+                 scheduler: Optional[HeartbeatScheduler] = None):
         """
         Initialize heartbeat monitor for a WebSocket connection
 
@@ -128,17 +354,19 @@ class WebSocketHeartbeatMonitor:
             websocket: WebSocket connection to monitor
             session_id: Session identifier for logging
             config: Heartbeat configuration
+            scheduler: Timer wheel to register with (default: the worker's)
         """
         self.websocket = websocket
         self.session_id = session_id
         self.config = config or HeartbeatConfig()
+        self.scheduler = scheduler if scheduler is not None else get_heartbeat_scheduler()
 
         # State management
         self.state = HeartbeatState.STOPPED
         self.monitor_id = str(uuid.uuid4())[:8]
 
-        # Monitoring task
-        self._heartbeat_task: Optional[asyncio.Task] = None
+        # Wheel registration
+        self._heartbeat: Optional[HeartbeatEntry] = None
 
         # Metrics
         self.metrics = HeartbeatMetrics()
@@ -171,8 +399,16 @@ class WebSocketHeartbeatMonitor:
         # Initialize metrics
         self.metrics.first_ping_time = time.time()
 
-        # Start monitoring task
-        self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+        # Register with the timer wheel
+        self._heartbeat = self.scheduler.register(
+            self.websocket,
+            interval=self._calculate_interval,
+            timeout=self.config.timeout_seconds,
+            on_result=self._on_ping_result
+        )
+
+        self.state = HeartbeatState.ACTIVE
+        self._notify_state_change()
 
         logger.info("heartbeat.started",
                    session_id=self.session_id,
@@ -187,13 +423,9 @@ class WebSocketHeartbeatMonitor:
         self.state = HeartbeatState.STOPPED
         self._notify_state_change()
 
-        # Cancel monitoring task
-        if self._heartbeat_task and not self._heartbeat_task.done():
-            self._heartbeat_task.cancel()
-            try:
-                await self._heartbeat_task
-            except asyncio.CancelledError:
-                pass
+        # Leave the timer wheel
+        self.scheduler.unregister(self._heartbeat)
+        self._heartbeat = None
 
         logger.info("heartbeat.stopped",
                    session_id=self.session_id,
@@ -202,77 +434,35 @@ class WebSocketHeartbeatMonitor:
                    total_pings=self.metrics.total_pings,
                    success_rate=self.metrics.success_rate)
 
-    async def _heartbeat_loop(self):
-        """Main heartbeat monitoring loop"""
-        try:
-            self.state = HeartbeatState.ACTIVE
-            self._notify_state_change()
-
-            while self.state not in [HeartbeatState.STOPPED, HeartbeatState.FAILED]:
-                # Calculate current interval (adaptive or fixed)
-                current_interval = self._calculate_interval()
-
-                # Wait for next heartbeat
-                await asyncio.sleep(current_interval)
-
-                # Send ping and measure response
-                success, latency_ms = await self._send_ping()
-
-                # Update metrics
-                self._update_metrics(success, latency_ms)
-
-                # Update state based on recent performance
-                self._update_state()
-
-                logger.debug("heartbeat.ping_completed",
-                            session_id=self.session_id,
-                            success=success,
-                            latency_ms=latency_ms,
-                            success_rate=self.metrics.success_rate,
-                            state=self.state.value)
-
-        except asyncio.CancelledError:
-            logger.debug("heartbeat.loop_cancelled",
-                        session_id=self.session_id)
-        except Exception as e:
-            logger.error("heartbeat.loop_error",
-                        session_id=self.session_id,
-                        error=str(e))
-            self.state = HeartbeatState.FAILED
-            self._notify_state_change()
-
-    async def _send_ping(self) -> tuple[bool, Optional[float]]:
-        """
-        Send ping and measure response time
-
-        Returns:
-            (success, latency_ms) tuple
-        """
-        start_time = time.time()
-
-        try:
-            # Send WebSocket ping
-            pong_waiter = await self.websocket.ping()
-
-            # Wait for pong response with timeout
-            await asyncio.wait_for(pong_waiter, timeout=self.config.timeout_seconds)
-
-            # Calculate latency
-            latency_ms = (time.time() - start_time) * 1000
-
-            return True, latency_ms
-
-        except asyncio.TimeoutError:
+    def _on_ping_result(self, latency_ms: Optional[float], error: Optional[BaseException]):
+        """Record the outcome of one ping sent by the scheduler"""
+        if isinstance(error, asyncio.TimeoutError):
             logger.warning("heartbeat.ping_timeout",
                           session_id=self.session_id,
                           timeout=self.config.timeout_seconds)
-            return False, None
-
-        except Exception as e:
+        elif error is not None:
             logger.warning("heartbeat.ping_error",
                           session_id=self.session_id,
-                          error=str(e))
-            return False, None
+                          error=str(error))
+
+        success = error is None
+
+        # Update metrics
+        self._update_metrics(success, latency_ms)
+
+        # Update state based on recent performance
+        self._update_state()
+
+        logger.debug("heartbeat.ping_completed",
+                    session_id=self.session_id,
+                    success=success,
+                    latency_ms=latency_ms,
+                    success_rate=self.metrics.success_rate,
+                    state=self.state.value)
+
+        # A failed connection is not pinged any more
+        if self.state == HeartbeatState.FAILED:
+            self.scheduler.unregister(self._heartbeat)
 
     def _update_metrics(self, success: bool, latency_ms: Optional[float]):
         """Update heartbeat metrics with latest result"""
@@ -420,10 +610,21 @@ class WebSocketHeartbeatMonitor:
                 self.consecutive_failures < self.config.consecutive_failures_threshold)
 
 
-# Global heartbeat monitors registry
+# Global heartbeat scheduler and monitors registry
+_heartbeat_scheduler: Optional[HeartbeatScheduler] = None
 _heartbeat_monitors: Dict[str, WebSocketHeartbeatMonitor] = {}
 
 
+def get_heartbeat_scheduler() -> HeartbeatScheduler:
+    """Get the timer wheel shared by all connections of this worker"""
+    global _heartbeat_scheduler
+
+    if _heartbeat_scheduler is None:
+        _heartbeat_scheduler = HeartbeatScheduler()
+
+    return _heartbeat_scheduler
+
+
 def register_heartbeat_monitor(session_id: str, monitor: WebSocketHeartbeatMonitor):
     """Register a heartbeat monitor for global tracking"""
     _heartbeat_monitors[session_id] = monitor
@@ -24,6 +24,7 @@ import structlog
 from fastapi import WebSocket
 
 from avatar.core.config import config
+from avatar.core.websocket_heartbeat import HeartbeatEntry, get_heartbeat_scheduler
 
 logger = structlog.get_logger()
 
@@ -136,9 +137,10 @@ class WebSocketReconnectManager:
         self.active_sessions: Dict[str, SessionSnapshot] = {}
         self.session_callbacks: Dict[str, Callable] = {}
 
-        # Background tasks
-        self._heartbeat_task: Optional[asyncio.Task] = None
+        # Heartbeat registration (shared timer wheel) and background tasks
+        self._heartbeat: Optional[HeartbeatEntry] = None
         self._cleanup_task: Optional[asyncio.Task] = None
+        self._disconnect_tasks: Set[asyncio.Task] = set()  # Referenced until done
 
         # Statistics
         self.connection_stats = {
@@ -223,9 +225,7 @@ class WebSocketReconnectManager:
                        stage=session_snapshot.processing_stage)
 
         # Stop heartbeat monitoring
-        if self._heartbeat_task:
-            self._heartbeat_task.cancel()
-            self._heartbeat_task = None
+        self._stop_heartbeat()
 
         # Update state
         if self.state == ConnectionState.CONNECTED:
@@ -309,8 +309,14 @@ class WebSocketReconnectManager:
         self.first_attempt_time = None
         self.last_attempt_time = None
 
-        # Start heartbeat monitoring
-        self._heartbeat_task = asyncio.create_task(self._heartbeat_monitor())
+        # Start heartbeat monitoring (replaces the previous connection's)
+        self._stop_heartbeat()
+        self._heartbeat = get_heartbeat_scheduler().register(
+            websocket,
+            interval=lambda: self.config.heartbeat_interval_seconds,
+            timeout=self.config.heartbeat_timeout_seconds,
+            on_result=self._on_heartbeat
+        )
 
         # Start session cleanup task
         if self._cleanup_task is None or self._cleanup_task.done():
@@ -351,33 +357,30 @@ class WebSocketReconnectManager:
 
         return snapshot
 
-    async def _heartbeat_monitor(self):
+    def _on_heartbeat(self, latency_ms: Optional[float], error: Optional[BaseException]):
         """
-        Background task to monitor connection health
+        Ping result from the heartbeat scheduler; a failed ping disconnects
         """
-        try:
-            while self.state == ConnectionState.CONNECTED:
-                await asyncio.sleep(self.config.heartbeat_interval_seconds)
-
-                if self.current_websocket:
-                    try:
-                        # Send ping frame
-                        await asyncio.wait_for(
-                            self.current_websocket.ping(),
-                            timeout=self.config.heartbeat_timeout_seconds
-                        )
-
-                    except asyncio.TimeoutError:
-                        logger.warning("websocket_reconnect.heartbeat_timeout")
-                        await self.handle_disconnect(DisconnectReason.TIMEOUT)
-                        break
-                    except Exception as e:
-                        logger.warning("websocket_reconnect.heartbeat_error", error=str(e))
-                        await self.handle_disconnect(DisconnectReason.NETWORK_ERROR)
-                        break
+        if error is None:
+            return
 
-        except asyncio.CancelledError:
-            logger.debug("websocket_reconnect.heartbeat_cancelled")
+        if isinstance(error, asyncio.TimeoutError):
+            logger.warning("websocket_reconnect.heartbeat_timeout")
+            reason = DisconnectReason.TIMEOUT
+        else:
+            logger.warning("websocket_reconnect.heartbeat_error", error=str(error))
+            reason = DisconnectReason.NETWORK_ERROR
+
+        self._stop_heartbeat()
+        task = asyncio.create_task(self.handle_disconnect(reason))
+        self._disconnect_tasks.add(task)
+        task.add_done_callback(self._disconnect_tasks.discard)
+
+    def _stop_heartbeat(self):
+        """Leave the heartbeat timer wheel"""
+        if self._heartbeat is not None:
+            get_heartbeat_scheduler().unregister(self._heartbeat)
+            self._heartbeat = None
 
     async def _session_cleanup(self):
         """
@@ -426,9 +429,9 @@ class WebSocketReconnectManager:
         self.state = ConnectionState.SUSPENDED
 
         # Cancel background tasks
-        for task in [self._heartbeat_task, self._cleanup_task]:
-            if task and not task.done():
-                task.cancel()
+        self._stop_heartbeat()
+        if self._cleanup_task and not self._cleanup_task.done():
+            self._cleanup_task.cancel()
 
         # Clear sessions
         self.active_sessions.clear()
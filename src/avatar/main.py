@@ -4,6 +4,7 @@ AVATAR - FastAPI Main Application
 Entry point for the AI Voice Assistant API server.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
@@ -21,7 +22,9 @@ from slowapi.errors import RateLimitExceeded
 from avatar.core.config import config
 from avatar.core.model_preloader import preload_all_models, get_model_preloader
 from avatar.core.security import get_security_headers, verify_api_token
+from avatar.core.session_queue import initialize_session_queue
 from avatar.core.vram_monitor import get_vram_monitor
+from avatar.core.gpu_telemetry import get_gpu_telemetry
 from avatar.core.logging_config import configure_logging
 from avatar.core.error_handling import get_error_handler
 from avatar.core.monitoring import setup_monitoring
@@ -30,6 +33,9 @@ from avatar.api.websocket import websocket_endpoint
 from avatar.api.voice_profiles import router as voice_profiles_router
 from avatar.api.conversations import router as conversations_router
 from avatar.api.monitoring import router as monitoring_router
+from avatar.api.audio import router as audio_router
+from avatar.services.tts_phrase_cache import list_voice_profiles, warm_up_phrase_cache
+from avatar.services.database import db
 
 # Configure unified structured logging
 configure_logging()
@@ -76,6 +82,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                 max_sessions=config.MAX_CONCURRENT_SESSIONS,
                 vram_limit_gb=config.VRAM_LIMIT_GB)
 
+    # Sample GPU stats on a fixed cadence; VRAM consumers read the snapshot
+    gpu_telemetry = get_gpu_telemetry()
+    gpu_telemetry.start()
+
     # Preload AI models for optimal performance
     # This eliminates cold start latency for better user experience
     logger.info("avatar.models.preloading",
@@ -104,12 +114,25 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     metrics_collector = get_metrics_collector()
     setup_monitoring(error_handler, metrics_collector)
 
+    # Per-stage admission for the conversation pipeline (STT → LLM → TTS slots)
+    session_queue = await initialize_session_queue()
+
+    # Pre-render common phrases in the background (does not delay startup)
+    phrase_warmup_task = None
+    if config.TTS_PHRASE_CACHE_ENABLED and config.TTS_WARMUP_PHRASES:
+        phrase_warmup_task = asyncio.create_task(warm_up_phrase_cache())
+
     logger.info("avatar.startup.complete")
 
     yield  # Server is running
 
     # Shutdown
     logger.info("avatar.shutdown", message="Cleaning up resources")
+    if phrase_warmup_task is not None and not phrase_warmup_task.done():
+        phrase_warmup_task.cancel()
+    await session_queue.stop()
+    gpu_telemetry.stop()
+    await db.close()  # Commits writes still queued for the group-commit writer
     # TODO: Cleanup AI model resources
     logger.info("avatar.shutdown.complete")
 
@@ -164,16 +187,18 @@ async def health_check(request: Request):
 @limiter.limit("10/minute")
 async def system_info(request: Request):
     """Get system information and resource status"""
-    import torch
+    gpu = get_gpu_telemetry().snapshot().gpu(0)
 
     gpu_info = {}
-    if torch.cuda.is_available():
+    if gpu is not None:
         gpu_info = {
             "available": True,
-            "device_name": torch.cuda.get_device_name(0),
-            "total_memory_gb": round(torch.cuda.get_device_properties(0).total_memory / 1024**3, 2),
-            "allocated_memory_gb": round(torch.cuda.memory_allocated(0) / 1024**3, 2),
-            "reserved_memory_gb": round(torch.cuda.memory_reserved(0) / 1024**3, 2),
+            "device_name": gpu.name,
+            "total_memory_gb": gpu.total_gb,
+            "allocated_memory_gb": gpu.allocated_gb,
+            "reserved_memory_gb": gpu.reserved_gb,
+            "used_memory_gb": gpu.used_gb,
+            "process_memory_gb": gpu.process_gb,
         }
     else:
         gpu_info = {"available": False}
@@ -182,6 +207,8 @@ async def system_info(request: Request):
         "version": app.version,
         "config": {
             "max_concurrent_sessions": config.MAX_CONCURRENT_SESSIONS,
+            "max_connections": config.MAX_CONNECTIONS,
+            "stage_concurrency": config.STAGE_CONCURRENCY,
             "vram_limit_gb": config.VRAM_LIMIT_GB,
         },
         "gpu": gpu_info,
@@ -199,6 +226,7 @@ async def models_status(request: Request):
     return JSONResponse({
         "preload_status": status["status"],
         "total_preload_time": status["total_time"],
+        "timeline": status["timeline"],
         "loaded_models": status["loaded_models"],
         "failed_models": status["failed_models"],
         "models_ready": len(status["loaded_models"]),
@@ -256,6 +284,42 @@ async def trigger_model_warmup(request: Request):
         }, status_code=500)
 
 
+@app.post("/api/system/tts/warmup", tags=["System", "Models"])
+@limiter.limit("2/minute")
+async def trigger_tts_phrase_warmup(request: Request, profile: Optional[str] = None):
+    """Pre-render the configured phrase list into the TTS phrase cache"""
+    logger.info("api.tts.warmup_triggered", profile=profile)
+
+    if not config.TTS_PHRASE_CACHE_ENABLED:
+        return JSONResponse({
+            "success": False,
+            "message": "TTS phrase cache is disabled (AVATAR_TTS_PHRASE_CACHE=false)"
+        }, status_code=400)
+
+    if profile is not None and profile not in list_voice_profiles():
+        return JSONResponse({
+            "success": False,
+            "message": f"Voice profile not found: {profile}"
+        }, status_code=404)
+
+    try:
+        summary = await warm_up_phrase_cache(profiles=[profile] if profile else None)
+
+        return JSONResponse({
+            "success": True,
+            "message": "TTS phrase warm-up completed",
+            "summary": summary
+        })
+
+    except Exception as e:
+        logger.error("api.tts.warmup_failed", error=str(e))
+        return JSONResponse({
+            "success": False,
+            "message": f"TTS phrase warm-up failed: {e}",
+            "error": str(e)
+        }, status_code=500)
+
+
 # VRAM monitoring endpoints (Task 20)
 @app.get("/api/system/vram/status", tags=["System", "VRAM"])
 @limiter.limit("30/minute")
@@ -286,7 +350,7 @@ async def get_vram_status(request: Request):
 async def get_vram_history(
     request: Request,
     device_id: int = Query(0, ge=0, description="GPU device ID"),
-    minutes: int = Query(10, ge=1, le=60, description="History period in minutes")
+    minutes: int = Query(10, ge=1, le=360, description="History period in minutes")
 ):
     """Get VRAM usage history for specified GPU"""
     logger.info("api.vram.history_requested", device_id=device_id, minutes=minutes)
@@ -371,6 +435,7 @@ async def predict_service_capacity(
 app.include_router(voice_profiles_router)
 app.include_router(conversations_router)
 app.include_router(monitoring_router)
+app.include_router(audio_router)
 
 
 # Root endpoint
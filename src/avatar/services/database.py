@@ -2,11 +2,42 @@
 Database operations for conversations and voice profiles
 
 Provides async interface to SQLite database using aiosqlite.
+
+Connections (WAL mode):
+- one writer connection, owned by a writer task that group-commits: writes
+  queued within DB_COMMIT_INTERVAL_MS share one transaction (one savepoint
+  per write, so a failing write does not fail the others) and one commit
+- a pool of read-only connections, so API reads run in parallel with each
+  other and with the writer instead of queueing behind it
+
+Callers still await every write until its batch has committed.
+
+Session listing and stats read conversation_sessions, a per-session summary
+(turn count, first/last timestamps, first message, voice profile) that
+triggers update on every saved or deleted turn, instead of grouping the
+whole conversations table per request. A deleted turn adjusts its session's
+row in place; deleting a whole session drops the row first so the per-turn
+trigger has nothing to do.
+
+Conversation search uses an FTS5 index (conversations_fts) kept in sync by
+triggers. unicode61 keeps a run of CJK characters as one token, so text is
+indexed with every CJK character split into its own token and CJK queries
+become phrase queries: any substring matches, including two-character words
+that a trigram index could not serve. The triggers index the raw text, so
+other writers (sqlite3 CLI, scripts) need no custom SQL function;
+save_conversation re-indexes its row with segmented text in the same
+transaction. CJK text written by other writers is only found by whole-run
+prefix until it is saved again.
 """
 
+import asyncio
+import re
+import sqlite3
 import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, AsyncIterator, Optional, Sequence
 
 import aiosqlite
 import structlog
@@ -15,6 +46,77 @@ from avatar.core.config import config
 
 logger = structlog.get_logger()
 
+# Han, kana and Hangul: written without spaces, indexed one character per token
+_CJK_CHAR = re.compile(r"([\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uac00-\ud7af])")
+_CJK_SPACING = re.compile(r" ?([\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uac00-\ud7af]) ?")
+
+SNIPPET_TOKENS = 32
+
+BUSY_TIMEOUT_MS = 5000
+
+# conversation_sessions rows rebuilt from conversations (append WHERE/GROUP BY)
+_SESSION_SUMMARY_SELECT = """
+    SELECT
+        c.session_id,
+        COUNT(*),
+        MIN(c.turn_number),
+        (SELECT f.user_text FROM conversations f
+         WHERE f.session_id = c.session_id ORDER BY f.turn_number LIMIT 1),
+        MIN(c.created_at),
+        MAX(c.created_at),
+        (SELECT l.voice_profile_id FROM conversations l
+         WHERE l.session_id = c.session_id ORDER BY l.id DESC LIMIT 1)
+    FROM conversations c
+"""
+MAX_WRITE_BATCH = 256
+
+
+@dataclass
+class WriteResult:
+    """Outcome of one queued write statement"""
+    lastrowid: Optional[int]
+    rowcount: int
+
+
+@dataclass
+class _WriteOp:
+    sql: str
+    params: Sequence[Any]
+    future: asyncio.Future
+    before: Sequence[tuple[str, Sequence[Any]]] = ()  # Run in the same savepoint
+    after: Sequence[tuple[str, Sequence[Any]]] = ()
+
+
+def segment_cjk(text: Optional[str]) -> Optional[str]:
+    """Surround every CJK character with spaces for the unicode61 tokenizer"""
+    if not text:
+        return text
+    return _CJK_CHAR.sub(r" \1 ", text)
+
+
+def desegment_cjk(text: str) -> str:
+    """Undo segment_cjk on indexed text (e.g. snippets)"""
+    return _CJK_SPACING.sub(r"\1", text)
+
+
+def build_fts_query(query: str) -> Optional[str]:
+    """
+    Turn user input into an FTS5 MATCH expression
+
+    Every whitespace-separated term becomes a quoted prefix phrase (terms are
+    ANDed), so operators and quotes in user input are matched literally.
+
+    Returns:
+        MATCH expression, or None if the query has no searchable characters
+    """
+    phrases = []
+    for term in query.split():
+        if not re.search(r"\w", term):
+            continue  # Punctuation only: the tokenizer would drop it
+        phrase = " ".join(segment_cjk(term).split()).replace('"', '""')
+        phrases.append(f'"{phrase}"*')
+    return " ".join(phrases) if phrases else None
+
 
 class DatabaseService:
     """
@@ -23,23 +125,197 @@ class DatabaseService:
     Handles all database operations for conversations and voice profiles.
     """
 
-    def __init__(self, db_path: Path = config.DATABASE_PATH):
+    def __init__(
+        self,
+        db_path: Path = config.DATABASE_PATH,
+        read_pool_size: int = config.DB_READ_POOL_SIZE,
+        commit_interval_ms: float = config.DB_COMMIT_INTERVAL_MS,
+    ):
         self.db_path = db_path
-        self._conn: Optional[aiosqlite.Connection] = None
+        self.read_pool_size = max(1, read_pool_size)
+        self.commit_interval = commit_interval_ms / 1000
+
+        self._conn: Optional[aiosqlite.Connection] = None  # Writer connection
+        self._readers: Optional[asyncio.Queue] = None
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._connect_lock = asyncio.Lock()
+        self._fts_enabled = False
+        self._v2_schema_ready = False
+
+        self.write_count = 0
+        self.write_batches = 0
 
     async def connect(self):
-        """Establish database connection"""
-        if self._conn is None:
-            self._conn = await aiosqlite.connect(str(self.db_path))
-            self._conn.row_factory = aiosqlite.Row
-            logger.info("db.connected", path=str(self.db_path))
+        """Open the writer connection, the reader pool and the writer task"""
+        async with self._connect_lock:
+            if self._conn is not None:
+                return
+
+            # Callers arriving during setup wait on these queues
+            self._readers = asyncio.Queue()
+            self._write_queue = asyncio.Queue()
+
+            # Autocommit mode: the writer task issues BEGIN/COMMIT itself
+            conn = await aiosqlite.connect(str(self.db_path), isolation_level=None)
+            conn.row_factory = aiosqlite.Row
+            await conn.execute("PRAGMA journal_mode=WAL")
+            await conn.execute("PRAGMA synchronous=NORMAL")  # WAL: fsync at checkpoints, not per commit
+            await conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+            # Only used by the conversations_fts backfill on this connection
+            await conn.create_function("avatar_fts_segment", 1, segment_cjk, deterministic=True)
+            self._conn = conn
+
+            await self._ensure_voice_profiles_v2_schema()
+            await self._ensure_conversation_sessions_schema()
+            await self._ensure_conversation_search_schema()
+
+            for _ in range(self.read_pool_size):
+                reader = await aiosqlite.connect(str(self.db_path), isolation_level=None)
+                reader.row_factory = aiosqlite.Row
+                await reader.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+                await reader.execute("PRAGMA query_only=ON")
+                self._readers.put_nowait(reader)
+
+            self._writer_task = asyncio.create_task(self._writer_loop())
+
+            logger.info("db.connected",
+                       path=str(self.db_path),
+                       readers=self.read_pool_size,
+                       commit_interval_ms=self.commit_interval * 1000)
 
     async def close(self):
-        """Close database connection"""
-        if self._conn:
-            await self._conn.close()
-            self._conn = None
-            logger.info("db.closed")
+        """Flush queued writes and close all connections"""
+        if self._conn is None:
+            return
+
+        if self._writer_task is not None:
+            self._write_queue.put_nowait(None)  # Writer drains the queue, then exits
+            await self._writer_task
+            self._writer_task = None
+
+        while not self._readers.empty():
+            await self._readers.get_nowait().close()
+
+        await self._conn.close()
+        self._conn = None
+        logger.info("db.closed", writes=self.write_count, batches=self.write_batches)
+
+    # Connection pool and writer
+
+    @asynccontextmanager
+    async def _reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a read-only connection from the pool"""
+        if not self._conn:
+            await self.connect()
+
+        conn = await self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put_nowait(conn)
+
+    async def _fetchall(self, sql: str, params: Sequence[Any] = ()) -> list:
+        async with self._reader() as conn:
+            cursor = await conn.execute(sql, params)
+            return await cursor.fetchall()
+
+    async def _fetchone(self, sql: str, params: Sequence[Any] = ()):
+        async with self._reader() as conn:
+            cursor = await conn.execute(sql, params)
+            return await cursor.fetchone()
+
+    async def _write(
+        self,
+        sql: str,
+        params: Sequence[Any] = (),
+        before: Sequence[tuple[str, Sequence[Any]]] = (),
+        after: Sequence[tuple[str, Sequence[Any]]] = (),
+    ) -> WriteResult:
+        """
+        Queue a write statement for the writer task
+
+        Statements in before and after run in the same savepoint, so they
+        commit or roll back with it.
+
+        Returns: Result of sql once the batch holding the write has committed
+
+        Raises:
+            sqlite3.Error: The statement or its batch's commit failed
+        """
+        if not self._conn:
+            await self.connect()
+
+        future = asyncio.get_running_loop().create_future()
+        self._write_queue.put_nowait(
+            _WriteOp(sql=sql, params=params, future=future, before=before, after=after)
+        )
+        return await future
+
+    async def _writer_loop(self):
+        """Collect queued writes for commit_interval, then commit them together"""
+        while True:
+            op = await self._write_queue.get()
+            if op is None:
+                return
+
+            if self.commit_interval > 0:
+                await asyncio.sleep(self.commit_interval)
+
+            batch = [op]
+            closing = False
+            while len(batch) < MAX_WRITE_BATCH and not self._write_queue.empty():
+                op = self._write_queue.get_nowait()
+                if op is None:
+                    closing = True
+                    break
+                batch.append(op)
+
+            await self._commit_batch(batch)
+            if closing:
+                return
+
+    async def _commit_batch(self, batch: list[_WriteOp]):
+        """Run a batch in one transaction, one savepoint per write"""
+        conn = self._conn
+        results: list[Any] = []
+
+        try:
+            await conn.execute("BEGIN IMMEDIATE")
+            for op in batch:
+                await conn.execute("SAVEPOINT write_op")
+                try:
+                    for sql, params in op.before:
+                        await conn.execute(sql, params)
+                    cursor = await conn.execute(op.sql, op.params)
+                    result = WriteResult(lastrowid=cursor.lastrowid, rowcount=cursor.rowcount)
+                    for sql, params in op.after:
+                        await conn.execute(sql, params)
+                    results.append(result)
+                    await conn.execute("RELEASE write_op")
+                except sqlite3.Error as e:
+                    await conn.execute("ROLLBACK TO write_op")
+                    await conn.execute("RELEASE write_op")
+                    results.append(e)
+            await conn.execute("COMMIT")
+
+        except Exception as e:
+            logger.error("db.writer.batch_failed", size=len(batch), error=str(e))
+            if conn.in_transaction:
+                await conn.execute("ROLLBACK")
+            results = [e] * len(batch)
+
+        for op, result in zip(batch, results):
+            if op.future.done():
+                continue  # Caller cancelled; the write itself still happened
+            if isinstance(result, Exception):
+                op.future.set_exception(result)
+            else:
+                op.future.set_result(result)
+
+        self.write_count += len(batch)
+        self.write_batches += 1
+        logger.debug("db.writer.committed", size=len(batch))
 
     async def __aenter__(self):
         """Context manager entry"""
@@ -73,7 +349,18 @@ class DatabaseService:
 
         created_at = int(time.time())
 
-        cursor = await self._conn.execute(
+        # The trigger indexed the raw text; segment CJK for search
+        after = ()
+        if self._fts_enabled:
+            after = ((
+                """
+                UPDATE conversations_fts SET user_text = ?, ai_text = ?
+                WHERE rowid = last_insert_rowid()
+                """,
+                (segment_cjk(user_text), segment_cjk(ai_text)),
+            ),)
+
+        result = await self._write(
             """
             INSERT INTO conversations (
                 session_id, turn_number,
@@ -93,10 +380,10 @@ class DatabaseService:
                 voice_profile_id,
                 created_at,
             ),
+            after=after,
         )
 
-        await self._conn.commit()
-        conversation_id = cursor.lastrowid
+        conversation_id = result.lastrowid
 
         logger.info(
             "db.conversation.saved",
@@ -118,7 +405,7 @@ class DatabaseService:
         if not self._conn:
             await self.connect()
 
-        cursor = await self._conn.execute(
+        rows = await self._fetchall(
             """
             SELECT
                 id, session_id, turn_number,
@@ -133,7 +420,6 @@ class DatabaseService:
             (session_id, limit),
         )
 
-        rows = await cursor.fetchall()
         conversations = [dict(row) for row in rows]
 
         logger.debug(
@@ -144,6 +430,30 @@ class DatabaseService:
 
         return conversations
 
+    async def get_conversation_turn(self, session_id: str, turn_number: int) -> Optional[dict]:
+        """
+        Get one conversation turn
+
+        Single-row lookup through the UNIQUE(session_id, turn_number) index.
+        """
+        if not self._conn:
+            await self.connect()
+
+        row = await self._fetchone(
+            """
+            SELECT
+                id, session_id, turn_number,
+                user_audio_path, user_text, ai_text,
+                ai_audio_fast_path, ai_audio_hq_path,
+                voice_profile_id, created_at
+            FROM conversations
+            WHERE session_id = ? AND turn_number = ?
+            """,
+            (session_id, turn_number),
+        )
+
+        return dict(row) if row else None
+
     async def get_recent_sessions(self, limit: int = 10) -> list[dict]:
         """
         Get recent conversation sessions
@@ -153,22 +463,20 @@ class DatabaseService:
         if not self._conn:
             await self.connect()
 
-        cursor = await self._conn.execute(
+        rows = await self._fetchall(
             """
             SELECT
                 session_id,
-                COUNT(*) as turn_count,
-                MIN(created_at) as started_at,
-                MAX(created_at) as last_updated
-            FROM conversations
-            GROUP BY session_id
-            ORDER BY last_updated DESC
+                turn_count,
+                first_created_at as started_at,
+                last_created_at as last_updated
+            FROM conversation_sessions
+            ORDER BY last_created_at DESC
             LIMIT ?
             """,
             (limit,),
         )
 
-        rows = await cursor.fetchall()
         sessions = [dict(row) for row in rows]
 
         logger.debug("db.sessions.fetched", count=len(sessions))
@@ -194,7 +502,7 @@ class DatabaseService:
 
         created_at = int(time.time())
 
-        cursor = await self._conn.execute(
+        result = await self._write(
             """
             INSERT INTO voice_profiles (
                 name, audio_path, embedding, duration_sec, created_at
@@ -203,8 +511,7 @@ class DatabaseService:
             (name, audio_path, embedding, duration_sec, created_at),
         )
 
-        await self._conn.commit()
-        profile_id = cursor.lastrowid
+        profile_id = result.lastrowid
 
         logger.info(
             "db.voice_profile.created",
@@ -220,7 +527,7 @@ class DatabaseService:
         if not self._conn:
             await self.connect()
 
-        cursor = await self._conn.execute(
+        row = await self._fetchone(
             """
             SELECT id, name, audio_path, embedding, duration_sec, created_at
             FROM voice_profiles
@@ -229,8 +536,6 @@ class DatabaseService:
             (profile_id,),
         )
 
-        row = await cursor.fetchone()
-
         if row:
             logger.debug("db.voice_profile.fetched", id=profile_id)
             return dict(row)
@@ -243,7 +548,7 @@ class DatabaseService:
         if not self._conn:
             await self.connect()
 
-        cursor = await self._conn.execute(
+        row = await self._fetchone(
             """
             SELECT id, name, audio_path, embedding, duration_sec, created_at
             FROM voice_profiles
@@ -252,8 +557,6 @@ class DatabaseService:
             (name,),
         )
 
-        row = await cursor.fetchone()
-
         if row:
             logger.debug("db.voice_profile.fetched_by_name", name=name)
             return dict(row)
@@ -265,7 +568,7 @@ class DatabaseService:
         if not self._conn:
             await self.connect()
 
-        cursor = await self._conn.execute(
+        rows = await self._fetchall(
             """
             SELECT id, name, audio_path, duration_sec, created_at
             FROM voice_profiles
@@ -273,7 +576,6 @@ class DatabaseService:
             """
         )
 
-        rows = await cursor.fetchall()
         profiles = [dict(row) for row in rows]
 
         logger.debug("db.voice_profiles.listed", count=len(profiles))
@@ -289,15 +591,14 @@ class DatabaseService:
         if not self._conn:
             await self.connect()
 
-        cursor = await self._conn.execute(
+        result = await self._write(
             """
             DELETE FROM voice_profiles WHERE id = ?
             """,
             (profile_id,),
         )
 
-        await self._conn.commit()
-        deleted = cursor.rowcount > 0
+        deleted = result.rowcount > 0
 
         if deleted:
             logger.info("db.voice_profile.deleted", id=profile_id)
@@ -334,7 +635,7 @@ class DatabaseService:
         created_at = profile_data['created_at'].timestamp()
         updated_at = profile_data['updated_at'].timestamp()
 
-        await self._conn.execute(
+        await self._write(
             """
             INSERT INTO voice_profiles_v2 (
                 id, name, description, reference_text, audio_path,
@@ -353,8 +654,6 @@ class DatabaseService:
             ),
         )
 
-        await self._conn.commit()
-
         logger.info(
             "db.voice_profile_v2.created",
             id=profile_data['id'],
@@ -371,7 +670,7 @@ class DatabaseService:
 
         await self._ensure_voice_profiles_v2_schema()
 
-        cursor = await self._conn.execute(
+        row = await self._fetchone(
             """
             SELECT id, name, description, reference_text, audio_path,
                    file_size, created_at, updated_at
@@ -381,7 +680,6 @@ class DatabaseService:
             (profile_id,),
         )
 
-        row = await cursor.fetchone()
         if row:
             from datetime import datetime
             return {
@@ -403,7 +701,7 @@ class DatabaseService:
 
         await self._ensure_voice_profiles_v2_schema()
 
-        cursor = await self._conn.execute(
+        rows = await self._fetchall(
             """
             SELECT id, name, description, reference_text, audio_path,
                    file_size, created_at, updated_at
@@ -414,7 +712,6 @@ class DatabaseService:
             (limit, offset),
         )
 
-        rows = await cursor.fetchall()
         from datetime import datetime
 
         profiles = []
@@ -440,8 +737,7 @@ class DatabaseService:
 
         await self._ensure_voice_profiles_v2_schema()
 
-        cursor = await self._conn.execute("SELECT COUNT(*) FROM voice_profiles_v2")
-        row = await cursor.fetchone()
+        row = await self._fetchone("SELECT COUNT(*) FROM voice_profiles_v2")
         return row[0] if row else 0
 
     async def update_voice_profile_v2(self, profile_id: str, update_data: dict) -> bool:
@@ -469,14 +765,12 @@ class DatabaseService:
 
         values.append(profile_id)
 
-        cursor = await self._conn.execute(
+        result = await self._write(
             f"UPDATE voice_profiles_v2 SET {', '.join(fields)} WHERE id = ?",
             values
         )
 
-        await self._conn.commit()
-
-        success = cursor.rowcount > 0
+        success = result.rowcount > 0
         if success:
             logger.info("db.voice_profile_v2.updated", id=profile_id)
         else:
@@ -491,14 +785,12 @@ class DatabaseService:
 
         await self._ensure_voice_profiles_v2_schema()
 
-        cursor = await self._conn.execute(
+        result = await self._write(
             "DELETE FROM voice_profiles_v2 WHERE id = ?",
             (profile_id,)
         )
 
-        await self._conn.commit()
-
-        success = cursor.rowcount > 0
+        success = result.rowcount > 0
         if success:
             logger.info("db.voice_profile_v2.deleted", id=profile_id)
         else:
@@ -513,25 +805,23 @@ class DatabaseService:
         if not self._conn:
             await self.connect()
 
-        cursor = await self._conn.execute(
+        rows = await self._fetchall(
             """
             SELECT
-                c.session_id,
-                COUNT(*) as turn_count,
-                MIN(c.created_at) as first_created_at,
-                MAX(c.created_at) as last_created_at,
-                MIN(c.user_text) as first_user_message,
+                s.session_id,
+                s.turn_count,
+                s.first_created_at,
+                s.last_created_at,
+                s.first_user_message,
                 vp.name as voice_profile_name
-            FROM conversations c
-            LEFT JOIN voice_profiles_v2 vp ON c.voice_profile_id = vp.id
-            GROUP BY c.session_id
-            ORDER BY last_created_at DESC
+            FROM conversation_sessions s
+            LEFT JOIN voice_profiles_v2 vp ON s.voice_profile_id = vp.id
+            ORDER BY s.last_created_at DESC
             LIMIT ? OFFSET ?
             """,
             (limit, offset),
         )
 
-        rows = await cursor.fetchall()
         return [dict(row) for row in rows]
 
     async def count_conversation_sessions(self) -> int:
@@ -539,10 +829,9 @@ class DatabaseService:
         if not self._conn:
             await self.connect()
 
-        cursor = await self._conn.execute(
-            "SELECT COUNT(DISTINCT session_id) FROM conversations"
+        row = await self._fetchone(
+            "SELECT COUNT(*) FROM conversation_sessions"
         )
-        row = await cursor.fetchone()
         return row[0] if row else 0
 
     async def count_conversation_turns(self) -> int:
@@ -550,17 +839,68 @@ class DatabaseService:
         if not self._conn:
             await self.connect()
 
-        cursor = await self._conn.execute("SELECT COUNT(*) FROM conversations")
-        row = await cursor.fetchone()
+        row = await self._fetchone("SELECT COALESCE(SUM(turn_count), 0) FROM conversation_sessions")
         return row[0] if row else 0
 
     async def search_conversations(self, query: str, limit: int = 20, offset: int = 0) -> list[dict]:
-        """Search conversations by text content"""
+        """
+        Search conversations by text content
+
+        Returns: Sessions with matching turns, best match first. turn_count,
+        created_at and last_activity cover the matching turns; matched_text
+        is a snippet of the best-ranked turn.
+        """
         if not self._conn:
             await self.connect()
 
-        # Use FTS if available, otherwise simple LIKE search
-        cursor = await self._conn.execute(
+        if not self._fts_enabled:
+            return await self._search_conversations_like(query, limit, offset)
+
+        match = build_fts_query(query)
+        if match is None:
+            return []
+
+        # bm25() is lower for better matches; the bare snippet column comes
+        # from the row holding MIN(score). The CTE is materialized because FTS5
+        # auxiliary functions cannot run inside the aggregate once flattened.
+        rows = await self._fetchall(
+            """
+            WITH hits AS MATERIALIZED (
+                SELECT
+                    rowid AS id,
+                    bm25(conversations_fts) AS score,
+                    snippet(conversations_fts, -1, '', '', '…', ?) AS snippet
+                FROM conversations_fts
+                WHERE conversations_fts MATCH ?
+            )
+            SELECT
+                c.session_id,
+                COUNT(*) as turn_count,
+                MIN(c.created_at) as created_at,
+                MAX(c.created_at) as last_activity,
+                MIN(h.score) as score,
+                h.snippet as matched_text,
+                vp.name as voice_profile_name
+            FROM hits h
+            JOIN conversations c ON c.id = h.id
+            LEFT JOIN voice_profiles_v2 vp ON c.voice_profile_id = vp.id
+            GROUP BY c.session_id
+            ORDER BY score, last_activity DESC
+            LIMIT ? OFFSET ?
+            """,
+            (SNIPPET_TOKENS, match, limit, offset),
+        )
+
+        sessions = []
+        for row in rows:
+            session = dict(row)
+            session["matched_text"] = desegment_cjk(session["matched_text"] or "")
+            sessions.append(session)
+        return sessions
+
+    async def _search_conversations_like(self, query: str, limit: int, offset: int) -> list[dict]:
+        """Substring search without the FTS index (full table scan)"""
+        rows = await self._fetchall(
             """
             SELECT
                 c.session_id,
@@ -579,7 +919,6 @@ class DatabaseService:
             (f"%{query}%", f"%{query}%", limit, offset),
         )
 
-        rows = await cursor.fetchall()
         return [dict(row) for row in rows]
 
     async def count_search_results(self, query: str) -> int:
@@ -587,15 +926,28 @@ class DatabaseService:
         if not self._conn:
             await self.connect()
 
-        cursor = await self._conn.execute(
-            """
-            SELECT COUNT(DISTINCT session_id)
-            FROM conversations
-            WHERE user_text LIKE ? OR ai_text LIKE ?
-            """,
-            (f"%{query}%", f"%{query}%"),
-        )
-        row = await cursor.fetchone()
+        if self._fts_enabled:
+            match = build_fts_query(query)
+            if match is None:
+                return 0
+            row = await self._fetchone(
+                """
+                SELECT COUNT(DISTINCT c.session_id)
+                FROM conversations_fts f
+                JOIN conversations c ON c.id = f.rowid
+                WHERE conversations_fts MATCH ?
+                """,
+                (match,),
+            )
+        else:
+            row = await self._fetchone(
+                """
+                SELECT COUNT(DISTINCT session_id)
+                FROM conversations
+                WHERE user_text LIKE ? OR ai_text LIKE ?
+                """,
+                (f"%{query}%", f"%{query}%"),
+            )
         return row[0] if row else 0
 
     async def count_recent_sessions(self, hours: int = 24) -> int:
@@ -603,16 +955,16 @@ class DatabaseService:
         if not self._conn:
             await self.connect()
 
+        # A session has a turn in the period exactly when its last turn is in it
         cutoff_time = int(time.time()) - (hours * 3600)
-        cursor = await self._conn.execute(
+        row = await self._fetchone(
             """
-            SELECT COUNT(DISTINCT session_id)
-            FROM conversations
-            WHERE created_at >= ?
+            SELECT COUNT(*)
+            FROM conversation_sessions
+            WHERE last_created_at >= ?
             """,
             (cutoff_time,),
         )
-        row = await cursor.fetchone()
         return row[0] if row else 0
 
     async def count_recent_turns(self, hours: int = 24) -> int:
@@ -621,11 +973,10 @@ class DatabaseService:
             await self.connect()
 
         cutoff_time = int(time.time()) - (hours * 3600)
-        cursor = await self._conn.execute(
+        row = await self._fetchone(
             "SELECT COUNT(*) FROM conversations WHERE created_at >= ?",
             (cutoff_time,),
         )
-        row = await cursor.fetchone()
         return row[0] if row else 0
 
     async def delete_conversation_session(self, session_id: str) -> bool:
@@ -633,19 +984,208 @@ class DatabaseService:
         if not self._conn:
             await self.connect()
 
-        cursor = await self._conn.execute(
+        # Without its summary row the per-turn delete trigger skips the session
+        result = await self._write(
             "DELETE FROM conversations WHERE session_id = ?",
             (session_id,),
+            before=(("DELETE FROM conversation_sessions WHERE session_id = ?", (session_id,)),),
         )
-        await self._conn.commit()
 
-        success = cursor.rowcount > 0
+        success = result.rowcount > 0
         if success:
-            logger.info("db.conversation_session.deleted", session_id=session_id, rows=cursor.rowcount)
+            logger.info("db.conversation_session.deleted", session_id=session_id, rows=result.rowcount)
         return success
 
+    async def _ensure_conversation_sessions_schema(self):
+        """
+        Create the conversation_sessions summary and its triggers
+
+        Backfills existing sessions when the table is first created.
+        """
+        cursor = await self._conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name IN ('conversations', 'conversation_sessions')"
+        )
+        tables = {row[0] for row in await cursor.fetchall()}
+
+        if "conversations" not in tables:
+            logger.warning("db.sessions_summary.skipped", reason="conversations table missing")
+            return
+
+        await self._conn.execute("BEGIN")
+        try:
+            if "conversation_sessions" not in tables:
+                await self._conn.execute(
+                    """
+                    CREATE TABLE conversation_sessions (
+                        session_id TEXT PRIMARY KEY,
+                        turn_count INTEGER NOT NULL,
+                        first_turn_number INTEGER NOT NULL,
+                        first_user_message TEXT NOT NULL,
+                        first_created_at INTEGER NOT NULL,
+                        last_created_at INTEGER NOT NULL,
+                        voice_profile_id INTEGER
+                    )
+                    """
+                )
+                await self._conn.execute(
+                    """
+                    CREATE INDEX idx_conversation_sessions_last_created_at
+                    ON conversation_sessions(last_created_at)
+                    """
+                )
+                cursor = await self._conn.execute(
+                    f"INSERT INTO conversation_sessions {_SESSION_SUMMARY_SELECT} GROUP BY c.session_id"
+                )
+                logger.info("db.sessions_summary.backfilled", sessions=cursor.rowcount)
+
+            # New turn: O(1) upsert. Latest turn's voice profile wins
+            await self._conn.execute(
+                """
+                CREATE TRIGGER IF NOT EXISTS conversation_sessions_insert
+                AFTER INSERT ON conversations BEGIN
+                    INSERT INTO conversation_sessions (
+                        session_id, turn_count, first_turn_number, first_user_message,
+                        first_created_at, last_created_at, voice_profile_id
+                    ) VALUES (
+                        new.session_id, 1, new.turn_number, new.user_text,
+                        new.created_at, new.created_at, new.voice_profile_id
+                    )
+                    ON CONFLICT(session_id) DO UPDATE SET
+                        turn_count = turn_count + 1,
+                        first_user_message = CASE WHEN excluded.first_turn_number < first_turn_number
+                            THEN excluded.first_user_message ELSE first_user_message END,
+                        first_turn_number = MIN(first_turn_number, excluded.first_turn_number),
+                        first_created_at = MIN(first_created_at, excluded.first_created_at),
+                        last_created_at = MAX(last_created_at, excluded.last_created_at),
+                        voice_profile_id = excluded.voice_profile_id;
+                END
+                """
+            )
+            # Deleted turn: adjust the row in place. Fields the turn held are
+            # looked up again: first turn via UNIQUE(session_id, turn_number),
+            # latest voice profile via idx_session_id, timestamps by scanning
+            # the session only when the turn was at either end
+            await self._conn.execute("DROP TRIGGER IF EXISTS conversation_sessions_delete")
+            await self._conn.execute(
+                """
+                CREATE TRIGGER conversation_sessions_delete
+                AFTER DELETE ON conversations
+                WHEN EXISTS (SELECT 1 FROM conversation_sessions WHERE session_id = old.session_id)
+                BEGIN
+                    UPDATE conversation_sessions SET turn_count = turn_count - 1
+                    WHERE session_id = old.session_id;
+                    DELETE FROM conversation_sessions
+                    WHERE session_id = old.session_id AND turn_count <= 0;
+                    UPDATE conversation_sessions SET (first_turn_number, first_user_message) = (
+                        SELECT f.turn_number, f.user_text FROM conversations f
+                        WHERE f.session_id = old.session_id ORDER BY f.turn_number LIMIT 1
+                    )
+                    WHERE session_id = old.session_id AND first_turn_number = old.turn_number;
+                    UPDATE conversation_sessions SET
+                        first_created_at = (SELECT MIN(created_at) FROM conversations
+                                            WHERE session_id = old.session_id),
+                        last_created_at = (SELECT MAX(created_at) FROM conversations
+                                           WHERE session_id = old.session_id)
+                    WHERE session_id = old.session_id
+                      AND old.created_at IN (first_created_at, last_created_at);
+                    UPDATE conversation_sessions SET voice_profile_id = (
+                        SELECT l.voice_profile_id FROM conversations l
+                        WHERE l.session_id = old.session_id ORDER BY l.id DESC LIMIT 1
+                    )
+                    WHERE session_id = old.session_id AND NOT EXISTS (
+                        SELECT 1 FROM conversations l
+                        WHERE l.session_id = old.session_id AND l.id > old.id
+                    );
+                END
+                """
+            )
+            await self._conn.execute("COMMIT")
+
+        except Exception:
+            await self._conn.execute("ROLLBACK")
+            raise
+
+    async def _ensure_conversation_search_schema(self):
+        """
+        Create the conversations_fts index and its triggers
+
+        Backfills existing turns when the index is first created. The
+        triggers index raw text and call no custom functions, so databases
+        whose triggers used avatar_fts_segment get them replaced. Without a
+        conversations table (not initialized) or without FTS5 support,
+        search falls back to LIKE.
+        """
+        cursor = await self._conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name IN ('conversations', 'conversations_fts')"
+        )
+        tables = {row[0] for row in await cursor.fetchall()}
+
+        if "conversations" not in tables:
+            logger.warning("db.fts.skipped", reason="conversations table missing")
+            return
+
+        try:
+            await self._conn.execute("BEGIN")
+            if "conversations_fts" not in tables:
+                await self._conn.execute(
+                    """
+                    CREATE VIRTUAL TABLE conversations_fts USING fts5(
+                        user_text, ai_text,
+                        tokenize = 'unicode61 remove_diacritics 2'
+                    )
+                    """
+                )
+                cursor = await self._conn.execute(
+                    """
+                    INSERT INTO conversations_fts (rowid, user_text, ai_text)
+                    SELECT id, avatar_fts_segment(user_text), avatar_fts_segment(ai_text)
+                    FROM conversations
+                    """
+                )
+                logger.info("db.fts.backfilled", rows=cursor.rowcount)
+
+            await self._conn.execute("DROP TRIGGER IF EXISTS conversations_fts_insert")
+            await self._conn.execute("DROP TRIGGER IF EXISTS conversations_fts_update")
+            await self._conn.execute(
+                """
+                CREATE TRIGGER conversations_fts_insert
+                AFTER INSERT ON conversations BEGIN
+                    INSERT INTO conversations_fts (rowid, user_text, ai_text)
+                    VALUES (new.id, new.user_text, new.ai_text);
+                END
+                """
+            )
+            await self._conn.execute(
+                """
+                CREATE TRIGGER IF NOT EXISTS conversations_fts_delete
+                AFTER DELETE ON conversations BEGIN
+                    DELETE FROM conversations_fts WHERE rowid = old.id;
+                END
+                """
+            )
+            await self._conn.execute(
+                """
+                CREATE TRIGGER conversations_fts_update
+                AFTER UPDATE OF user_text, ai_text ON conversations BEGIN
+                    UPDATE conversations_fts
+                    SET user_text = new.user_text, ai_text = new.ai_text
+                    WHERE rowid = new.id;
+                END
+                """
+            )
+            await self._conn.execute("COMMIT")
+            self._fts_enabled = True
+
+        except aiosqlite.OperationalError as e:  # SQLite built without FTS5
+            if self._conn.in_transaction:
+                await self._conn.execute("ROLLBACK")
+            logger.warning("db.fts.unavailable", error=str(e))
+
     async def _ensure_voice_profiles_v2_schema(self):
-        """Ensure voice_profiles_v2 table exists"""
+        """Ensure voice_profiles_v2 table exists (checked once, on connect)"""
+        if self._v2_schema_ready:
+            return
+
         await self._conn.execute(
             """
             CREATE TABLE IF NOT EXISTS voice_profiles_v2 (
@@ -662,7 +1202,7 @@ class DatabaseService:
             )
             """
         )
-        await self._conn.commit()
+        self._v2_schema_ready = True
 
 
 # Global database service instance
@@ -44,7 +44,9 @@ async def get_llm_service() -> LLMProvider:
         _llm_service = VLLMProvider(
             model_path=config.VLLM_MODEL,
             gpu_memory_utilization=config.VLLM_GPU_MEMORY,
-            max_model_len=config.VLLM_MAX_TOKENS
+            max_model_len=config.VLLM_MAX_TOKENS,
+            enable_prefix_caching=config.VLLM_ENABLE_PREFIX_CACHING,
+            system_prompt=config.LLM_SYSTEM_PROMPT
         )
 
     # 未來擴展點
@@ -70,3 +72,16 @@ async def get_llm_service() -> LLMProvider:
 
     logger.info("llm.factory.ready", provider=provider)
     return _llm_service
+
+
+def get_llm_metrics() -> dict | None:
+    """
+    Prefix-cache metrics of the active LLM provider
+
+    Returns:
+        Provider metrics dict, or None if the service has not been created
+        yet or the provider does not report metrics
+    """
+    if _llm_service is None or not hasattr(_llm_service, "get_metrics"):
+        return None
+    return _llm_service.get_metrics()
@@ -9,13 +9,19 @@ Implements: LLMProvider protocol (see protocols.py)
 
 import asyncio
 import uuid
-from typing import AsyncIterator, Optional
+from contextlib import aclosing
+from typing import AsyncIterator, Optional, Union
 
 import structlog
 from vllm import AsyncLLMEngine, SamplingParams
 from vllm.engine.arg_utils import AsyncEngineArgs
 
 from avatar.core.config import config
+from avatar.services.llm_prompt import (
+    PrefixReuseTracker,
+    PromptBuilder,
+    first_token_latency,
+)
 
 logger = structlog.get_logger()
 
@@ -29,13 +35,21 @@ class VLLMProvider:
     - Streaming response support
     - Lazy model loading
     - Optimized for low TTFT (Time To First Token)
+    - Automatic prefix caching: every chat prompt starts with the same
+      system persona (and a session's history), so those KV blocks are
+      computed once and reused across requests
+    - Abandoned requests are aborted: a generation whose consumer stops
+      early (cancelled turn, closed stream) is removed from the engine
+      instead of decoding tokens nobody reads
     """
 
     def __init__(
         self,
         model_path: str = config.VLLM_MODEL,
         gpu_memory_utilization: float = config.VLLM_GPU_MEMORY,
-        max_model_len: int = config.VLLM_MAX_TOKENS
+        max_model_len: int = config.VLLM_MAX_TOKENS,
+        enable_prefix_caching: bool = config.VLLM_ENABLE_PREFIX_CACHING,
+        system_prompt: str = config.LLM_SYSTEM_PROMPT
     ):
         """
         Initialize LLM service
@@ -44,22 +58,38 @@ class VLLMProvider:
             model_path: HuggingFace model path or local path
             gpu_memory_utilization: Fraction of GPU memory to use (0.0-1.0)
             max_model_len: Maximum sequence length
+            enable_prefix_caching: Reuse KV cache of shared prompt prefixes
+            system_prompt: Persona placed first in every chat prompt
         """
         self.model_path = model_path
         self.gpu_memory_utilization = gpu_memory_utilization
         self.max_model_len = max_model_len
+        self.enable_prefix_caching = enable_prefix_caching
+        self.system_prompt = system_prompt
         self._engine: Optional[AsyncLLMEngine] = None
+        self._load_lock = asyncio.Lock()
+        self._prompt_builder: Optional[PromptBuilder] = None
+        self.prefix_stats = PrefixReuseTracker()
+        self.aborted_requests = 0
 
         logger.info(
             "llm.init",
             model=model_path,
             gpu_memory=f"{gpu_memory_utilization*100:.0f}%",
-            max_tokens=max_model_len
+            max_tokens=max_model_len,
+            prefix_caching=enable_prefix_caching
         )
 
     async def _load_model(self):
         """Lazy load vLLM engine (first call only)"""
-        if self._engine is None:
+        if self._engine is not None:
+            return
+
+        # Loading awaits the executor, so concurrent first calls must not both load
+        async with self._load_lock:
+            if self._engine is not None:
+                return
+
             logger.info("llm.loading_model", model=self.model_path)
 
             engine_args = AsyncEngineArgs(
@@ -68,13 +98,70 @@ class VLLMProvider:
                 max_model_len=self.max_model_len,
                 trust_remote_code=True,  # Required for Qwen models
                 dtype="auto",
-                enforce_eager=False  # Enable CUDA graph for better performance
+                enforce_eager=False,  # Enable CUDA graph for better performance
+                enable_prefix_caching=self.enable_prefix_caching
             )
 
-            self._engine = AsyncLLMEngine.from_engine_args(engine_args)
+            # Engine construction loads weights and captures CUDA graphs;
+            # run it off the event loop so other models can load meanwhile
+            loop = asyncio.get_running_loop()
+            engine = await loop.run_in_executor(
+                None, AsyncLLMEngine.from_engine_args, engine_args
+            )
+            self._prompt_builder = PromptBuilder(
+                await engine.get_tokenizer(),
+                system_prompt=self.system_prompt
+            )
+            self._engine = engine
 
             logger.info("llm.model_loaded", model=self.model_path)
 
+    async def get_tokenizer(self):
+        """
+        Tokenizer of the loaded model (shared with the engine)
+
+        Used to count prompt tokens exactly, e.g. for history budgets.
+        """
+        await self._load_model()
+        return await self._engine.get_tokenizer()
+
+    def _prompt_inputs(self, prompt: Union[str, list[int]]):
+        """
+        Engine inputs for a text or token-ID prompt
+
+        Token-ID prompts (chat) are also recorded for prefix-reuse stats.
+
+        Returns:
+            Tuple of (inputs, prompt_tokens, cached_tokens); token counts are
+            None for text prompts
+        """
+        if isinstance(prompt, str):
+            return prompt, None, None
+
+        cached_tokens = self.prefix_stats.observe(prompt)
+        return {"prompt_token_ids": prompt}, len(prompt), cached_tokens
+
+    def _record_ttft(self, request_output, prompt_tokens: Optional[int], cached_tokens: Optional[int]):
+        """Record vLLM-measured TTFT for token-ID prompts"""
+        if prompt_tokens is None or request_output is None:
+            return
+        ttft = first_token_latency(request_output)
+        if ttft is not None:
+            self.prefix_stats.record_ttft(ttft, prompt_tokens, cached_tokens)
+
+    async def abort(self, request_id: str):
+        """
+        Stop decoding a request and free its KV cache blocks
+
+        Safe to call for finished or unknown request IDs.
+        """
+        if self._engine is None:
+            return
+
+        await self._engine.abort(request_id)
+        self.aborted_requests += 1
+        logger.info("llm.request_aborted", request_id=request_id)
+
     def _create_sampling_params(
         self,
         max_tokens: int,
@@ -96,7 +183,7 @@ class VLLMProvider:
 
     async def generate(
         self,
-        prompt: str,
+        prompt: Union[str, list[int]],
         max_tokens: int = 512,
         temperature: float = 0.7,
         top_p: float = 0.9,
@@ -106,7 +193,7 @@ class VLLMProvider:
         Generate text completion (non-streaming)
 
         Args:
-            prompt: Input text prompt
+            prompt: Input text prompt, or prompt token IDs
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature (0.0 = greedy, higher = more random)
             top_p: Nucleus sampling parameter
@@ -129,11 +216,14 @@ class VLLMProvider:
             temperature=temperature
         )
 
+        # Unique request ID (also used to abort)
+        request_id = f"req-{uuid.uuid4().hex[:8]}"
+        finished = False
+
         try:
-            # Generate using async engine with unique request ID
-            request_id = f"req-{uuid.uuid4().hex[:8]}"
+            inputs, prompt_tokens, cached_tokens = self._prompt_inputs(prompt)
             results_generator = self._engine.generate(
-                prompt,
+                inputs,
                 sampling_params,
                 request_id
             )
@@ -142,10 +232,13 @@ class VLLMProvider:
             final_output = None
             async for request_output in results_generator:
                 final_output = request_output
+            finished = True
 
             if final_output is None:
                 raise RuntimeError("No output generated")
 
+            self._record_ttft(final_output, prompt_tokens, cached_tokens)
+
             generated_text = final_output.outputs[0].text
 
             logger.info(
@@ -160,9 +253,13 @@ class VLLMProvider:
             logger.error("llm.generate_failed", error=str(e))
             raise RuntimeError(f"LLM generation failed: {e}") from e
 
+        finally:
+            if not finished:  # Cancelled or failed mid-generation
+                await self.abort(request_id)
+
     async def generate_stream(
         self,
-        prompt: str,
+        prompt: Union[str, list[int]],
         max_tokens: int = 512,
         temperature: float = 0.7,
         top_p: float = 0.9,
@@ -172,7 +269,7 @@ class VLLMProvider:
         Generate text completion with streaming (yields tokens as they're generated)
 
         Args:
-            prompt: Input text prompt
+            prompt: Input text prompt, or prompt token IDs
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature
             top_p: Nucleus sampling parameter
@@ -180,6 +277,8 @@ class VLLMProvider:
 
         Yields:
             Generated text chunks
+
+        Closing the generator early (aclose or cancellation) aborts the request.
         """
         await self._load_model()
 
@@ -194,17 +293,21 @@ class VLLMProvider:
             max_tokens=max_tokens
         )
 
+        # Generate unique request ID to avoid conflicts (also used to abort)
+        request_id = f"stream-{uuid.uuid4().hex[:8]}"
+        finished = False
+
         try:
-            # Generate unique request ID to avoid conflicts
-            request_id = f"stream-{uuid.uuid4().hex[:8]}"
+            inputs, prompt_tokens, cached_tokens = self._prompt_inputs(prompt)
             results_generator = self._engine.generate(
-                prompt,
+                inputs,
                 sampling_params,
                 request_id
             )
 
             previous_text = ""
             token_count = 0
+            request_output = None
 
             async for request_output in results_generator:
                 current_text = request_output.outputs[0].text
@@ -214,39 +317,39 @@ class VLLMProvider:
                     token_count += 1
                     yield new_text
                     previous_text = current_text
+            finished = True
+
+            self._record_ttft(request_output, prompt_tokens, cached_tokens)
 
             logger.info(
                 "llm.stream_complete",
                 total_tokens=token_count,
-                total_chars=len(previous_text)
+                total_chars=len(previous_text),
+                prompt_tokens=prompt_tokens,
+                cached_prompt_tokens=cached_tokens
             )
 
         except Exception as e:
             logger.error("llm.stream_failed", error=str(e))
             raise RuntimeError(f"LLM streaming failed: {e}") from e
 
-    def _format_chat_messages(self, messages: list[dict[str, str]]) -> str:
-        """
-        Format messages into Qwen2.5 chat template (DRY helper)
+        finally:
+            if not finished:  # Consumer stopped early: free the GPU for others
+                await self.abort(request_id)
 
-        Qwen2.5-Instruct uses: <|im_start|>role\ncontent<|im_end|>
+    async def _build_chat_prompt(self, messages: list[dict[str, str]]) -> list[int]:
+        """
+        Chat prompt token IDs: system persona first, then the messages,
+        rendered with the model's chat template
 
         Args:
             messages: List of message dicts with 'role' and 'content'
 
         Returns:
-            Formatted prompt string
+            Prompt token IDs ending with the assistant generation prefix
         """
-        formatted_prompt = ""
-        for msg in messages:
-            role = msg.get("role", "user")
-            content = msg.get("content", "")
-            formatted_prompt += f"<|im_start|>{role}\n{content}<|im_end|>\n"
-
-        # Add assistant prefix to trigger response
-        formatted_prompt += "<|im_start|>assistant\n"
-
-        return formatted_prompt
+        await self._load_model()
+        return self._prompt_builder.build(messages)
 
     async def chat(
         self,
@@ -266,17 +369,17 @@ class VLLMProvider:
         Returns:
             Assistant's response text
         """
-        formatted_prompt = self._format_chat_messages(messages)
+        prompt_ids = await self._build_chat_prompt(messages)
 
         logger.info(
             "llm.chat_start",
             messages_count=len(messages),
-            prompt_len=len(formatted_prompt)
+            prompt_tokens=len(prompt_ids)
         )
 
         # Generate response
         response = await self.generate(
-            formatted_prompt,
+            prompt_ids,
             max_tokens=max_tokens,
             temperature=temperature,
             stop=["<|im_end|>"]
@@ -304,22 +407,41 @@ class VLLMProvider:
         Yields:
             Generated text chunks
         """
-        formatted_prompt = self._format_chat_messages(messages)
+        prompt_ids = await self._build_chat_prompt(messages)
 
         logger.info(
             "llm.chat_stream_start",
             messages_count=len(messages),
-            prompt_len=len(formatted_prompt)
+            prompt_tokens=len(prompt_ids)
         )
 
-        # Stream response
-        async for chunk in self.generate_stream(
-            formatted_prompt,
+        # Stream response (closing this generator closes, and aborts, the inner one)
+        async with aclosing(self.generate_stream(
+            prompt_ids,
             max_tokens=max_tokens,
             temperature=temperature,
             stop=["<|im_end|>"]
-        ):
-            yield chunk
+        )) as stream:
+            async for chunk in stream:
+                yield chunk
+
+    def get_metrics(self) -> dict:
+        """
+        Prefix-cache and abort metrics
+
+        Returns:
+            prefix_caching flag, aborted request count, plus PrefixReuseTracker
+            counters (estimated cached prompt tokens, reuse/hit rate, TTFT for
+            hits vs misses)
+        """
+        return {
+            "prefix_caching": self.enable_prefix_caching,
+            "system_prompt_tokens": (
+                len(self._prompt_builder.build([])) if self._prompt_builder is not None else None
+            ),
+            "aborted_requests": self.aborted_requests,
+            **self.prefix_stats.get_metrics(),
+        }
 
     async def unload_model(self):
         """Unload model to free VRAM"""
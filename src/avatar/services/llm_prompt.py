@@ -0,0 +1,176 @@
+"""
+Prompt construction and prefix-reuse accounting for the local LLM
+
+PromptBuilder renders chat messages with the model's own chat template
+(tokenizer.apply_chat_template) behind a fixed system persona, and returns
+token IDs so vLLM does not tokenize the prompt a second time.
+
+PrefixReuseTracker estimates how much of each prompt vLLM's automatic
+prefix caching can serve from cache. vLLM 0.5.3 does not report cache hits
+per request, so the tracker hashes prompts in KV-block-sized chunks the
+same way the block manager does (a block is reusable only if every token
+before it matches) and remembers recently seen blocks.
+
+Design Philosophy:
+- The persona is always the first message, so every session shares the
+  same cached prefix
+- Estimates are labelled as such; TTFT is measured, not estimated
+"""
+
+from collections import OrderedDict, deque
+from typing import Optional
+
+import structlog
+
+from avatar.core.config import config
+
+logger = structlog.get_logger()
+
+# vLLM default KV cache block size (tokens)
+VLLM_BLOCK_SIZE = 16
+
+# Recently seen blocks remembered for the reuse estimate (~130k tokens)
+TRACKED_BLOCKS = 8192
+
+# Recent requests kept for TTFT statistics
+METRICS_WINDOW = 200
+
+# Requests with at least this fraction of cached prompt tokens count as hits
+HIT_THRESHOLD = 0.5
+
+
+class PromptBuilder:
+    """
+    Render chat messages with the tokenizer's chat template
+
+    Usage:
+        builder = PromptBuilder(tokenizer)
+        token_ids = builder.build([{"role": "user", "content": "你好"}])
+    """
+
+    def __init__(self, tokenizer, system_prompt: str = config.LLM_SYSTEM_PROMPT):
+        """
+        Args:
+            tokenizer: HuggingFace tokenizer of the served model
+            system_prompt: Persona placed first in every prompt ("" to disable)
+        """
+        self.tokenizer = tokenizer
+        self.system_prompt = system_prompt
+        self.has_chat_template = bool(getattr(tokenizer, "chat_template", None))
+
+        if not self.has_chat_template:
+            logger.warning("llm.prompt.no_chat_template", fallback="chatml")
+
+    def with_system_prompt(self, messages: list[dict[str, str]]) -> list[dict[str, str]]:
+        """Prepend the persona unless the messages already start with it"""
+        if not self.system_prompt:
+            return list(messages)
+        if messages and messages[0].get("role") == "system" and messages[0].get("content") == self.system_prompt:
+            return list(messages)
+        return [{"role": "system", "content": self.system_prompt}] + list(messages)
+
+    def render(self, messages: list[dict[str, str]]) -> str:
+        """Prompt text ending with the assistant generation prefix"""
+        messages = self.with_system_prompt(messages)
+
+        if self.has_chat_template:
+            return self.tokenizer.apply_chat_template(
+                messages,
+                tokenize=False,
+                add_generation_prompt=True
+            )
+
+        # ChatML, as used by Qwen2.5-Instruct
+        prompt = "".join(
+            f"<|im_start|>{msg.get('role', 'user')}\n{msg.get('content', '')}<|im_end|>\n"
+            for msg in messages
+        )
+        return prompt + "<|im_start|>assistant\n"
+
+    def build(self, messages: list[dict[str, str]]) -> list[int]:
+        """Prompt token IDs (special tokens come from the template itself)"""
+        return self.tokenizer.encode(self.render(messages), add_special_tokens=False)
+
+
+class PrefixReuseTracker:
+    """
+    Estimate prefix-cache reuse and measure TTFT with and without it
+
+    Not thread-safe; used from the event loop only.
+    """
+
+    def __init__(self, block_size: int = VLLM_BLOCK_SIZE, capacity_blocks: int = TRACKED_BLOCKS):
+        self.block_size = block_size
+        self.capacity_blocks = capacity_blocks
+        self._blocks: OrderedDict[int, None] = OrderedDict()
+
+        self.requests = 0
+        self.hit_requests = 0
+        self.prompt_tokens = 0
+        self.cached_tokens = 0
+        self._ttft_hit: deque[float] = deque(maxlen=METRICS_WINDOW)
+        self._ttft_miss: deque[float] = deque(maxlen=METRICS_WINDOW)
+
+    def observe(self, token_ids: list[int]) -> int:
+        """
+        Record a prompt and return how many of its tokens were likely cached
+
+        Only full blocks can be shared, and a block only matches if all
+        blocks before it matched too (hash chain).
+        """
+        cached_tokens = 0
+        matching = True
+        block_hash = None
+
+        for start in range(0, len(token_ids) - self.block_size + 1, self.block_size):
+            block_hash = hash((block_hash, tuple(token_ids[start:start + self.block_size])))
+            if matching and block_hash in self._blocks:
+                cached_tokens += self.block_size
+                self._blocks.move_to_end(block_hash)
+            else:
+                matching = False
+                self._blocks[block_hash] = None
+
+        while len(self._blocks) > self.capacity_blocks:
+            self._blocks.popitem(last=False)
+
+        self.requests += 1
+        self.prompt_tokens += len(token_ids)
+        self.cached_tokens += cached_tokens
+        if token_ids and cached_tokens / len(token_ids) >= HIT_THRESHOLD:
+            self.hit_requests += 1
+
+        return cached_tokens
+
+    def record_ttft(self, ttft_sec: float, prompt_tokens: int, cached_tokens: int):
+        """Record time-to-first-token, split by whether the prefix was reused"""
+        if prompt_tokens and cached_tokens / prompt_tokens >= HIT_THRESHOLD:
+            self._ttft_hit.append(ttft_sec)
+        else:
+            self._ttft_miss.append(ttft_sec)
+
+    def get_metrics(self) -> dict:
+        """Reuse counters and TTFT averages (hit vs miss)"""
+        metrics = {
+            "requests": self.requests,
+            "hit_requests": self.hit_requests,
+            "prompt_tokens": self.prompt_tokens,
+            "cached_prompt_tokens_estimated": self.cached_tokens,
+            "prompt_token_reuse_rate": round(self.cached_tokens / self.prompt_tokens, 4) if self.prompt_tokens else 0.0,
+            "hit_rate": round(self.hit_requests / self.requests, 4) if self.requests else 0.0,
+        }
+
+        if self._ttft_hit:
+            metrics["ttft_hit_avg_ms"] = round(sum(self._ttft_hit) / len(self._ttft_hit) * 1000, 1)
+        if self._ttft_miss:
+            metrics["ttft_miss_avg_ms"] = round(sum(self._ttft_miss) / len(self._ttft_miss) * 1000, 1)
+
+        return metrics
+
+
+def first_token_latency(request_output) -> Optional[float]:
+    """TTFT measured by vLLM (first token time - arrival time), if available"""
+    metrics = getattr(request_output, "metrics", None)
+    if metrics is None or metrics.first_token_time is None:
+        return None
+    return metrics.first_token_time - metrics.arrival_time
@@ -34,7 +34,9 @@ class STTProvider(Protocol):
         Transcribe audio to text
 
         Args:
-            audio_path: Path to audio file (WAV 16kHz mono recommended)
+            audio_path: Path to audio file (WAV 16kHz mono recommended), or
+                        float32 16kHz mono NumPy samples if the provider
+                        supports in-memory input
             language: ISO 639-1 language code (None for auto-detect)
             **kwargs: Provider-specific options
 
@@ -57,7 +57,8 @@ async def get_stt_service() -> STTProvider:
         _stt_service = WhisperSTTProvider(
             model_size=config.WHISPER_MODEL_SIZE,
             device=config.WHISPER_DEVICE,
-            compute_type=config.WHISPER_COMPUTE_TYPE
+            compute_type=config.WHISPER_COMPUTE_TYPE,
+            num_workers=config.WHISPER_NUM_WORKERS
         )
 
     # 未來擴展點 (選型完成後解除註釋)
@@ -94,3 +95,16 @@ async def get_stt_service() -> STTProvider:
 
     logger.info("stt.factory.ready", provider=provider)
     return _stt_service
+
+
+def get_stt_metrics() -> dict | None:
+    """
+    Decode metrics of the active STT provider
+
+    Returns:
+        Provider metrics dict, or None if the service has not been created
+        yet or the provider does not report metrics
+    """
+    if _stt_service is None or not hasattr(_stt_service, "get_metrics"):
+        return None
+    return _stt_service.get_metrics()
@@ -0,0 +1,398 @@
+"""
+Micro-batching scheduler for multi-session Whisper inference
+
+Concurrent sessions each call transcribe() for their own turn. Instead of
+running one model invocation per call, requests are collected for a short
+window (STT_BATCH_WAIT_MS) and decoded together through faster-whisper's
+BatchedInferencePipeline, so the encoder/decoder run once per batch.
+
+How a batch is decoded:
+1. Each request's audio is loaded and split into speech clips (Silero VAD,
+   ≤30s each); requests without a language get it detected per request
+2. Requests are grouped by (language, beam_size), since those are shared
+   by every chunk of a pipeline call. Requests carry no initial_prompt:
+   it is per-session context, and keying groups by it would put every
+   session in a batch of its own
+3. A group's audio is concatenated and its clips are passed as
+   clip_timestamps, so every clip becomes one row of the batched forward
+4. Segments are mapped back to their request by offset
+
+Design Philosophy:
+- Callers just await a future; batching is invisible to them
+- A batch slot is only taken when a decode worker is free, so batches grow
+  by themselves while workers are busy
+"""
+
+import asyncio
+import time
+from bisect import bisect_right
+from collections import defaultdict, deque
+from contextlib import suppress
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Optional, Union
+
+import numpy as np
+import structlog
+
+from avatar.core.config import config
+
+logger = structlog.get_logger()
+
+WHISPER_SAMPLE_RATE = 16000
+
+# Whisper's receptive field; longer speech clips are split by VAD
+CHUNK_SEC = 30
+
+# Recent requests kept for latency statistics
+METRICS_WINDOW = 200
+
+# Segment starts are rounded to 1ms by faster-whisper
+OFFSET_TOLERANCE_SEC = 0.001
+
+
+@dataclass
+class BatchRequest:
+    """One transcription request waiting for a batch"""
+    audio: Union[str, np.ndarray]
+    language: Optional[str]
+    beam_size: int
+    vad_filter: bool
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.perf_counter)
+    started_at: Optional[float] = None  # Set on the decode thread
+
+
+BatchRunner = Callable[[list[BatchRequest]], Awaitable[list]]
+
+
+class WhisperBatchScheduler:
+    """
+    Collects concurrent transcription requests into micro-batches
+
+    Usage:
+        scheduler = WhisperBatchScheduler(run_batch, max_concurrent_batches=2)
+        segments, metadata = await scheduler.submit(audio, language=None)
+    """
+
+    def __init__(
+        self,
+        run_batch: BatchRunner,
+        max_batch_size: int = config.STT_BATCH_SIZE,
+        max_wait_ms: float = config.STT_BATCH_WAIT_MS,
+        max_concurrent_batches: int = 1
+    ):
+        """
+        Args:
+            run_batch: Async callable decoding a batch; returns one
+                       (segments, metadata) tuple or Exception per request
+            max_batch_size: Max requests per batch
+            max_wait_ms: How long the first request waits for others to join
+            max_concurrent_batches: Batches in flight (decode workers)
+        """
+        self.run_batch = run_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_sec = max(0.0, max_wait_ms) / 1000
+        self.max_concurrent_batches = max(1, max_concurrent_batches)
+
+        self._pending: deque[BatchRequest] = deque()
+        self._has_work = asyncio.Event()
+        self._batch_full = asyncio.Event()
+        self._slots = asyncio.Semaphore(self.max_concurrent_batches)
+        self._task: Optional[asyncio.Task] = None
+        self._inflight: set[asyncio.Task] = set()
+
+        self._batches = 0
+        self._requests = 0
+        self._queue_times: deque[float] = deque(maxlen=METRICS_WINDOW)
+        self._compute_times: deque[float] = deque(maxlen=METRICS_WINDOW)
+        self._batch_sizes: deque[int] = deque(maxlen=METRICS_WINDOW)
+
+    async def submit(
+        self,
+        audio: Union[str, np.ndarray],
+        language: Optional[str] = None,
+        beam_size: int = 5,
+        vad_filter: bool = True
+    ) -> tuple[list[dict], dict]:
+        """
+        Queue a request and wait for its batch to finish
+
+        Returns:
+            Tuple of (segments, metadata), same shape as transcribe_array
+
+        Raises:
+            Exception raised while decoding this request's batch
+        """
+        loop = asyncio.get_running_loop()
+        request = BatchRequest(
+            audio=audio,
+            language=language,
+            beam_size=beam_size,
+            vad_filter=vad_filter,
+            future=loop.create_future()
+        )
+
+        self._pending.append(request)
+        self._has_work.set()
+        if len(self._pending) >= self.max_batch_size:
+            self._batch_full.set()
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._dispatch_loop())
+
+        return await request.future
+
+    async def close(self):
+        """Stop dispatching and fail requests that are still waiting"""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        while self._pending:
+            request = self._pending.popleft()
+            if not request.future.done():
+                request.future.set_exception(RuntimeError("STT scheduler closed"))
+
+    async def _dispatch_loop(self):
+        """Form a batch whenever work is pending and a decode slot is free"""
+        while True:
+            await self._has_work.wait()
+            await self._slots.acquire()
+
+            # Micro-batching window: let concurrent sessions join the batch
+            if len(self._pending) < self.max_batch_size:
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._batch_full.wait(), self.max_wait_sec)
+
+            batch = []
+            while self._pending and len(batch) < self.max_batch_size:
+                request = self._pending.popleft()
+                if not request.future.done():  # Caller gave up while queued
+                    batch.append(request)
+
+            if not self._pending:
+                self._has_work.clear()
+            if len(self._pending) < self.max_batch_size:
+                self._batch_full.clear()
+
+            if not batch:
+                self._slots.release()
+                continue
+
+            task = asyncio.create_task(self._execute(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _execute(self, batch: list[BatchRequest]):
+        """Run one batch and resolve its futures"""
+        try:
+            results = await self.run_batch(batch)
+        except Exception as e:
+            results = [e] * len(batch)
+        finally:
+            self._slots.release()
+
+        finished = time.perf_counter()
+        self._batches += 1
+        self._requests += len(batch)
+        self._batch_sizes.append(len(batch))
+
+        for request, result in zip(batch, results):
+            started = request.started_at or finished
+            self._queue_times.append(started - request.enqueued_at)
+            self._compute_times.append(finished - started)
+
+            if request.future.done():
+                continue
+            if isinstance(result, Exception):
+                request.future.set_exception(result)
+            else:
+                request.future.set_result(result)
+
+        logger.debug("stt.batch.complete",
+                    batch_size=len(batch),
+                    compute_sec=round(finished - (batch[0].started_at or finished), 3),
+                    pending=len(self._pending))
+
+    def get_metrics(self) -> dict:
+        """
+        Scheduler metrics
+
+        queue_time is enqueue → batch start on a decode thread (window wait
+        plus waiting for a free worker); compute_time is batch start → done.
+        """
+        metrics = {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_sec * 1000,
+            "pending": len(self._pending),
+            "batches_in_flight": len(self._inflight),
+            "batches": self._batches,
+            "requests": self._requests,
+        }
+
+        if self._batch_sizes:
+            metrics["avg_batch_size"] = round(sum(self._batch_sizes) / len(self._batch_sizes), 2)
+        metrics.update(_latency_stats("queue_time", self._queue_times))
+        metrics.update(_latency_stats("compute_time", self._compute_times))
+
+        return metrics
+
+
+def _latency_stats(name: str, values) -> dict:
+    """Average and p95 of recent latencies (seconds)"""
+    if not values:
+        return {}
+    ordered = sorted(values)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return {
+        f"{name}_avg_sec": round(sum(ordered) / len(ordered), 4),
+        f"{name}_p95_sec": round(p95, 4),
+    }
+
+
+@dataclass
+class _PreparedAudio:
+    index: int
+    audio: np.ndarray
+    clips: list[tuple[int, int]]
+    language: Optional[str]
+    language_probability: float
+
+
+def transcribe_batch(model, requests: list[BatchRequest], batch_size: int) -> list:
+    """
+    Decode a batch of requests in as few batched model calls as possible
+
+    Blocking; runs on a decode thread.
+
+    Args:
+        model: Loaded faster_whisper.WhisperModel
+        requests: Requests of this batch
+        batch_size: Max clips per batched forward pass
+
+    Returns:
+        One (segments, metadata) tuple or Exception per request, in order
+    """
+    from faster_whisper import BatchedInferencePipeline
+
+    started = time.perf_counter()
+    for request in requests:
+        request.started_at = started
+
+    results: list = [None] * len(requests)
+    groups: dict[tuple, list[_PreparedAudio]] = defaultdict(list)
+
+    for index, request in enumerate(requests):
+        try:
+            prepared = _prepare_request(model, index, request)
+        except Exception as e:
+            results[index] = e
+            continue
+
+        if not prepared.clips:
+            results[index] = ([], _metadata(prepared, [], len(requests)))
+            continue
+
+        groups[(prepared.language, request.beam_size)].append(prepared)
+
+    pipeline = BatchedInferencePipeline(model)
+
+    for (language, beam_size), items in groups.items():
+        try:
+            segments_per_item = _transcribe_group(pipeline, items, language, beam_size, batch_size)
+        except Exception as e:
+            for item in items:
+                results[item.index] = e
+            continue
+
+        for item, segments in zip(items, segments_per_item):
+            results[item.index] = (segments, _metadata(item, segments, len(requests)))
+
+    return results
+
+
+def _prepare_request(model, index: int, request: BatchRequest) -> _PreparedAudio:
+    """Load audio, find speech clips and resolve the language"""
+    from faster_whisper import decode_audio
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+    if isinstance(request.audio, np.ndarray):
+        audio = request.audio.astype(np.float32, copy=False)
+    else:
+        audio = decode_audio(request.audio, sampling_rate=WHISPER_SAMPLE_RATE)
+
+    if request.vad_filter:
+        # Same VAD settings as BatchedInferencePipeline's own chunking
+        vad_options = VadOptions(max_speech_duration_s=CHUNK_SEC, min_silence_duration_ms=160)
+        clips = [(ts["start"], ts["end"]) for ts in get_speech_timestamps(audio, vad_options)]
+    else:
+        step = CHUNK_SEC * WHISPER_SAMPLE_RATE
+        clips = [(start, min(start + step, len(audio))) for start in range(0, len(audio), step)]
+
+    language, probability = request.language, 1.0
+    if language is None and clips:
+        if model.model.is_multilingual:
+            language, probability, _ = model.detect_language(audio=audio, vad_filter=request.vad_filter)
+        else:
+            language = "en"
+    elif language is None:
+        probability = 0.0
+
+    return _PreparedAudio(index, audio, clips, language, probability)
+
+
+def _transcribe_group(
+    pipeline,
+    items: list[_PreparedAudio],
+    language: str,
+    beam_size: int,
+    batch_size: int
+) -> list[list[dict]]:
+    """Run one batched pipeline call over the concatenated audio of a group"""
+    offsets = []
+    clip_timestamps = []
+    position = 0
+
+    for item in items:
+        offsets.append(position / WHISPER_SAMPLE_RATE)
+        for start, end in item.clips:
+            clip_timestamps.append({
+                "start": (position + start) / WHISPER_SAMPLE_RATE,
+                "end": (position + end) / WHISPER_SAMPLE_RATE,
+            })
+        position += len(item.audio)
+
+    segments, _ = pipeline.transcribe(
+        np.concatenate([item.audio for item in items]),
+        language=language,
+        beam_size=beam_size,
+        clip_timestamps=clip_timestamps,
+        batch_size=batch_size,
+        without_timestamps=False,
+        condition_on_previous_text=False,  # Fixed by the batched pipeline
+        vad_filter=False
+    )
+
+    segments_per_item: list[list[dict]] = [[] for _ in items]
+    for seg in segments:
+        position = bisect_right(offsets, seg.start + OFFSET_TOLERANCE_SEC) - 1
+        offset = offsets[position]
+        segments_per_item[position].append({
+            "start": max(0.0, seg.start - offset),
+            "end": max(0.0, seg.end - offset),
+            "text": seg.text.strip(),
+        })
+
+    return segments_per_item
+
+
+def _metadata(item: _PreparedAudio, segments: list[dict], batch_size: int) -> dict:
+    return {
+        "language": item.language,
+        "language_probability": item.language_probability,
+        "duration": len(item.audio) / WHISPER_SAMPLE_RATE,
+        "segments_count": len(segments),
+        "batch_size": batch_size,
+    }
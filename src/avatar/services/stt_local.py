@@ -8,16 +8,28 @@ Implements: STTProvider protocol (see protocols.py)
 """
 
 import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import AsyncIterator, Callable, Optional, Tuple, Union
 
+import numpy as np
 import structlog
 from faster_whisper import WhisperModel
 
 from avatar.core.config import config
+from avatar.core.logging_config import get_metrics_collector
+from avatar.services.stt_batching import WhisperBatchScheduler, transcribe_batch
 
 logger = structlog.get_logger()
 
+# Recent decodes kept for latency statistics
+METRICS_WINDOW = 200
+
+AudioInput = Union[Path, np.ndarray]
+
 
 class WhisperSTTProvider:
     """
@@ -28,13 +40,31 @@ class WhisperSTTProvider:
     - Lazy model loading
     - Auto language detection
     - Async API to avoid blocking
+
+    Decoding:
+    faster-whisper returns a lazy segment generator; the actual decoding
+    happens while it is iterated. All of that runs on a dedicated, bounded
+    thread pool (num_workers threads), never on the event loop and never on
+    the default executor shared with file I/O. Requests beyond num_workers
+    wait in the pool queue, which is reported as queue_depth.
+
+    With batching enabled, transcribe()/transcribe_array() calls from
+    concurrent sessions are merged by WhisperBatchScheduler and decoded in
+    one batched pass per pool job (see stt_batching.py). Accuracy trade-off:
+    batched clips are decoded independently, so a turn is not conditioned
+    on its own earlier text (clips longer than 30s lose cross-window
+    context) and streaming passes lose their committed-text prompt.
     """
 
     def __init__(
         self,
         model_size: str = "base",
         device: str = "cpu",
-        compute_type: str = "int8"
+        compute_type: str = "int8",
+        num_workers: int = config.WHISPER_NUM_WORKERS,
+        batching: bool = config.STT_BATCHING_ENABLED,
+        batch_size: int = config.STT_BATCH_SIZE,
+        batch_wait_ms: float = config.STT_BATCH_WAIT_MS
     ):
         """
         Initialize STT service
@@ -43,35 +73,218 @@ class WhisperSTTProvider:
             model_size: Whisper model size (tiny, base, small, medium, large)
             device: Device for inference (cpu recommended)
             compute_type: Quantization type (int8, float16, float32)
+            num_workers: Decode threads (max concurrent transcriptions)
+            batching: Merge concurrent requests into batched decodes
+            batch_size: Max requests (and clips per forward pass) per batch
+            batch_wait_ms: Micro-batching window
         """
         self.model_size = model_size
         self.device = device
         self.compute_type = compute_type
+        self.num_workers = max(1, num_workers)
         self._model: Optional[WhisperModel] = None
+        self._model_lock = threading.Lock()
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.num_workers,
+            thread_name_prefix="whisper-decode"
+        )
+
+        # Updated from decode threads
+        self._metrics_lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._completed = 0
+        self._failed = 0
+        self._queue_waits: deque[float] = deque(maxlen=METRICS_WINDOW)
+        self._decode_times: deque[float] = deque(maxlen=METRICS_WINDOW)
+
+        self.batch_size = max(1, batch_size)
+        self._scheduler: Optional[WhisperBatchScheduler] = None
+        if batching:
+            self._scheduler = WhisperBatchScheduler(
+                self._run_batch,
+                max_batch_size=self.batch_size,
+                max_wait_ms=batch_wait_ms,
+                max_concurrent_batches=self.num_workers
+            )
 
         logger.info(
             "stt.init",
             model_size=model_size,
             device=device,
-            compute_type=compute_type
+            compute_type=compute_type,
+            num_workers=self.num_workers,
+            batching=batching
         )
 
     def _load_model(self):
-        """Lazy load Whisper model (first call only)"""
-        if self._model is None:
-            logger.info("stt.loading_model", model_size=self.model_size)
-
-            self._model = WhisperModel(
-                self.model_size,
-                device=self.device,
-                compute_type=self.compute_type
+        """Lazy load Whisper model (first call only, thread-safe)"""
+        with self._model_lock:
+            if self._model is None:
+                logger.info("stt.loading_model", model_size=self.model_size)
+
+                # num_workers lets CTranslate2 run concurrent transcribe() calls
+                # from our decode threads in parallel instead of serializing them
+                self._model = WhisperModel(
+                    self.model_size,
+                    device=self.device,
+                    compute_type=self.compute_type,
+                    num_workers=self.num_workers
+                )
+
+                logger.info("stt.model_loaded", model_size=self.model_size)
+
+    @staticmethod
+    def _prepare_input(audio: AudioInput) -> Tuple[Union[str, np.ndarray], str]:
+        """Validate audio input and return (model_input, log_description)"""
+        if isinstance(audio, np.ndarray):
+            return audio, f"<memory:{len(audio)} samples>"
+
+        if not audio.exists():
+            logger.error("stt.file_not_found", path=str(audio))
+            raise FileNotFoundError(f"Audio file not found: {audio}")
+
+        return str(audio), str(audio)
+
+    def _run_tracked(self, fn: Callable, submitted_at: float, *args):
+        """
+        Run fn on a decode thread with queue/active bookkeeping
+
+        Returns:
+            Tuple of (fn result, decode_sec)
+        """
+        started = time.perf_counter()
+        with self._metrics_lock:
+            self._queued -= 1
+            self._active += 1
+            self._queue_waits.append(started - submitted_at)
+
+        succeeded = False
+        try:
+            self._load_model()
+            result = fn(*args)
+            succeeded = True
+            return result, time.perf_counter() - started
+
+        finally:
+            with self._metrics_lock:
+                self._active -= 1
+                if succeeded:
+                    self._completed += 1
+                    self._decode_times.append(time.perf_counter() - started)
+                else:
+                    self._failed += 1
+
+    async def _run_in_pool(self, fn: Callable, *args, stop: Optional[threading.Event] = None):
+        """Submit fn to the decode pool and wait for its result"""
+        with self._metrics_lock:
+            self._queued += 1
+            queue_depth = self._queued
+
+        if queue_depth > self.num_workers:
+            logger.debug("stt.decode_queued", queue_depth=queue_depth, workers=self.num_workers)
+
+        future = self._executor.submit(self._run_tracked, fn, time.perf_counter(), *args)
+
+        try:
+            result, decode_sec = await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # Not started yet: drop it from the queue. Running: stop after the current segment
+            if future.cancel():
+                with self._metrics_lock:
+                    self._queued -= 1
+            elif stop is not None:
+                stop.set()
+            raise
+
+        get_metrics_collector().record_performance("stt.decode", decode_sec)
+        return result
+
+    def _consume_segments(
+        self,
+        audio_input: Union[str, np.ndarray],
+        options: dict,
+        on_segment: Optional[Callable[[dict], None]] = None,
+        stop: Optional[threading.Event] = None
+    ) -> Tuple[list[dict], dict]:
+        """Run the model and iterate its segment generator (decode thread only)"""
+        segments, info = self._model.transcribe(audio_input, **options)
+
+        # Iterating the generator is where the decoding actually happens
+        segment_list = []
+        for seg in segments:
+            item = {"start": seg.start, "end": seg.end, "text": seg.text.strip()}
+            segment_list.append(item)
+            if on_segment is not None:
+                on_segment(item)
+            if stop is not None and stop.is_set():
+                break
+
+        metadata = {
+            "language": info.language,
+            "language_probability": info.language_probability,
+            "duration": info.duration,
+            "segments_count": len(segment_list)
+        }
+
+        return segment_list, metadata
+
+    async def _decode(
+        self,
+        audio_input: Union[str, np.ndarray],
+        options: dict,
+        on_segment: Optional[Callable[[dict], None]] = None,
+        stop: Optional[threading.Event] = None
+    ) -> Tuple[list[dict], dict]:
+        """Decode one request on the worker pool"""
+        return await self._run_in_pool(
+            self._consume_segments, audio_input, options, on_segment, stop, stop=stop
+        )
+
+    async def _transcribe_segments(
+        self,
+        audio_input: Union[str, np.ndarray],
+        language: Optional[str],
+        beam_size: int,
+        vad_filter: bool,
+        initial_prompt: Optional[str] = None,
+        condition_on_previous_text: bool = True
+    ) -> Tuple[list[dict], dict]:
+        """
+        Decode via the batch scheduler when enabled, else as a single request
+
+        Batched requests drop initial_prompt and condition_on_previous_text
+        (see the class docstring).
+        """
+        if self._scheduler is not None:
+            return await self._scheduler.submit(
+                audio_input,
+                language=language,
+                beam_size=beam_size,
+                vad_filter=vad_filter
             )
 
-            logger.info("stt.model_loaded", model_size=self.model_size)
+        options = {
+            "language": language,
+            "beam_size": beam_size,
+            "vad_filter": vad_filter,
+            "initial_prompt": initial_prompt,
+            "condition_on_previous_text": condition_on_previous_text
+        }
+
+        return await self._decode(audio_input, options)
+
+    def _transcribe_batch_blocking(self, requests: list) -> list:
+        return transcribe_batch(self._model, requests, self.batch_size)
+
+    async def _run_batch(self, requests: list) -> list:
+        """Batch runner for WhisperBatchScheduler (one pool job per batch)"""
+        return await self._run_in_pool(self._transcribe_batch_blocking, requests)
 
     async def transcribe(
         self,
-        audio_path: Path,
+        audio_path: AudioInput,
         language: Optional[str] = None,
         beam_size: int = 5,
         vad_filter: bool = True
@@ -80,7 +293,8 @@ class WhisperSTTProvider:
         Transcribe audio file to text
 
         Args:
-            audio_path: Path to audio file
+            audio_path: Path to audio file, or float32 16kHz mono samples
+                        (in-memory path, no file I/O)
             language: Language code (e.g., 'zh', 'en'), None for auto-detection
             beam_size: Beam size for decoding (higher = slower but more accurate)
             vad_filter: Enable Voice Activity Detection to filter silence
@@ -93,70 +307,185 @@ class WhisperSTTProvider:
             FileNotFoundError: Audio file not found
             RuntimeError: Transcription failed
         """
-        # Validate audio file exists
-        if not audio_path.exists():
-            logger.error("stt.file_not_found", path=str(audio_path))
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        audio_input, audio_desc = self._prepare_input(audio_path)
 
         logger.info(
             "stt.transcribe_start",
-            audio=str(audio_path),
+            audio=audio_desc,
             language=language or "auto-detect"
         )
 
-        # Load model if not already loaded
-        self._load_model()
+        try:
+            segment_list, metadata = await self._transcribe_segments(
+                audio_input, language, beam_size, vad_filter
+            )
+        except Exception as e:
+            logger.error(
+                "stt.transcribe_failed",
+                error=str(e),
+                audio=audio_desc
+            )
+            raise RuntimeError(f"Transcription failed: {e}") from e
 
-        # Run transcription in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
+        full_text = " ".join(seg["text"] for seg in segment_list)
 
+        logger.info(
+            "stt.transcribe_complete",
+            text_length=len(full_text),
+            duration_sec=metadata["duration"],
+            language=metadata["language"],
+            segments=len(segment_list)
+        )
+
+        return full_text, metadata
+
+    async def transcribe_array(
+        self,
+        audio: np.ndarray,
+        language: Optional[str] = None,
+        beam_size: int = 5,
+        vad_filter: bool = True,
+        initial_prompt: Optional[str] = None
+    ) -> Tuple[list[dict], dict]:
+        """
+        Transcribe in-memory audio and return timed segments
+
+        Used by streaming STT, which needs segment timestamps to decide
+        which part of the rolling window is stable.
+
+        Args:
+            audio: float32 mono samples at 16kHz
+            language: Language code, None for auto-detection
+            beam_size: Beam size for decoding
+            vad_filter: Enable Voice Activity Detection to filter silence
+            initial_prompt: Previously transcribed text to condition decoding
+                (ignored when batching is enabled)
+
+        Returns:
+            Tuple of (segments, metadata)
+            segments: [{"start": float, "end": float, "text": str}, ...]
+            metadata includes: language, language_probability, duration
+
+        Raises:
+            RuntimeError: Transcription failed
+        """
         try:
-            segments, info = await loop.run_in_executor(
-                None,
-                lambda: self._model.transcribe(
-                    str(audio_path),
-                    language=language,
-                    beam_size=beam_size,
-                    vad_filter=vad_filter
-                )
+            return await self._transcribe_segments(
+                audio,
+                language,
+                beam_size,
+                vad_filter,
+                initial_prompt=initial_prompt,
+                condition_on_previous_text=False
             )
+        except Exception as e:
+            logger.error("stt.transcribe_array_failed", error=str(e))
+            raise RuntimeError(f"Transcription failed: {e}") from e
 
-            # Collect all segments
-            segment_list = list(segments)
-            full_text = " ".join(seg.text.strip() for seg in segment_list)
+    async def transcribe_stream(
+        self,
+        audio: AudioInput,
+        language: Optional[str] = None,
+        beam_size: int = 5,
+        vad_filter: bool = True
+    ) -> AsyncIterator[dict]:
+        """
+        Yield segments as soon as the decode thread produces them
 
-            metadata = {
-                "language": info.language,
-                "language_probability": info.language_probability,
-                "duration": info.duration,
-                "segments_count": len(segment_list)
-            }
+        The caller sees the first segment after one segment of decoding
+        instead of after the whole clip. Closing the iterator early stops
+        the decode after the current segment and frees the worker.
 
-            logger.info(
-                "stt.transcribe_complete",
-                text_length=len(full_text),
-                duration_sec=info.duration,
-                language=info.language,
-                segments=len(segment_list)
-            )
+        Args:
+            audio: Path to audio file, or float32 16kHz mono samples
+            language: Language code, None for auto-detection
+            beam_size: Beam size for decoding
+            vad_filter: Enable Voice Activity Detection to filter silence
 
-            return full_text, metadata
+        Yields:
+            {"start": float, "end": float, "text": str}
 
-        except Exception as e:
-            logger.error(
-                "stt.transcribe_failed",
-                error=str(e),
-                audio=str(audio_path)
+        Raises:
+            FileNotFoundError: Audio file not found
+            RuntimeError: Transcription failed
+        """
+        audio_input, audio_desc = self._prepare_input(audio)
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        stop = threading.Event()
+
+        def on_segment(item: dict):
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+
+        decode = asyncio.ensure_future(self._decode(
+            audio_input,
+            {"language": language, "beam_size": beam_size, "vad_filter": vad_filter},
+            on_segment=on_segment,
+            stop=stop
+        ))
+        # Segments are scheduled on the loop before the result, so None arrives last
+        decode.add_done_callback(lambda _: queue.put_nowait(None))
+
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                yield item
+
+            try:
+                await decode
+            except Exception as e:
+                logger.error("stt.transcribe_stream_failed", error=str(e), audio=audio_desc)
+                raise RuntimeError(f"Transcription failed: {e}") from e
+
+        finally:
+            stop.set()
+            if not decode.done():
+                decode.cancel()
+
+    def get_metrics(self) -> dict:
+        """
+        Decode pool metrics
+
+        Returns:
+            workers, active, queue_depth, completed, failed, plus average/p95
+            decode time and average queue wait over the last METRICS_WINDOW decodes
+            (one decode per batch when batching; per-request queue vs compute
+            time is under "batching")
+        """
+        with self._metrics_lock:
+            decode_times = sorted(self._decode_times)
+            queue_waits = list(self._queue_waits)
+            metrics = {
+                "workers": self.num_workers,
+                "active": self._active,
+                "queue_depth": self._queued,
+                "completed": self._completed,
+                "failed": self._failed,
+            }
+
+        if decode_times:
+            metrics["decode_time_avg_sec"] = round(sum(decode_times) / len(decode_times), 4)
+            metrics["decode_time_p95_sec"] = round(
+                decode_times[min(len(decode_times) - 1, int(len(decode_times) * 0.95))], 4
             )
-            raise RuntimeError(f"Transcription failed: {e}") from e
+        if queue_waits:
+            metrics["queue_wait_avg_sec"] = round(sum(queue_waits) / len(queue_waits), 4)
+        if self._scheduler is not None:
+            metrics["batching"] = self._scheduler.get_metrics()
+
+        return metrics
 
     def unload_model(self):
         """Unload model to free memory"""
-        if self._model is not None:
-            logger.info("stt.unloading_model")
-            del self._model
-            self._model = None
-            logger.info("stt.model_unloaded")
+        with self._model_lock:
+            if self._model is not None:
+                logger.info("stt.unloading_model")
+                del self._model
+                self._model = None
+                logger.info("stt.model_unloaded")
 
 
 # Global singleton instance
@@ -0,0 +1,296 @@
+"""
+Incremental streaming STT for a single conversation turn
+
+Transcribes audio while the user is still speaking, so only the last
+few seconds remain to be decoded when the client sends audio_end.
+
+How it works:
+1. Audio chunks are appended as they arrive (feed)
+2. At most every STT_STREAM_INTERVAL_SEC, the audio after the committed
+   point is decoded in memory and Whisper (with VAD) runs on it. Raw PCM is
+   cut at the committed point before decoding, so a pass costs the
+   uncommitted tail only; containers (WebM/Opus) cannot be cut mid-stream
+   and are decoded from the start
+3. Leading segments that two consecutive passes agree on, and that end
+   before the commit margin, are committed (local agreement); the window
+   then starts after them, so passes stay short
+4. finish() runs one last pass over the uncommitted tail
+
+Design Philosophy:
+- One background task per turn, woken by new audio (no polling when idle)
+- Committed text never changes; only the tentative tail is revised
+"""
+
+import asyncio
+import time
+from contextlib import suppress
+from typing import Awaitable, Callable, Optional
+
+import numpy as np
+import structlog
+
+from avatar.core.config import config
+
+logger = structlog.get_logger()
+
+WHISPER_SAMPLE_RATE = 16000
+
+# Shortest window worth a Whisper pass while streaming
+MIN_PASS_AUDIO_SEC = 0.5
+
+# Raw PCM decoded before the committed point, then dropped (primes the resampler)
+DECODE_OVERLAP_SEC = 0.1
+
+# Committed text passed to Whisper as context (characters)
+PROMPT_CONTEXT_CHARS = 200
+
+PartialCallback = Callable[[str, str], Awaitable[None]]
+
+
+class StreamingTranscriber:
+    """
+    Rolling-window transcriber with a stable committed prefix
+
+    Usage:
+        transcriber = StreamingTranscriber(stt, on_partial=send_partial)
+        transcriber.feed(chunk)          # for each incoming audio chunk
+        text, metadata = await transcriber.finish()
+    """
+
+    def __init__(
+        self,
+        stt,
+        on_partial: Optional[PartialCallback] = None,
+        interval_sec: float = config.STT_STREAM_INTERVAL_SEC,
+        max_window_sec: float = config.STT_STREAM_MAX_WINDOW_SEC,
+        commit_margin_sec: float = config.STT_STREAM_COMMIT_MARGIN_SEC,
+        language: Optional[str] = None,
+        beam_size: int = 5,
+        audio_format: Optional[str] = None
+    ):
+        """
+        Args:
+            stt: WhisperSTTProvider (needs transcribe_array)
+            on_partial: Async callback(stable_text, full_text) on each commit
+            interval_sec: Minimum time between streaming passes
+            max_window_sec: Force-commit when the window grows beyond this
+            commit_margin_sec: Segments ending this close to the window end stay tentative
+            language: Language code, None to auto-detect (locked after first confident pass)
+            beam_size: Beam size for decoding
+            audio_format: Container hint for decoding (None = auto-detect)
+        """
+        self.stt = stt
+        self.on_partial = on_partial
+        self.interval_sec = interval_sec
+        self.max_window_sec = max_window_sec
+        self.commit_margin_sec = commit_margin_sec
+        self.language = language
+        self.beam_size = beam_size
+        self.audio_format = audio_format
+
+        self._audio = bytearray()
+        self._committed: list[str] = []
+        self._committed_sec = 0.0
+        self._tentative: list[dict] = []
+        self._audio_sec = 0.0
+        self._samples: Optional[np.ndarray] = None
+        self._detected_language: Optional[str] = language
+
+        self._new_audio = asyncio.Event()
+        self._pass_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+        self.passes = 0
+
+    @property
+    def stable_text(self) -> str:
+        """Text that will not change anymore"""
+        return " ".join(self._committed)
+
+    @property
+    def samples(self) -> np.ndarray:
+        """Decoded 16kHz samples of the whole turn (complete after finish())"""
+        if self._samples is None:
+            return np.zeros(0, dtype=np.float32)
+        return self._samples
+
+    @property
+    def text(self) -> str:
+        """Committed text plus the current tentative tail"""
+        return " ".join(self._committed + [seg["text"] for seg in self._tentative])
+
+    def feed(self, chunk: bytes):
+        """
+        Append an audio chunk and wake the background transcription task
+
+        Must be called from the event loop thread.
+        """
+        self._audio.extend(chunk)
+        self._new_audio.set()
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._stream_loop())
+
+    async def finish(self) -> tuple[str, dict]:
+        """
+        Stop streaming and transcribe the remaining uncommitted audio
+
+        Returns:
+            Tuple of (full_text, metadata)
+
+        Raises:
+            RuntimeError: Final transcription failed
+        """
+        finish_start = time.time()
+
+        # Wait for an in-flight pass instead of abandoning it mid-decode
+        async with self._pass_lock:
+            await self._stop_task()
+            await self._transcribe_pass(final=True)
+
+        metadata = {
+            "language": self._detected_language,
+            "duration": self._audio_sec,
+            "segments_count": len(self._committed),
+            "passes": self.passes,
+            "tail_latency_sec": round(time.time() - finish_start, 3),
+            "provider": "whisper_streaming",
+        }
+
+        logger.info("stt.streaming.finished", **metadata)
+
+        return self.text, metadata
+
+    async def cancel(self):
+        """Discard the turn (buffer error or disconnect)"""
+        await self._stop_task()
+        self._audio.clear()
+
+    async def _stop_task(self):
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _stream_loop(self):
+        """Run a pass whenever new audio arrived, at most once per interval"""
+        while True:
+            await self._new_audio.wait()
+            await asyncio.sleep(self.interval_sec)  # Let more audio accumulate
+            self._new_audio.clear()
+
+            async with self._pass_lock:
+                try:
+                    await self._transcribe_pass(final=False)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    # Truncated containers may not decode yet; retry on next audio
+                    logger.debug("stt.streaming.pass_skipped", error=str(e))
+
+    async def _transcribe_pass(self, final: bool):
+        """Decode and transcribe the window after the committed point"""
+        if not self._audio:
+            return
+
+        # The final pass decodes everything once, for samples
+        window = await self._decode_window(from_start=final)
+        window_sec = len(window) / WHISPER_SAMPLE_RATE
+
+        if not final and window_sec < MIN_PASS_AUDIO_SEC:
+            return
+
+        prompt = self.stable_text[-PROMPT_CONTEXT_CHARS:] or None
+        segments, metadata = await self.stt.transcribe_array(
+            window,
+            language=self._detected_language,
+            beam_size=self.beam_size,
+            vad_filter=True,
+            initial_prompt=prompt
+        )
+        self.passes += 1
+
+        # Lock the language once detected confidently, so passes don't flip
+        if self._detected_language is None and metadata.get("language_probability", 0) >= 0.8:
+            self._detected_language = metadata["language"]
+
+        if final:
+            self._commit(segments)
+            self._tentative = []
+            return
+
+        commit_count = self._count_agreed(segments, window_sec)
+        committed = segments[:commit_count]
+        self._tentative = segments[commit_count:]
+
+        if committed:
+            self._commit(committed)
+        elif not segments and window_sec > self.max_window_sec:
+            # Long silence (VAD removed everything): skip it
+            self._committed_sec += window_sec - self.commit_margin_sec
+
+        logger.debug("stt.streaming.pass",
+                    window_sec=round(window_sec, 2),
+                    committed_sec=round(self._committed_sec, 2),
+                    committed_segments=commit_count,
+                    tentative_segments=len(self._tentative))
+
+        if committed and self.on_partial is not None:
+            await self.on_partial(self.stable_text, self.text)
+
+    async def _decode_window(self, from_start: bool) -> np.ndarray:
+        """
+        Decode the samples after the committed point
+
+        Raw PCM is cut DECODE_OVERLAP_SEC before the committed point, unless
+        from_start is set; other formats are always decoded from the start.
+        Audio decoded from the start is kept as samples.
+        """
+        from avatar.core.audio_utils import PCM_FORMAT, PCM_SAMPLE_RATE, decode_audio_bytes
+
+        start = 0
+        if self.audio_format == PCM_FORMAT and not from_start:
+            start_sec = max(0.0, self._committed_sec - DECODE_OVERLAP_SEC)
+            start = int(start_sec * PCM_SAMPLE_RATE) * 2
+        start_sec = start / (PCM_SAMPLE_RATE * 2)
+
+        loop = asyncio.get_running_loop()
+        audio = await loop.run_in_executor(
+            None,
+            decode_audio_bytes,
+            bytes(self._audio[start:]),
+            WHISPER_SAMPLE_RATE,
+            self.audio_format
+        )
+        if start == 0:
+            self._samples = audio
+        self._audio_sec = start_sec + len(audio) / WHISPER_SAMPLE_RATE
+
+        return audio[int((self._committed_sec - start_sec) * WHISPER_SAMPLE_RATE):]
+
+    def _count_agreed(self, segments: list[dict], window_sec: float) -> int:
+        """Number of leading segments confirmed by the previous pass"""
+        count = 0
+        for previous, current in zip(self._tentative, segments):
+            if previous["text"] != current["text"]:
+                break
+            if current["end"] > window_sec - self.commit_margin_sec:
+                break
+            count += 1
+
+        # Window grew too long without agreement: keep passes bounded
+        if count == 0 and window_sec > self.max_window_sec and len(segments) > 1:
+            count = len(segments) - 1
+
+        return count
+
+    def _commit(self, segments: list[dict]):
+        """Append segments to the committed text and advance the window start"""
+        for seg in segments:
+            if seg["text"]:
+                self._committed.append(seg["text"])
+
+        if segments:
+            # Segment times are relative to the window start
+            self._committed_sec += segments[-1]["end"]
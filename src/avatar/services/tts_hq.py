@@ -11,8 +11,11 @@ Design Philosophy (Linus-style):
 """
 
 import asyncio
+import contextlib
+import threading
+import time
 from pathlib import Path
-from typing import Optional, Union
+from typing import AsyncIterator, Callable, Optional, Union
 
 import structlog
 import torch
@@ -21,6 +24,15 @@ from avatar.core.config import config
 
 logger = structlog.get_logger()
 
+# CosyVoice's frontend expects the prompt speech at 16kHz
+PROMPT_SAMPLE_RATE = 16000
+
+
+def _remove_files(paths: list[Path]):
+    """Delete files, ignoring ones already gone"""
+    for path in paths:
+        path.unlink(missing_ok=True)
+
 
 class TTSHQService:
     """
@@ -164,35 +176,9 @@ class TTSHQService:
 
         def _synthesize():
             try:
-                import torchaudio
-
-                # Load reference audio
-                ref_audio, sr = torchaudio.load(str(ref_audio_path))
-                if sr != self.sample_rate:
-                    resampler = torchaudio.transforms.Resample(sr, self.sample_rate)
-                    ref_audio = resampler(ref_audio)
-
-                # CosyVoice2 zero-shot synthesis
-                results = self._model.inference_zero_shot(
-                    text,           # Text to synthesize
-                    ref_text,       # Reference text
-                    ref_audio       # Reference audio tensor
-                )
-
-                # Convert generator to list and get first result
-                result_list = list(results)
-                if not result_list:
-                    raise RuntimeError("CosyVoice2 returned no results")
-
-                audio_data = result_list[0]['tts_speech']
-
-                # Save audio data to file
-                torchaudio.save(
-                    str(output_path),
-                    audio_data,
-                    self.sample_rate
-                )
-
+                # Non-streaming inference still yields one result per text segment
+                chunks = self._synthesize_chunks(text, ref_audio_path, ref_text, stream=False)
+                self._save_audio(torch.cat(chunks, dim=1), output_path)
                 return output_path
 
             except Exception as e:
@@ -218,6 +204,183 @@ class TTSHQService:
             logger.error("tts_hq.synthesize_failed", error=str(e))
             raise
 
+    async def synthesize_stream(
+        self,
+        text: str,
+        ref_audio_path: Union[str, Path],
+        ref_text: str,
+        output_path: Union[str, Path],
+        keep_chunks: bool = False
+    ) -> AsyncIterator[Path]:
+        """
+        Synthesize with CosyVoice streaming inference, chunk by chunk
+
+        Each chunk is written to its own WAV file next to output_path
+        (<stem>_000.wav, <stem>_001.wav, ...) and yielded as soon as CosyVoice
+        produces it, so playback can start after the first chunk instead of
+        after the whole utterance. When the iterator is exhausted, the full
+        utterance has been written to output_path for the archive.
+
+        Without keep_chunks, a chunk file is only valid until the next chunk
+        is requested: once the iterator is exhausted or closed, the chunk
+        files are deleted. Closing the iterator early stops inference after
+        the current chunk.
+
+        Args:
+            text: Text to synthesize
+            ref_audio_path: Reference audio for voice cloning
+            ref_text: Reference text corresponding to ref_audio
+            output_path: Where to save the concatenated utterance
+            keep_chunks: Leave chunk files on disk (e.g. served by URL to a client)
+
+        Yields:
+            Path of each chunk file, in playback order
+
+        Raises:
+            RuntimeError: If synthesis fails
+            FileNotFoundError: If reference audio not found
+        """
+        if not text or not text.strip():
+            raise ValueError("Text cannot be empty")
+
+        ref_audio_path = Path(ref_audio_path)
+        output_path = Path(output_path)
+
+        if not ref_audio_path.exists():
+            raise FileNotFoundError(f"Reference audio not found: {ref_audio_path}")
+
+        await self._ensure_model_loaded()
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        logger.info(
+            "tts_hq.synthesize_stream_start",
+            output=str(output_path),
+            text_length=len(text)
+        )
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        stop = threading.Event()
+        start_time = time.time()
+        chunk_paths: list[Path] = []
+
+        def on_chunk(index: int, audio):
+            chunk_path = output_path.with_name(f"{output_path.stem}_{index:03d}{output_path.suffix}")
+            chunk_paths.append(chunk_path)
+            self._save_audio(audio, chunk_path)
+            loop.call_soon_threadsafe(queue.put_nowait, chunk_path)
+
+        def _synthesize():
+            chunks = self._synthesize_chunks(
+                text, ref_audio_path, ref_text, stream=True, on_chunk=on_chunk, stop=stop
+            )
+            if not stop.is_set():
+                self._save_audio(torch.cat(chunks, dim=1), output_path)
+            return len(chunks)
+
+        synthesis = loop.run_in_executor(None, _synthesize)
+        # Chunks are scheduled on the loop before the result, so None arrives last
+        synthesis.add_done_callback(lambda _: queue.put_nowait(None))
+
+        try:
+            first = True
+            while True:
+                chunk_path = await queue.get()
+                if chunk_path is None:
+                    break
+
+                if first:
+                    first = False
+                    logger.info("tts_hq.first_chunk",
+                               latency_sec=round(time.time() - start_time, 3))
+                yield chunk_path
+
+            try:
+                chunk_count = await synthesis
+            except Exception as e:
+                logger.error("tts_hq.synthesize_stream_failed", error=str(e))
+                raise RuntimeError(f"CosyVoice2 synthesis failed: {e}") from e
+
+            logger.info(
+                "tts_hq.synthesize_stream_complete",
+                output=str(output_path),
+                chunks=chunk_count,
+                total_sec=round(time.time() - start_time, 3)
+            )
+
+        finally:
+            # Early close: the worker stops after its current chunk. Wait for
+            # it so its error is retrieved and no chunk is written afterwards
+            stop.set()
+            with contextlib.suppress(Exception):
+                await synthesis
+            if not keep_chunks:
+                await loop.run_in_executor(None, _remove_files, list(chunk_paths))
+
+    def _load_prompt_speech(self, ref_audio_path: Path) -> torch.Tensor:
+        """Reference audio as the 16kHz mono prompt CosyVoice expects"""
+        import torchaudio
+
+        from avatar.core.audio_utils import get_resampler
+
+        ref_audio, sr = torchaudio.load(str(ref_audio_path))
+        if ref_audio.shape[0] > 1:
+            ref_audio = ref_audio.mean(dim=0, keepdim=True)
+        if sr != PROMPT_SAMPLE_RATE:
+            ref_audio = get_resampler(sr, PROMPT_SAMPLE_RATE)(ref_audio)
+        return ref_audio
+
+    def _synthesize_chunks(
+        self,
+        text: str,
+        ref_audio_path: Path,
+        ref_text: str,
+        stream: bool,
+        on_chunk: Optional[Callable[[int, torch.Tensor], None]] = None,
+        stop: Optional[threading.Event] = None
+    ) -> list[torch.Tensor]:
+        """
+        Run CosyVoice2 zero-shot inference (blocking)
+
+        Returns every chunk CosyVoice yields, in order (one per text segment,
+        or several per segment when streaming), calling on_chunk for each.
+        """
+        prompt_speech = self._load_prompt_speech(ref_audio_path)
+
+        chunks = []
+        results = self._model.inference_zero_shot(
+            text,           # Text to synthesize
+            ref_text,       # Reference text
+            prompt_speech,  # Reference audio tensor (16kHz)
+            stream=stream
+        )
+        for result in results:
+            audio = result['tts_speech']
+            if on_chunk is not None:
+                on_chunk(len(chunks), audio)
+            chunks.append(audio)
+
+            if stop is not None and stop.is_set():
+                break
+
+        if not chunks:
+            raise RuntimeError("CosyVoice2 returned no results")
+
+        return chunks
+
+    def _save_audio(self, audio: torch.Tensor, path: Path):
+        """Write (1, samples) audio at the model sample rate as 16-bit PCM (sendable as PCM16 frames)"""
+        import torchaudio
+
+        torchaudio.save(
+            str(path),
+            audio,
+            self.sample_rate,
+            encoding="PCM_S",
+            bits_per_sample=16
+        )
+
     async def synthesize_hq(
         self,
         text: str,
@@ -252,6 +415,38 @@ class TTSHQService:
         )
 
 
+    async def synthesize_hq_stream(
+        self,
+        text: str,
+        voice_profile_name: str,
+        output_path: Union[str, Path],
+        keep_chunks: bool = False
+    ) -> AsyncIterator[Path]:
+        """
+        Streaming high-quality synthesis using voice profile
+
+        See synthesize_stream(); the full utterance ends up at output_path.
+
+        Yields:
+            Path of each chunk file, in playback order
+        """
+        from avatar.services.tts_local import _load_voice_profile
+
+        ref_audio_path, ref_text = _load_voice_profile(voice_profile_name)
+
+        stream = self.synthesize_stream(
+            text=text,
+            ref_audio_path=ref_audio_path,
+            ref_text=ref_text,
+            output_path=output_path,
+            keep_chunks=keep_chunks
+        )
+        # Closing this iterator early must stop inference too
+        async with contextlib.aclosing(stream) as chunks:
+            async for chunk_path in chunks:
+                yield chunk_path
+
+
 # Singleton instance
 _tts_hq_service: Optional[TTSHQService] = None
 
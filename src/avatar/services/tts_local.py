@@ -8,6 +8,7 @@ Implements: TTSProvider protocol (see protocols.py)
 """
 
 import asyncio
+import threading
 from pathlib import Path
 from typing import Optional, Union
 
@@ -15,10 +16,28 @@ import structlog
 import torch
 
 from avatar.core.config import config
+from avatar.services.voice_reference_cache import (
+    VoiceReference,
+    get_voice_reference_cache,
+    reference_mtimes,
+)
 
 logger = structlog.get_logger()
 
 
+class _NoOpProgress:
+    """
+    No-op progress bar to suppress F5-TTS progress output
+
+    Workaround for F5-TTS bug: progress parameter expects object with .tqdm() method
+    but code has bug where it calls progress.tqdm() instead of progress()
+    """
+    @staticmethod
+    def tqdm(iterable):
+        """Fake tqdm method that just returns the iterable"""
+        return iterable
+
+
 def _load_voice_profile(profile_name: str) -> tuple[Path, str]:
     """
     Load voice profile from disk (helper function)
@@ -78,6 +97,7 @@ class F5TTSProvider:
     - Fast synthesis mode (target: ≤1.5s)
     - Lazy model loading
     - Async API to avoid blocking
+    - Voice profile references prepared once and cached as tensors
     """
 
     def __init__(
@@ -110,6 +130,7 @@ class F5TTSProvider:
 
         self.speed = speed
         self._model = None  # Will hold F5TTS instance
+        self._model_lock = threading.Lock()
 
         logger.info(
             "tts.init",
@@ -119,33 +140,38 @@ class F5TTSProvider:
         )
 
     def _load_model(self):
-        """Lazy load F5-TTS model (first call only)"""
-        if self._model is None:
-            logger.info("tts.loading_model", model=self.model_name)
+        """Lazy load F5-TTS model (first call only, thread-safe)"""
+        if self._model is not None:
+            return
 
-            try:
-                # Import F5-TTS high-level API
-                from f5_tts.api import F5TTS
+        # Preloading calls this from an executor thread while requests may too
+        with self._model_lock:
+            if self._model is None:
+                logger.info("tts.loading_model", model=self.model_name)
 
-                # Load model (auto-downloads from HuggingFace)
-                # model_name maps: "F5-TTS" -> "F5TTS_v1_Base"
-                model_id = "F5TTS_v1_Base" if self.model_name == "F5-TTS" else self.model_name
+                try:
+                    # Import F5-TTS high-level API
+                    from f5_tts.api import F5TTS
 
-                self._model = F5TTS(
-                    model=model_id,
-                    device=self.device
-                )
+                    # Load model (auto-downloads from HuggingFace)
+                    # model_name maps: "F5-TTS" -> "F5TTS_v1_Base"
+                    model_id = "F5TTS_v1_Base" if self.model_name == "F5-TTS" else self.model_name
 
-                logger.info("tts.model_loaded", model=model_id, device=self.device)
+                    self._model = F5TTS(
+                        model=model_id,
+                        device=self.device
+                    )
 
-            except ImportError as e:
-                logger.error("tts.import_failed", error=str(e))
-                raise RuntimeError(
-                    f"F5-TTS not installed. Run: poetry add f5-tts\n{e}"
-                ) from e
-            except Exception as e:
-                logger.error("tts.load_failed", error=str(e))
-                raise RuntimeError(f"Failed to load F5-TTS model: {e}") from e
+                    logger.info("tts.model_loaded", model=model_id, device=self.device)
+
+                except ImportError as e:
+                    logger.error("tts.import_failed", error=str(e))
+                    raise RuntimeError(
+                        f"F5-TTS not installed. Run: poetry add f5-tts\n{e}"
+                    ) from e
+                except Exception as e:
+                    logger.error("tts.load_failed", error=str(e))
+                    raise RuntimeError(f"Failed to load F5-TTS model: {e}") from e
 
     async def synthesize(
         self,
@@ -191,19 +217,23 @@ class F5TTSProvider:
         # Load model if not already loaded
         self._load_model()
 
-        # Run synthesis in thread pool to avoid blocking
+        return await self._run_synthesis(
+            text,
+            output_path,
+            self._synthesize_blocking,
+            text,
+            ref_audio_path,
+            ref_text,
+            output_path,
+            remove_silence
+        )
+
+    async def _run_synthesis(self, text: str, output_path: Path, blocking_fn, *args) -> Path:
+        """Run a blocking synthesis function in the thread pool and verify its output"""
         loop = asyncio.get_event_loop()
 
         try:
-            await loop.run_in_executor(
-                None,
-                self._synthesize_blocking,
-                text,
-                ref_audio_path,
-                ref_text,
-                output_path,
-                remove_silence
-            )
+            await loop.run_in_executor(None, blocking_fn, *args)
 
             # Verify output exists
             if not output_path.exists():
@@ -240,15 +270,6 @@ class F5TTSProvider:
 
         Uses F5TTS high-level API for inference.
         """
-        # Workaround for F5-TTS bug: progress parameter expects object with .tqdm() method
-        # but code has bug where it calls progress.tqdm() instead of progress()
-        class NoOpProgress:
-            """No-op progress bar to suppress F5-TTS progress output"""
-            @staticmethod
-            def tqdm(iterable):
-                """Fake tqdm method that just returns the iterable"""
-                return iterable
-
         # Use F5TTS.infer() which handles everything
         self._model.infer(
             ref_file=str(ref_audio_path),
@@ -258,9 +279,106 @@ class F5TTSProvider:
             speed=self.speed,
             remove_silence=remove_silence,
             show_info=lambda x: None,  # Suppress print output
-            progress=NoOpProgress  # Suppress progress bar
+            progress=_NoOpProgress  # Suppress progress bar
         )
 
+    def _prepare_voice_reference(self, profile_name: str) -> VoiceReference:
+        """
+        Load and preprocess a voice profile reference (blocking, cache miss path)
+
+        Same preprocessing F5TTS.infer() does per call (clip to ≤12s, trim
+        silence, normalize text ending), then downmix and resample to the
+        model rate once, and keep the tensor on the device.
+
+        Loudness is left alone: infer_batch_process() RMS-normalizes the
+        reference itself and scales its output back to the reference's
+        original level, which it can only do if it sees that level.
+        """
+        import torchaudio
+        from f5_tts.infer.utils_infer import preprocess_ref_audio_text
+
+        from avatar.core.audio_utils import get_resampler
+
+        ref_audio_path, ref_text = _load_voice_profile(profile_name)
+        text_path = ref_audio_path.parent / "reference.txt"
+        mtimes = reference_mtimes(ref_audio_path, text_path)
+
+        clipped_path, ref_text = preprocess_ref_audio_text(
+            str(ref_audio_path), ref_text, show_info=lambda x: None
+        )
+        audio, sr = torchaudio.load(clipped_path)
+
+        if audio.shape[0] > 1:
+            audio = torch.mean(audio, dim=0, keepdim=True)
+
+        target_sr = self._model.target_sample_rate
+        if sr != target_sr:
+            with torch.inference_mode():
+                audio = get_resampler(sr, target_sr)(audio)
+
+        logger.info("tts.voice_reference_prepared",
+                   profile=profile_name,
+                   duration_sec=round(audio.shape[-1] / target_sr, 2))
+
+        return VoiceReference(
+            profile_name=profile_name,
+            audio_path=ref_audio_path,
+            text_path=text_path,
+            mtimes=mtimes,
+            audio=audio.to(self._model.device),
+            sample_rate=target_sr,
+            ref_text=ref_text,
+            duration_sec=audio.shape[-1] / target_sr
+        )
+
+    def _get_voice_reference(self, profile_name: str) -> VoiceReference:
+        """Prepared reference from the cache, preparing it on a miss (blocking)"""
+        cache = get_voice_reference_cache()
+
+        reference = cache.get(profile_name)
+        if reference is None:
+            reference = self._prepare_voice_reference(profile_name)
+            cache.put(reference)
+
+        return reference
+
+    def _synthesize_reference_blocking(
+        self,
+        text: str,
+        reference: VoiceReference,
+        output_path: Path,
+        remove_silence: bool
+    ):
+        """
+        Synthesize from an already prepared reference (runs in thread pool)
+
+        Equivalent to F5TTS.infer() minus reference loading/preprocessing:
+        the cached tensor is already mono and at the model rate (loudness
+        normalization and the matching output rescale happen in
+        infer_batch_process, as with F5TTS.infer()).
+        """
+        from f5_tts.infer.utils_infer import chunk_text, infer_batch_process
+
+        # Same text batching rule as F5-TTS infer_process()
+        max_chars = int(
+            len(reference.ref_text.encode("utf-8")) / reference.duration_sec
+            * (22 - reference.duration_sec) * self.speed
+        )
+
+        wav, _, _ = next(infer_batch_process(
+            (reference.audio, reference.sample_rate),
+            reference.ref_text,
+            chunk_text(text, max_chars=max_chars),
+            self._model.ema_model,
+            self._model.vocoder,
+            mel_spec_type=self._model.mel_spec_type,
+            progress=_NoOpProgress,
+            speed=self.speed,
+            device=self._model.device
+        ))
+
+        self._model.export_wav(wav, str(output_path), remove_silence)
+
     async def synthesize_fast(
         self,
         text: str,
@@ -270,8 +388,9 @@ class F5TTSProvider:
         """
         Convenience method for synthesis using pre-stored voice profile
 
-        This method loads the voice profile and delegates to synthesize().
-        File system operations are handled by _load_voice_profile().
+        The profile's reference is taken from the voice reference cache
+        (prepared on first use), so a hit skips all file reads and
+        reference preprocessing.
 
         Args:
             text: Text to synthesize
@@ -292,16 +411,25 @@ class F5TTSProvider:
             text_length=len(text)
         )
 
-        # Load voice profile (file system operations separated)
-        ref_audio_path, ref_text = _load_voice_profile(voice_profile_name)
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Delegate to core synthesis method
-        return await self.synthesize(
-            text=text,
-            ref_audio_path=ref_audio_path,
-            ref_text=ref_text,
-            output_path=output_path,
-            remove_silence=True
+        self._load_model()
+
+        # Profile errors (FileNotFoundError/ValueError) propagate unchanged
+        loop = asyncio.get_event_loop()
+        reference = await loop.run_in_executor(
+            None, self._get_voice_reference, voice_profile_name
+        )
+
+        return await self._run_synthesis(
+            text,
+            output_path,
+            self._synthesize_reference_blocking,
+            text,
+            reference,
+            output_path,
+            True
         )
 
     def unload_model(self):
@@ -311,6 +439,9 @@ class F5TTSProvider:
             del self._model
             self._model = None
 
+            # Cached references live on the model device
+            get_voice_reference_cache().clear()
+
             # Clear CUDA cache
             if torch.cuda.is_available():
                 torch.cuda.empty_cache()
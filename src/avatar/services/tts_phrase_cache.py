@@ -0,0 +1,409 @@
+"""
+Content-addressed cache of synthesized TTS phrases
+
+Greetings, error fallbacks and short common answers repeat across turns and
+sessions, yet each one costs a full F5-TTS synthesis. This cache stores the
+synthesized WAV under a hash of (normalized text, voice profile, speed,
+model); a repeated phrase is copied from the existing file.
+
+Turns always get their own file: a hit is copied to the turn's output path,
+so eviction or invalidate_voice never deletes archived conversation audio.
+File work (stat, copy, rename, unlink) runs in the default executor.
+
+Storage:
+- Files live in AUDIO_TTS_FAST as phrase_<voice hash>_<digest>.wav, so a
+  cached file has a regular /api/audio/tts/ URL
+- Total size is capped; the least recently used files are evicted
+- Recency is persisted through file mtimes, so the index survives restarts
+- Encoded copies (<stem>.enc.opus/.webm, see core.audio_encoding) are
+  deleted with their phrase file
+
+Only short texts are cached: long LLM answers rarely repeat and would only
+churn the cache.
+"""
+
+import asyncio
+import hashlib
+import os
+import re
+import shutil
+import threading
+import unicodedata
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+import structlog
+
+from avatar.core.audio_encoding import remove_encodings
+from avatar.core.config import config
+
+logger = structlog.get_logger()
+
+FILE_PREFIX = "phrase_"
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_phrase(text: str) -> str:
+    """Canonical form of a phrase (NFKC, collapsed whitespace)"""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+
+def phrase_key(text: str, voice: str, speed: Optional[float], model: str) -> str:
+    """Content address of a synthesized phrase"""
+    material = "\x1f".join([model, voice, f"{speed}", normalize_phrase(text)])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()[:32]
+
+
+def _voice_tag(voice: str) -> str:
+    """Fixed-length, filesystem-safe voice tag used in cache filenames (distinct per voice)"""
+    return hashlib.sha256(voice.encode("utf-8")).hexdigest()[:12]
+
+
+def _copy_file(source: Path, target: Path):
+    """Copy source to target atomically (readers never see a partial file)"""
+    tmp = target.with_name(f"{target.name}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        shutil.copyfile(source, tmp)
+        os.replace(tmp, target)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+class TTSPhraseCache:
+    """
+    Disk-backed LRU cache of synthesized phrases
+
+    Usage:
+        await cache.synthesize_fast(tts, text, voice_profile_name, output_path)
+        url = f"/api/audio/tts/{output_path.name}"
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path = config.AUDIO_TTS_FAST,
+        max_bytes: int = config.TTS_PHRASE_CACHE_MB * 1024 * 1024,
+        max_chars: int = config.TTS_PHRASE_CACHE_MAX_CHARS
+    ):
+        """
+        Args:
+            cache_dir: Directory holding cached files (served as /api/audio/tts/)
+            max_bytes: Size cap of all cached files
+            max_chars: Longer texts are synthesized without caching
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.max_chars = max_chars
+
+        self._entries: OrderedDict[str, int] = OrderedDict()  # filename -> size, LRU order
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._load_index()
+
+    def _load_index(self):
+        """Rebuild the LRU index from files left by previous runs"""
+        if not self.cache_dir.exists():
+            return
+
+        files = []
+        for path in self.cache_dir.glob(f"{FILE_PREFIX}*.wav"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime_ns, path.name, stat.st_size))
+
+        for _, name, size in sorted(files):
+            self._entries[name] = size
+            self._total_bytes += size
+
+        if files:
+            logger.info("tts.phrase_cache.loaded",
+                       entries=len(self._entries),
+                       size_mb=round(self._total_bytes / 1024 / 1024, 1))
+
+        self._evict()
+
+    def is_cacheable(self, text: str) -> bool:
+        """Whether a text is short enough to be cached"""
+        return 0 < len(normalize_phrase(text)) <= self.max_chars
+
+    def filename(self, key: str, voice: str) -> str:
+        return f"{FILE_PREFIX}{_voice_tag(voice)}_{key}.wav"
+
+    def lookup(self, key: str, voice: str) -> Optional[Path]:
+        """Path of a cached phrase, or None (miss; blocking file I/O)"""
+        name = self.filename(key, voice)
+        path = self.cache_dir / name
+
+        with self._lock:
+            known = name in self._entries
+
+        if known and path.exists():
+            try:
+                os.utime(path)  # Persist recency for the next restart
+            except OSError:
+                pass
+
+            with self._lock:
+                if name in self._entries:
+                    self._entries.move_to_end(name)
+                self.hits += 1
+            return path
+
+        with self._lock:
+            if known:
+                # Removed behind our back (e.g. conversation cleanup)
+                self._total_bytes -= self._entries.pop(name, 0)
+            self.misses += 1
+
+        return None
+
+    def store(self, key: str, voice: str, source_path: Path, move: bool = True) -> Path:
+        """
+        Put a freshly synthesized file into the cache (blocking file I/O)
+
+        Args:
+            move: Move source_path into the cache; False keeps it and stores a copy
+
+        Returns:
+            Path of the cached file
+        """
+        name = self.filename(key, voice)
+        path = self.cache_dir / name
+
+        if move:
+            os.replace(source_path, path)
+        else:
+            _copy_file(source_path, path)
+        size = path.stat().st_size
+
+        with self._lock:
+            self._total_bytes += size - self._entries.pop(name, 0)
+            self._entries[name] = size
+
+        self._evict(keep=name)
+        return path
+
+    def invalidate_voice(self, voice: str) -> int:
+        """
+        Delete all cached phrases of a voice profile
+
+        Returns:
+            Number of files removed
+        """
+        prefix = f"{FILE_PREFIX}{_voice_tag(voice)}_"
+
+        with self._lock:
+            # Voice tags are fixed-length, so the prefix never matches another voice
+            names = [name for name in self._entries if name.startswith(prefix)]
+            for name in names:
+                self._total_bytes -= self._entries.pop(name)
+
+        for name in names:
+            self._remove(name)
+
+        if names:
+            logger.info("tts.phrase_cache.invalidated", voice=voice, files=len(names))
+
+        return len(names)
+
+    def _evict(self, keep: Optional[str] = None):
+        """Delete least recently used files until under the size cap"""
+        removed = []
+
+        with self._lock:
+            while self._total_bytes > self.max_bytes and self._entries:
+                name, size = next(iter(self._entries.items()))
+                if name == keep:
+                    break
+                del self._entries[name]
+                self._total_bytes -= size
+                self.evictions += 1
+                removed.append(name)
+
+        for name in removed:
+            self._remove(name)
+
+        if removed:
+            logger.debug("tts.phrase_cache.evicted", files=len(removed))
+
+    def _remove(self, name: str):
+        """Delete a cached file and its encoded copies"""
+        path = self.cache_dir / name
+        path.unlink(missing_ok=True)
+        remove_encodings(path)
+
+    async def synthesize_fast(
+        self,
+        tts,
+        text: str,
+        voice_profile_name: str,
+        output_path: Path
+    ) -> Path:
+        """
+        tts.synthesize_fast() through the cache
+
+        Args:
+            tts: TTS provider
+            text: Text to synthesize
+            voice_profile_name: Stored voice profile
+            output_path: Turn's own file (synthesized on a miss, copied from the cache on a hit)
+
+        Returns:
+            output_path
+        """
+        if not self.is_cacheable(text):
+            await tts.synthesize_fast(
+                text=text,
+                voice_profile_name=voice_profile_name,
+                output_path=output_path
+            )
+            return output_path
+
+        key = phrase_key(
+            text,
+            voice_profile_name,
+            getattr(tts, "speed", None),
+            getattr(tts, "model_name", type(tts).__name__)
+        )
+
+        loop = asyncio.get_event_loop()
+        cached = await loop.run_in_executor(None, self.lookup, key, voice_profile_name)
+        if cached is not None:
+            try:
+                await loop.run_in_executor(None, _copy_file, cached, Path(output_path))
+                logger.info("tts.phrase_cache.hit", voice=voice_profile_name, text_length=len(text))
+                return output_path
+            except FileNotFoundError:
+                pass  # Evicted between lookup and copy; synthesize instead
+
+        await tts.synthesize_fast(
+            text=text,
+            voice_profile_name=voice_profile_name,
+            output_path=output_path
+        )
+
+        await loop.run_in_executor(None, self.store, key, voice_profile_name, Path(output_path), False)
+        return output_path
+
+    def get_stats(self) -> dict:
+        """Hit/miss counters and disk usage"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "size_mb": round(self._total_bytes / 1024 / 1024, 2),
+                "max_size_mb": round(self.max_bytes / 1024 / 1024, 2),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+            }
+
+
+def profile_name(voice_profile_id) -> str:
+    """
+    Name of a stored voice profile as used by TTS and the cache
+
+    Profiles are stored under AUDIO_PROFILES/<profile id>, so a turn's
+    voice_profile_id and a directory found by list_voice_profiles() give
+    the same name (and the same cache key).
+    """
+    return str(voice_profile_id)
+
+
+def list_voice_profiles() -> list[str]:
+    """Names (profile ids) of voice profile directories on disk"""
+    if not config.AUDIO_PROFILES.exists():
+        return []
+    return sorted(path.name for path in config.AUDIO_PROFILES.iterdir() if path.is_dir())
+
+
+async def warm_up_phrase_cache(
+    phrases: Optional[list[str]] = None,
+    profiles: Optional[list[str]] = None
+) -> dict:
+    """
+    Pre-render phrases for voice profiles
+
+    Already cached phrases are skipped, so repeated warm-ups are cheap.
+    A failing profile is logged and skipped. Each synthesis holds a
+    tts_fast stage slot, so warm-up queues behind live turns instead of
+    oversubscribing the model.
+
+    Args:
+        phrases: Phrases to render (default: AVATAR_TTS_WARMUP_PHRASES)
+        profiles: Voice profile ids (default: AVATAR_TTS_WARMUP_PROFILES, or all on disk)
+
+    Returns:
+        Summary with rendered/cached/failed counts
+    """
+    from avatar.core.session_queue import get_session_queue
+    from avatar.services.tts import get_tts_service
+
+    phrases = [p for p in (phrases if phrases is not None else config.TTS_WARMUP_PHRASES) if p.strip()]
+    profiles = [
+        profile_name(profile) for profile in
+        (profiles if profiles is not None else (config.TTS_WARMUP_PROFILES or list_voice_profiles()))
+    ]
+
+    cache = get_tts_phrase_cache()
+    tts = await get_tts_service()
+    summary = {"rendered": 0, "cached": 0, "failed": 0, "profiles": len(profiles), "phrases": len(phrases)}
+    start = asyncio.get_event_loop().time()
+
+    for profile in profiles:
+        for phrase in phrases:
+            if not cache.is_cacheable(phrase):
+                logger.warning("tts.phrase_cache.warmup_skipped", reason="too_long", text=phrase[:40])
+                continue
+
+            key = phrase_key(phrase, profile, getattr(tts, "speed", None),
+                             getattr(tts, "model_name", type(tts).__name__))
+            loop = asyncio.get_event_loop()
+            if await loop.run_in_executor(None, cache.lookup, key, profile) is not None:
+                summary["cached"] += 1
+                continue
+
+            try:
+                async with get_session_queue().stage(
+                    "phrase_warmup", "tts_fast", timeout=config.STAGE_QUEUE_TIMEOUT
+                ):
+                    await tts.synthesize_fast(
+                        text=phrase,
+                        voice_profile_name=profile,
+                        output_path=config.AUDIO_TTS_FAST / f"warmup_{key}.wav"
+                    )
+                await loop.run_in_executor(
+                    None, cache.store, key, profile, config.AUDIO_TTS_FAST / f"warmup_{key}.wav"
+                )
+                summary["rendered"] += 1
+            except Exception as e:
+                logger.warning("tts.phrase_cache.warmup_failed", profile=profile, error=str(e))
+                summary["failed"] += 1
+                break  # Profile is likely broken; skip its remaining phrases
+
+    summary["total_time"] = round(asyncio.get_event_loop().time() - start, 2)
+    logger.info("tts.phrase_cache.warmup_complete", **summary)
+    return summary
+
+
+# Global instance shared by WebSocket sessions and warm-up
+_phrase_cache: Optional[TTSPhraseCache] = None
+
+
+def get_tts_phrase_cache() -> TTSPhraseCache:
+    """Get global TTS phrase cache"""
+    global _phrase_cache
+    if _phrase_cache is None:
+        _phrase_cache = TTSPhraseCache()
+    return _phrase_cache
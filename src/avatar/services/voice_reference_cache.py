@@ -0,0 +1,161 @@
+"""
+In-memory cache of preprocessed voice-profile references
+
+Voice-cloning TTS needs the profile's reference audio decoded, clipped,
+downmixed and resampled to the model rate, plus the normalized reference
+text. Doing that per request means globbing the
+profile directory, reading reference.txt and re-decoding the WAV every time.
+
+This cache keeps the prepared tensors per profile (LRU). An entry is valid
+while the reference files' mtimes are unchanged, so a hit costs two stat()
+calls and no reads. The voice profile API invalidates entries explicitly on
+update/delete.
+
+Thread-safe: entries are read and written from executor threads.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+import structlog
+
+from avatar.core.config import config
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class VoiceReference:
+    """Prepared reference for one voice profile"""
+    profile_name: str
+    audio_path: Path
+    text_path: Path
+    mtimes: tuple[int, int]  # (audio, text) st_mtime_ns when prepared
+    audio: Any               # torch.Tensor (1, samples): mono, original loudness, on the model device
+    sample_rate: int
+    ref_text: str
+    duration_sec: float
+
+
+def reference_mtimes(audio_path: Path, text_path: Path) -> tuple[int, int]:
+    """Modification times used to detect changed reference files"""
+    return audio_path.stat().st_mtime_ns, text_path.stat().st_mtime_ns
+
+
+class VoiceReferenceCache:
+    """
+    LRU cache of VoiceReference entries keyed by profile name
+
+    Usage:
+        reference = cache.get(profile_name)
+        if reference is None:
+            reference = prepare(profile_name)
+            cache.put(reference)
+    """
+
+    def __init__(self, max_entries: int = config.TTS_VOICE_CACHE_SIZE):
+        """
+        Args:
+            max_entries: Profiles kept in memory (each ~1MB for a 12s reference)
+        """
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[str, VoiceReference] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, profile_name: str) -> Optional[VoiceReference]:
+        """
+        Cached reference if its files are unchanged, else None (miss)
+
+        Stale entries (files changed or removed) are dropped.
+        """
+        with self._lock:
+            entry = self._entries.get(profile_name)
+
+        if entry is not None:
+            try:
+                fresh = reference_mtimes(entry.audio_path, entry.text_path) == entry.mtimes
+            except OSError:
+                fresh = False
+
+            with self._lock:
+                if fresh:
+                    self._entries.move_to_end(profile_name)
+                    self.hits += 1
+                    return entry
+
+                self._entries.pop(profile_name, None)
+                self.stale += 1
+
+        with self._lock:
+            self.misses += 1
+
+        return None
+
+    def put(self, reference: VoiceReference):
+        """Store a prepared reference, evicting the least recently used"""
+        with self._lock:
+            self._entries[reference.profile_name] = reference
+            self._entries.move_to_end(reference.profile_name)
+
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                self.evictions += 1
+                logger.debug("tts.voice_cache.evicted", profile=evicted)
+
+    def invalidate(self, profile_name: str) -> bool:
+        """
+        Drop a profile (call after its files are updated or deleted)
+
+        Returns:
+            True if an entry was removed
+        """
+        with self._lock:
+            removed = self._entries.pop(profile_name, None) is not None
+            if removed:
+                self.invalidations += 1
+
+        if removed:
+            logger.info("tts.voice_cache.invalidated", profile=profile_name)
+
+        return removed
+
+    def clear(self):
+        """Drop all entries (e.g. when the TTS model is unloaded)"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict:
+        """Hit/miss counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "stale": self.stale,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+# Global instance shared by TTS providers and the voice profile API
+_voice_reference_cache: Optional[VoiceReferenceCache] = None
+
+
+def get_voice_reference_cache() -> VoiceReferenceCache:
+    """Get global voice reference cache"""
+    global _voice_reference_cache
+    if _voice_reference_cache is None:
+        _voice_reference_cache = VoiceReferenceCache()
+    return _voice_reference_cache
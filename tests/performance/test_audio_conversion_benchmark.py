@@ -0,0 +1,120 @@
+"""
+Audio Conversion Micro-Benchmark
+
+Measures per-call resampling cost for the two conversions on the hot path:
+- 48kHz stereo → 16kHz mono (browser upload → Whisper)
+- 44.1kHz mono → 24kHz mono (voice profile → F5-TTS/CosyVoice)
+
+Compares a fresh torchaudio Resample per call (old behaviour) with the
+cached kernels in audio_utils, and single-clip vs batched conversion.
+
+Run directly for a report:
+    poetry run python tests/performance/test_audio_conversion_benchmark.py
+"""
+
+import statistics
+import sys
+import os
+import time
+from typing import Callable
+
+import pytest
+import torch
+import torchaudio
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+from avatar.core.audio_utils import get_resampler, resample_batch, to_target_format
+
+CASES = [
+    ("48k stereo -> 16k mono", 48000, 16000, 2),
+    ("44.1k mono -> 24k mono", 44100, 24000, 1),
+]
+
+CLIP_SECONDS = 3.0
+BATCH_SIZE = 8
+
+
+def _time_per_call(fn: Callable[[], object], iterations: int) -> dict:
+    """Run fn repeatedly and return latency stats in milliseconds"""
+    fn()  # Warm-up (first call also builds the cached kernel)
+
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    return {
+        "mean_ms": statistics.mean(latencies),
+        "p50_ms": statistics.median(latencies),
+        "min_ms": min(latencies),
+    }
+
+
+def benchmark_case(orig_sr: int, target_sr: int, channels: int, iterations: int = 20) -> dict:
+    """Benchmark uncached vs cached vs batched conversion for one rate pair"""
+    clip = torch.randn(channels, int(orig_sr * CLIP_SECONDS)) * 0.1
+
+    def uncached():
+        waveform = torch.mean(clip, dim=0, keepdim=True) if channels > 1 else clip
+        resampler = torchaudio.transforms.Resample(orig_freq=orig_sr, new_freq=target_sr)
+        return resampler(waveform)
+
+    def cached():
+        return to_target_format(clip, orig_sr, target_sr, target_channels=1)
+
+    batch = [(clip, orig_sr)] * BATCH_SIZE
+
+    def batched():
+        return resample_batch(batch, target_sr, target_channels=1)
+
+    batched_stats = _time_per_call(batched, max(iterations // 4, 3))
+
+    return {
+        "uncached": _time_per_call(uncached, iterations),
+        "cached": _time_per_call(cached, iterations),
+        "batched_per_clip_ms": batched_stats["mean_ms"] / BATCH_SIZE,
+    }
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("name,orig_sr,target_sr,channels", CASES)
+def test_cached_resampler_faster_than_uncached(name, orig_sr, target_sr, channels):
+    """Cached kernels must not be slower than building a Resample per call"""
+    result = benchmark_case(orig_sr, target_sr, channels, iterations=10)
+
+    print(f"\n{name}: uncached {result['uncached']['mean_ms']:.2f}ms, "
+          f"cached {result['cached']['mean_ms']:.2f}ms, "
+          f"batched {result['batched_per_clip_ms']:.2f}ms/clip")
+
+    assert result["cached"]["p50_ms"] <= result["uncached"]["p50_ms"]
+
+
+def test_resampler_cache_reuses_kernel():
+    """Same rate pair returns the same transform instance"""
+    assert get_resampler(48000, 16000) is get_resampler(48000, 16000)
+    assert get_resampler(48000, 16000) is not get_resampler(44100, 16000)
+
+
+def test_batch_matches_single_clip():
+    """Batched resampling yields the same samples as per-clip conversion"""
+    short = torch.randn(1, 48000) * 0.1
+    long = torch.randn(2, 96000) * 0.1
+
+    batched = resample_batch([(short, 48000), (long, 48000)], 16000)
+
+    assert torch.allclose(batched[0], to_target_format(short, 48000, 16000), atol=1e-5)
+    assert torch.allclose(batched[1], to_target_format(long, 48000, 16000), atol=1e-5)
+
+
+if __name__ == "__main__":
+    print(f"🧪 Audio conversion micro-benchmark ({CLIP_SECONDS:.0f}s clips, batch={BATCH_SIZE})")
+    for name, orig_sr, target_sr, channels in CASES:
+        result = benchmark_case(orig_sr, target_sr, channels, iterations=50)
+        speedup = result["uncached"]["mean_ms"] / max(result["cached"]["mean_ms"], 1e-6)
+        print(f"\n{name}:")
+        print(f"  Uncached (new Resample per call): {result['uncached']['mean_ms']:.2f}ms")
+        print(f"  Cached kernel:                    {result['cached']['mean_ms']:.2f}ms ({speedup:.1f}x)")
+        print(f"  Batched (per clip):               {result['batched_per_clip_ms']:.2f}ms")
@@ -0,0 +1,126 @@
+"""
+Unit Tests for audio file serving
+
+Range requests, conditional requests and path resolution.
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from avatar.api import audio
+from avatar.core import audio_encoding
+from avatar.core.config import config
+
+
+AUDIO_BYTES = bytes(range(256)) * 40  # 10240 bytes
+
+
+@pytest.fixture
+def tts_dir(tmp_path, monkeypatch):
+    fast, hq = tmp_path / "tts_fast", tmp_path / "tts_hq"
+    fast.mkdir()
+    hq.mkdir()
+    (fast / "turn.wav").write_bytes(AUDIO_BYTES)
+    monkeypatch.setattr(config, "AUDIO_TTS_FAST", fast)
+    monkeypatch.setattr(config, "AUDIO_TTS_HQ", hq)
+    return fast
+
+
+@pytest.fixture
+def client(tts_dir):
+    app = FastAPI()
+    app.state.limiter = audio.limiter
+    app.include_router(audio.router)
+    return TestClient(app)
+
+
+class TestPathResolution:
+    """Test file lookup from names and stored URLs"""
+
+    def test_stored_tts_url_resolves_to_file(self, tts_dir):
+        """AI audio is stored as its URL"""
+        assert audio.resolve_stored_audio("/api/audio/tts/turn.wav") == tts_dir / "turn.wav"
+
+    def test_path_components_are_rejected(self, tts_dir):
+        """Names cannot escape the audio directories"""
+        assert audio.resolve_tts_file("../tts_fast/turn.wav") is None
+        assert audio.resolve_tts_file("..") is None
+
+
+class TestRangeRequests:
+    """Test partial content and caching headers"""
+
+    def test_full_download_has_validators(self, client):
+        """Full responses carry ETag, Last-Modified and Accept-Ranges"""
+        response = client.get("/api/audio/tts/turn.wav")
+
+        assert response.status_code == 200
+        assert response.content == AUDIO_BYTES
+        assert response.headers["accept-ranges"] == "bytes"
+        assert response.headers["etag"]
+        assert response.headers["last-modified"]
+
+    @pytest.mark.parametrize("header,start,end", [
+        ("bytes=0-99", 0, 99),
+        ("bytes=10000-", 10000, 10239),
+        ("bytes=-240", 10000, 10239),
+        ("bytes=10200-99999", 10200, 10239),
+    ])
+    def test_byte_ranges(self, client, header, start, end):
+        """Single ranges return 206 with the requested bytes"""
+        response = client.get("/api/audio/tts/turn.wav", headers={"Range": header})
+
+        assert response.status_code == 206
+        assert response.content == AUDIO_BYTES[start:end + 1]
+        assert response.headers["content-range"] == f"bytes {start}-{end}/{len(AUDIO_BYTES)}"
+
+    def test_unsatisfiable_range(self, client):
+        """Ranges past the end return 416"""
+        response = client.get("/api/audio/tts/turn.wav", headers={"Range": "bytes=20000-"})
+
+        assert response.status_code == 416
+        assert response.headers["content-range"] == f"bytes */{len(AUDIO_BYTES)}"
+
+    def test_etag_revalidation(self, client):
+        """A matching If-None-Match returns 304 without a body"""
+        etag = client.get("/api/audio/tts/turn.wav").headers["etag"]
+
+        response = client.get("/api/audio/tts/turn.wav", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_stale_if_range_serves_full_file(self, client):
+        """A Range with an outdated If-Range validator gets the whole file"""
+        response = client.get("/api/audio/tts/turn.wav",
+                              headers={"Range": "bytes=0-99", "If-Range": '"stale"'})
+
+        assert response.status_code == 200
+        assert response.content == AUDIO_BYTES
+
+    def test_opus_without_ffmpeg_falls_back_to_wav(self, client, monkeypatch):
+        """Transcoding is optional"""
+        monkeypatch.setattr(audio_encoding, "ffmpeg_path", lambda: None)
+
+        response = client.get("/api/audio/tts/turn.wav?format=opus")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "audio/wav"
+
+    def test_accept_header_without_ffmpeg_serves_wav(self, client, monkeypatch):
+        """Negotiated formats fall back to WAV as well"""
+        monkeypatch.setattr(audio_encoding, "ffmpeg_path", lambda: None)
+
+        response = client.get("/api/audio/tts/turn.wav", headers={"Accept": "audio/webm"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "audio/wav"
+        assert response.headers["vary"] == "Accept"
+
+    def test_missing_file(self, client):
+        assert client.get("/api/audio/tts/missing.wav").status_code == 404
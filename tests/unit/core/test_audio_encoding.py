@@ -0,0 +1,131 @@
+"""
+Unit Tests for compressed audio encodings
+
+Format negotiation and the cached encode path (with a stand-in ffmpeg).
+"""
+
+import asyncio
+import stat
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from avatar.core import audio_encoding
+from avatar.core.audio_encoding import (
+    AudioEncodingError,
+    cached_encoding,
+    choose_format,
+    encode_audio,
+    get_encoded_audio,
+)
+
+
+@pytest.fixture
+def fake_ffmpeg(tmp_path, monkeypatch):
+    """Script that writes a marker to its last argument (the output file)"""
+    script = tmp_path / "ffmpeg"
+    script.write_text('#!/bin/sh\nfor last; do :; done\nprintf encoded > "$last"\n')
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setattr(audio_encoding, "ffmpeg_path", lambda: str(script))
+    return script
+
+
+class TestChooseFormat:
+    """Test picking a format from what the client accepts"""
+
+    @pytest.mark.parametrize("accepted,expected", [
+        (["opus", "wav"], "opus"),
+        (["webm", "wav"], "webm"),
+        ("audio/webm, audio/ogg;q=0.8, */*;q=0.5", "webm"),
+        ("audio/webm;q=0.5, audio/ogg", "opus"),
+        ("*/*", "wav"),            # Wildcards keep old players on WAV
+        ("audio/ogg;q=0", "wav"),  # Explicitly refused
+        (None, "wav"),
+    ])
+    def test_negotiation(self, fake_ffmpeg, accepted, expected):
+        assert choose_format(accepted) == expected
+
+    def test_no_ffmpeg_means_wav(self, monkeypatch):
+        monkeypatch.setattr(audio_encoding, "ffmpeg_path", lambda: None)
+
+        assert choose_format(["opus"]) == "wav"
+
+
+class TestEncodedAudio:
+    """Test the cached encode path"""
+
+    async def test_encode_is_cached_next_to_source(self, fake_ffmpeg, tmp_path):
+        source = tmp_path / "turn.wav"
+        source.write_bytes(b"RIFF")
+
+        path, media_type = await get_encoded_audio(source, "webm")
+
+        assert path == tmp_path / "turn.enc.webm"  # Never the raw upload turn.webm
+        assert path.read_bytes() == b"encoded"
+        assert media_type == "audio/webm; codecs=opus"
+        assert cached_encoding(source, "webm") == path
+        assert not audio_encoding._encode_locks
+
+    async def test_concurrent_requests_share_one_encode(self, fake_ffmpeg, tmp_path, monkeypatch):
+        """Several requests for the same file start a single ffmpeg process"""
+        source = tmp_path / "turn.wav"
+        source.write_bytes(b"RIFF")
+        calls = []
+        real_exec = asyncio.create_subprocess_exec
+
+        async def counting_exec(*args, **kwargs):
+            calls.append(args)
+            return await real_exec(*args, **kwargs)
+
+        monkeypatch.setattr(asyncio, "create_subprocess_exec", counting_exec)
+
+        results = await asyncio.gather(*(get_encoded_audio(source, "opus") for _ in range(4)))
+
+        assert {path for path, _ in results} == {tmp_path / "turn.enc.opus"}
+        assert len(calls) == 1
+
+    async def test_failed_encode_releases_lock(self, tmp_path, monkeypatch):
+        script = tmp_path / "ffmpeg"
+        script.write_text("#!/bin/sh\necho broken >&2\nexit 1\n")
+        script.chmod(script.stat().st_mode | stat.S_IEXEC)
+        monkeypatch.setattr(audio_encoding, "ffmpeg_path", lambda: str(script))
+        source = tmp_path / "turn.wav"
+        source.write_bytes(b"RIFF")
+
+        with pytest.raises(AudioEncodingError, match="broken"):
+            await encode_audio(source, "opus")
+
+        assert not audio_encoding._encode_locks
+        assert list(tmp_path.glob("*.tmp")) == []
+
+    async def test_cancelled_encode_kills_ffmpeg(self, tmp_path, monkeypatch):
+        """A caller going away leaves neither the process nor a partial file"""
+        script = tmp_path / "ffmpeg"
+        script.write_text('#!/bin/sh\nfor last; do :; done\nprintf partial > "$last"\nexec sleep 30\n')
+        script.chmod(script.stat().st_mode | stat.S_IEXEC)
+        monkeypatch.setattr(audio_encoding, "ffmpeg_path", lambda: str(script))
+        source = tmp_path / "turn.wav"
+        source.write_bytes(b"RIFF")
+
+        task = asyncio.create_task(encode_audio(source, "opus"))
+        await asyncio.sleep(0.3)
+        task.cancel()
+        await asyncio.wait({task}, timeout=5)
+
+        assert task.cancelled()
+        assert list(tmp_path.glob("*.tmp")) == []
+        assert not (tmp_path / "turn.enc.opus").exists()
+        assert not audio_encoding._encode_locks
+
+    async def test_compressed_source_is_served_as_is(self, tmp_path):
+        """URLs sent to Opus clients point at the encoded file itself"""
+        source = tmp_path / "turn.opus"
+        source.write_bytes(b"OggS")
+
+        path, media_type = await get_encoded_audio(source, "wav")
+
+        assert path == source
+        assert media_type == "audio/ogg; codecs=opus"
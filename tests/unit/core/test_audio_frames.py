@@ -0,0 +1,130 @@
+"""
+Unit Tests for binary WebSocket audio frames
+
+Header parsing, sequence checks and the preallocated audio buffer.
+"""
+
+import wave
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from avatar.core.audio_frames import (
+    CODEC_CONTAINER,
+    CODEC_PCM16,
+    FRAME_HEADER,
+    AudioBuffer,
+    AudioFrameError,
+    build_audio_frame,
+    parse_audio_frame,
+    read_pcm16_wav,
+    split_pcm,
+)
+
+
+class TestFrameParsing:
+    """Test the frame header"""
+
+    def test_round_trip(self):
+        """Header fields and payload survive build/parse"""
+        frame = parse_audio_frame(build_audio_frame(b"\x01\x02\x03", sequence=7, codec=CODEC_PCM16))
+
+        assert frame.sequence == 7
+        assert frame.codec == CODEC_PCM16
+        assert bytes(frame.payload) == b"\x01\x02\x03"
+
+    @pytest.mark.parametrize("data", [
+        b"\x01\x00",                                 # Shorter than the header
+        FRAME_HEADER.pack(2, CODEC_CONTAINER, 0, 0),  # Unknown version
+        FRAME_HEADER.pack(1, 99, 0, 0),               # Unknown codec
+    ])
+    def test_malformed_frames(self, data):
+        with pytest.raises(AudioFrameError):
+            parse_audio_frame(data)
+
+
+class TestAudioBuffer:
+    """Test sequencing and buffer growth"""
+
+    def test_frames_append_in_order(self):
+        """Payloads are concatenated; capacity grows past the initial size"""
+        buffer = AudioBuffer(initial_capacity=4)
+        for sequence, payload in enumerate([b"abc", b"defg", b"h"]):
+            frame = parse_audio_frame(build_audio_frame(payload, sequence))
+            buffer.check_frame(frame)
+            buffer.append(frame.payload)
+
+        assert buffer.getvalue() == b"abcdefgh"
+        assert len(buffer) == 8
+        assert buffer.chunk_count == 3
+        assert buffer.capacity >= 8
+
+    def test_sequence_gap_is_rejected(self):
+        """A missing frame would corrupt the audio"""
+        buffer = AudioBuffer()
+        buffer.check_frame(parse_audio_frame(build_audio_frame(b"a", 0)))
+
+        with pytest.raises(AudioFrameError):
+            buffer.check_frame(parse_audio_frame(build_audio_frame(b"c", 2)))
+
+    def test_codec_change_is_rejected(self):
+        buffer = AudioBuffer()
+        buffer.check_frame(parse_audio_frame(build_audio_frame(b"a", 0, CODEC_PCM16)))
+
+        with pytest.raises(AudioFrameError):
+            buffer.check_frame(parse_audio_frame(build_audio_frame(b"b", 1, CODEC_CONTAINER)))
+
+        assert buffer.audio_format == "pcm_s16le"
+
+    def test_clear_keeps_capacity(self):
+        """The next turn reuses the allocation and restarts the sequence"""
+        buffer = AudioBuffer(initial_capacity=16)
+        assert buffer.capacity == 0  # Idle connections hold no buffer
+
+        buffer.check_frame(parse_audio_frame(build_audio_frame(b"x" * 10, 0, CODEC_PCM16)))
+        buffer.append(b"x" * 10)
+        buffer.clear()
+
+        assert not buffer
+        assert buffer.capacity == 16
+        assert buffer.codec is None
+        buffer.check_frame(parse_audio_frame(build_audio_frame(b"y", 0)))
+
+
+class TestDownstreamFrames:
+    """Test cutting synthesized WAV files into frames"""
+
+    def test_wav_is_split_on_sample_boundaries(self, tmp_path):
+        """24kHz mono: 0.2s frames are 9600 bytes, the tail frame is shorter"""
+        path = tmp_path / "tts.wav"
+        with wave.open(str(path), "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(24000)
+            f.writeframes(b"\x01\x00" * 12000)  # 0.5s
+
+        pcm, sample_rate, channels = read_pcm16_wav(path)
+        frames = list(split_pcm(pcm, sample_rate, channels))
+
+        assert sample_rate == 24000
+        assert [len(frame) for frame in frames] == [9600, 9600, 4800]
+        assert b"".join(frames) == pcm
+
+    def test_non_pcm16_wav_is_rejected(self, tmp_path):
+        """8-bit or non-WAV files fall back to the URL"""
+        path = tmp_path / "tts.wav"
+        with wave.open(str(path), "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(1)
+            f.setframerate(16000)
+            f.writeframes(b"\x80" * 100)
+
+        with pytest.raises(AudioFrameError):
+            read_pcm16_wav(path)
+
+        path.write_bytes(b"not a wav")
+        with pytest.raises(AudioFrameError):
+            read_pcm16_wav(path)
@@ -13,7 +13,16 @@ from pathlib import Path
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
 
-from avatar.core.audio_utils import convert_to_wav, validate_audio_for_whisper
+from avatar.core import audio_utils
+from avatar.core.audio_utils import (
+    PCM_FORMAT,
+    convert_batch_to_wav,
+    convert_batch_to_wav_async,
+    convert_to_wav,
+    decode_audio_bytes,
+    save_wav,
+    validate_audio_for_whisper,
+)
 from avatar.core.config import config
 
 
@@ -113,6 +122,118 @@ class TestAudioUtilsReal:
         assert metadata['converted_channels'] == 2
 
 
+class TestInMemoryAudio:
+    """Test in-memory decode path (no intermediate WAV)"""
+
+    def test_decode_audio_bytes_real_file(self, tmp_path):
+        """Decoding bytes gives float32 mono samples at the target rate"""
+        input_file = config.AUDIO_RAW / "test_sample.wav"
+        if not input_file.exists():
+            pytest.skip("No test audio file")
+
+        samples = decode_audio_bytes(input_file.read_bytes(), target_sample_rate=16000)
+
+        assert samples.ndim == 1
+        assert samples.dtype.name == "float32"
+        assert len(samples) > 16000 * 0.1
+
+    def test_save_wav_roundtrip(self, tmp_path):
+        """Samples written with save_wav decode back to the same length"""
+        import numpy as np
+
+        samples = np.sin(np.linspace(0, 440 * 2 * np.pi, 16000)).astype(np.float32) * 0.5
+        output = save_wav(samples, tmp_path / "tone.wav", sample_rate=16000)
+
+        decoded = decode_audio_bytes(output.read_bytes(), target_sample_rate=16000)
+
+        assert len(decoded) == len(samples)
+        assert validate_audio_for_whisper(output) is True
+
+    def test_decode_raw_pcm(self):
+        """Headerless PCM from binary frames is converted without a decoder"""
+        import numpy as np
+
+        pcm = np.array([0, 16384, -32768, 32767], dtype="<i2").tobytes()
+
+        samples = decode_audio_bytes(pcm, target_sample_rate=16000, format=PCM_FORMAT)
+
+        assert samples.dtype.name == "float32"
+        np.testing.assert_allclose(samples, [0.0, 0.5, -1.0, 32767 / 32768])
+
+    def test_decode_invalid_bytes(self):
+        """Garbage input raises RuntimeError"""
+        with pytest.raises(RuntimeError):
+            decode_audio_bytes(b"not audio at all")
+
+
+class TestBatchConversion:
+    """Test bulk conversion (one resampler call per source sample rate)"""
+
+    @staticmethod
+    def _tone(path: Path, sample_rate: int, seconds: float) -> Path:
+        import numpy as np
+
+        t = np.arange(int(sample_rate * seconds)) / sample_rate
+        samples = (np.sin(2 * np.pi * 440 * t) * 0.5).astype(np.float32)
+        return save_wav(samples, path, sample_rate=sample_rate)
+
+    @pytest.fixture
+    def jobs(self, tmp_path):
+        clips = [("a", 48000, 0.5), ("b", 44100, 0.3), ("c", 48000, 0.2), ("d", 16000, 0.4)]
+        return [
+            (self._tone(tmp_path / "in" / f"{name}.wav", sr, seconds),
+             tmp_path / "out" / f"{name}.wav")
+            for name, sr, seconds in clips
+        ]
+
+    def test_groups_by_sample_rate(self, jobs, monkeypatch):
+        """Clips sharing a sample rate are resampled in one call; 16kHz clips skip it"""
+        calls = []
+        real_get_resampler = audio_utils.get_resampler
+
+        def counting_get_resampler(orig_sample_rate, target_sample_rate):
+            calls.append(orig_sample_rate)
+            return real_get_resampler(orig_sample_rate, target_sample_rate)
+
+        monkeypatch.setattr(audio_utils, "get_resampler", counting_get_resampler)
+
+        convert_batch_to_wav(jobs)
+
+        assert sorted(calls) == [44100, 48000]
+
+    def test_writes_each_output_in_order(self, jobs):
+        """Every clip gets its own 16kHz mono file with its own duration"""
+        results = convert_batch_to_wav(jobs)
+
+        assert [path for path, _ in results] == [output for _, output in jobs]
+        expected = [(48000, 0.5), (44100, 0.3), (48000, 0.2), (16000, 0.4)]
+        for (output, metadata), (orig_sr, seconds) in zip(results, expected):
+            assert output.exists()
+            assert validate_audio_for_whisper(output) is True
+            assert metadata["original_sample_rate"] == orig_sr
+            assert metadata["converted_sample_rate"] == 16000
+            assert metadata["converted_channels"] == 1
+            # Padding from batching is trimmed back to each clip's length
+            assert metadata["converted_duration_sec"] == pytest.approx(seconds, abs=0.01)
+
+    @pytest.mark.asyncio
+    async def test_async_wrapper(self, jobs):
+        """Async wrapper returns the same results as the blocking call"""
+        results = await convert_batch_to_wav_async(jobs)
+
+        assert len(results) == len(jobs)
+        assert all(path.exists() for path, _ in results)
+
+    def test_missing_input(self, jobs, tmp_path):
+        """A missing clip fails the batch before anything is written"""
+        jobs.append((tmp_path / "missing.wav", tmp_path / "out" / "missing.wav"))
+
+        with pytest.raises(FileNotFoundError):
+            convert_batch_to_wav(jobs)
+
+        assert not (tmp_path / "out").exists()
+
+
 class TestAudioUtilsErrorHandling:
     """Test audio utils error handling (Real scenarios)"""
 
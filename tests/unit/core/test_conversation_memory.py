@@ -0,0 +1,103 @@
+"""
+Conversation Memory Tests
+
+Tests token-budgeted history trimming and prompt prefix stability.
+Uses a character counter instead of a real tokenizer.
+"""
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from avatar.core.conversation_memory import (
+    MESSAGE_OVERHEAD_TOKENS,
+    ConversationMemory,
+    estimate_tokens,
+)
+
+
+def char_count(text: str) -> int:
+    return len(text)
+
+
+def turn_tokens(user: str, assistant: str) -> int:
+    return len(user) + len(assistant) + 2 * MESSAGE_OVERHEAD_TOKENS
+
+
+class TestConversationMemory:
+    """Test history window behaviour"""
+
+    def test_messages_include_previous_turns(self):
+        """Earlier turns come before the new message, system prompt first"""
+        memory = ConversationMemory(count_tokens=char_count)
+        memory.add_turn("你好", "你好！有什麼可以幫你？")
+
+        messages = memory.build_messages("今天天氣如何？", system_prompt="persona")
+
+        assert messages == [
+            {"role": "system", "content": "persona"},
+            {"role": "user", "content": "你好"},
+            {"role": "assistant", "content": "你好！有什麼可以幫你？"},
+            {"role": "user", "content": "今天天氣如何？"},
+        ]
+
+    def test_trim_to_low_watermark(self):
+        """Going over budget drops oldest turns down to the trim target, not just one"""
+        budget = 5 * turn_tokens("u" * 10, "a" * 10)
+        memory = ConversationMemory(token_budget=budget, max_turns=100, count_tokens=char_count)
+
+        for i in range(5):
+            assert memory.add_turn(f"u{i:09d}", "a" * 10) == []
+
+        evicted = memory.add_turn("u000000005", "a" * 10)
+
+        assert [turn.user for turn in evicted] == ["u000000000", "u000000001", "u000000002"]
+        assert len(memory.turns) == 3
+        assert memory.history_tokens <= budget * 0.6
+
+    def test_prefix_stable_between_trims(self):
+        """After a trim, following turns only append to the prompt"""
+        budget = 4 * turn_tokens("u" * 10, "a" * 10)
+        memory = ConversationMemory(token_budget=budget, max_turns=100, count_tokens=char_count)
+        for i in range(5):
+            memory.add_turn(f"u{i:09d}", "a" * 10)
+
+        before = memory.build_messages("next")[:-1]
+        memory.add_turn("u000000005", "a" * 10)
+        after = memory.build_messages("next")[:-1]
+
+        assert after[:len(before)] == before
+
+    def test_max_turns_enforced(self):
+        """Turn count limit applies even when tokens are within budget"""
+        memory = ConversationMemory(token_budget=10_000, max_turns=4, count_tokens=char_count)
+        for i in range(5):
+            memory.add_turn(f"q{i}", f"a{i}")
+
+        assert len(memory.turns) <= 4
+        assert memory.turns[-1].user == "q4"
+
+    @pytest.mark.asyncio
+    async def test_summarize_evicted_turns(self):
+        """Evicted turns are folded into a summary system message"""
+        memory = ConversationMemory(token_budget=10_000, max_turns=2, count_tokens=char_count)
+        memory.add_turn("我叫小明", "你好小明")
+        memory.add_turn("q1", "a1")
+        evicted = memory.add_turn("q2", "a2")
+
+        async def fake_chat(messages):
+            assert "我叫小明" in messages[-1]["content"]
+            return " 使用者名叫小明 "
+
+        await memory.summarize(evicted, fake_chat)
+        messages = memory.build_messages("我是誰？")
+
+        assert messages[0]["role"] == "system"
+        assert messages[0]["content"].endswith("使用者名叫小明")
+
+    def test_estimate_tokens_cjk_and_ascii(self):
+        """CJK counts per character, ASCII about four characters per token"""
+        assert estimate_tokens("你好世界") == 4
+        assert estimate_tokens("hello world!") == 3
@@ -0,0 +1,119 @@
+"""
+Unit Tests for the sampled GPU telemetry
+
+Uses fake torch/NVML modules; no GPU needed.
+"""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from avatar.core import gpu_telemetry
+from avatar.core.gpu_telemetry import GB, GPUTelemetry, _Device
+
+
+class FakeNVML:
+    """One GPU with 20GB used; this process holds 15GB of it"""
+
+    NVML_TEMPERATURE_GPU = 0
+
+    def __init__(self, pid: int):
+        self.pid = pid
+
+    def nvmlDeviceGetMemoryInfo(self, handle):
+        return SimpleNamespace(used=20 * GB)
+
+    def nvmlDeviceGetComputeRunningProcesses(self, handle):
+        return [
+            SimpleNamespace(pid=self.pid, usedGpuMemory=15 * GB),
+            SimpleNamespace(pid=self.pid + 1, usedGpuMemory=5 * GB),
+        ]
+
+    def nvmlDeviceGetTemperature(self, handle, sensor):
+        return 61
+
+    def nvmlDeviceGetPowerUsage(self, handle):
+        return 120500
+
+    def nvmlDeviceGetUtilizationRates(self, handle):
+        return SimpleNamespace(gpu=42)
+
+
+@pytest.fixture
+def fake_torch(monkeypatch):
+    """torch.cuda reporting 2GB allocated / 4GB reserved"""
+    cuda = SimpleNamespace(
+        memory_allocated=lambda device_id: 2 * GB,
+        memory_reserved=lambda device_id: 4 * GB,
+    )
+    monkeypatch.setattr(gpu_telemetry, "torch", SimpleNamespace(cuda=cuda))
+
+
+def make_telemetry(nvml=None, interval: float = 1.0, history_size: int = 3) -> GPUTelemetry:
+    telemetry = GPUTelemetry(interval=interval, history_size=history_size)
+    telemetry._nvml = nvml
+    telemetry._devices = [_Device(device_id=0, name="Fake GPU", total_gb=24.0,
+                                  nvml_handle="handle" if nvml else None)]
+    return telemetry
+
+
+class TestGPUTelemetry:
+    """Test sampling sources, caching and the ring buffer"""
+
+    def test_nvml_reports_device_and_process_memory(self, fake_torch):
+        """NVML used memory and this process's share replace torch's numbers"""
+        telemetry = make_telemetry(nvml=FakeNVML(os.getpid()))
+
+        gpu = telemetry.sample().gpu(0)
+
+        assert telemetry.source == "nvml"
+        assert gpu.used_gb == 20.0
+        assert gpu.process_gb == 15.0
+        assert gpu.allocated_gb == 2.0
+        assert gpu.free_gb == 4.0
+        assert gpu.temperature_c == 61.0
+        assert gpu.power_usage_w == 120.5
+
+    def test_torch_fallback_uses_reserved(self, fake_torch):
+        """Without NVML, reserved memory counts as used"""
+        telemetry = make_telemetry()
+
+        gpu = telemetry.sample().gpu(0)
+
+        assert telemetry.source == "torch"
+        assert gpu.used_gb == 4.0
+        assert gpu.usage_percent == pytest.approx(4 / 24 * 100)
+
+    def test_snapshot_reuses_fresh_sample(self, fake_torch):
+        """Consumers read the cached sample instead of querying the GPU"""
+        telemetry = make_telemetry(interval=60.0)
+
+        first = telemetry.snapshot()
+        second = telemetry.snapshot()
+
+        assert first is second
+        assert telemetry.sample_count == 1
+
+    def test_stale_snapshot_is_resampled(self, fake_torch):
+        """An old sample triggers an on-demand sample"""
+        telemetry = make_telemetry()
+
+        first = telemetry.snapshot()
+        second = telemetry.snapshot(max_age=0.0)
+
+        assert second is not first
+        assert telemetry.on_demand_samples == 2
+
+    def test_ring_buffer_keeps_latest(self, fake_torch):
+        """History is capped at history_size snapshots"""
+        telemetry = make_telemetry(history_size=3)
+
+        snapshots = [telemetry.sample() for _ in range(5)]
+
+        assert list(telemetry.history) == snapshots[-3:]
+        assert telemetry.get_stats()["history_size"] == 3
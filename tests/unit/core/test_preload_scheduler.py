@@ -0,0 +1,79 @@
+"""
+Preload Scheduler Tests
+
+Tests concurrency and ordering of model preload tasks with sleep-based
+fake loaders.
+"""
+
+import asyncio
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from avatar.core.preload_scheduler import PreloadTask, device_key, run_preload_tasks
+
+
+def sleeper(seconds: float, fail: bool = False):
+    async def load():
+        await asyncio.sleep(seconds)
+        if fail:
+            raise RuntimeError("load failed")
+    return load
+
+
+class TestPreloadScheduler:
+    """Test concurrent, device-ordered loading"""
+
+    @pytest.mark.asyncio
+    async def test_different_devices_overlap(self):
+        """CPU and separate GPUs load at the same time"""
+        timeline = await run_preload_tasks([
+            PreloadTask("stt", sleeper(0.1), device="cpu"),
+            PreloadTask("llm", sleeper(0.1), device="cuda:0"),
+            PreloadTask("tts_fast", sleeper(0.1), device="cuda:1"),
+        ])
+
+        assert all(entry["start"] < 0.05 for entry in timeline.values())
+        assert max(entry["end"] for entry in timeline.values()) < 0.25
+
+    @pytest.mark.asyncio
+    async def test_same_gpu_loads_in_order(self):
+        """A later model on the same GPU waits for the earlier one"""
+        timeline = await run_preload_tasks([
+            PreloadTask("llm", sleeper(0.1), device="cuda:0"),
+            PreloadTask("tts_hq", sleeper(0.05), device="cuda"),
+        ])
+
+        assert timeline["tts_hq"]["after"] == ["llm"]
+        assert timeline["tts_hq"]["start"] >= timeline["llm"]["end"]
+
+    @pytest.mark.asyncio
+    async def test_failure_does_not_block_followers(self):
+        """A failed load is reported and still releases waiting tasks"""
+        timeline = await run_preload_tasks([
+            PreloadTask("llm", sleeper(0.01, fail=True), device="cuda:0"),
+            PreloadTask("tts_fast", sleeper(0.01), device="cuda:0"),
+        ])
+
+        assert timeline["llm"]["loaded"] is False
+        assert timeline["llm"]["error"] == "load failed"
+        assert timeline["tts_fast"]["loaded"] is True
+
+    @pytest.mark.asyncio
+    async def test_explicit_dependency_must_be_declared_first(self):
+        """Dependencies on later or unknown tasks are rejected (no cycles)"""
+        with pytest.raises(ValueError):
+            await run_preload_tasks([
+                PreloadTask("a", sleeper(0), after=("b",)),
+                PreloadTask("b", sleeper(0)),
+            ])
+
+    def test_device_key(self):
+        """CPU needs no ordering; bare cuda means GPU 0"""
+        assert device_key("cpu") is None
+        assert device_key(None) is None
+        assert device_key("cuda") == "cuda:0"
+        assert device_key("cuda:1") == "cuda:1"
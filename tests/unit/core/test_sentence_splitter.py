@@ -0,0 +1,71 @@
+"""
+Sentence Splitter Tests
+
+Tests incremental sentence splitting for streaming TTS.
+Pure string processing - no models needed.
+"""
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from avatar.core.sentence_splitter import SentenceSplitter
+
+
+def split_streamed(text: str, **kwargs) -> list[str]:
+    """Feed text one character at a time (worst-case token granularity)"""
+    splitter = SentenceSplitter(**kwargs)
+    sentences = []
+    for ch in text:
+        sentences.extend(splitter.feed(ch))
+    sentences.extend(splitter.flush())
+    return sentences
+
+
+class TestSentenceSplitter:
+    """Test sentence boundary detection"""
+
+    def test_cjk_punctuation_splits_without_spaces(self):
+        """CJK terminators end a sentence with no following whitespace"""
+        result = split_streamed("今天天氣很好。我們去公園散步吧！你覺得怎麼樣？")
+        assert result == ["今天天氣很好。", "我們去公園散步吧！", "你覺得怎麼樣？"]
+
+    def test_short_sentences_merge_forward(self):
+        """Sentences below min_chars are merged with the next one"""
+        result = split_streamed("好的。我馬上幫你查詢天氣。")
+        assert result == ["好的。我馬上幫你查詢天氣。"]
+
+    def test_ascii_terminator_requires_whitespace(self):
+        """Decimal points and version numbers do not split sentences"""
+        result = split_streamed("Pi is about 3.14 today. Version v1.2 is out!")
+        assert result == ["Pi is about 3.14 today.", "Version v1.2 is out!"]
+
+    def test_closers_stay_with_sentence(self):
+        """Closing quotes and repeated punctuation stay attached"""
+        result = split_streamed("他說「真的嗎？」然後笑了……接著離開了。")
+        assert result == ["他說「真的嗎？」", "然後笑了……", "接著離開了。"]
+
+    def test_long_text_cut_at_soft_break(self):
+        """Text without terminators is cut at a comma once max_chars is reached"""
+        splitter = SentenceSplitter(min_chars=2, max_chars=12)
+        result = splitter.feed("一二三四五六，七八九十一二三四")
+        assert result == ["一二三四五六，"]
+        assert splitter.flush() == ["七八九十一二三四"]
+
+    def test_boundary_waits_for_next_chunk(self):
+        """A terminator at the end of the buffer is not emitted until confirmed"""
+        splitter = SentenceSplitter()
+        assert splitter.feed("This is the end.") == []
+        assert splitter.feed(" Next") == ["This is the end."]
+        assert splitter.flush() == ["Next"]
+
+    def test_flush_empty(self):
+        """Flushing an empty splitter returns nothing"""
+        assert SentenceSplitter().flush() == []
+
+    def test_invalid_limits(self):
+        """max_chars below min_chars is rejected"""
+        with pytest.raises(ValueError):
+            SentenceSplitter(min_chars=10, max_chars=5)
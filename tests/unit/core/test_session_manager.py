@@ -13,6 +13,7 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
 
+from avatar.core.gpu_telemetry import GPUSample, TelemetrySnapshot
 from avatar.core.session_manager import SessionManager
 
 
@@ -39,58 +40,48 @@ class TestSessionManagerInitialization:
 
 
 class TestVRAMMonitoring:
-    """Test VRAM monitoring functionality"""
-
-    @patch('avatar.core.session_manager.torch')
-    def test_check_vram_available_no_cuda(self, mock_torch):
+    """Test VRAM checks read from the shared GPU telemetry snapshot"""
+
+    @staticmethod
+    def fake_telemetry(used_gb=None, total_gb=24.0):
+        """Telemetry with one GPU using `used_gb` (None: no CUDA)"""
+        gpus = () if used_gb is None else (GPUSample(
+            device_id=0, name="Fake GPU", total_gb=total_gb, used_gb=used_gb,
+            process_gb=used_gb, allocated_gb=used_gb, reserved_gb=used_gb
+        ),)
+        telemetry = MagicMock()
+        telemetry.snapshot.return_value = TelemetrySnapshot(timestamp=0.0, gpus=gpus, source="torch")
+        return telemetry
+
+    def test_check_vram_available_no_cuda(self):
         """Test VRAM check when CUDA not available returns True"""
-        mock_torch.cuda.is_available.return_value = False
-
-        manager = SessionManager()
-        result = manager._check_vram_available()
+        with patch('avatar.core.session_manager.get_gpu_telemetry', return_value=self.fake_telemetry()):
+            manager = SessionManager()
+            result = manager._check_vram_available()
 
         assert result is True
-        mock_torch.cuda.is_available.assert_called_once()
 
-    @patch('avatar.core.session_manager.torch')
-    def test_check_vram_available_under_threshold(self, mock_torch):
+    def test_check_vram_available_under_threshold(self):
         """Test VRAM check under 90% threshold returns True"""
-        mock_torch.cuda.is_available.return_value = True
-        mock_torch.cuda.memory_allocated.return_value = 8 * (1024**3)  # 8GB
-        mock_device_props = MagicMock()
-        mock_device_props.total_memory = 24 * (1024**3)  # 24GB
-        mock_torch.cuda.get_device_properties.return_value = mock_device_props
-
-        manager = SessionManager()
-        result = manager._check_vram_available()
+        with patch('avatar.core.session_manager.get_gpu_telemetry', return_value=self.fake_telemetry(8.0)):
+            manager = SessionManager()
+            result = manager._check_vram_available()
 
         assert result is True  # 33% < 90%
 
-    @patch('avatar.core.session_manager.torch')
-    def test_check_vram_available_over_threshold(self, mock_torch):
+    def test_check_vram_available_over_threshold(self):
         """Test VRAM check over 90% threshold returns False"""
-        mock_torch.cuda.is_available.return_value = True
-        mock_torch.cuda.memory_allocated.return_value = 22 * (1024**3)  # 22GB
-        mock_device_props = MagicMock()
-        mock_device_props.total_memory = 24 * (1024**3)  # 24GB
-        mock_torch.cuda.get_device_properties.return_value = mock_device_props
-
-        manager = SessionManager()
-        result = manager._check_vram_available()
+        with patch('avatar.core.session_manager.get_gpu_telemetry', return_value=self.fake_telemetry(22.0)):
+            manager = SessionManager()
+            result = manager._check_vram_available()
 
         assert result is False  # 92% > 90%
 
-    @patch('avatar.core.session_manager.torch')
-    def test_get_vram_status_returns_dict(self, mock_torch):
+    def test_get_vram_status_returns_dict(self):
         """Test get_vram_status returns properly formatted dict"""
-        mock_torch.cuda.is_available.return_value = True
-        mock_torch.cuda.memory_allocated.return_value = 8 * (1024**3)  # 8GB
-        mock_device_props = MagicMock()
-        mock_device_props.total_memory = 24 * (1024**3)  # 24GB
-        mock_torch.cuda.get_device_properties.return_value = mock_device_props
-
-        manager = SessionManager()
-        status = manager.get_vram_status()
+        with patch('avatar.core.session_manager.get_gpu_telemetry', return_value=self.fake_telemetry(8.0)):
+            manager = SessionManager()
+            status = manager.get_vram_status()
 
         assert isinstance(status, dict)
         assert 'total_gb' in status
@@ -100,6 +91,13 @@ class TestVRAMMonitoring:
         assert status['used_gb'] == 8.0
         assert status['usage_percent'] == pytest.approx(33.3, rel=1e-2)
 
+    def test_acceptance_rejects_only_when_all_gpus_exhausted(self):
+        """Connections are refused only when no GPU has headroom left"""
+        with patch('avatar.core.session_manager.get_gpu_telemetry', return_value=self.fake_telemetry(23.5)):
+            manager = SessionManager()
+            assert manager._evaluate_session_acceptance(manager._get_multi_gpu_vram_status(), "general") is False
+            assert manager._evaluate_session_acceptance([], "general") is True
+
 
 class TestSessionAcquisition:
     """Test session acquisition and release"""
@@ -0,0 +1,250 @@
+"""
+Session Queue Scheduler Tests
+
+Tests event-driven admission with a fake VRAM monitor (no GPU needed).
+"""
+
+import asyncio
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from avatar.core.session_queue import AdmissionRejected, QueueState, SessionQueue
+from avatar.core.vram_monitor import ServicePriority
+
+
+class FakeVRAMMonitor:
+    """Admits everything unless `can_handle` is False; counts GPU queries"""
+
+    service_priority = {
+        "stt": ServicePriority.CRITICAL,
+        "llm": ServicePriority.HIGH,
+        "tts_fast": ServicePriority.MEDIUM,
+        "tts_hq": ServicePriority.LOW,
+    }
+
+    def __init__(self, can_handle: bool = True):
+        self.can_handle = can_handle
+        self.status_queries = 0
+        self.listeners = []
+
+    def get_all_gpu_status(self):
+        self.status_queries += 1
+        return []
+
+    def predict_can_handle_service(self, service_type, vram_status=None):
+        return {"can_handle": self.can_handle, "recommended_gpu": None, "reasoning": []}
+
+    def add_change_listener(self, callback):
+        self.listeners.append(callback)
+
+    def remove_change_listener(self, callback):
+        if callback in self.listeners:
+            self.listeners.remove(callback)
+
+
+@pytest.fixture
+async def make_queue():
+    queues = []
+
+    def factory(max_concurrent: int = 4, can_handle: bool = True, stage_limits: dict = None) -> SessionQueue:
+        queue = SessionQueue(max_concurrent=max_concurrent, max_queue_size=16,
+                             stage_limits=stage_limits or {})
+        queue.vram_monitor = FakeVRAMMonitor(can_handle)
+        queues.append(queue)
+        return queue
+
+    yield factory
+
+    for queue in queues:
+        await queue.stop()
+
+
+class TestSessionQueueScheduling:
+    """Test heap ordering and event-driven wakeups"""
+
+    @pytest.mark.asyncio
+    async def test_enqueue_starts_immediately(self, make_queue):
+        """A free slot is filled on enqueue, without waiting for a poll tick"""
+        queue = make_queue()
+        await queue.start()
+
+        await queue.enqueue_session("s1", "stt")
+        await asyncio.sleep(0.01)
+
+        assert "s1" in queue.processing
+        assert queue.processing["s1"].wait_time_seconds < 0.05
+
+    @pytest.mark.asyncio
+    async def test_priority_order(self, make_queue):
+        """Higher priority is served first, FIFO within a priority"""
+        queue = make_queue(max_concurrent=1)
+
+        await queue.enqueue_session("hq", "tts_hq")
+        await queue.enqueue_session("llm-1", "llm")
+        await queue.enqueue_session("llm-2", "llm")
+        stt = await queue.enqueue_session("stt", "stt")
+
+        assert [s.session_id for s in queue.queue] == ["stt", "llm-1", "llm-2", "hq"]
+        assert queue.position_of("llm-2") == 2
+
+        await queue.start()
+        await asyncio.sleep(0.01)
+
+        assert stt.state == QueueState.PROCESSING
+        assert queue.waiting_count == 3
+
+    @pytest.mark.asyncio
+    async def test_one_gpu_query_per_round(self, make_queue):
+        """Admitting several sessions reads GPU status once"""
+        queue = make_queue(max_concurrent=3)
+        for i in range(3):
+            await queue.enqueue_session(f"s{i}", "llm")
+
+        await queue.start()
+        await asyncio.sleep(0.01)
+
+        assert len(queue.processing) == 3
+        assert queue.vram_monitor.status_queries == 1
+
+    @pytest.mark.asyncio
+    async def test_timeout_without_polling(self, make_queue):
+        """A blocked session expires at its deadline; the scheduler stays idle otherwise"""
+        queue = make_queue(can_handle=False)
+        await queue.start()
+
+        session = await queue.enqueue_session("s1", "llm", timeout=0.05)
+        await asyncio.sleep(0.15)
+
+        assert session.state == QueueState.REJECTED
+        assert session.error_reason == "timeout"
+        assert queue.stats["total_timeouts"] == 1
+        assert queue.stats["scheduling_rounds"] <= 4
+
+    @pytest.mark.asyncio
+    async def test_vram_change_wakes_scheduler(self, make_queue):
+        """A VRAM change notification re-evaluates blocked sessions"""
+        queue = make_queue(can_handle=False)
+        await queue.start()
+
+        session = await queue.enqueue_session("s1", "llm")
+        await asyncio.sleep(0.01)
+        assert session.state == QueueState.WAITING
+
+        queue.vram_monitor.can_handle = True
+        for callback in queue.vram_monitor.listeners:
+            callback()
+        await asyncio.sleep(0.01)
+
+        assert session.state == QueueState.PROCESSING
+
+    @pytest.mark.asyncio
+    async def test_cancel_waiting_session(self, make_queue):
+        """Cancelled sessions leave the queue and are never started"""
+        queue = make_queue(max_concurrent=1, can_handle=False)
+        session = await queue.enqueue_session("s1", "llm")
+
+        assert await queue.cancel_session("s1") is True
+        assert session.state == QueueState.CANCELLED
+        assert queue.queue == []
+        assert queue.waiting_count == 0
+
+
+class TestPipelineStages:
+    """Test per-stage slots held by the conversation pipeline"""
+
+    @pytest.mark.asyncio
+    async def test_stage_limit_is_per_service(self, make_queue):
+        """A full LLM stage blocks LLM work only; its slot passes on when released"""
+        queue = make_queue(stage_limits={"stt": 2, "llm": 1})
+        release = asyncio.Event()
+        order = []
+
+        async def hold_llm(session_id):
+            async with queue.stage(session_id, "llm"):
+                order.append(session_id)
+                await release.wait()
+
+        first = asyncio.create_task(hold_llm("a"))
+        second = asyncio.create_task(hold_llm("b"))
+        await asyncio.sleep(0.01)
+
+        async with queue.stage("c", "stt"):
+            assert order == ["a"]
+            assert queue.waiting_count == 1
+
+        release.set()
+        await asyncio.gather(first, second)
+
+        assert order == ["a", "b"]
+        assert queue.processing == {}
+        assert queue.stats["total_processed"] == 3
+
+    @pytest.mark.asyncio
+    async def test_same_session_holds_different_stages(self, make_queue):
+        """Streaming TTS overlaps the LLM stage of the same session"""
+        queue = make_queue(stage_limits={"llm": 1, "tts_fast": 1})
+
+        async with queue.stage("s1", "llm"):
+            async with queue.stage("s1", "tts_fast"):
+                assert set(queue.processing) == {"s1/llm", "s1/tts_fast"}
+
+    @pytest.mark.asyncio
+    async def test_stage_released_on_error(self, make_queue):
+        """An exception in the stage frees its slot"""
+        queue = make_queue(stage_limits={"llm": 1})
+
+        with pytest.raises(ValueError):
+            async with queue.stage("s1", "llm") as session:
+                raise ValueError("boom")
+
+        assert session.state == QueueState.REJECTED
+        assert session.error_reason == "boom"
+
+        async with queue.stage("s2", "llm"):
+            assert "s2/llm" in queue.processing
+
+    @pytest.mark.asyncio
+    async def test_stage_timeout_raises(self, make_queue):
+        """No slot within the timeout raises AdmissionRejected"""
+        queue = make_queue(stage_limits={"llm": 1})
+
+        async with queue.stage("s1", "llm"):
+            with pytest.raises(AdmissionRejected) as exc_info:
+                async with queue.stage("s2", "llm", timeout=0.05):
+                    pass
+
+        assert exc_info.value.reason == "timeout"
+        assert queue.stats["total_timeouts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_withdraws(self, make_queue):
+        """Cancelling a task waiting for a slot removes it from the queue"""
+        queue = make_queue(stage_limits={"llm": 1})
+
+        async def wait_for_slot():
+            async with queue.stage("s2", "llm"):
+                pass
+
+        async with queue.stage("s1", "llm"):
+            waiter = asyncio.create_task(wait_for_slot())
+            await asyncio.sleep(0.01)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+
+            assert queue.waiting_count == 0
+
+        await asyncio.sleep(0.01)
+        assert queue.processing == {}
+
+    @pytest.mark.asyncio
+    async def test_stage_skips_vram_prediction(self, make_queue):
+        """Resident-model stages are bound by their limit, not a VRAM prediction"""
+        queue = make_queue(can_handle=False, stage_limits={"llm": 1})
+
+        async with queue.stage("s1", "llm") as session:
+            assert session.state == QueueState.PROCESSING
@@ -0,0 +1,103 @@
+"""
+Unit Tests for the VRAM usage ring buffer
+"""
+
+import numpy as np
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from avatar.core.vram_history import UsageRingBuffer
+
+
+def brute_force(times, usage, now, seconds):
+    """Reference aggregates over a plain list"""
+    selected = [(t, u) for t, u in zip(times, usage) if t >= now - seconds]
+    t = np.array([s[0] for s in selected], dtype=np.float64)
+    u = np.array([s[1] for s in selected], dtype=np.float32).astype(np.float64)
+    slope = np.polyfit(t - t[0], u, 1)[0] * 60 if len(t) > 1 else 0.0
+    return {"count": len(u), "min": u.min(), "max": u.max(), "mean": u.mean(), "slope_per_minute": slope}
+
+
+class TestUsageRingBuffer:
+    """Test capacity, incremental windows and the slice fallback"""
+
+    def test_capacity_is_fixed(self):
+        """Old samples are overwritten once the buffer is full"""
+        buffer = UsageRingBuffer(capacity=10)
+
+        for i in range(25):
+            buffer.append(1000.0 + i, float(i))
+
+        times, usage = buffer.values_since(0)
+        assert len(buffer) == 10
+        assert usage.tolist() == [float(i) for i in range(15, 25)]
+        assert times[0] == 1015.0
+
+    def test_incremental_window_matches_brute_force(self):
+        """Configured windows agree with a full recomputation, across wrap-around"""
+        rng = np.random.default_rng(0)
+        buffer = UsageRingBuffer(capacity=500, windows_sec=(60, 300))
+        times, usage = [], []
+
+        for i in range(2000):
+            t, u = 1_700_000_000.0 + i, float(50 + 20 * np.sin(i / 50) + rng.normal())
+            buffer.append(t, u)
+            times.append(t)
+            usage.append(u)
+
+        now = times[-1]
+        for seconds in (60, 300):
+            stats = buffer.window_stats(seconds)
+            expected = brute_force(times, usage, now, seconds)
+            assert stats["count"] == expected["count"]
+            assert stats["min"] == pytest.approx(expected["min"])
+            assert stats["max"] == pytest.approx(expected["max"])
+            assert stats["mean"] == pytest.approx(expected["mean"], rel=1e-6)
+            assert stats["slope_per_minute"] == pytest.approx(expected["slope_per_minute"], rel=1e-4, abs=1e-6)
+
+    def test_unconfigured_window_uses_slice(self):
+        """Other window lengths are computed from the buffer slice"""
+        buffer = UsageRingBuffer(capacity=100, windows_sec=(60,))
+        times = [1000.0 + 2 * i for i in range(150)]
+        usage = [10.0 + 0.5 * i for i in range(150)]
+        for t, u in zip(times, usage):
+            buffer.append(t, u)
+
+        stats = buffer.window_stats(90)
+        expected = brute_force(times, usage, times[-1], 90)
+
+        assert stats["count"] == expected["count"] == 46
+        assert stats["min"] == pytest.approx(expected["min"])
+        assert stats["slope_per_minute"] == pytest.approx(15.0)
+
+    def test_window_at_newest_sample_is_incremental(self, monkeypatch):
+        """Without an explicit now, configured windows never rescan the buffer"""
+        buffer = UsageRingBuffer(capacity=1000, windows_sec=(300,))
+        for i in range(900):
+            buffer.append(1000.0 + 0.5 * i, float(i % 100))
+
+        monkeypatch.setattr(buffer, "values_since", lambda cutoff: pytest.fail("rescanned the buffer"))
+        stats = buffer.window_stats(300)
+
+        assert stats["count"] == 601  # 1149.5 .. 1449.5
+        assert stats["current"] == 99.0
+
+    def test_stale_window_falls_back_to_now(self):
+        """Samples older than now - window are excluded even without new samples"""
+        buffer = UsageRingBuffer(capacity=100, windows_sec=(60,))
+        for i in range(30):
+            buffer.append(1000.0 + i, float(i))
+
+        assert buffer.window_stats(60, now=1080.0)["count"] == 10
+        assert buffer.window_stats(60, now=2000.0) is None
+
+    def test_bucket_counts(self):
+        """Threshold distribution counts each sample once"""
+        buffer = UsageRingBuffer(capacity=100)
+        for i, u in enumerate([10.0, 65.0, 75.0, 90.0, 99.0]):
+            buffer.append(1000.0 + i, u)
+
+        assert buffer.bucket_counts(60, [60.0, 70.0, 85.0], now=1004.0) == [1, 1, 1, 2]
@@ -0,0 +1,195 @@
+"""
+Unit Tests for the shared heartbeat scheduler
+
+Timer wheel batching, pong timeouts and the monitors registered with it.
+"""
+
+import asyncio
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from avatar.core import websocket_heartbeat
+from avatar.core.websocket_heartbeat import (
+    HeartbeatConfig,
+    HeartbeatScheduler,
+    HeartbeatState,
+    WebSocketHeartbeatMonitor,
+)
+from avatar.core.websocket_reconnect import (
+    ConnectionState,
+    DisconnectReason,
+    ReconnectionConfig,
+    WebSocketReconnectManager,
+)
+
+TICK = 0.01
+
+
+class FakeWebSocket:
+    """Answers pings immediately unless told to stay silent or fail"""
+
+    def __init__(self, answer: bool = True, error: Exception = None):
+        self.answer = answer
+        self.error = error
+        self.pings = 0
+
+    async def ping(self):
+        self.pings += 1
+        if self.error:
+            raise self.error
+        waiter = asyncio.get_running_loop().create_future()
+        if self.answer:
+            waiter.set_result(None)
+        return waiter
+
+
+@pytest.fixture
+async def scheduler():
+    wheel = HeartbeatScheduler(tick_seconds=TICK, slots=16)
+    yield wheel
+    await wheel.shutdown()
+
+
+def recorder(results):
+    return lambda latency_ms, error: results.append((latency_ms, error))
+
+
+class TestHeartbeatScheduler:
+    """Test the timer wheel"""
+
+    async def test_connections_share_one_task(self, scheduler):
+        """Many idle connections add no tasks; each is pinged every interval"""
+        tasks_before = len(asyncio.all_tasks())
+        sockets = [FakeWebSocket() for _ in range(200)]
+        results = []
+        for ws in sockets:
+            scheduler.register(ws, interval=lambda: 0.05, timeout=0.02, on_result=recorder(results))
+
+        assert len(scheduler) == 200
+        assert len(asyncio.all_tasks()) == tasks_before + 1
+
+        await asyncio.sleep(0.2)  # Slack for a loaded loop: 3 intervals, 2 pings expected
+
+        assert all(ws.pings >= 2 for ws in sockets)
+        assert all(error is None for _, error in results)
+        assert scheduler.pings_sent >= 400
+
+    async def test_interval_beyond_one_revolution(self, scheduler):
+        """Delays longer than the wheel wait for their round"""
+        ws = FakeWebSocket()
+        scheduler.register(ws, interval=lambda: 0.25, timeout=0.02, on_result=lambda *args: None)
+
+        await asyncio.sleep(0.2)
+        assert ws.pings == 0
+
+        await asyncio.sleep(0.1)
+        assert ws.pings == 1
+
+    async def test_missing_pong_times_out(self, scheduler):
+        """The timeout check fails the ping and the next one is scheduled"""
+        ws = FakeWebSocket(answer=False)
+        results = []
+        scheduler.register(ws, interval=lambda: 0.02, timeout=0.03, on_result=recorder(results))
+
+        await asyncio.sleep(0.15)
+
+        assert results
+        assert all(latency is None and isinstance(error, asyncio.TimeoutError)
+                   for latency, error in results)
+        assert ws.pings >= 2
+
+    async def test_ping_error_is_reported(self, scheduler):
+        ws = FakeWebSocket(error=ConnectionError("closed"))
+        results = []
+        scheduler.register(ws, interval=lambda: 0.02, timeout=0.05, on_result=recorder(results))
+
+        await asyncio.sleep(0.05)
+
+        assert isinstance(results[0][1], ConnectionError)
+        assert scheduler.ping_failures >= 1
+
+    async def test_unregister_stops_pings(self, scheduler):
+        """The wheel task exits once nothing is registered"""
+        ws = FakeWebSocket()
+        entry = scheduler.register(ws, interval=lambda: 0.02, timeout=0.02, on_result=lambda *args: None)
+        await asyncio.sleep(0.05)
+
+        scheduler.unregister(entry)
+        scheduler.unregister(entry)
+        pings = ws.pings
+        await asyncio.sleep(0.05)
+
+        assert ws.pings == pings
+        assert len(scheduler) == 0
+        assert not scheduler.get_status()["running"]
+
+
+class TestHeartbeatMonitor:
+    """Test monitors driven by the scheduler"""
+
+    @pytest.fixture
+    def heartbeat_config(self):
+        return HeartbeatConfig(
+            interval_seconds=0.02,
+            timeout_seconds=0.02,
+            min_interval_seconds=0.01,
+            max_interval_seconds=0.05,
+            consecutive_failures_threshold=1
+        )
+
+    async def test_metrics_follow_pings(self, scheduler, heartbeat_config):
+        monitor = WebSocketHeartbeatMonitor(FakeWebSocket(), "s1", heartbeat_config, scheduler)
+
+        await monitor.start()
+        assert monitor.state == HeartbeatState.ACTIVE
+        await asyncio.sleep(0.1)
+        await monitor.stop()
+
+        assert monitor.metrics.successful_pings >= 2
+        assert monitor.is_healthy() is False  # Stopped
+        assert len(scheduler) == 0
+
+    async def test_failed_connection_leaves_the_wheel(self, scheduler, heartbeat_config):
+        """Two consecutive failures (threshold * 2) fail the monitor"""
+        lost = asyncio.Event()
+        ws = FakeWebSocket(answer=False)
+        monitor = WebSocketHeartbeatMonitor(ws, "s2", heartbeat_config, scheduler)
+        monitor.on_connection_lost = lost.set
+
+        await monitor.start()
+        await asyncio.wait_for(lost.wait(), timeout=1.0)
+        pings = ws.pings
+        await asyncio.sleep(0.05)
+
+        assert monitor.state == HeartbeatState.FAILED
+        assert monitor.metrics.timeout_pings == 2
+        assert ws.pings == pings
+        assert len(scheduler) == 0
+
+
+class TestReconnectHeartbeat:
+    """Test the reconnect manager's registration"""
+
+    async def test_failed_ping_disconnects(self, scheduler, monkeypatch):
+        monkeypatch.setattr(websocket_heartbeat, "_heartbeat_scheduler", scheduler)
+        manager = WebSocketReconnectManager(ReconnectionConfig(
+            heartbeat_interval_seconds=0.02,
+            heartbeat_timeout_seconds=0.02,
+            retriable_errors=set()
+        ))
+
+        await manager.handle_successful_connection(FakeWebSocket())
+        await manager.handle_successful_connection(FakeWebSocket(answer=False))
+        assert len(scheduler) == 1  # The new connection replaces the old one
+
+        await asyncio.sleep(0.1)
+
+        assert manager.last_disconnect_reason == DisconnectReason.TIMEOUT
+        assert manager.state == ConnectionState.FAILED
+        assert len(scheduler) == 0
+        assert not manager._disconnect_tasks  # Released once done
+        await manager.shutdown()
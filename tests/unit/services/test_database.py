@@ -0,0 +1,307 @@
+"""
+Unit Tests for DatabaseService
+
+Runs against a temporary SQLite file.
+"""
+
+import asyncio
+import sqlite3
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from avatar.services.database import (
+    _SESSION_SUMMARY_SELECT,
+    DatabaseService,
+    build_fts_query,
+    desegment_cjk,
+    segment_cjk,
+)
+
+
+# Same schema as scripts/setup/init_database.py
+CONVERSATIONS_SCHEMA = """
+CREATE TABLE conversations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    session_id TEXT NOT NULL,
+    turn_number INTEGER NOT NULL,
+    user_audio_path TEXT NOT NULL,
+    user_text TEXT NOT NULL,
+    ai_text TEXT NOT NULL,
+    ai_audio_fast_path TEXT,
+    ai_audio_hq_path TEXT,
+    voice_profile_id INTEGER,
+    created_at INTEGER NOT NULL,
+    UNIQUE(session_id, turn_number)
+);
+CREATE TABLE voice_profiles_v2 (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT,
+    reference_text TEXT,
+    audio_path TEXT NOT NULL,
+    file_size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "app.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(CONVERSATIONS_SCHEMA)
+    conn.close()
+    return path
+
+
+@pytest.fixture
+async def db(db_path):
+    service = DatabaseService(db_path=db_path)
+    await service.connect()
+    yield service
+    await service.close()
+
+
+async def save_turn(db: DatabaseService, session_id: str, turn: int, user_text: str, ai_text: str):
+    return await db.save_conversation(
+        session_id=session_id,
+        turn_number=turn,
+        user_audio_path=f"audio/raw/{session_id}_{turn}.wav",
+        user_text=user_text,
+        ai_text=ai_text,
+    )
+
+
+class TestFTSQuery:
+    """Test CJK segmentation and query building"""
+
+    def test_segment_round_trip(self):
+        """CJK characters become single tokens; Latin words stay intact"""
+        segmented = segment_cjk("今天天氣 good")
+
+        assert segmented.split() == ["今", "天", "天", "氣", "good"]
+        assert desegment_cjk(segmented).strip() == "今天天氣 good"
+
+    def test_build_query_quotes_terms(self):
+        """Terms become ANDed prefix phrases; FTS syntax in input is literal"""
+        assert build_fts_query('天氣 "hello" OR') == '"天 氣"* """hello"""* "OR"*'
+        assert build_fts_query("!!! ...") is None
+
+
+class TestConversationSearch:
+    """Test the FTS5 index, triggers and ranking"""
+
+    async def test_cjk_substring_search(self, db):
+        """Two-character Chinese words inside longer runs are found"""
+        await save_turn(db, "s1", 1, "今天天氣很好", "是的，適合出門散步")
+        await save_turn(db, "s2", 1, "明天會下雨嗎", "可能會有陣雨")
+
+        results = await db.search_conversations("天氣")
+
+        assert [r["session_id"] for r in results] == ["s1"]
+        assert "天氣" in results[0]["matched_text"]
+        assert await db.count_search_results("天氣") == 1
+        assert await db.count_search_results("散步") == 1
+
+    async def test_latin_prefix_and_ranking(self, db):
+        """Prefix terms match; the session with more matches ranks first"""
+        await save_turn(db, "s1", 1, "tell me about python", "python is a language")
+        await save_turn(db, "s2", 1, "what is a snake", "a python is a snake")
+        await save_turn(db, "s2", 2, "thanks", "you are welcome")
+
+        results = await db.search_conversations("pyth")
+
+        assert [r["session_id"] for r in results] == ["s1", "s2"]
+        assert results[0]["turn_count"] == 1
+
+    async def test_delete_and_update_keep_index_in_sync(self, db, db_path):
+        """Triggers follow deletes and text updates"""
+        await save_turn(db, "s1", 1, "hello world", "hi")
+        await save_turn(db, "s2", 1, "hello again", "hi")
+
+        await db.delete_conversation_session("s1")
+        await db._write("UPDATE conversations SET user_text = 'goodbye' WHERE session_id = 's2'")
+
+        assert await db.count_search_results("hello") == 0
+        assert await db.count_search_results("good") == 1
+
+    async def test_other_writers_need_no_custom_function(self, db, db_path):
+        """Connections without avatar_fts_segment can still write turns"""
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "INSERT INTO conversations (session_id, turn_number, user_audio_path, user_text, ai_text, created_at) "
+            "VALUES ('cli', 1, 'a.wav', 'imported turn', 'ok', 1)"
+        )
+        conn.execute("UPDATE conversations SET ai_text = 'edited' WHERE session_id = 'cli'")
+        conn.commit()
+        conn.close()
+
+        assert await db.count_search_results("imported") == 1
+        assert await db.count_search_results("edited") == 1
+
+    async def test_migration_backfills_existing_rows(self, db_path):
+        """Turns saved before the index existed are searchable after connect"""
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "INSERT INTO conversations (session_id, turn_number, user_audio_path, user_text, ai_text, created_at) "
+            "VALUES ('old', 1, 'a.wav', '舊的對話內容', 'ok', 1)"
+        )
+        conn.commit()
+        conn.close()
+
+        service = DatabaseService(db_path=db_path)
+        await service.connect()
+        try:
+            results = await service.search_conversations("對話")
+            assert [r["session_id"] for r in results] == ["old"]
+        finally:
+            await service.close()
+
+
+class TestConnectionPool:
+    """Test WAL mode, the reader pool and group commit"""
+
+    async def test_wal_mode_and_readers(self, db):
+        """The database runs in WAL mode with a read-only pool"""
+        row = await db._fetchone("PRAGMA journal_mode")
+        assert row[0] == "wal"
+
+        with pytest.raises(sqlite3.OperationalError):
+            async with db._reader() as conn:
+                await conn.execute("DELETE FROM conversations")
+
+    async def test_concurrent_saves_share_commits(self, db):
+        """Writes queued together are committed in one batch"""
+        ids = await asyncio.gather(*(
+            save_turn(db, f"s{i}", 1, f"message {i}", "reply") for i in range(20)
+        ))
+
+        assert len(set(ids)) == 20
+        assert db.write_count == 20
+        assert db.write_batches < 20
+        assert await db.count_conversation_turns() == 20
+
+    async def test_failed_write_does_not_fail_batch(self, db):
+        """A constraint violation only fails its own write"""
+        await save_turn(db, "s1", 1, "first", "reply")
+
+        results = await asyncio.gather(
+            save_turn(db, "s1", 1, "duplicate turn", "reply"),
+            save_turn(db, "s1", 2, "second", "reply"),
+            return_exceptions=True,
+        )
+
+        assert isinstance(results[0], sqlite3.IntegrityError)
+        assert isinstance(results[1], int)
+        assert await db.count_conversation_turns() == 2
+
+    async def test_close_flushes_queued_writes(self, db_path):
+        """Writes still queued at close are committed"""
+        service = DatabaseService(db_path=db_path, commit_interval_ms=50)
+        await service.connect()
+
+        pending = asyncio.ensure_future(save_turn(service, "s1", 1, "late", "reply"))
+        await asyncio.sleep(0)
+        await service.close()
+
+        assert isinstance(await pending, int)
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("SELECT COUNT(*) FROM conversations").fetchone()[0] == 1
+        conn.close()
+
+
+class TestSessionSummary:
+    """Test the conversation_sessions summary table"""
+
+    async def test_summary_follows_saved_turns(self, db):
+        """Turn count, timestamps and first message track inserts"""
+        await save_turn(db, "s1", 2, "second", "reply")
+        await save_turn(db, "s1", 1, "first", "reply")
+        await save_turn(db, "s2", 1, "other", "reply")
+
+        sessions = {s["session_id"]: s for s in await db.get_recent_conversation_sessions()}
+
+        assert sessions["s1"]["turn_count"] == 2
+        assert sessions["s1"]["first_user_message"] == "first"
+        assert await db.count_conversation_sessions() == 2
+        assert await db.count_conversation_turns() == 3
+        assert await db.count_recent_sessions(hours=24) == 2
+
+    async def test_delete_rebuilds_summary(self, db):
+        """Deleting turns updates or removes the session row"""
+        await save_turn(db, "s1", 1, "first", "reply")
+        await save_turn(db, "s1", 2, "second", "reply")
+        await save_turn(db, "s2", 1, "other", "reply")
+
+        await db._write("DELETE FROM conversations WHERE session_id = 's1' AND turn_number = 1")
+        await db.delete_conversation_session("s2")
+
+        sessions = await db.get_recent_conversation_sessions()
+        assert [(s["session_id"], s["turn_count"], s["first_user_message"]) for s in sessions] == [
+            ("s1", 1, "second")
+        ]
+
+    async def test_deletes_match_a_rebuild(self, db, db_path):
+        """Per-turn adjustments agree with rebuilding from the remaining turns"""
+        conn = sqlite3.connect(db_path)
+        conn.executemany(
+            "INSERT INTO conversations (session_id, turn_number, user_audio_path, user_text, "
+            "ai_text, voice_profile_id, created_at) VALUES (?, ?, 'a.wav', ?, 'ok', ?, ?)",
+            [("s1", turn, f"turn {turn}", turn % 3, 100 + turn // 2) for turn in range(1, 9)]
+            + [("s2", turn, f"other {turn}", None, 50 + turn) for turn in range(1, 4)],
+        )
+        for where in ("turn_number = 1", "turn_number = 8", "turn_number IN (4, 5)", "turn_number = 2"):
+            conn.execute(f"DELETE FROM conversations WHERE session_id = 's1' AND {where}")
+        conn.execute("DELETE FROM conversations WHERE session_id = 's2'")
+        conn.commit()
+
+        expected = conn.execute(f"{_SESSION_SUMMARY_SELECT} GROUP BY c.session_id").fetchall()
+        actual = conn.execute("SELECT * FROM conversation_sessions").fetchall()
+        conn.close()
+
+        assert actual == expected
+        assert expected[0][:4] == ("s1", 3, 3, "turn 3")
+
+    async def test_migration_backfills_sessions(self, db_path):
+        """Sessions saved before the summary existed are listed after connect"""
+        conn = sqlite3.connect(db_path)
+        conn.executemany(
+            "INSERT INTO conversations (session_id, turn_number, user_audio_path, user_text, ai_text, created_at) "
+            "VALUES (?, ?, 'a.wav', ?, 'ok', ?)",
+            [("old", 1, "hello", 10), ("old", 2, "again", 20), ("older", 1, "hi", 5)],
+        )
+        conn.commit()
+        conn.close()
+
+        service = DatabaseService(db_path=db_path)
+        await service.connect()
+        try:
+            sessions = await service.get_recent_conversation_sessions()
+            assert [(s["session_id"], s["turn_count"], s["first_created_at"], s["last_created_at"])
+                    for s in sessions] == [("old", 2, 10, 20), ("older", 1, 5, 5)]
+        finally:
+            await service.close()
+
+
+class TestTurnLookup:
+    """Test the single-turn lookup"""
+
+    async def test_turn_lookup_uses_index(self, db):
+        """One turn is fetched through the (session_id, turn_number) index"""
+        await save_turn(db, "s1", 1, "first", "reply")
+        await save_turn(db, "s1", 2, "second", "reply")
+
+        turn = await db.get_conversation_turn("s1", 2)
+        plan = await db._fetchall(
+            "EXPLAIN QUERY PLAN SELECT * FROM conversations WHERE session_id = ? AND turn_number = ?",
+            ("s1", 2),
+        )
+
+        assert turn["user_text"] == "second"
+        assert await db.get_conversation_turn("s1", 3) is None
+        assert "(session_id=? AND turn_number=?)" in plan[0]["detail"]
@@ -0,0 +1,90 @@
+"""
+Unit Tests for VLLMProvider request abort
+
+Runs against a stand-in engine; no model is loaded.
+"""
+
+import asyncio
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from avatar.services.llm_local import VLLMProvider
+
+
+class _Output:
+    def __init__(self, text: str):
+        self.text = text
+        self.token_ids = list(range(len(text)))
+
+
+class _RequestOutput:
+    def __init__(self, text: str):
+        self.outputs = [_Output(text)]
+        self.metrics = None
+
+
+class FakeEngine:
+    """Yields one character per step until aborted"""
+
+    def __init__(self, text: str = "hello world", step_sec: float = 0.0):
+        self.text = text
+        self.step_sec = step_sec
+        self.aborted: list[str] = []
+
+    async def generate(self, inputs, sampling_params, request_id):
+        for end in range(1, len(self.text) + 1):
+            await asyncio.sleep(self.step_sec)
+            yield _RequestOutput(self.text[:end])
+
+    async def abort(self, request_id: str):
+        self.aborted.append(request_id)
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    service = VLLMProvider(model_path="test/model")
+    service._engine = FakeEngine()
+    monkeypatch.setattr(service, "_prompt_inputs", lambda prompt: ({"prompt": prompt}, None, None))
+    monkeypatch.setattr(service, "_record_ttft", lambda *args: None)
+    return service
+
+
+class TestRequestAbort:
+    """Test that abandoned generations are removed from the engine"""
+
+    async def test_complete_stream_is_not_aborted(self, provider):
+        chunks = [chunk async for chunk in provider.generate_stream("hi")]
+
+        assert "".join(chunks) == "hello world"
+        assert provider._engine.aborted == []
+
+    async def test_closed_stream_aborts_request(self, provider):
+        """A consumer that stops early aborts the request"""
+        stream = provider.generate_stream("hi")
+        assert await stream.__anext__() == "h"
+
+        await stream.aclose()
+
+        assert len(provider._engine.aborted) == 1
+        assert provider._engine.aborted[0].startswith("stream-")
+        assert provider.get_metrics()["aborted_requests"] == 1
+
+    async def test_cancelled_consumer_aborts_request(self, provider):
+        """Cancelling the task that reads the stream aborts the request"""
+        provider._engine.step_sec = 0.01
+
+        async def consume():
+            async for _ in provider.generate_stream("hi"):
+                pass
+
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0.03)
+        task.cancel()
+        await asyncio.wait({task})
+
+        assert task.cancelled()
+        assert len(provider._engine.aborted) == 1
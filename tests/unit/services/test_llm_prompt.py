@@ -0,0 +1,100 @@
+"""
+Unit Tests for LLM prompt construction and prefix-reuse accounting
+
+Uses a character-level fake tokenizer; no model download needed.
+"""
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from avatar.services.llm_prompt import PrefixReuseTracker, PromptBuilder
+
+
+class CharTokenizer:
+    """One token per character; ChatML-style chat template"""
+
+    chat_template = "chatml"
+
+    def apply_chat_template(self, messages, tokenize=False, add_generation_prompt=False):
+        text = "".join(f"<{m['role']}>{m['content']}</{m['role']}>" for m in messages)
+        return text + ("<assistant>" if add_generation_prompt else "")
+
+    def encode(self, text, add_special_tokens=True):
+        return [ord(ch) for ch in text]
+
+
+class TestPromptBuilder:
+    """Test system persona placement and template use"""
+
+    def test_persona_prepended(self):
+        """The fixed persona is the first message of every prompt"""
+        builder = PromptBuilder(CharTokenizer(), system_prompt="PERSONA")
+
+        prompt = builder.render([{"role": "user", "content": "hi"}])
+
+        assert prompt == "<system>PERSONA</system><user>hi</user><assistant>"
+
+    def test_persona_not_duplicated(self):
+        """Messages already starting with the persona are left as-is"""
+        builder = PromptBuilder(CharTokenizer(), system_prompt="PERSONA")
+        messages = [{"role": "system", "content": "PERSONA"}, {"role": "user", "content": "hi"}]
+
+        assert builder.render(messages).count("PERSONA") == 1
+
+    def test_chatml_fallback_without_template(self):
+        """Tokenizers without a chat template fall back to ChatML"""
+        tokenizer = CharTokenizer()
+        tokenizer.chat_template = None
+        builder = PromptBuilder(tokenizer, system_prompt="")
+
+        prompt = builder.render([{"role": "user", "content": "hi"}])
+
+        assert prompt == "<|im_start|>user\nhi<|im_end|>\n<|im_start|>assistant\n"
+
+
+class TestPrefixReuseTracker:
+    """Test block-level prefix reuse estimation"""
+
+    def test_shared_prefix_counts_full_blocks_only(self):
+        """Only complete blocks of a matching prefix count as cached"""
+        tracker = PrefixReuseTracker(block_size=4)
+
+        assert tracker.observe(list(range(10))) == 0
+        # Same first 9 tokens: blocks [0-3] and [4-7] match, the partial rest does not
+        assert tracker.observe(list(range(9)) + [99, 100, 101]) == 8
+
+    def test_divergence_stops_matching(self):
+        """A block after a mismatch is not reused even if identical"""
+        tracker = PrefixReuseTracker(block_size=2)
+        tracker.observe([1, 2, 3, 4])
+
+        assert tracker.observe([9, 9, 3, 4]) == 0
+
+    def test_metrics_and_ttft_split(self):
+        """Reuse rate and TTFT are reported for hits and misses separately"""
+        tracker = PrefixReuseTracker(block_size=4)
+        prompt = list(range(16))
+
+        miss = tracker.observe(prompt)
+        tracker.record_ttft(0.30, len(prompt), miss)
+        hit = tracker.observe(prompt)
+        tracker.record_ttft(0.10, len(prompt), hit)
+
+        metrics = tracker.get_metrics()
+
+        assert metrics["requests"] == 2
+        assert metrics["hit_requests"] == 1
+        assert metrics["prompt_token_reuse_rate"] == pytest.approx(0.5)
+        assert metrics["ttft_hit_avg_ms"] == pytest.approx(100.0)
+        assert metrics["ttft_miss_avg_ms"] == pytest.approx(300.0)
+
+    def test_capacity_evicts_oldest_blocks(self):
+        """Blocks beyond capacity are forgotten (LRU)"""
+        tracker = PrefixReuseTracker(block_size=2, capacity_blocks=2)
+        tracker.observe([1, 2, 3, 4])
+        tracker.observe([5, 6, 7, 8])
+
+        assert tracker.observe([1, 2, 3, 4]) == 0
@@ -0,0 +1,128 @@
+"""
+Unit Tests for the STT micro-batching scheduler
+
+Scheduling is tested with a recording batch runner, and segment routing
+with a fake batched pipeline, so no Whisper weights are needed.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from avatar.services.stt_batching import (
+    WHISPER_SAMPLE_RATE,
+    WhisperBatchScheduler,
+    _PreparedAudio,
+    _transcribe_group,
+)
+
+
+class RecordingRunner:
+    """Echoes each request's audio back as its transcript"""
+
+    def __init__(self, delay: float = 0.0):
+        self.batches: list[list] = []
+        self.delay = delay
+
+    async def __call__(self, requests):
+        self.batches.append(requests)
+        for request in requests:
+            request.started_at = time.perf_counter()
+        await asyncio.sleep(self.delay)
+        results = []
+        for request in requests:
+            if request.audio == "bad":
+                results.append(RuntimeError("decode failed"))
+            else:
+                results.append(([{"start": 0.0, "end": 1.0, "text": request.audio}], {"batch_size": len(requests)}))
+        return results
+
+
+class TestWhisperBatchScheduler:
+    """Test micro-batch formation and result routing"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_batch(self):
+        """Requests arriving within the window are decoded together"""
+        runner = RecordingRunner()
+        scheduler = WhisperBatchScheduler(runner, max_batch_size=8, max_wait_ms=20)
+
+        results = await asyncio.gather(*(scheduler.submit(f"s{i}") for i in range(3)))
+
+        assert len(runner.batches) == 1
+        assert [segments[0]["text"] for segments, _ in results] == ["s0", "s1", "s2"]
+
+    @pytest.mark.asyncio
+    async def test_full_batch_dispatches_without_waiting(self):
+        """A full batch does not wait for the window to expire"""
+        runner = RecordingRunner()
+        scheduler = WhisperBatchScheduler(runner, max_batch_size=2, max_wait_ms=1000)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(scheduler.submit(f"s{i}") for i in range(4)))
+
+        assert [len(batch) for batch in runner.batches] == [2, 2]
+        assert time.perf_counter() - start < 0.5
+
+    @pytest.mark.asyncio
+    async def test_failure_only_affects_its_request(self):
+        """A per-request exception is raised to that caller only"""
+        scheduler = WhisperBatchScheduler(RecordingRunner(), max_wait_ms=10)
+
+        ok, bad = await asyncio.gather(
+            scheduler.submit("fine"), scheduler.submit("bad"), return_exceptions=True
+        )
+
+        assert ok[0][0]["text"] == "fine"
+        assert isinstance(bad, RuntimeError)
+
+    @pytest.mark.asyncio
+    async def test_metrics_split_queue_and_compute_time(self):
+        """Queue time covers the window; compute time covers the batch"""
+        scheduler = WhisperBatchScheduler(RecordingRunner(delay=0.05), max_wait_ms=20)
+
+        await asyncio.gather(scheduler.submit("a"), scheduler.submit("b"))
+        metrics = scheduler.get_metrics()
+
+        assert metrics["batches"] == 1
+        assert metrics["requests"] == 2
+        assert metrics["avg_batch_size"] == 2
+        assert metrics["queue_time_avg_sec"] >= 0.015
+        assert metrics["compute_time_avg_sec"] >= 0.04
+        assert metrics["pending"] == 0
+
+
+class TestSegmentRouting:
+    """Test mapping batched segments back to their requests"""
+
+    def test_segments_mapped_by_offset(self):
+        """Segment times become relative to each request's own audio"""
+        calls = {}
+
+        def fake_transcribe(audio, clip_timestamps, **kwargs):
+            calls["clips"] = clip_timestamps
+            segments = [
+                SimpleNamespace(start=clip["start"], end=clip["end"], text=f" clip{i} ")
+                for i, clip in enumerate(clip_timestamps)
+            ]
+            return iter(segments), None
+
+        pipeline = SimpleNamespace(transcribe=fake_transcribe)
+        sr = WHISPER_SAMPLE_RATE
+        items = [
+            _PreparedAudio(0, np.zeros(2 * sr, dtype=np.float32), [(0, sr)], "zh", 1.0),
+            _PreparedAudio(1, np.zeros(3 * sr, dtype=np.float32), [(sr // 2, 2 * sr)], "zh", 1.0),
+        ]
+
+        result = _transcribe_group(pipeline, items, "zh", 5, batch_size=8)
+
+        assert calls["clips"][1] == {"start": 2.5, "end": 4.0}
+        assert result[0] == [{"start": 0.0, "end": 1.0, "text": "clip0"}]
+        assert result[1] == [{"start": 0.5, "end": 2.0, "text": "clip1"}]
@@ -0,0 +1,125 @@
+"""
+Unit Tests for the Whisper decode pool
+
+Uses a fake model whose lazy segment generator records which thread
+iterates it, so the tests need no Whisper weights.
+"""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from avatar.services.stt_local import WhisperSTTProvider
+
+
+class FakeWhisperModel:
+    """Mimics faster-whisper: transcribe() returns a lazy generator"""
+
+    def __init__(self, texts: list[str], delay: float = 0.0):
+        self.texts = texts
+        self.delay = delay
+        self.decode_threads: set[str] = set()
+
+    def transcribe(self, audio, **options):
+        info = SimpleNamespace(language="zh", language_probability=0.99, duration=len(self.texts))
+
+        def segments():
+            for i, text in enumerate(self.texts):
+                self.decode_threads.add(threading.current_thread().name)
+                if self.delay:
+                    threading.Event().wait(self.delay)
+                yield SimpleNamespace(start=float(i), end=float(i + 1), text=f" {text} ")
+
+        return segments(), info
+
+
+def make_provider(model: FakeWhisperModel, num_workers: int = 1) -> WhisperSTTProvider:
+    provider = WhisperSTTProvider(num_workers=num_workers)
+    provider._model = model
+    return provider
+
+
+class TestDecodePool:
+    """Test that decoding runs on the dedicated pool"""
+
+    @pytest.mark.asyncio
+    async def test_generator_consumed_on_decode_thread(self):
+        """Segment iteration happens on a whisper-decode thread, not the event loop"""
+        model = FakeWhisperModel(["你好", "世界"])
+        provider = make_provider(model)
+
+        text, metadata = await provider.transcribe(np.zeros(16000, dtype=np.float32))
+
+        assert text == "你好 世界"
+        assert metadata["segments_count"] == 2
+        assert all(name.startswith("whisper-decode") for name in model.decode_threads)
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_segments_in_order(self):
+        """transcribe_stream yields each segment as it is decoded"""
+        provider = make_provider(FakeWhisperModel(["一", "二", "三"], delay=0.01))
+
+        texts = [seg["text"] async for seg in provider.transcribe_stream(np.zeros(10, dtype=np.float32))]
+
+        assert texts == ["一", "二", "三"]
+
+    @pytest.mark.asyncio
+    async def test_metrics_track_queue_and_decode_time(self):
+        """Requests beyond the worker count wait in the queue and are counted"""
+        provider = make_provider(FakeWhisperModel(["a"], delay=0.05), num_workers=1)
+        audio = np.zeros(10, dtype=np.float32)
+
+        pending = [asyncio.create_task(provider.transcribe(audio)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        assert provider.get_metrics()["queue_depth"] == 2
+
+        await asyncio.gather(*pending)
+        metrics = provider.get_metrics()
+
+        assert metrics["completed"] == 3
+        assert metrics["queue_depth"] == 0
+        assert metrics["active"] == 0
+        assert metrics["decode_time_avg_sec"] >= 0.04
+        assert metrics["queue_wait_avg_sec"] > 0
+
+    @pytest.mark.asyncio
+    async def test_failure_wrapped_and_counted(self):
+        """Model errors surface as RuntimeError and count as failed"""
+        model = FakeWhisperModel([])
+        model.transcribe = lambda audio, **options: (_ for _ in ()).throw(ValueError("bad audio"))
+        provider = make_provider(model)
+
+        with pytest.raises(RuntimeError):
+            await provider.transcribe(np.zeros(10, dtype=np.float32))
+
+        assert provider.get_metrics()["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_batching_covers_turns_and_streaming_passes(self):
+        """Both entry points go through the scheduler, without a per-session prompt"""
+        model = FakeWhisperModel(["unused"])
+        provider = WhisperSTTProvider(batching=True)
+        provider._model = model
+        batched = []
+
+        async def submit(audio, **options):
+            batched.append(options)
+            return [{"start": 0.0, "end": 1.0, "text": "你好"}], {"language": "zh", "duration": 1.0}
+
+        provider._scheduler.submit = submit
+        audio = np.zeros(16000, dtype=np.float32)
+
+        text, _ = await provider.transcribe(audio)
+        await provider.transcribe_array(audio, initial_prompt="前文")
+
+        assert text == "你好"
+        assert not model.decode_threads
+        assert len(batched) == 2
+        assert all("initial_prompt" not in options for options in batched)
@@ -0,0 +1,144 @@
+"""
+Unit Tests for Streaming STT
+
+Tests the local-agreement commit logic of StreamingTranscriber with a
+scripted Whisper stand-in (model behaviour is covered by test_stt_service).
+"""
+
+import pytest
+import numpy as np
+from unittest.mock import patch
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from avatar.services.stt_streaming import StreamingTranscriber, WHISPER_SAMPLE_RATE
+
+
+class ScriptedSTT:
+    """Returns one scripted segment list per transcribe_array call"""
+
+    def __init__(self, passes: list[list[dict]]):
+        self.passes = passes
+        self.windows: list[float] = []
+
+    async def transcribe_array(self, audio, **kwargs):
+        self.windows.append(len(audio) / WHISPER_SAMPLE_RATE)
+        segments = self.passes[min(len(self.windows) - 1, len(self.passes) - 1)]
+        return segments, {"language": "zh", "language_probability": 0.99, "duration": 0.0}
+
+
+def seg(start: float, end: float, text: str) -> dict:
+    return {"start": start, "end": end, "text": text}
+
+
+@pytest.fixture
+def decoded_audio():
+    """Patch in-memory decoding to return `seconds` of silence"""
+    state = {"seconds": 0.0}
+
+    def fake_decode(data, sample_rate, fmt=None):
+        return np.zeros(int(state["seconds"] * sample_rate), dtype=np.float32)
+
+    with patch("avatar.core.audio_utils.decode_audio_bytes", side_effect=fake_decode):
+        yield state
+
+
+class TestStreamingTranscriber:
+    """Test stable-prefix commit behaviour"""
+
+    @pytest.mark.asyncio
+    async def test_agreed_segments_are_committed(self, decoded_audio):
+        """A segment seen identically in two passes (and outside the margin) is committed"""
+        stt = ScriptedSTT([
+            [seg(0.0, 1.5, "你好"), seg(1.5, 2.8, "今天")],
+            [seg(0.0, 1.5, "你好"), seg(1.5, 3.0, "今天天氣")],
+        ])
+        partials = []
+
+        async def on_partial(stable, text):
+            partials.append((stable, text))
+
+        transcriber = StreamingTranscriber(stt, on_partial=on_partial, commit_margin_sec=1.0)
+        transcriber._audio.extend(b"x")
+
+        decoded_audio["seconds"] = 3.0
+        await transcriber._transcribe_pass(final=False)
+        assert transcriber.stable_text == ""
+
+        decoded_audio["seconds"] = 4.0
+        await transcriber._transcribe_pass(final=False)
+        assert transcriber.stable_text == "你好"
+        assert transcriber._committed_sec == pytest.approx(1.5)
+        assert partials == [("你好", "你好 今天天氣")]
+
+    @pytest.mark.asyncio
+    async def test_finish_only_decodes_uncommitted_tail(self, decoded_audio):
+        """The final pass starts at the committed point"""
+        stt = ScriptedSTT([
+            [seg(0.0, 2.0, "第一句")],
+            [seg(0.0, 2.0, "第一句"), seg(2.0, 3.0, "第")],
+            [seg(0.0, 2.5, "第二句")],
+        ])
+        transcriber = StreamingTranscriber(stt, commit_margin_sec=1.0)
+        transcriber._audio.extend(b"x")
+
+        decoded_audio["seconds"] = 3.5
+        await transcriber._transcribe_pass(final=False)
+        decoded_audio["seconds"] = 5.0
+        await transcriber._transcribe_pass(final=False)
+
+        text, metadata = await transcriber.finish()
+
+        assert text == "第一句 第二句"
+        assert stt.windows[-1] == pytest.approx(3.0)  # 5.0s total - 2.0s committed
+        assert metadata["passes"] == 3
+
+    @pytest.mark.asyncio
+    async def test_long_window_forces_commit(self, decoded_audio):
+        """Without agreement, a window beyond max_window_sec commits all but the last segment"""
+        stt = ScriptedSTT([
+            [seg(0.0, 8.0, "很長的一段話"), seg(8.0, 16.0, "還沒結束")],
+        ])
+        transcriber = StreamingTranscriber(stt, max_window_sec=15.0)
+        transcriber._audio.extend(b"x")
+
+        decoded_audio["seconds"] = 17.0
+        await transcriber._transcribe_pass(final=False)
+
+        assert transcriber.stable_text == "很長的一段話"
+        assert transcriber.text == "很長的一段話 還沒結束"
+
+    @pytest.mark.asyncio
+    async def test_pcm_passes_decode_only_the_tail(self):
+        """Raw PCM is cut at the committed point (less the overlap) before decoding"""
+        from avatar.core import audio_utils
+
+        stt = ScriptedSTT([
+            [seg(0.0, 2.0, "第一句")],
+            [seg(0.0, 2.0, "第一句"), seg(2.0, 3.0, "第")],
+            [seg(0.0, 1.0, "第二句")],
+        ])
+        transcriber = StreamingTranscriber(stt, commit_margin_sec=1.0, audio_format=audio_utils.PCM_FORMAT)
+        pcm_second = np.zeros(WHISPER_SAMPLE_RATE, dtype="<i2").tobytes()
+        decode = audio_utils.decode_audio_bytes
+        decoded = []
+
+        def spy(data, sample_rate, fmt=None):
+            decoded.append(len(data))
+            return decode(data, sample_rate, fmt)
+
+        with patch("avatar.core.audio_utils.decode_audio_bytes", side_effect=spy):
+            transcriber._audio.extend(pcm_second * 3)
+            await transcriber._transcribe_pass(final=False)
+            await transcriber._transcribe_pass(final=False)  # Commits 2.0s
+            transcriber._audio.extend(pcm_second * 2)
+            await transcriber._transcribe_pass(final=False)
+            text, metadata = await transcriber.finish()
+
+        assert decoded[2] == 2 * int(3.1 * WHISPER_SAMPLE_RATE)  # From 1.9s, not 0
+        assert stt.windows[2] == pytest.approx(3.0)
+        assert decoded[-1] == len(pcm_second) * 5  # finish() decodes everything once
+        assert len(transcriber.samples) == 5 * WHISPER_SAMPLE_RATE
+        assert metadata["duration"] == pytest.approx(5.0)
@@ -6,6 +6,7 @@ Testing high-quality TTS service with CosyVoice integration.
 
 import pytest
 import asyncio
+import threading
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -289,5 +290,127 @@ class TestTTSDualModeManager:
         mock_fast_service.synthesize_fast.assert_called_once()
 
 
+class ChunkedCosyVoice:
+    """Fake CosyVoice2 yielding fixed-size chunks"""
+
+    def __init__(self, chunks: int = 3, samples: int = 100, gate=None):
+        self.chunks = chunks
+        self.samples = samples
+        self.gate = gate  # Held after the first chunk until set
+        self.waiting = threading.Event()
+        self.stream_args = []
+
+    def inference_zero_shot(self, text, prompt_text, prompt_speech_16k, stream=False):
+        import torch
+        self.stream_args.append(stream)
+        for i in range(self.chunks):
+            if i and self.gate is not None:
+                self.waiting.set()
+                self.gate.wait()
+            yield {'tts_speech': torch.full((1, self.samples), float(i))}
+
+
+@pytest.mark.unit
+class TestTTSHQStreaming:
+    """Test chunked HQ synthesis"""
+
+    @pytest.fixture
+    def reference_audio(self, tmp_path):
+        import torch
+        import torchaudio
+        path = tmp_path / "reference.wav"
+        torchaudio.save(str(path), torch.zeros(1, 16000), 16000)
+        return path
+
+    @pytest.fixture
+    def saved(self):
+        """Capture torchaudio.save calls and create the files"""
+        calls = {}
+
+        def fake_save(path, audio, sample_rate, **kwargs):
+            assert kwargs == {"encoding": "PCM_S", "bits_per_sample": 16}  # Sendable as PCM16 frames
+            calls[Path(path).name] = audio
+            Path(path).touch()
+
+        with patch('torchaudio.save', side_effect=fake_save):
+            yield calls
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_every_chunk_then_archive(self, reference_audio, saved, tmp_path):
+        """Each chunk is its own file; the archive holds all chunks in order"""
+        service = TTSHQService()
+        service._model = ChunkedCosyVoice(chunks=3, samples=100)
+        output_path = tmp_path / "turn1_hq.wav"
+
+        chunk_paths = [
+            path async for path in service.synthesize_stream(
+                text="你好", ref_audio_path=reference_audio, ref_text="參考", output_path=output_path
+            )
+        ]
+
+        assert [p.name for p in chunk_paths] == ["turn1_hq_000.wav", "turn1_hq_001.wav", "turn1_hq_002.wav"]
+        assert service._model.stream_args == [True]
+        assert saved["turn1_hq.wav"].shape == (1, 300)
+        assert saved["turn1_hq.wav"][0, -1].item() == 2.0
+        assert not any(path.exists() for path in chunk_paths)
+        assert output_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_early_close_waits_and_cleans_up(self, reference_audio, saved, tmp_path):
+        """Closing after the first chunk stops the worker and deletes its chunks"""
+        gate = threading.Event()
+        service = TTSHQService()
+        service._model = ChunkedCosyVoice(chunks=5, samples=10, gate=gate)
+        output_path = tmp_path / "turn2_hq.wav"
+
+        stream = service.synthesize_stream(
+            text="你好", ref_audio_path=reference_audio, ref_text="參考", output_path=output_path
+        )
+        first = await stream.__anext__()
+        assert first.exists()
+        while not service._model.waiting.is_set():
+            await asyncio.sleep(0.001)
+
+        closing = asyncio.ensure_future(stream.aclose())
+        await asyncio.sleep(0.01)
+        assert not closing.done()  # Waiting for the worker's current chunk
+        gate.set()
+        await closing
+
+        assert list(tmp_path.glob("turn2_hq*")) == []
+        assert "turn2_hq.wav" not in saved
+
+    @pytest.mark.asyncio
+    async def test_keep_chunks_leaves_files(self, reference_audio, saved, tmp_path):
+        """With keep_chunks, chunk files outlive the stream (served by URL)"""
+        service = TTSHQService()
+        service._model = ChunkedCosyVoice(chunks=2, samples=10)
+        output_path = tmp_path / "turn3_hq.wav"
+
+        chunk_paths = [
+            path async for path in service.synthesize_stream(
+                text="你好", ref_audio_path=reference_audio, ref_text="參考",
+                output_path=output_path, keep_chunks=True
+            )
+        ]
+
+        assert len(chunk_paths) == 2
+        assert all(path.exists() for path in chunk_paths)
+        assert output_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_synthesize_keeps_all_segments(self, reference_audio, saved, tmp_path):
+        """Non-streaming synthesis concatenates every result, not just the first"""
+        service = TTSHQService()
+        service._model = ChunkedCosyVoice(chunks=2, samples=50)
+        output_path = tmp_path / "full.wav"
+
+        await service.synthesize(
+            text="你好", ref_audio_path=reference_audio, ref_text="參考", output_path=output_path
+        )
+
+        assert saved["full.wav"].shape == (1, 100)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
\ No newline at end of file
@@ -0,0 +1,233 @@
+"""
+Unit Tests for the TTS phrase cache
+
+Uses a fake TTS provider that writes placeholder files; no model needed.
+"""
+
+import os
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from avatar.services import tts_phrase_cache
+from avatar.services.tts_phrase_cache import (
+    TTSPhraseCache,
+    normalize_phrase,
+    phrase_key,
+    profile_name,
+    warm_up_phrase_cache,
+)
+
+
+def cached_path(cache: TTSPhraseCache, tts: "FakeTTS", text: str, voice: str) -> Path:
+    """Cache file of a phrase"""
+    key = phrase_key(text, voice, tts.speed, tts.model_name)
+    return cache.cache_dir / cache.filename(key, voice)
+
+
+class FakeTTS:
+    """Writes `size` bytes per synthesis and counts calls"""
+
+    model_name = "F5-TTS"
+
+    def __init__(self, speed: float = 1.0, size: int = 100):
+        self.speed = speed
+        self.size = size
+        self.calls = 0
+
+    async def synthesize_fast(self, text, voice_profile_name, output_path):
+        self.calls += 1
+        Path(output_path).write_bytes(b"\0" * self.size)
+        return output_path
+
+
+class TestPhraseKey:
+    """Test content addressing"""
+
+    def test_normalization(self):
+        """Whitespace and full-width forms do not change the key"""
+        assert normalize_phrase("  你好\n  世界 ") == "你好 世界"
+        assert phrase_key("Ｈｉ！", "v", 1.0, "m") == phrase_key("Hi!", "v", 1.0, "m")
+
+    def test_key_depends_on_voice_speed_model(self):
+        """Each synthesis parameter is part of the address"""
+        base = phrase_key("你好", "alice", 1.0, "F5-TTS")
+
+        assert phrase_key("你好", "bob", 1.0, "F5-TTS") != base
+        assert phrase_key("你好", "alice", 1.2, "F5-TTS") != base
+        assert phrase_key("你好", "alice", 1.0, "E2-TTS") != base
+
+
+class TestTTSPhraseCache:
+    """Test hits, eviction and invalidation"""
+
+    @pytest.mark.asyncio
+    async def test_hit_is_copied_to_the_turn(self, tmp_path):
+        """A repeated phrase is copied from the cache without synthesis"""
+        cache = TTSPhraseCache(cache_dir=tmp_path, max_bytes=10_000, max_chars=40)
+        tts = FakeTTS()
+
+        first = await cache.synthesize_fast(tts, "你好！", "alice", tmp_path / "turn1.wav")
+        second = await cache.synthesize_fast(tts, "你好！ ", "alice", tmp_path / "turn2.wav")
+
+        assert first == tmp_path / "turn1.wav"
+        assert second == tmp_path / "turn2.wav"
+        assert second.read_bytes() == first.read_bytes()
+        assert cached_path(cache, tts, "你好！", "alice").name.startswith("phrase_")
+        assert tts.calls == 1
+        assert cache.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_turn_audio_survives_invalidation(self, tmp_path):
+        """Archived turns never point at cache files"""
+        cache = TTSPhraseCache(cache_dir=tmp_path, max_bytes=10_000, max_chars=40)
+        tts = FakeTTS()
+        await cache.synthesize_fast(tts, "你好", "alice", tmp_path / "turn1.wav")
+        turn2 = await cache.synthesize_fast(tts, "你好", "alice", tmp_path / "turn2.wav")
+
+        cache.invalidate_voice("alice")
+
+        assert not cached_path(cache, tts, "你好", "alice").exists()
+        assert (tmp_path / "turn1.wav").exists()
+        assert turn2.exists()
+
+    @pytest.mark.asyncio
+    async def test_long_text_not_cached(self, tmp_path):
+        """Texts over max_chars are synthesized to the requested path"""
+        cache = TTSPhraseCache(cache_dir=tmp_path, max_bytes=10_000, max_chars=5)
+        tts = FakeTTS()
+
+        path = await cache.synthesize_fast(tts, "這是一句很長的回答", "alice", tmp_path / "turn1.wav")
+
+        assert path == tmp_path / "turn1.wav"
+        assert cache.get_stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_by_size(self, tmp_path):
+        """Least recently used files are deleted when over the size cap"""
+        cache = TTSPhraseCache(cache_dir=tmp_path, max_bytes=250, max_chars=40)
+        tts = FakeTTS(size=100)
+
+        await cache.synthesize_fast(tts, "a", "alice", tmp_path / "1.wav")
+        await cache.synthesize_fast(tts, "b", "alice", tmp_path / "2.wav")
+        a = cached_path(cache, tts, "a", "alice")
+        b = cached_path(cache, tts, "b", "alice")
+        b_opus = b.with_name(f"{b.stem}.enc.opus")
+        b_opus.write_bytes(b"OggS")
+        await cache.synthesize_fast(tts, "a", "alice", tmp_path / "3.wav")  # Touch a
+        await cache.synthesize_fast(tts, "c", "alice", tmp_path / "4.wav")
+
+        assert a.exists()
+        assert not b.exists()
+        assert not b_opus.exists()  # Encoded copies go with the phrase
+        assert cache.get_stats()["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_index_survives_restart(self, tmp_path):
+        """A new instance finds files cached by a previous one"""
+        tts = FakeTTS()
+        await TTSPhraseCache(cache_dir=tmp_path, max_bytes=10_000).synthesize_fast(
+            tts, "你好", "alice", tmp_path / "1.wav"
+        )
+
+        cache = TTSPhraseCache(cache_dir=tmp_path, max_bytes=10_000)
+        await cache.synthesize_fast(tts, "你好", "alice", tmp_path / "2.wav")
+
+        assert tts.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_deleted_file_is_a_miss(self, tmp_path):
+        """Files removed outside the cache are re-synthesized"""
+        cache = TTSPhraseCache(cache_dir=tmp_path, max_bytes=10_000)
+        tts = FakeTTS()
+
+        await cache.synthesize_fast(tts, "你好", "alice", tmp_path / "1.wav")
+        path = cached_path(cache, tts, "你好", "alice")
+        os.remove(path)
+        await cache.synthesize_fast(tts, "你好", "alice", tmp_path / "2.wav")
+
+        assert tts.calls == 2
+        assert path.exists()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_voice(self, tmp_path):
+        """Only the given voice's phrases are removed"""
+        cache = TTSPhraseCache(cache_dir=tmp_path, max_bytes=10_000)
+        tts = FakeTTS()
+        await cache.synthesize_fast(tts, "你好", "profile_1", tmp_path / "1.wav")
+        await cache.synthesize_fast(tts, "你好", "profile_10", tmp_path / "2.wav")
+
+        assert cache.invalidate_voice("profile_1") == 1
+        assert len(list(tmp_path.glob("phrase_*.wav"))) == 1
+
+    @pytest.mark.asyncio
+    async def test_similar_voice_names_do_not_collide(self, tmp_path):
+        """Voices differing only in punctuation keep separate files"""
+        cache = TTSPhraseCache(cache_dir=tmp_path, max_bytes=10_000)
+        tts = FakeTTS()
+        await cache.synthesize_fast(tts, "你好", "a_b", tmp_path / "1.wav")
+        await cache.synthesize_fast(tts, "你好", "a-b", tmp_path / "2.wav")
+
+        assert cache.invalidate_voice("a_b") == 1
+        assert cached_path(cache, tts, "你好", "a-b").exists()
+
+
+class TestWarmUp:
+    """Test that warm-up renders what turns look up"""
+
+    @pytest.fixture
+    def env(self, tmp_path, monkeypatch):
+        """Profile directory, cache, TTS and stage queue isolated in tmp_path"""
+        from contextlib import asynccontextmanager
+        from avatar.core.config import config
+        import avatar.core.session_queue as session_queue
+        import avatar.services.tts as tts_module
+
+        profile_id = "3f1c2d4e-0000-4000-8000-000000000001"
+        (tmp_path / "profiles" / profile_id).mkdir(parents=True)
+        monkeypatch.setattr(config, "AUDIO_PROFILES", tmp_path / "profiles")
+        monkeypatch.setattr(config, "AUDIO_TTS_FAST", tmp_path)
+
+        cache = TTSPhraseCache(cache_dir=tmp_path, max_bytes=10_000)
+        tts = FakeTTS()
+        monkeypatch.setattr(tts_phrase_cache, "_phrase_cache", cache)
+
+        async def get_tts_service():
+            return tts
+        monkeypatch.setattr(tts_module, "get_tts_service", get_tts_service)
+
+        stages = []
+
+        class RecordingQueue:
+            @asynccontextmanager
+            async def stage(self, session_id, service_type, timeout=None):
+                stages.append(service_type)
+                yield
+
+        monkeypatch.setattr(session_queue, "get_session_queue", lambda: RecordingQueue())
+
+        return profile_id, cache, tts, stages
+
+    @pytest.mark.asyncio
+    async def test_turn_hits_warmed_phrase(self, env, tmp_path):
+        """A turn with the profile's id is served from the warm-up render"""
+        profile_id, cache, tts, _ = env
+
+        summary = await warm_up_phrase_cache(phrases=["你好！"])
+        await cache.synthesize_fast(tts, "你好！", profile_name(profile_id), tmp_path / "turn.wav")
+
+        assert summary["rendered"] == 1
+        assert tts.calls == 1
+        assert cache.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_holds_tts_fast_slot(self, env):
+        """Each warm-up synthesis runs inside a tts_fast stage slot"""
+        stages = env[3]
+
+        await warm_up_phrase_cache(phrases=["你好！", "請稍等一下。"])
+
+        assert stages == ["tts_fast", "tts_fast"]
@@ -0,0 +1,103 @@
+"""
+Unit Tests for the voice reference cache
+
+Uses temporary reference files and placeholder audio; no TTS model needed.
+"""
+
+import os
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from avatar.services.voice_reference_cache import (
+    VoiceReference,
+    VoiceReferenceCache,
+    reference_mtimes,
+)
+
+
+def make_reference(tmp_path: Path, name: str) -> VoiceReference:
+    profile_dir = tmp_path / name
+    profile_dir.mkdir()
+    audio_path = profile_dir / "reference.wav"
+    text_path = profile_dir / "reference.txt"
+    audio_path.write_bytes(b"RIFF")
+    text_path.write_text("你好", encoding="utf-8")
+
+    return VoiceReference(
+        profile_name=name,
+        audio_path=audio_path,
+        text_path=text_path,
+        mtimes=reference_mtimes(audio_path, text_path),
+        audio=object(),
+        sample_rate=24000,
+        ref_text="你好。",
+        duration_sec=1.0
+    )
+
+
+class TestVoiceReferenceCache:
+    """Test lookup, staleness and eviction"""
+
+    def test_hit_after_put(self, tmp_path):
+        """A stored reference is returned while its files are unchanged"""
+        cache = VoiceReferenceCache(max_entries=4)
+        reference = make_reference(tmp_path, "alice")
+
+        assert cache.get("alice") is None
+        cache.put(reference)
+
+        assert cache.get("alice") is reference
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == pytest.approx(0.5)
+
+    def test_changed_file_is_stale(self, tmp_path):
+        """Rewriting a reference file invalidates the entry"""
+        cache = VoiceReferenceCache(max_entries=4)
+        reference = make_reference(tmp_path, "alice")
+        cache.put(reference)
+
+        stat = reference.text_path.stat()
+        os.utime(reference.text_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert cache.get("alice") is None
+        assert cache.get_stats()["stale"] == 1
+        assert cache.get_stats()["entries"] == 0
+
+    def test_removed_file_is_stale(self, tmp_path):
+        """A deleted profile is a miss, not an error"""
+        cache = VoiceReferenceCache(max_entries=4)
+        reference = make_reference(tmp_path, "alice")
+        cache.put(reference)
+
+        reference.audio_path.unlink()
+
+        assert cache.get("alice") is None
+
+    def test_lru_eviction(self, tmp_path):
+        """The least recently used profile is evicted first"""
+        cache = VoiceReferenceCache(max_entries=2)
+        for name in ("a", "b"):
+            cache.put(make_reference(tmp_path, name))
+
+        cache.get("a")
+        cache.put(make_reference(tmp_path, "c"))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_invalidate(self, tmp_path):
+        """Explicit invalidation removes the entry once"""
+        cache = VoiceReferenceCache(max_entries=4)
+        cache.put(make_reference(tmp_path, "alice"))
+
+        assert cache.invalidate("alice") is True
+        assert cache.invalidate("alice") is False
+        assert cache.get("alice") is None